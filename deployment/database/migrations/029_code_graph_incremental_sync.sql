@@ -0,0 +1,85 @@
+-- Migration: 029_code_graph_incremental_sync
+-- Purpose: Support incremental Postgres -> Memgraph sync of code entities
+--
+-- 1. Keyset indexes on (updated_at, id) so changed entities/relationships can be
+--    streamed in pages since a high-water mark.
+-- 2. Tombstone tables filled by AFTER DELETE triggers, so hard-deleted entities
+--    and relationships (zombie cleanup) can be removed from Memgraph.
+-- 3. code_graph_sync_state persists the high-water mark per sync stream.
+--
+-- All statements are idempotent.
+
+-- Keyset pagination indexes
+CREATE INDEX IF NOT EXISTS idx_code_entities_updated_at_id
+    ON code_entities (updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_code_relationships_updated_at_id
+    ON code_relationships (updated_at, id);
+
+-- Entity tombstones (graph nodes keyed by qualified_name + source_repo)
+CREATE TABLE IF NOT EXISTS code_entity_tombstones (
+    seq BIGSERIAL PRIMARY KEY,
+    entity_id UUID NOT NULL,
+    qualified_name TEXT NOT NULL,
+    source_repo TEXT NOT NULL,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_code_entity_tombstones_deleted_at
+    ON code_entity_tombstones (deleted_at, seq);
+
+-- Relationship tombstones. Endpoint qualified names are captured at delete
+-- time; they are NULL when the endpoint entity was deleted first (cascade),
+-- in which case the node tombstone already removes the edge.
+CREATE TABLE IF NOT EXISTS code_relationship_tombstones (
+    seq BIGSERIAL PRIMARY KEY,
+    relationship_id UUID NOT NULL,
+    source_qualified_name TEXT,
+    target_qualified_name TEXT,
+    relationship_type TEXT NOT NULL,
+    source_repo TEXT NOT NULL,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_code_relationship_tombstones_deleted_at
+    ON code_relationship_tombstones (deleted_at, seq);
+
+CREATE OR REPLACE FUNCTION record_code_entity_tombstone() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO code_entity_tombstones (entity_id, qualified_name, source_repo)
+    VALUES (OLD.id, OLD.qualified_name, OLD.source_repo);
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION record_code_relationship_tombstone() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO code_relationship_tombstones (
+        relationship_id, source_qualified_name, target_qualified_name,
+        relationship_type, source_repo
+    ) VALUES (
+        OLD.id,
+        (SELECT qualified_name FROM code_entities WHERE id = OLD.source_entity_id),
+        (SELECT qualified_name FROM code_entities WHERE id = OLD.target_entity_id),
+        OLD.relationship_type,
+        OLD.source_repo
+    );
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_code_entities_tombstone ON code_entities;
+CREATE TRIGGER trg_code_entities_tombstone
+    AFTER DELETE ON code_entities
+    FOR EACH ROW EXECUTE FUNCTION record_code_entity_tombstone();
+
+DROP TRIGGER IF EXISTS trg_code_relationships_tombstone ON code_relationships;
+CREATE TRIGGER trg_code_relationships_tombstone
+    AFTER DELETE ON code_relationships
+    FOR EACH ROW EXECUTE FUNCTION record_code_relationship_tombstone();
+
+-- Persisted high-water mark per sync stream
+CREATE TABLE IF NOT EXISTS code_graph_sync_state (
+    sync_key TEXT PRIMARY KEY,
+    high_water_mark TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,23 @@
+-- Migration: 030_learned_patterns_query_keyset_index
+-- Description: Composite index for keyset pagination of the pattern query API
+-- Author: omniintelligence
+--
+-- Dependencies: 005_create_learned_patterns.sql
+-- Note: Indexes exactly the expressions used by the query_patterns /
+--       query_patterns_after repository operations: ORDER BY (status rank,
+--       -confidence, id) and the keyset row comparison
+--       (rank, -confidence, id) > ($6, -$7, $8), under their fixed filters
+--       (current validated/provisional rows). A cursor page is then an index
+--       range scan instead of an OFFSET skip over earlier rows.
+
+-- ============================================================================
+-- Keyset index for GET /api/v1/patterns
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_learned_patterns_query_keyset
+    ON learned_patterns (
+        (CASE WHEN status = 'validated' THEN 0 ELSE 1 END),
+        (-confidence),
+        id
+    )
+    WHERE is_current = TRUE AND status IN ('validated', 'provisional');
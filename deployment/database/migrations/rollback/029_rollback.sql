@@ -0,0 +1,18 @@
+-- Rollback Migration 029: Code graph incremental sync
+
+-- Drop triggers and trigger functions first
+DROP TRIGGER IF EXISTS trg_code_relationships_tombstone ON code_relationships;
+DROP TRIGGER IF EXISTS trg_code_entities_tombstone ON code_entities;
+DROP FUNCTION IF EXISTS record_code_relationship_tombstone();
+DROP FUNCTION IF EXISTS record_code_entity_tombstone();
+
+-- Drop indexes
+DROP INDEX IF EXISTS idx_code_relationship_tombstones_deleted_at;
+DROP INDEX IF EXISTS idx_code_entity_tombstones_deleted_at;
+DROP INDEX IF EXISTS idx_code_relationships_updated_at_id;
+DROP INDEX IF EXISTS idx_code_entities_updated_at_id;
+
+-- Drop tables
+DROP TABLE IF EXISTS code_graph_sync_state;
+DROP TABLE IF EXISTS code_relationship_tombstones;
+DROP TABLE IF EXISTS code_entity_tombstones;
@@ -0,0 +1,3 @@
+-- Rollback: 030_learned_patterns_query_keyset_index
+
+DROP INDEX IF EXISTS idx_learned_patterns_query_keyset;
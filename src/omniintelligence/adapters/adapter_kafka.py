@@ -9,6 +9,7 @@ operations using confluent-kafka.
 
 Supported Operations:
     - produce: Produce a message to a topic
+    - produce_batch: Produce many messages and await all delivery reports
     - consume: Consume messages from subscribed topics
 
 Config Keys:
@@ -17,6 +18,17 @@ Config Keys:
     - producer_config (dict, optional): Additional producer configuration
     - consumer_config (dict, optional): Additional consumer configuration
     - group_id (str, optional): Consumer group ID (required for consume)
+    - async_mode (bool, optional): Pipelined producer/consumer mode (default: False)
+
+Async Mode:
+    With ``async_mode`` enabled, a background thread polls the producer and
+    resolves one asyncio future per message from the delivery callback, so
+    produce never flushes and never blocks the event loop. linger.ms and
+    batch.num.messages default to batching-friendly values (overridable via
+    producer_config) and actually take effect because messages are no longer
+    flushed one at a time. The consumer only resubscribes when the requested
+    topics change and fetches with a single batched ``consume()`` call in a
+    worker thread.
 
 Params Keys:
     For produce:
@@ -25,6 +37,9 @@ Params Keys:
         - value (dict, required): Message value (JSON-serialized)
         - headers (dict, optional): Message headers
 
+    For produce_batch:
+        - messages (list[dict], required): Produce params, one per message
+
     For consume:
         - topics (list[str], required): Topics to subscribe to
         - timeout (float, optional): Poll timeout in seconds (default: 1.0)
@@ -36,8 +51,10 @@ Reference:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import threading
 from typing import Any, cast
 
 from confluent_kafka import Consumer, KafkaError, KafkaException, Producer
@@ -52,11 +69,19 @@ logger = logging.getLogger(__name__)
 # Constants
 # =============================================================================
 
-VALID_OPERATIONS = frozenset({"produce", "consume"})
+VALID_OPERATIONS = frozenset({"produce", "produce_batch", "consume"})
 DEFAULT_CLIENT_ID = "onex-protocol-handler"
 DEFAULT_POLL_TIMEOUT = 1.0
 DEFAULT_MAX_MESSAGES = 1
 
+# Async mode
+ASYNC_PRODUCER_DEFAULTS: dict[str, Any] = {
+    "linger.ms": 5,
+    "batch.num.messages": 10000,
+}
+PRODUCER_POLL_INTERVAL = 0.1
+QUEUE_FULL_BACKOFF = 0.01
+
 
 # =============================================================================
 # Handler Implementation
@@ -70,16 +95,16 @@ class KafkaHandler:
     created; the consumer is only created when a group_id is provided.
 
     Thread Safety:
-        confluent-kafka Producer and Consumer are NOT thread-safe but
-        are safe for sequential use from a single coroutine. Operations
-        run synchronously in the event loop (confluent-kafka does not
-        provide native async). For production use, consider wrapping
-        in run_in_executor.
+        In the default mode, operations run synchronously in the event loop
+        and produce flushes after every message. In async mode, the producer
+        is shared with a background poll thread (librdkafka producers are
+        thread-safe) and consume calls are serialized by an asyncio lock
+        before being handed to a worker thread.
 
     Note:
-        This handler uses synchronous confluent-kafka calls. For high-throughput
-        scenarios, the caller should run operations via asyncio.to_thread()
-        or use the ONEX event bus abstraction instead.
+        The default mode is kept for low-volume callers that want a delivery
+        report per call with no background thread. High-throughput callers
+        should connect with ``async_mode=True``.
     """
 
     def __init__(self) -> None:
@@ -87,6 +112,11 @@ class KafkaHandler:
         self._consumer: Consumer | None = None
         self._bootstrap_servers: str = ""
         self._connected: bool = False
+        self._async_mode: bool = False
+        self._poll_thread: threading.Thread | None = None
+        self._poll_stop = threading.Event()
+        self._consume_lock = asyncio.Lock()
+        self._subscribed_topics: list[str] | None = None
 
     async def connect(self, config: dict[str, Any]) -> None:
         """Create Kafka producer and optionally consumer.
@@ -98,6 +128,8 @@ class KafkaHandler:
                 - producer_config (dict, optional): Additional producer config.
                 - consumer_config (dict, optional): Additional consumer config.
                 - group_id (str, optional): Consumer group (enables consumer).
+                - async_mode (bool, optional): Enable the pipelined
+                  producer and batched consumer.
 
         Raises:
             ConnectionError: If bootstrap_servers is missing.
@@ -108,11 +140,13 @@ class KafkaHandler:
 
         client_id = config.get("client_id", DEFAULT_CLIENT_ID)
         self._bootstrap_servers = str(bootstrap_servers)
+        self._async_mode = bool(config.get("async_mode", False))
 
         # Build producer config
         producer_conf: dict[str, Any] = {
             "bootstrap.servers": self._bootstrap_servers,
             "client.id": f"{client_id}-producer",
+            **(ASYNC_PRODUCER_DEFAULTS if self._async_mode else {}),
             **(config.get("producer_config", {})),
         }
 
@@ -136,15 +170,31 @@ class KafkaHandler:
             except KafkaException as exc:
                 raise ConnectionError(f"Kafka consumer creation failed: {exc}") from exc
 
+        if self._async_mode:
+            self._poll_stop.clear()
+            self._poll_thread = threading.Thread(
+                target=self._poll_loop,
+                args=(self._producer,),
+                name=f"{client_id}-producer-poll",
+                daemon=True,
+            )
+            self._poll_thread.start()
+
         self._connected = True
         logger.info(
             "Kafka handler connected",
             extra={
                 "bootstrap_servers": self._bootstrap_servers,
                 "has_consumer": self._consumer is not None,
+                "async_mode": self._async_mode,
             },
         )
 
+    def _poll_loop(self, producer: Producer) -> None:
+        """Serve producer delivery callbacks until disconnect."""
+        while not self._poll_stop.is_set():
+            producer.poll(PRODUCER_POLL_INTERVAL)
+
     async def execute(
         self,
         operation: str,
@@ -155,12 +205,14 @@ class KafkaHandler:
         """Execute a Kafka operation.
 
         Args:
-            operation: "produce" or "consume".
+            operation: "produce", "produce_batch" or "consume".
             params: Operation parameters (see module docstring).
             correlation_id: Optional correlation ID added to message headers.
 
         Returns:
             For produce: dict with "topic", "partition", "offset".
+            For produce_batch: dict with "results" (one delivery report per
+                message, in input order), "delivered" and "failed" counts.
             For consume: dict with "messages" (list of message dicts).
 
         Raises:
@@ -175,29 +227,31 @@ class KafkaHandler:
                 f"Unsupported Kafka operation: {operation}. Must be one of {VALID_OPERATIONS}"
             )
 
+        if self._async_mode:
+            if operation == "produce":
+                return await self._produce_async(params, correlation_id=correlation_id)
+            if operation == "produce_batch":
+                return await self._produce_batch_async(
+                    params, correlation_id=correlation_id
+                )
+            return await self._consume_async(params, correlation_id=correlation_id)
+
         if operation == "produce":
             return self._produce(params, correlation_id=correlation_id)
-        else:
-            return self._consume(params, correlation_id=correlation_id)
+        if operation == "produce_batch":
+            return self._produce_batch(params, correlation_id=correlation_id)
+        return self._consume(params, correlation_id=correlation_id)
 
-    def _produce(
-        self,
+    # =========================================================================
+    # Produce
+    # =========================================================================
+
+    @staticmethod
+    def _build_message(
         params: dict[str, Any],
-        *,
-        correlation_id: str | None = None,
+        correlation_id: str | None,
     ) -> dict[str, Any]:
-        """Produce a message to a Kafka topic.
-
-        Args:
-            params: Must contain "topic" and "value".
-            correlation_id: Added to headers if provided.
-
-        Returns:
-            dict with "topic", "delivered" status.
-        """
-        if self._producer is None:
-            raise RuntimeError("Kafka producer is not initialized")
-
+        """Validate produce params and serialize them to producer kwargs."""
         topic = params.get("topic")
         if not topic:
             raise ValueError("KafkaHandler produce requires 'topic' in params")
@@ -226,37 +280,181 @@ class KafkaHandler:
             for k, v in headers.items()
         ]
 
-        delivery_result: dict[str, Any] = {"topic": topic, "delivered": False}
+        return {
+            "topic": topic,
+            "key": key_bytes,
+            "value": value_bytes,
+            "headers": header_list if header_list else None,
+        }
 
-        def on_delivery(err: Any, msg: Any) -> None:
-            if err is not None:
-                delivery_result["error"] = str(err)
-            else:
-                delivery_result["delivered"] = True
-                delivery_result["partition"] = msg.partition()
-                delivery_result["offset"] = msg.offset()
-
-        self._producer.produce(
-            topic=topic,
-            key=key_bytes,
-            value=value_bytes,
-            headers=header_list if header_list else None,
-            on_delivery=on_delivery,
+    @staticmethod
+    def _delivery_report(topic: str, err: Any, msg: Any) -> dict[str, Any]:
+        """Convert a delivery callback into the produce result dict."""
+        if err is not None:
+            return {"topic": topic, "delivered": False, "error": str(err)}
+        return {
+            "topic": topic,
+            "delivered": True,
+            "partition": msg.partition(),
+            "offset": msg.offset(),
+        }
+
+    def _produce(
+        self,
+        params: dict[str, Any],
+        *,
+        correlation_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Produce a message to a Kafka topic.
+
+        Args:
+            params: Must contain "topic" and "value".
+            correlation_id: Added to headers if provided.
+
+        Returns:
+            dict with "topic", "delivered" status.
+        """
+        result = self._produce_batch(
+            {"messages": [params]}, correlation_id=correlation_id
         )
+        delivery_result: dict[str, Any] = result["results"][0]
+        return delivery_result
+
+    def _produce_batch(
+        self,
+        params: dict[str, Any],
+        *,
+        correlation_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Produce messages and flush once for the whole batch.
+
+        Args:
+            params: Must contain "messages".
+            correlation_id: Added to every message's headers if provided.
+
+        Returns:
+            dict with "results", "delivered" and "failed".
+        """
+        if self._producer is None:
+            raise RuntimeError("Kafka producer is not initialized")
+
+        messages = [
+            self._build_message(message_params, correlation_id)
+            for message_params in self._batch_messages(params)
+        ]
+        results: list[dict[str, Any]] = [
+            {"topic": message["topic"], "delivered": False} for message in messages
+        ]
+
+        for index, message in enumerate(messages):
+
+            def on_delivery(
+                err: Any, msg: Any, index: int = index, topic: str = message["topic"]
+            ) -> None:
+                results[index] = self._delivery_report(topic, err, msg)
+
+            while True:
+                try:
+                    self._producer.produce(**message, on_delivery=on_delivery)
+                    break
+                except BufferError:
+                    # Local queue is full: serve callbacks to drain it.
+                    self._producer.poll(PRODUCER_POLL_INTERVAL)
 
-        # Flush to ensure delivery callback fires
+        # Flush to ensure delivery callbacks fire
         self._producer.flush(timeout=10.0)
 
+        return self._batch_summary(results, correlation_id)
+
+    async def _produce_async(
+        self,
+        params: dict[str, Any],
+        *,
+        correlation_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Produce a message and await its delivery report without flushing."""
+        message = self._build_message(params, correlation_id)
+        return await self._enqueue(message)
+
+    async def _produce_batch_async(
+        self,
+        params: dict[str, Any],
+        *,
+        correlation_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Enqueue every message, then await all delivery reports together."""
+        messages = [
+            self._build_message(message_params, correlation_id)
+            for message_params in self._batch_messages(params)
+        ]
+        pending = [asyncio.ensure_future(self._enqueue(m)) for m in messages]
+        results = list(await asyncio.gather(*pending))
+        return self._batch_summary(results, correlation_id)
+
+    async def _enqueue(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Hand one message to the producer and return its delivery future.
+
+        The delivery callback runs on the poll thread, so it resolves the
+        future through ``call_soon_threadsafe``.
+        """
+        if self._producer is None:
+            raise RuntimeError("Kafka producer is not initialized")
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        topic = message["topic"]
+
+        def resolve(report: dict[str, Any]) -> None:
+            if not future.done():
+                future.set_result(report)
+
+        def on_delivery(err: Any, msg: Any) -> None:
+            loop.call_soon_threadsafe(resolve, self._delivery_report(topic, err, msg))
+
+        while True:
+            try:
+                self._producer.produce(**message, on_delivery=on_delivery)
+                break
+            except BufferError:
+                # Local queue is full: yield while the poll thread drains it.
+                await asyncio.sleep(QUEUE_FULL_BACKOFF)
+
+        return await future
+
+    @staticmethod
+    def _batch_messages(params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return the per-message params of a produce_batch request."""
+        messages = params.get("messages")
+        if not messages:
+            raise ValueError("KafkaHandler produce_batch requires 'messages' in params")
+        return list(messages)
+
+    @staticmethod
+    def _batch_summary(
+        results: list[dict[str, Any]],
+        correlation_id: str | None,
+    ) -> dict[str, Any]:
+        """Build the produce_batch result and log the delivery counts."""
+        delivered = sum(1 for result in results if result["delivered"])
+
         logger.debug(
             "Kafka produce completed",
             extra={
-                "topic": topic,
-                "delivered": delivery_result.get("delivered", False),
+                "message_count": len(results),
+                "delivered": delivered,
                 "correlation_id": correlation_id,
             },
         )
 
-        return delivery_result
+        return {
+            "results": results,
+            "delivered": delivered,
+            "failed": len(results) - delivered,
+        }
+
+    # =========================================================================
+    # Consume
+    # =========================================================================
 
     def _consume(
         self,
@@ -297,29 +495,66 @@ class KafkaHandler:
                 if err.code() == KafkaError._PARTITION_EOF:
                     break
                 raise ConnectionError(f"Kafka consumer error: {err}")
+            messages.append(self._decode_message(msg))
 
-            raw_key = msg.key()
-            raw_value = msg.value()
-            msg_dict: dict[str, Any] = {
-                "topic": msg.topic(),
-                "partition": msg.partition(),
-                "offset": msg.offset(),
-                "key": raw_key.decode("utf-8") if raw_key is not None else None,
-                "value": json.loads(raw_value.decode("utf-8"))
-                if raw_value is not None
-                else None,
-            }
+        logger.debug(
+            "Kafka consume completed",
+            extra={
+                "message_count": len(messages),
+                "correlation_id": correlation_id,
+            },
+        )
 
-            # Parse headers
-            raw_headers = msg.headers()
-            if raw_headers is not None:
-                headers_list = cast(list[tuple[str, str | bytes | None]], raw_headers)
-                msg_dict["headers"] = {
-                    k: v.decode("utf-8") if isinstance(v, bytes) else v
-                    for k, v in headers_list
-                }
+        return {"messages": messages}
+
+    async def _consume_async(
+        self,
+        params: dict[str, Any],
+        *,
+        correlation_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Consume up to max_messages with one batched fetch.
 
-            messages.append(msg_dict)
+        Subscribes only when the requested topics differ from the current
+        subscription, and runs the blocking fetch in a worker thread.
+
+        Args:
+            params: Must contain "topics".
+            correlation_id: For logging only.
+
+        Returns:
+            dict with "messages" list.
+        """
+        consumer = self._consumer
+        if consumer is None:
+            raise RuntimeError(
+                "Kafka consumer is not initialized. Provide 'group_id' in connect config."
+            )
+
+        topics = params.get("topics")
+        if not topics:
+            raise ValueError("KafkaHandler consume requires 'topics' in params")
+
+        timeout = params.get("timeout", DEFAULT_POLL_TIMEOUT)
+        max_messages = params.get("max_messages", DEFAULT_MAX_MESSAGES)
+
+        async with self._consume_lock:
+            if self._subscribed_topics != list(topics):
+                consumer.subscribe(list(topics))
+                self._subscribed_topics = list(topics)
+
+            batch = await asyncio.to_thread(
+                consumer.consume, num_messages=max_messages, timeout=timeout
+            )
+
+        messages: list[dict[str, Any]] = []
+        for msg in batch:
+            err = msg.error()
+            if err is not None:
+                if err.code() == KafkaError._PARTITION_EOF:
+                    continue
+                raise ConnectionError(f"Kafka consumer error: {err}")
+            messages.append(self._decode_message(msg))
 
         logger.debug(
             "Kafka consume completed",
@@ -331,14 +566,54 @@ class KafkaHandler:
 
         return {"messages": messages}
 
+    @staticmethod
+    def _decode_message(msg: Any) -> dict[str, Any]:
+        """Decode a consumed message's key, JSON value and headers."""
+        raw_key = msg.key()
+        raw_value = msg.value()
+        msg_dict: dict[str, Any] = {
+            "topic": msg.topic(),
+            "partition": msg.partition(),
+            "offset": msg.offset(),
+            "key": raw_key.decode("utf-8") if raw_key is not None else None,
+            "value": json.loads(raw_value.decode("utf-8"))
+            if raw_value is not None
+            else None,
+        }
+
+        # Parse headers
+        raw_headers = msg.headers()
+        if raw_headers is not None:
+            headers_list = cast(list[tuple[str, str | bytes | None]], raw_headers)
+            msg_dict["headers"] = {
+                k: v.decode("utf-8") if isinstance(v, bytes) else v
+                for k, v in headers_list
+            }
+
+        return msg_dict
+
     async def disconnect(self) -> None:
-        """Close Kafka producer and consumer."""
+        """Close Kafka producer and consumer.
+
+        In async mode the poll thread is stopped first and the final flush
+        runs in a worker thread; outstanding delivery futures resolve from
+        the flush's callbacks.
+        """
         if self._consumer is not None:
             self._consumer.close()
             self._consumer = None
+            self._subscribed_topics = None
+
+        if self._poll_thread is not None:
+            self._poll_stop.set()
+            await asyncio.to_thread(self._poll_thread.join)
+            self._poll_thread = None
 
         if self._producer is not None:
-            self._producer.flush(timeout=5.0)
+            if self._async_mode:
+                await asyncio.to_thread(self._producer.flush, 5.0)
+            else:
+                self._producer.flush(timeout=5.0)
             self._producer = None
 
         self._connected = False
@@ -348,8 +623,13 @@ class KafkaHandler:
         """Check if the Kafka handler is connected.
 
         Returns:
-            True if the handler is connected and the producer exists.
+            True if the handler is connected and the producer exists (and,
+            in async mode, the poll thread is alive).
         """
+        if self._async_mode and (
+            self._poll_thread is None or not self._poll_thread.is_alive()
+        ):
+            return False
         return self._connected and self._producer is not None
 
 
@@ -19,6 +19,7 @@ import asyncpg
 from fastapi import HTTPException
 from pydantic import ValidationError
 
+from omniintelligence.api.model_pattern_query_cursor import ModelPatternQueryCursor
 from omniintelligence.api.model_pattern_query_page import ModelPatternQueryPage
 from omniintelligence.api.model_pattern_query_response import ModelPatternQueryResponse
 
@@ -50,11 +51,13 @@ async def handle_query_patterns(
     min_confidence: float = 0.7,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> ModelPatternQueryPage:
     """Query validated/provisional patterns from the pattern store.
 
-    Delegates to AdapterPatternStore.query_patterns and transforms
-    raw database rows into typed response models.
+    Delegates to AdapterPatternStore.query_patterns (offset paging) or, when a
+    cursor is given, AdapterPatternStore.query_patterns_after (keyset paging),
+    and transforms raw database rows into typed response models.
 
     Args:
         adapter: Pattern store adapter for database access.
@@ -62,29 +65,59 @@ async def handle_query_patterns(
         language: Optional language filter (matched against keywords).
         min_confidence: Minimum confidence threshold (default 0.7).
         limit: Maximum results per page (1-200, default 50).
-        offset: Pagination offset (default 0).
+        offset: Pagination offset (default 0). Must be 0 when cursor is set.
+        cursor: Opaque cursor from a previous page's next_cursor.
 
     Returns:
         Paginated response with matching patterns.
     """
     logger.debug(
         "Querying patterns: domain=%s language=%s min_confidence=%.2f "
-        "limit=%d offset=%d",
+        "limit=%d offset=%d cursor=%s",
         domain,
         language,
         min_confidence,
         limit,
         offset,
+        cursor is not None,
     )
 
+    after: ModelPatternQueryCursor | None = None
+    if cursor is not None:
+        if offset != 0:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    "Invalid query parameters: offset cannot be combined with cursor"
+                ),
+            )
+        try:
+            after = ModelPatternQueryCursor.decode(cursor)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid query parameters: {exc}",
+            )
+
     try:
-        rows = await adapter.query_patterns(
-            domain=domain,
-            language=language,
-            min_confidence=min_confidence,
-            limit=limit,
-            offset=offset,
-        )
+        if after is None:
+            rows = await adapter.query_patterns(
+                domain=domain,
+                language=language,
+                min_confidence=min_confidence,
+                limit=limit,
+                offset=offset,
+            )
+        else:
+            rows = await adapter.query_patterns_after(
+                domain=domain,
+                language=language,
+                min_confidence=min_confidence,
+                limit=limit,
+                after_status_rank=after.status_rank,
+                after_confidence=after.confidence,
+                after_id=after.id,
+            )
     except PatternQueryValidationError as exc:
         logger.warning("Invalid query parameters: %s", exc)
         raise HTTPException(
@@ -111,11 +144,21 @@ async def handle_query_patterns(
             detail="Pattern query returned rows with unexpected schema.",
         )
 
+    next_cursor: str | None = None
+    if patterns and len(patterns) >= limit:
+        last = patterns[-1]
+        next_cursor = ModelPatternQueryCursor.from_pattern(
+            status=last.status,
+            confidence=last.confidence,
+            pattern_id=last.id,
+        ).encode()
+
     return ModelPatternQueryPage(
         patterns=patterns,
         total_returned=len(patterns),
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Opaque keyset cursor for the pattern query API.
+
+A cursor identifies the last row of a page by its position in the
+query_patterns ORDER BY: (status rank, confidence DESC, id ASC). It is
+serialized as URL-safe base64 JSON so clients treat it as an opaque token.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+_CURSOR_VERSION = 1
+
+# Status rank used by the query_patterns ORDER BY (validated sorts first)
+_STATUS_RANK: dict[str, Literal[0, 1]] = {"validated": 0, "provisional": 1}
+
+
+class ModelPatternQueryCursor(BaseModel):
+    """Keyset position of the last pattern on a page."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    status_rank: Literal[0, 1] = Field(
+        ...,
+        description="0 for validated, 1 for provisional",
+    )
+    confidence: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Confidence of the last pattern on the page",
+    )
+    id: UUID = Field(..., description="ID of the last pattern on the page")
+
+    @classmethod
+    def from_pattern(
+        cls, *, status: str, confidence: float, pattern_id: UUID
+    ) -> ModelPatternQueryCursor:
+        """Build the cursor that resumes after the given pattern."""
+        return cls(
+            status_rank=_STATUS_RANK[status],
+            confidence=confidence,
+            id=pattern_id,
+        )
+
+    def encode(self) -> str:
+        """Serialize to an opaque URL-safe token."""
+        payload = {
+            "v": _CURSOR_VERSION,
+            "r": self.status_rank,
+            "c": self.confidence,
+            "i": str(self.id),
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> ModelPatternQueryCursor:
+        """Parse a token produced by encode().
+
+        Raises:
+            ValueError: If the token is malformed or from another cursor version.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise ValueError("malformed cursor") from exc
+        if not isinstance(payload, dict) or payload.get("v") != _CURSOR_VERSION:
+            raise ValueError("unsupported cursor version")
+        try:
+            return cls(
+                status_rank=payload.get("r"),
+                confidence=payload.get("c"),
+                id=payload.get("i"),
+            )
+        except ValidationError as exc:
+            raise ValueError("malformed cursor") from exc
+
+
+__all__ = ["ModelPatternQueryCursor"]
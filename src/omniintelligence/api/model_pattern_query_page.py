@@ -16,8 +16,9 @@ from omniintelligence.api.model_pattern_query_response import ModelPatternQueryR
 class ModelPatternQueryPage(BaseModel):
     """Paginated response for pattern queries.
 
-    Wraps a list of pattern results with pagination metadata
-    to support cursor-free offset-based pagination.
+    Wraps a list of pattern results with pagination metadata. Supports
+    offset-based pagination and keyset pagination: pass ``next_cursor`` back
+    as the ``cursor`` request parameter to fetch the following page.
     """
 
     model_config = ConfigDict(
@@ -48,6 +49,13 @@ class ModelPatternQueryPage(BaseModel):
         ge=0,
         description="Number of patterns skipped (request parameter)",
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description=(
+            "Opaque cursor for the next page. None when this page is not full, "
+            "i.e. there are no further results."
+        ),
+    )
 
 
 __all__ = ["ModelPatternQueryPage"]
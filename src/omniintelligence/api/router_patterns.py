@@ -61,7 +61,9 @@ def create_pattern_router(
         description=(
             "Query validated and provisional patterns applicable to a domain "
             "and language. Returns paginated results filtered by minimum "
-            "confidence threshold. Used by compliance/enforcement nodes."
+            "confidence threshold. Page with offset, or pass next_cursor "
+            "back as cursor for keyset pagination. Used by "
+            "compliance/enforcement nodes."
         ),
     )
     async def get_patterns(
@@ -105,6 +107,18 @@ def create_pattern_router(
                 description="Number of patterns to skip for pagination",
             ),
         ] = 0,
+        cursor: Annotated[
+            str | None,
+            Query(
+                min_length=1,
+                max_length=512,
+                description=(
+                    "Opaque keyset cursor from a previous page's next_cursor. "
+                    "Preferred over offset for deep pagination; cannot be "
+                    "combined with a non-zero offset."
+                ),
+            ),
+        ] = None,
     ) -> ModelPatternQueryPage:
         """Query patterns for enforcement/compliance.
 
@@ -118,6 +132,7 @@ def create_pattern_router(
             min_confidence=min_confidence,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
     return router
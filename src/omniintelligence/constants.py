@@ -176,6 +176,23 @@ needing direct DB access.
 Deletion ticket: OMN-1546
 """
 
+TOPIC_SUFFIX_PATTERN_PROJECTION_DELTA_V1: str = (
+    "onex.evt.omniintelligence.pattern-projection-delta.v1"
+)
+"""
+TEMP_BOOTSTRAP: Canonical topic for per-pattern projection deltas (OUTPUT).
+
+Canonical topic: onex.evt.omniintelligence.pattern-projection-delta.v1
+
+In delta projection mode, NodePatternProjectionEffect publishes one
+ModelPatternProjectionDeltaEvent per changed pattern, keyed by pattern id.
+The topic is intended to be log-compacted so consumers can rebuild the
+current projection by reading the latest record per key; full snapshots on
+the pattern-projection topic become periodic rebuilds.
+
+Deletion ticket: OMN-1546
+"""
+
 TOPIC_SUFFIX_PATTERN_LIFECYCLE_TRANSITIONED_V1: str = (
     "onex.evt.omniintelligence.pattern-lifecycle-transitioned.v1"
 )
@@ -670,6 +687,7 @@ __all__ = [
     "TOPIC_SUFFIX_PATTERN_DEPRECATED_V1",
     "TOPIC_SUFFIX_PATTERN_LEARNING_CMD_V1",
     "TOPIC_SUFFIX_PATTERN_LIFECYCLE_TRANSITIONED_V1",
+    "TOPIC_SUFFIX_PATTERN_PROJECTION_DELTA_V1",
     "TOPIC_SUFFIX_PATTERN_PROJECTION_V1",
     "TOPIC_SUFFIX_PATTERN_PROMOTED_V1",
     "TOPIC_SUFFIX_PATTERN_STORED_V1",
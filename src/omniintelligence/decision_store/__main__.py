@@ -19,6 +19,10 @@ Environment Variables:
         (default: 8091).
     DECISION_STORE_HEALTH_CHECK_HOST: Health check bind host
         (default: 0.0.0.0).
+    DECISION_STORE_LOG_PATH: Append-only decision log replayed on startup
+        (default: unset, records are kept in memory only).
+    DECISION_STORE_MAX_RECORDS: Records retained before the oldest are
+        evicted (default: 100000).
 
 Related:
     - OMN-6608: Add health endpoint to decision_store consumer
@@ -46,6 +50,7 @@ async def _run() -> None:
 
     from omniintelligence.decision_store.consumer import DecisionRecordConsumer
     from omniintelligence.decision_store.repository import (
+        DEFAULT_MAX_RECORDS,
         DecisionRecordRepository,
     )
     from omniintelligence.decision_store.topics import DecisionTopics
@@ -76,6 +81,14 @@ async def _run() -> None:
         "DECISION_STORE_HEALTH_CHECK_HOST",
         "0.0.0.0",  # noqa: S104 — Docker bind
     )
+    log_path = os.environ.get(  # ONEX_FLAG_EXEMPT: config
+        "DECISION_STORE_LOG_PATH", ""
+    )
+    max_records = int(
+        os.environ.get(
+            "DECISION_STORE_MAX_RECORDS", str(DEFAULT_MAX_RECORDS)
+        )  # ONEX_FLAG_EXEMPT: config
+    )
 
     # --- Shutdown coordination ---
     shutdown_event = asyncio.Event()
@@ -95,9 +108,12 @@ async def _run() -> None:
 
     # --- Repository + Consumer ---
     # TODO(OMN-6608): Replace with PostgreSQL-backed repository once
-    # migration freeze is lifted. For now, use in-memory repository.
+    # migration freeze is lifted. For now, use the in-memory repository,
+    # persisted to a local append-only log when DECISION_STORE_LOG_PATH is set.
     _ = pool  # Pool reserved for future PostgreSQL backend
-    repository = DecisionRecordRepository()
+    repository = DecisionRecordRepository(
+        log_path=log_path or None, max_records=max_records
+    )
     consumer = DecisionRecordConsumer(repository=repository)
 
     # --- Kafka consumer (aiokafka) ---
@@ -194,6 +210,7 @@ async def _run() -> None:
         await kafka_consumer.stop()
 
     await runner.cleanup()
+    repository.close()
     await pool.close()
     logger.info("Shutdown complete")
 
@@ -4,7 +4,8 @@
 """CRUD and query operations for DecisionRecord storage.
 
 Provides the DecisionRecordRepository — an in-memory repository (backed by a
-dict) for storing, querying, and retrieving DecisionRecords.
+dict) for storing, querying, and retrieving DecisionRecords, optionally
+persisted to an append-only JSON Lines log.
 
 Design Decision:
     Migration freeze is active (``.migration_freeze``). No new SQL migrations
@@ -17,6 +18,27 @@ Query Support:
     - By decision_type + time range (paginated)
     - By selected_candidate + time range (paginated)
 
+Indexing:
+    Per-type and per-candidate secondary indexes hold ``(stored_at,
+    decision_id)`` keys in sorted order. Range and cursor bounds are found
+    by bisection, so a page costs O(log n + page) instead of a full scan.
+    Records normally arrive in stored_at order and are appended to the
+    indexes; only late records pay for an insertion into the middle.
+
+Retention:
+    At most ``max_records`` records are held. When the bound is exceeded,
+    the oldest records (by stored_at) are evicted in one batch down to
+    90% of the bound, so eviction cost is amortized across inserts.
+
+Persistence:
+    When ``log_path`` is given, every stored record is appended to the log
+    as one JSON line. On startup the log is replayed line by line and the
+    indexes are rebuilt with a single sort. A torn final line (crash
+    mid-write) is truncated away; malformed complete lines are skipped with
+    a warning. The log is compacted (rewritten with the retained records
+    and atomically replaced) on startup when it holds stale lines, and at
+    runtime once it grows past twice ``max_records`` lines.
+
 Layer Separation:
     - get_record(decision_id, include_rationale=False) → Layer 1 only
     - get_record(decision_id, include_rationale=True) → Full record
@@ -26,9 +48,14 @@ Ticket: OMN-2467
 
 from __future__ import annotations
 
+import bisect
+import json
 import logging
+import os
+from collections import defaultdict
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import IO, Any
 
 from omniintelligence.decision_store.models import (
     DecisionRecordCursor,
@@ -43,6 +70,23 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_PAGE_SIZE = 50
 
+# ---------------------------------------------------------------------------
+# Default retention bound (records held in memory and kept in the log)
+# ---------------------------------------------------------------------------
+
+DEFAULT_MAX_RECORDS = 100_000
+
+# Secondary index key: records are ordered by stored_at, then decision_id.
+_IndexKey = tuple[datetime, str]
+
+
+def _index_insert(index: list[_IndexKey], key: _IndexKey) -> None:
+    """Insert ``key`` into a sorted index, appending when it sorts last."""
+    if not index or index[-1] < key:
+        index.append(key)
+    else:
+        bisect.insort(index, key)
+
 
 # ---------------------------------------------------------------------------
 # DecisionRecordRepository
@@ -66,12 +110,48 @@ class DecisionRecordRepository:
     Layer Separation:
         ``get_record`` enforces Layer 1/Layer 2 separation via the
         ``include_rationale`` flag.
+
+    Retention:
+        At most ``max_records`` records are kept; the oldest by stored_at
+        are evicted first. Evicted records are no longer returned by reads
+        and are dropped from the log at the next compaction.
+
+    Args:
+        log_path: Optional append-only JSON Lines log. Existing records are
+            replayed from it on construction and new records are appended.
+            When None, records live in memory only.
+        max_records: Maximum number of records retained.
+
+    Raises:
+        ValueError: If ``max_records`` < 1.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty in-memory decision record store."""
+    def __init__(
+        self,
+        log_path: Path | str | None = None,
+        *,
+        max_records: int = DEFAULT_MAX_RECORDS,
+    ) -> None:
+        """Initialize the store, replaying ``log_path`` if it exists."""
+        if max_records < 1:
+            raise ValueError(f"max_records must be >= 1, got {max_records}")
+        self._max_records = max_records
         # decision_id → DecisionRecordRow
         self._records: dict[str, DecisionRecordRow] = {}
+        # All records, sorted (stored_at, decision_id); drives eviction
+        self._by_stored: list[_IndexKey] = []
+        # decision_type / selected_candidate → sorted (stored_at, decision_id)
+        self._by_type: defaultdict[str, list[_IndexKey]] = defaultdict(list)
+        self._by_candidate: defaultdict[str, list[_IndexKey]] = defaultdict(list)
+        self._log_path = Path(log_path) if log_path is not None else None
+        self._log: IO[str] | None = None
+        # Complete lines in the log, live or not
+        self._log_lines = 0
+        if self._log_path is not None:
+            if self._replay_log(self._log_path):
+                self._compact_log(self._log_path)
+            else:
+                self._log = self._log_path.open("a", encoding="utf-8")
 
     # ------------------------------------------------------------------
     # Write Operations
@@ -104,12 +184,32 @@ class DecisionRecordRepository:
             )
             return False
 
+        if self._log is not None:
+            self._log.write(
+                json.dumps(record.to_full_dict(), separators=(",", ":")) + "\n"
+            )
+            self._log.flush()
+            self._log_lines += 1
         self._records[record.decision_id] = record
+        key = (record.stored_at, record.decision_id)
+        _index_insert(self._by_stored, key)
+        _index_insert(self._by_type[record.decision_type], key)
+        _index_insert(self._by_candidate[record.selected_candidate], key)
         logger.debug(
             "Stored DecisionRecord. decision_id=%s correlation_id=%s",
             record.decision_id,
             correlation_id,
         )
+        if len(self._records) > self._max_records:
+            self._evict(
+                len(self._records) - (self._max_records - self._max_records // 10)
+            )
+        if (
+            self._log is not None
+            and self._log_path is not None
+            and self._log_lines > 2 * self._max_records
+        ):
+            self._compact_log(self._log_path)
         return True
 
     # ------------------------------------------------------------------
@@ -180,7 +280,7 @@ class DecisionRecordRepository:
             when there are no more pages.
         """
         return self._paginate(
-            filter_fn=lambda r: r.decision_type == decision_type,
+            self._by_type.get(decision_type, []),
             since=since,
             until=until,
             limit=limit,
@@ -215,7 +315,7 @@ class DecisionRecordRepository:
             when there are no more pages.
         """
         return self._paginate(
-            filter_fn=lambda r: r.selected_candidate == selected_candidate,
+            self._by_candidate.get(selected_candidate, []),
             since=since,
             until=until,
             limit=limit,
@@ -232,8 +332,145 @@ class DecisionRecordRepository:
         return len(self._records)
 
     def clear(self) -> None:
-        """Remove all records. For test use only."""
+        """Remove all records (and truncate the log). For test use only."""
         self._records.clear()
+        self._by_stored.clear()
+        self._by_type.clear()
+        self._by_candidate.clear()
+        if self._log is not None:
+            self._log.truncate(0)
+            self._log_lines = 0
+
+    def close(self) -> None:
+        """Close the append log. The in-memory records remain readable."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def _evict(self, count: int) -> None:
+        """Evict the ``count`` oldest records from the store and indexes."""
+        evicted = self._by_stored[:count]
+        del self._by_stored[:count]
+        cutoff = evicted[-1]
+        types: set[str] = set()
+        candidates: set[str] = set()
+        for _, decision_id in evicted:
+            record = self._records.pop(decision_id)
+            types.add(record.decision_type)
+            candidates.add(record.selected_candidate)
+        # Evicted keys are the oldest overall, so they prefix every index
+        for indexes, names in (
+            (self._by_type, types),
+            (self._by_candidate, candidates),
+        ):
+            for name in names:
+                index = indexes[name]
+                del index[: bisect.bisect_right(index, cutoff)]
+                if not index:
+                    del indexes[name]
+        logger.info(
+            "Evicted oldest decision records. evicted=%d retained=%d",
+            len(evicted),
+            len(self._records),
+        )
+
+    # ------------------------------------------------------------------
+    # Log replay and compaction
+    # ------------------------------------------------------------------
+
+    def _replay_log(self, path: Path) -> bool:
+        """Load records from an existing log and rebuild the indexes.
+
+        Returns:
+            True if the log holds lines that are not retained records
+            (evicted, duplicate or malformed) and should be compacted.
+        """
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return False
+
+        with path.open("r+b") as f:
+            complete_end = 0
+            for line_no, line in enumerate(f, start=1):
+                if not line.endswith(b"\n"):
+                    logger.warning(
+                        "Truncating torn trailing line in decision log. "
+                        "path=%s bytes=%d",
+                        path,
+                        len(line),
+                    )
+                    f.truncate(complete_end)
+                    break
+                complete_end += len(line)
+                if not line.strip():
+                    continue
+                self._log_lines += 1
+                try:
+                    record = DecisionRecordRow.from_dict(json.loads(line))
+                except (KeyError, TypeError, ValueError):
+                    logger.warning(
+                        "Skipping malformed decision log line. path=%s line=%d",
+                        path,
+                        line_no,
+                    )
+                    continue
+                self._records.setdefault(record.decision_id, record)
+
+        self._by_stored = sorted(
+            (record.stored_at, record.decision_id) for record in self._records.values()
+        )
+        overflow = len(self._by_stored) - self._max_records
+        if overflow > 0:
+            for _, decision_id in self._by_stored[:overflow]:
+                del self._records[decision_id]
+            del self._by_stored[:overflow]
+        for key in self._by_stored:
+            record = self._records[key[1]]
+            self._by_type[record.decision_type].append(key)
+            self._by_candidate[record.selected_candidate].append(key)
+
+        logger.info(
+            "Replayed decision log. path=%s records=%d evicted=%d",
+            path,
+            len(self._records),
+            max(overflow, 0),
+        )
+        return self._log_lines > len(self._records)
+
+    def _compact_log(self, path: Path) -> None:
+        """Rewrite the log with the retained records and reopen it for append.
+
+        The records are written to a sibling file that atomically replaces
+        the log, so a crash mid-compaction leaves the previous log intact.
+        """
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        tmp_path = path.with_name(path.name + ".compact")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for _, decision_id in self._by_stored:
+                f.write(
+                    json.dumps(
+                        self._records[decision_id].to_full_dict(),
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                )
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(path)
+        logger.info(
+            "Compacted decision log. path=%s lines=%d records=%d",
+            path,
+            self._log_lines,
+            len(self._records),
+        )
+        self._log_lines = len(self._records)
+        self._log = path.open("a", encoding="utf-8")
 
     # ------------------------------------------------------------------
     # Internal pagination helper
@@ -241,7 +478,7 @@ class DecisionRecordRepository:
 
     def _paginate(
         self,
-        filter_fn: Any,
+        index: list[_IndexKey],
         *,
         since: datetime | None,
         until: datetime | None,
@@ -249,10 +486,10 @@ class DecisionRecordRepository:
         cursor: DecisionRecordCursor | None,
         correlation_id: str | None = None,
     ) -> tuple[list[dict[str, Any]], DecisionRecordCursor | None]:
-        """Apply filter and time range, then paginate.
+        """Seek into a sorted secondary index, then read one page.
 
         Args:
-            filter_fn: Callable(DecisionRecordRow) → bool.
+            index: Sorted ``(stored_at, decision_id)`` keys to page over.
             since: Lower bound on stored_at.
             until: Upper bound on stored_at.
             limit: Max results per page.
@@ -262,37 +499,24 @@ class DecisionRecordRepository:
         Returns:
             (page_records, next_cursor) tuple. Layer 1 fields only.
         """
-        # Collect matching records
-        matching = []
-        for record in self._records.values():
-            if not filter_fn(record):
-                continue
-            if since is not None and record.stored_at < since:
-                continue
-            if until is not None and record.stored_at > until:
-                continue
-            matching.append(record)
-
-        # Sort by stored_at ascending for deterministic pagination
-        matching.sort(key=lambda r: (r.stored_at, r.decision_id))
-
-        # Apply cursor (skip records at or before cursor position)
+        start_idx = 0
+        if since is not None:
+            start_idx = bisect.bisect_left(index, since, key=lambda k: k[0])
         if cursor is not None:
-            start_idx = 0
-            for idx, record in enumerate(matching):
-                if record.stored_at > cursor.last_stored_at or (
-                    record.stored_at == cursor.last_stored_at
-                    and record.decision_id > cursor.last_decision_id
-                ):
-                    start_idx = idx
-                    break
-            else:
-                # All records are at or before cursor → empty page
-                start_idx = len(matching)
-            matching = matching[start_idx:]
+            # Skip records at or before the cursor position.
+            start_idx = max(
+                start_idx,
+                bisect.bisect_right(
+                    index, (cursor.last_stored_at, cursor.last_decision_id)
+                ),
+            )
 
         # Take one extra to check for next page
-        page = matching[: limit + 1]
+        page: list[DecisionRecordRow] = []
+        for stored_at, decision_id in index[start_idx : start_idx + limit + 1]:
+            if until is not None and stored_at > until:
+                break
+            page.append(self._records[decision_id])
         has_next = len(page) > limit
         page = page[:limit]
 
@@ -317,6 +541,7 @@ class DecisionRecordRepository:
 
 
 __all__ = [
+    "DEFAULT_MAX_RECORDS",
     "DEFAULT_PAGE_SIZE",
     "DecisionRecordRepository",
 ]
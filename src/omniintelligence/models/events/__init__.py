@@ -64,6 +64,9 @@ from omniintelligence.models.events.model_pattern_discovered_event import (
 from omniintelligence.models.events.model_pattern_lifecycle_event import (
     ModelPatternLifecycleEvent,
 )
+from omniintelligence.models.events.model_pattern_projection_delta_event import (
+    ModelPatternProjectionDeltaEvent,
+)
 from omniintelligence.models.events.model_pattern_projection_event import (
     ModelPatternProjectionEvent,
 )
@@ -100,6 +103,7 @@ __all__ = [
     "ModelSavingsEstimatedEvent",
     "ModelPatternDiscoveredEvent",
     "ModelPatternLifecycleEvent",
+    "ModelPatternProjectionDeltaEvent",
     "ModelPatternProjectionEvent",
     "ModelWasteDetectedEvent",
 ]
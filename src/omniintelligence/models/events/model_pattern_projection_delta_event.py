@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+# Copyright (c) 2025 OmniNode Team
+"""Per-pattern projection delta event model.
+
+Ticket: OMN-2424
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+from uuid import UUID
+
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, model_validator
+
+from omniintelligence.models.repository.model_pattern_summary import ModelPatternSummary
+
+
+class ModelPatternProjectionDeltaEvent(BaseModel):
+    """Change to a single pattern in the materialized projection.
+
+    Published to topic: onex.evt.omniintelligence.pattern-projection-delta.v1
+    (log-compacted, keyed by ``pattern_id``).
+
+    In delta projection mode, NodePatternProjectionEffect publishes one of
+    these per pattern touched by a coalesced burst of lifecycle events,
+    instead of a full snapshot per event. Consumers apply deltas on top of
+    the latest ModelPatternProjectionEvent snapshot:
+
+        - ``operation="upsert"``: the pattern is validated/provisional;
+          replace the cached entry with ``pattern``.
+        - ``operation="remove"``: the pattern left the projection (deprecated,
+          demoted, or deleted); drop the cached entry. ``pattern`` is None.
+
+    Ordering:
+        ``sequence`` increases monotonically per publisher across flushes
+        (a counter seeded from the wall clock, so it also keeps increasing
+        across restarts), so consumers can discard a delta older than the one
+        already applied for the same pattern. A rebuild snapshot carries the
+        sequence of the flush that published it.
+
+    Design notes:
+        - ``projected_at`` must be explicitly injected by the caller.
+        - ``frozen=True`` / ``extra="forbid"`` per the immutable event model
+          standard.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        from_attributes=True,
+    )
+
+    event_type: Literal["PatternProjectionDelta"] = "PatternProjectionDelta"
+
+    pattern_id: UUID = Field(..., description="Pattern UUID (also the Kafka key)")
+    operation: Literal["upsert", "remove"] = Field(
+        ...,
+        description="upsert: pattern is in the projection; remove: it left the projection",
+    )
+    pattern: ModelPatternSummary | None = Field(
+        default=None,
+        description="Current projection row for upserts; None for removals",
+    )
+    sequence: int = Field(
+        ...,
+        ge=0,
+        description="Publisher-monotonic sequence for ordering deltas per pattern",
+    )
+    projected_at: AwareDatetime = Field(
+        ...,
+        description=(
+            "UTC timestamp when the delta was computed. "
+            "Must be explicitly injected by the caller — no datetime.now() default."
+        ),
+    )
+    version: int = Field(
+        default=1,
+        ge=1,
+        description="Delta schema version (monotonic integer, increments on schema changes)",
+    )
+    correlation_id: UUID | None = Field(
+        default=None,
+        description="Correlation ID from the flush that produced this delta",
+    )
+
+    @model_validator(mode="after")
+    def _validate_pattern_matches_operation(self) -> ModelPatternProjectionDeltaEvent:
+        """Upserts carry the pattern row (with a matching id); removals do not."""
+        if self.operation == "upsert":
+            if self.pattern is None:
+                raise ValueError("upsert delta requires pattern")
+            if self.pattern.id != self.pattern_id:
+                raise ValueError(
+                    f"pattern.id ({self.pattern.id}) must equal pattern_id ({self.pattern_id})"
+                )
+        elif self.pattern is not None:
+            raise ValueError("remove delta must not carry pattern")
+        return self
+
+
+__all__ = ["ModelPatternProjectionDeltaEvent"]
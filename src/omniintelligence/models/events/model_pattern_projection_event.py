@@ -75,6 +75,14 @@ class ModelPatternProjectionEvent(BaseModel):
         default=None,
         description="Correlation ID from the triggering lifecycle event for distributed tracing",
     )
+    sequence: int | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Delta mode: projection sequence of the deltas published with this "
+            "rebuild; deltas with a lower sequence are already reflected"
+        ),
+    )
 
     @model_validator(mode="after")
     def _validate_total_count_matches_patterns(self) -> ModelPatternProjectionEvent:
@@ -31,6 +31,7 @@ from omniintelligence.nodes.node_ast_extraction_compute.models.model_code_entity
 from omniintelligence.nodes.node_ast_extraction_compute.models.model_code_relationship import (
     ModelCodeRelationship,
 )
+from omniintelligence.utils.parse_cache import parse_python
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +104,7 @@ def handle_ast_extract(input_data: AstExtractInput) -> ModelCodeEntitiesExtracte
     parse_error: str | None = None
 
     try:
-        tree = ast.parse(input_data.source_content)
+        tree = parse_python(input_data.source_content)
     except SyntaxError as exc:
         logger.warning(
             "AST parse failed for %s: %s",
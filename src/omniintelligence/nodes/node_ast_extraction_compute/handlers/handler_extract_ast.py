@@ -36,6 +36,7 @@ from omniintelligence.nodes.node_ast_extraction_compute.models.model_code_entity
 from omniintelligence.nodes.node_ast_extraction_compute.models.model_code_relationship import (
     ModelCodeRelationship,
 )
+from omniintelligence.utils.parse_cache import parse_python
 
 logger = logging.getLogger(__name__)
 
@@ -118,7 +119,7 @@ def extract_entities_from_source(
         file_hash = hashlib.sha256(source_code.encode()).hexdigest()
 
     try:
-        tree = ast.parse(source_code, filename=file_path)
+        tree = parse_python(source_code)
     except SyntaxError:
         logger.warning("Failed to parse %s in %s: syntax error", file_path, source_repo)
         return AstExtractionResult()
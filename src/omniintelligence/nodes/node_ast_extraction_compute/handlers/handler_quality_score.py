@@ -15,6 +15,11 @@ Scoring dimensions (configurable weights):
 - pattern_compliance: good patterns present
 - architectural_compliance: ONEX patterns detected
 
+Entity-scoped scoring: ``extract_entity_sources`` parses a file once and
+returns the dedented source slice of every statement keyed by its start line,
+so each entity (including methods and other nested definitions) is scored on
+its own definition rather than the whole file.
+
 Reference: OMN-5675
 """
 
@@ -23,6 +28,7 @@ from __future__ import annotations
 import ast
 import logging
 import re
+import textwrap
 from typing import Any
 
 from omniintelligence.nodes.node_ast_extraction_compute.models.model_quality_result import (
@@ -258,3 +264,42 @@ class QualityScorer:
                 else:
                     count += 1
         return max(1, count + 1)
+
+
+def extract_entity_sources(source_code: str) -> dict[int, str]:
+    """Slice a file into per-statement sources with a single AST parse.
+
+    Every statement (at any nesting depth) is keyed by ``node.lineno``, which
+    is the ``line_number`` recorded for extracted entities. Slices for
+    decorated classes and functions start at the first decorator. When
+    several statements begin on the same line the outermost one wins.
+    Nested statements (e.g. methods) are dedented so each slice parses on
+    its own.
+
+    Args:
+        source_code: Full source of one file.
+
+    Returns:
+        Mapping of start line to dedented statement source. Empty if the
+        file does not parse.
+    """
+    try:
+        tree = ast.parse(source_code)
+    except SyntaxError:
+        return {}
+
+    lines = source_code.splitlines(keepends=True)
+    spans: dict[int, tuple[int, int]] = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.stmt) or node.end_lineno is None:
+            continue
+        decorators = getattr(node, "decorator_list", ())
+        start = min([node.lineno, *(d.lineno for d in decorators)])
+        current = spans.get(node.lineno)
+        if current is None or node.end_lineno - start > current[1] - current[0]:
+            spans[node.lineno] = (start, node.end_lineno)
+
+    return {
+        lineno: textwrap.dedent("".join(lines[start - 1 : end]))
+        for lineno, (start, end) in spans.items()
+    }
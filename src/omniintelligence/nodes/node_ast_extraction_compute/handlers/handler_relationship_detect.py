@@ -24,6 +24,7 @@ from omniintelligence.nodes.node_ast_extraction_compute.models.model_code_entity
 from omniintelligence.nodes.node_ast_extraction_compute.models.model_code_relationship import (
     ModelCodeRelationship,
 )
+from omniintelligence.utils.parse_cache import parse_python
 
 logger = logging.getLogger(__name__)
 
@@ -127,7 +128,7 @@ def detect_relationships(
     cfg = _parse_config(config) if config else _DEFAULT_CONFIG
 
     try:
-        tree = ast.parse(source_code)
+        tree = parse_python(source_code)
     except SyntaxError as exc:
         logger.warning("Relationship detection skipped for %s: %s", file_path, exc)
         return []
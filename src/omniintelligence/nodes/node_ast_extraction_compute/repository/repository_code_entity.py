@@ -4,6 +4,8 @@
 
 Uses asyncpg connection pool. Entity identity: (qualified_name, source_repo).
 Upserts update in-place on file change. file_hash used for skip-if-unchanged.
+Bulk upserts pass one array per column and unnest them server-side, so a
+whole file's entities or relationships cost a single round trip.
 """
 
 from __future__ import annotations
@@ -13,6 +15,8 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     import asyncpg
 
 logger = logging.getLogger(__name__)
@@ -128,6 +132,167 @@ class RepositoryCodeEntity:
         )
         return str(row["id"])
 
+    async def upsert_entities(self, entities: list[dict[str, Any]]) -> dict[str, str]:
+        """Upsert many entities in one statement via unnest'ed column arrays.
+
+        Duplicate (qualified_name, source_repo) keys keep the last occurrence,
+        matching sequential upsert_entity calls (ON CONFLICT cannot update the
+        same row twice within one statement).
+
+        Returns mapping of qualified_name to entity UUID as string.
+        """
+        if not entities:
+            return {}
+        batch = list(
+            {(e["qualified_name"], e["source_repo"]): e for e in entities}.values()
+        )
+        rows = await self._pool.fetch(
+            """
+            INSERT INTO code_entities (
+                entity_name, entity_type, qualified_name, source_repo, source_path,
+                line_number, bases, methods, fields, decorators, docstring, signature,
+                file_hash, last_extracted_at, updated_at
+            )
+            SELECT
+                e.entity_name, e.entity_type, e.qualified_name, e.source_repo,
+                e.source_path, e.line_number,
+                CASE WHEN e.bases IS NULL THEN NULL
+                     ELSE ARRAY(SELECT jsonb_array_elements_text(e.bases::jsonb)) END,
+                e.methods::jsonb, e.fields::jsonb,
+                CASE WHEN e.decorators IS NULL THEN NULL
+                     ELSE ARRAY(SELECT jsonb_array_elements_text(e.decorators::jsonb)) END,
+                e.docstring, e.signature, e.file_hash, NOW(), NOW()
+            FROM unnest(
+                $1::text[], $2::text[], $3::text[], $4::text[], $5::text[],
+                $6::int[], $7::text[], $8::text[], $9::text[], $10::text[],
+                $11::text[], $12::text[], $13::text[]
+            ) AS e(
+                entity_name, entity_type, qualified_name, source_repo, source_path,
+                line_number, bases, methods, fields, decorators, docstring,
+                signature, file_hash
+            )
+            ON CONFLICT (qualified_name, source_repo) DO UPDATE SET
+                entity_name = EXCLUDED.entity_name,
+                entity_type = EXCLUDED.entity_type,
+                source_path = EXCLUDED.source_path,
+                line_number = EXCLUDED.line_number,
+                bases = EXCLUDED.bases,
+                methods = EXCLUDED.methods,
+                fields = EXCLUDED.fields,
+                decorators = EXCLUDED.decorators,
+                docstring = EXCLUDED.docstring,
+                signature = EXCLUDED.signature,
+                file_hash = EXCLUDED.file_hash,
+                last_extracted_at = NOW(),
+                updated_at = NOW()
+            RETURNING qualified_name, id
+            """,
+            [e["entity_name"] for e in batch],
+            [e["entity_type"] for e in batch],
+            [e["qualified_name"] for e in batch],
+            [e["source_repo"] for e in batch],
+            [e["source_path"] for e in batch],
+            [e.get("line_number") for e in batch],
+            [_json_or_none(e.get("bases")) for e in batch],
+            [_json_or_none(e.get("methods")) for e in batch],
+            [_json_or_none(e.get("fields")) for e in batch],
+            [_json_or_none(e.get("decorators")) for e in batch],
+            [e.get("docstring") for e in batch],
+            [e.get("signature") for e in batch],
+            [e["file_hash"] for e in batch],
+        )
+        return {row["qualified_name"]: str(row["id"]) for row in rows}
+
+    async def upsert_relationships(
+        self, relationships: list[dict[str, Any]], source_repo: str
+    ) -> list[tuple[str, str, str]]:
+        """Upsert many relationships, resolving endpoint names server-side.
+
+        Each relationship dict carries ``source_entity`` / ``target_entity``
+        qualified names (resolved against ``source_repo``) plus
+        relationship_type, trust_tier, confidence, evidence and
+        inject_into_context. Relationships whose endpoints do not exist are
+        skipped. Duplicate keys keep the last occurrence.
+
+        Returns (source_qualified_name, target_qualified_name,
+        relationship_type) for every relationship persisted.
+        """
+        if not relationships:
+            return []
+        batch = list(
+            {
+                (r["source_entity"], r["target_entity"], r["relationship_type"]): r
+                for r in relationships
+            }.values()
+        )
+        rows = await self._pool.fetch(
+            """
+            WITH resolved AS (
+                SELECT s.id AS source_entity_id, t.id AS target_entity_id,
+                       r.source_qualified_name, r.target_qualified_name,
+                       r.relationship_type, r.trust_tier, r.confidence,
+                       r.evidence, r.inject_into_context
+                FROM unnest(
+                    $1::text[], $2::text[], $3::text[], $4::text[],
+                    $5::float8[], $6::text[], $7::bool[]
+                ) AS r(
+                    source_qualified_name, target_qualified_name, relationship_type,
+                    trust_tier, confidence, evidence, inject_into_context
+                )
+                JOIN code_entities s
+                  ON s.qualified_name = r.source_qualified_name AND s.source_repo = $8
+                JOIN code_entities t
+                  ON t.qualified_name = r.target_qualified_name AND t.source_repo = $8
+            ),
+            upserted AS (
+                INSERT INTO code_relationships (
+                    source_entity_id, target_entity_id, relationship_type,
+                    trust_tier, confidence, evidence, inject_into_context, source_repo,
+                    updated_at
+                )
+                SELECT
+                    source_entity_id, target_entity_id, relationship_type,
+                    trust_tier, confidence,
+                    CASE WHEN evidence IS NULL THEN NULL
+                         ELSE ARRAY(SELECT jsonb_array_elements_text(evidence::jsonb))
+                    END,
+                    inject_into_context, $8, NOW()
+                FROM resolved
+                ON CONFLICT (source_entity_id, target_entity_id, relationship_type) DO UPDATE SET
+                    trust_tier = EXCLUDED.trust_tier,
+                    confidence = EXCLUDED.confidence,
+                    evidence = EXCLUDED.evidence,
+                    inject_into_context = EXCLUDED.inject_into_context,
+                    source_repo = EXCLUDED.source_repo,
+                    updated_at = NOW()
+                RETURNING source_entity_id, target_entity_id, relationship_type
+            )
+            SELECT r.source_qualified_name, r.target_qualified_name,
+                   r.relationship_type
+            FROM upserted u
+            JOIN resolved r
+              ON r.source_entity_id = u.source_entity_id
+             AND r.target_entity_id = u.target_entity_id
+             AND r.relationship_type = u.relationship_type
+            """,
+            [r["source_entity"] for r in batch],
+            [r["target_entity"] for r in batch],
+            [r["relationship_type"] for r in batch],
+            [r.get("trust_tier", "strong") for r in batch],
+            [r.get("confidence", 1.0) for r in batch],
+            [_json_or_none(r.get("evidence")) for r in batch],
+            [r.get("inject_into_context", True) for r in batch],
+            source_repo,
+        )
+        return [
+            (
+                row["source_qualified_name"],
+                row["target_qualified_name"],
+                row["relationship_type"],
+            )
+            for row in rows
+        ]
+
     async def get_entity_id_by_qualified_name(
         self, qualified_name: str, source_repo: str
     ) -> str | None:
@@ -183,65 +348,36 @@ class RepositoryCodeEntity:
         """Delete relationships whose source file was re-extracted and whose edges are no longer emitted.
 
         current_relationship_keys: list of (source_qualified_name, target_qualified_name, relationship_type).
+        The keep set is resolved to entity IDs server-side in the same
+        statement; an empty keep set deletes every relationship from the file.
         Returns count deleted.
         """
-        # Get all source entity IDs for this file
-        source_ids = await self._pool.fetch(
-            "SELECT id FROM code_entities WHERE source_path = $1 AND source_repo = $2",
+        result = await self._pool.execute(
+            """
+            DELETE FROM code_relationships cr
+            WHERE cr.source_entity_id IN (
+                SELECT id FROM code_entities
+                WHERE source_path = $1 AND source_repo = $2
+            )
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM unnest($3::text[], $4::text[], $5::text[]) AS keep(src, tgt, rel)
+                  JOIN code_entities s
+                    ON s.qualified_name = keep.src AND s.source_repo = $2
+                  JOIN code_entities t
+                    ON t.qualified_name = keep.tgt AND t.source_repo = $2
+                  WHERE cr.source_entity_id = s.id
+                    AND cr.target_entity_id = t.id
+                    AND cr.relationship_type = keep.rel
+              )
+            """,
             source_path,
             source_repo,
+            [k[0] for k in current_relationship_keys],
+            [k[1] for k in current_relationship_keys],
+            [k[2] for k in current_relationship_keys],
         )
-        if not source_ids:
-            return 0
-
-        source_id_list = [row["id"] for row in source_ids]
-
-        if current_relationship_keys:
-            # Build a set of (source_entity_id, target_entity_id, relationship_type) to keep
-            # by resolving qualified names to entity IDs
-            keep_tuples: list[tuple[str, str, str]] = []
-            for src_qn, tgt_qn, rel_type in current_relationship_keys:
-                src_id = await self.get_entity_id_by_qualified_name(src_qn, source_repo)
-                tgt_id = await self.get_entity_id_by_qualified_name(tgt_qn, source_repo)
-                if src_id and tgt_id:
-                    keep_tuples.append((src_id, tgt_id, rel_type))
-
-            if keep_tuples:
-                # Delete relationships from source entities in this file that are not in the keep set
-                # We use a CTE to express the keep set
-                keep_src = [t[0] for t in keep_tuples]
-                keep_tgt = [t[1] for t in keep_tuples]
-                keep_rel = [t[2] for t in keep_tuples]
-
-                result = await self._pool.execute(
-                    """
-                    DELETE FROM code_relationships cr
-                    WHERE cr.source_entity_id = ANY($1::uuid[])
-                      AND NOT EXISTS (
-                          SELECT 1
-                          FROM unnest($2::uuid[], $3::uuid[], $4::text[]) AS keep(src, tgt, rel)
-                          WHERE cr.source_entity_id = keep.src
-                            AND cr.target_entity_id = keep.tgt
-                            AND cr.relationship_type = keep.rel
-                      )
-                    """,
-                    source_id_list,
-                    keep_src,
-                    keep_tgt,
-                    keep_rel,
-                )
-            else:
-                # No valid keep tuples means delete all relationships from these source entities
-                result = await self._pool.execute(
-                    "DELETE FROM code_relationships WHERE source_entity_id = ANY($1::uuid[])",
-                    source_id_list,
-                )
-        else:
-            # No current relationships means delete all from these source entities
-            result = await self._pool.execute(
-                "DELETE FROM code_relationships WHERE source_entity_id = ANY($1::uuid[])",
-                source_id_list,
-            )
+        # asyncpg execute returns "DELETE N"
         return int(result.split()[-1])
 
     async def get_entities_needing_enrichment(
@@ -406,6 +542,38 @@ class RepositoryCodeEntity:
             enrichment_meta_patch,
         )
 
+    async def update_quality_scores(
+        self,
+        scores: list[tuple[str, float, str]],
+        enrichment_meta_patch: str,
+    ) -> None:
+        """Bulk update quality scoring columns in one statement.
+
+        Args:
+            scores: (entity_id, quality_score, quality_dimensions JSONB string)
+                per entity.
+            enrichment_meta_patch: JSONB string merged into every entity's
+                enrichment_metadata.
+        """
+        if not scores:
+            return
+        await self._pool.execute(
+            """
+            UPDATE code_entities AS ce SET
+                quality_score = u.quality_score,
+                quality_dimensions = u.quality_dimensions::jsonb,
+                enrichment_metadata = ce.enrichment_metadata || $4::jsonb,
+                updated_at = NOW()
+            FROM unnest($1::uuid[], $2::float8[], $3::text[])
+                AS u(id, quality_score, quality_dimensions)
+            WHERE ce.id = u.id
+            """,
+            [entry[0] for entry in scores],
+            [entry[1] for entry in scores],
+            [entry[2] for entry in scores],
+            enrichment_meta_patch,
+        )
+
     async def get_entity_enrichment_metadata(
         self, entity_id: str
     ) -> dict[str, Any] | None:
@@ -423,12 +591,16 @@ class RepositoryCodeEntity:
         }
 
     async def get_entities_by_ids(self, entity_ids: list[str]) -> list[dict[str, Any]]:
-        """Get entities by IDs for enrichment processing."""
+        """Get entities by IDs for enrichment processing.
+
+        Rows include file_hash and enrichment_metadata, so enrichment stages
+        can run their idempotency checks without a per-entity lookup.
+        """
         rows = await self._pool.fetch(
             """
             SELECT id, entity_name, entity_type, qualified_name, source_repo,
-                   source_path, docstring, signature, bases, methods, fields,
-                   decorators, file_hash, enrichment_metadata
+                   source_path, line_number, docstring, signature, bases, methods,
+                   fields, decorators, file_hash, enrichment_metadata
             FROM code_entities
             WHERE id = ANY($1::uuid[])
             """,
@@ -437,13 +609,186 @@ class RepositoryCodeEntity:
         return [dict(row) for row in rows]
 
     async def update_graph_synced_at(self, entity_ids: list[str]) -> None:
-        """Batch update last_graph_synced_at for entities synced to Memgraph."""
+        """Batch update last_graph_synced_at for entities synced to Memgraph.
+
+        Does not bump updated_at: updated_at drives incremental graph sync, and
+        recording a sync must not mark the entity as changed again.
+        """
         await self._pool.execute(
             """
             UPDATE code_entities SET
-                last_graph_synced_at = NOW(),
-                updated_at = NOW()
+                last_graph_synced_at = NOW()
             WHERE id = ANY($1::uuid[])
             """,
             entity_ids,
         )
+
+    # =========================================================================
+    # Incremental graph sync (high-water mark + tombstones)
+    # =========================================================================
+
+    async def get_graph_sync_state(self, sync_key: str) -> dict[str, Any]:
+        """Get the stored high-water mark and the database clock.
+
+        Returns:
+            {"high_water_mark": datetime | None, "now": datetime}. The mark is
+            None when the stream has never completed a sync.
+        """
+        row = await self._pool.fetchrow(
+            """
+            SELECT NOW() AS now,
+                   (SELECT high_water_mark FROM code_graph_sync_state
+                    WHERE sync_key = $1) AS high_water_mark
+            """,
+            sync_key,
+        )
+        return {"high_water_mark": row["high_water_mark"], "now": row["now"]}
+
+    async def set_graph_sync_watermark(
+        self, sync_key: str, high_water_mark: datetime
+    ) -> None:
+        """Persist the high-water mark after a successful incremental sync."""
+        await self._pool.execute(
+            """
+            INSERT INTO code_graph_sync_state (sync_key, high_water_mark, updated_at)
+            VALUES ($1, $2, NOW())
+            ON CONFLICT (sync_key) DO UPDATE SET
+                high_water_mark = EXCLUDED.high_water_mark,
+                updated_at = NOW()
+            """,
+            sync_key,
+            high_water_mark,
+        )
+
+    async def get_entities_changed_page(
+        self,
+        *,
+        after_updated_at: datetime,
+        after_id: str,
+        until: datetime,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Get one keyset page of entities changed in (after, until].
+
+        Pages are ordered by (updated_at, id); pass the last row's values as
+        the next cursor.
+        """
+        rows = await self._pool.fetch(
+            """
+            SELECT id, entity_name, entity_type, qualified_name, source_repo,
+                   source_path, classification, architectural_pattern, updated_at
+            FROM code_entities
+            WHERE (updated_at, id) > ($1, $2::uuid)
+              AND updated_at <= $3
+            ORDER BY updated_at, id
+            LIMIT $4
+            """,
+            after_updated_at,
+            after_id,
+            until,
+            limit,
+        )
+        return [dict(r) for r in rows]
+
+    async def get_relationships_changed_page(
+        self,
+        *,
+        after_updated_at: datetime,
+        after_id: str,
+        until: datetime,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Get one keyset page of relationships changed in (after, until].
+
+        Includes non-injectable relationships (so the caller can remove their
+        edges) and resolves endpoint qualified names.
+        """
+        rows = await self._pool.fetch(
+            """
+            SELECT cr.id, cr.relationship_type, cr.trust_tier, cr.confidence,
+                   cr.source_repo, cr.inject_into_context, cr.updated_at,
+                   s.qualified_name AS source_qualified_name,
+                   t.qualified_name AS target_qualified_name
+            FROM code_relationships cr
+            JOIN code_entities s ON s.id = cr.source_entity_id
+            JOIN code_entities t ON t.id = cr.target_entity_id
+            WHERE (cr.updated_at, cr.id) > ($1, $2::uuid)
+              AND cr.updated_at <= $3
+            ORDER BY cr.updated_at, cr.id
+            LIMIT $4
+            """,
+            after_updated_at,
+            after_id,
+            until,
+            limit,
+        )
+        return [dict(r) for r in rows]
+
+    async def get_entity_tombstones_page(
+        self,
+        *,
+        since: datetime,
+        until: datetime,
+        after_seq: int,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Get one page of entities deleted in (since, until], ordered by seq."""
+        rows = await self._pool.fetch(
+            """
+            SELECT seq, qualified_name, source_repo
+            FROM code_entity_tombstones
+            WHERE deleted_at > $1 AND deleted_at <= $2 AND seq > $3
+            ORDER BY seq
+            LIMIT $4
+            """,
+            since,
+            until,
+            after_seq,
+            limit,
+        )
+        return [dict(r) for r in rows]
+
+    async def get_relationship_tombstones_page(
+        self,
+        *,
+        since: datetime,
+        until: datetime,
+        after_seq: int,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Get one page of relationships deleted in (since, until], ordered by seq.
+
+        Endpoint qualified names may be NULL when the endpoint entity was
+        deleted first; those edges are removed with the node.
+        """
+        rows = await self._pool.fetch(
+            """
+            SELECT seq, source_qualified_name, target_qualified_name,
+                   relationship_type, source_repo
+            FROM code_relationship_tombstones
+            WHERE deleted_at > $1 AND deleted_at <= $2 AND seq > $3
+            ORDER BY seq
+            LIMIT $4
+            """,
+            since,
+            until,
+            after_seq,
+            limit,
+        )
+        return [dict(r) for r in rows]
+
+    async def prune_graph_tombstones(self, before: datetime) -> int:
+        """Delete tombstones older than before. Returns count deleted."""
+        entity_result = await self._pool.execute(
+            "DELETE FROM code_entity_tombstones WHERE deleted_at < $1", before
+        )
+        relationship_result = await self._pool.execute(
+            "DELETE FROM code_relationship_tombstones WHERE deleted_at < $1", before
+        )
+        # asyncpg execute returns "DELETE N"
+        return int(entity_result.split()[-1]) + int(relationship_result.split()[-1])
+
+
+def _json_or_none(value: Any) -> str | None:
+    """Serialize value to JSON text for array/jsonb columns, keeping None as NULL."""
+    return json.dumps(value) if value is not None else None
@@ -91,8 +91,11 @@ from omniintelligence.nodes.node_intent_classifier_compute.handlers.handler_adap
     UNKNOWN_CONFIDENCE_THRESHOLD,
     AdaptiveClassificationResult,
     classify_intent_adaptive,
+    classify_intent_adaptive_batch,
+    configure_classifier_snapshot,
     get_classifier_version,
     reset_classifier,
+    warm_up_classifier,
 )
 from omniintelligence.nodes.node_intent_classifier_compute.handlers.handler_intent_classification import (
     DEFAULT_CLASSIFICATION_CONFIG,
@@ -100,6 +103,7 @@ from omniintelligence.nodes.node_intent_classifier_compute.handlers.handler_inte
     EnumIntentCategory,
     classify_intent,
     handle_intent_classification,
+    handle_intent_classification_batch,
 )
 from omniintelligence.nodes.node_intent_classifier_compute.handlers.handler_langextract import (
     DEFAULT_SEMANTIC_CONFIG,
@@ -132,11 +136,15 @@ __all__ = [
     "analyze_semantics",
     "classify_intent",
     "classify_intent_adaptive",
+    "classify_intent_adaptive_batch",
+    "configure_classifier_snapshot",
     "create_empty_semantic_result",
     "get_category_to_typed_class_mapping",
     "get_classifier_version",
     "handle_intent_classification",
+    "handle_intent_classification_batch",
     "map_semantic_to_intent_boost",
     "reset_classifier",
     "resolve_typed_intent",
+    "warm_up_classifier",
 ]
@@ -14,10 +14,14 @@ Design:
       event not emitted downstream (R2 policy)
     - Thin functional wrapper: pure function delegates to AdaptiveClassifier instance
     - classifier_version reflects label file version
+    - Warm start: when a snapshot directory is configured (see
+      configure_classifier_snapshot), the trained classifier is saved once and
+      later processes load it instead of re-embedding every label example
 
 ONEX Compliance:
     - No try/except at this level — errors propagate to orchestrating handler
-    - No I/O after module initialization (label loading happens once at import)
+    - No I/O after classifier initialization (label store and snapshot are read
+      once, on first use or at warm-up)
     - Pure functional interface
     - Deterministic outputs for identical inputs (seed fixed at 42 in classifier)
 
@@ -26,7 +30,12 @@ Reference: OMN-2735
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import shutil
+import tempfile
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -58,6 +67,9 @@ UNKNOWN_CONFIDENCE_THRESHOLD: float = 0.4
 # near-zero confidence scores and clutter the Intents dashboard.
 MIN_CLASSIFIABLE_LENGTH: int = 3
 
+# Number of texts embedded per model call in classify_intent_adaptive_batch
+ADAPTIVE_BATCH_SIZE: int = 32
+
 # Embedding model used for adaptive-classifier (lightweight, sentence-level)
 _EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
 
@@ -114,6 +126,85 @@ def _load_label_store(path: Path) -> tuple[str, dict[str, list[str]]]:
 _classifier: AdaptiveClassifier | None = None
 _classifier_version: str = "uninitialized"
 
+# Directory holding warm-start snapshots; None disables snapshots. Set by the
+# runtime via configure_classifier_snapshot() (nodes do not read env vars).
+_snapshot_dir: Path | None = None
+
+
+def configure_classifier_snapshot(snapshot_dir: Path | None) -> None:
+    """Set the directory used for warm-start classifier snapshots.
+
+    Snapshots are keyed by label store version, embedding model name, and a
+    fingerprint of the label examples, so a label store change or model swap
+    never loads a stale snapshot. Takes effect on the next classifier
+    initialization.
+
+    Args:
+        snapshot_dir: Snapshot directory, or None to disable snapshots.
+    """
+    global _snapshot_dir
+    _snapshot_dir = snapshot_dir
+
+
+def _snapshot_path(
+    snapshot_dir: Path, version: str, examples: dict[str, list[str]]
+) -> Path:
+    """Return the snapshot directory for a label store version and model."""
+    fingerprint = hashlib.sha256(
+        json.dumps(
+            {"model": _EMBEDDING_MODEL, "classes": examples}, sort_keys=True
+        ).encode("utf-8")
+    ).hexdigest()[:16]
+    model_slug = _EMBEDDING_MODEL.replace("/", "--")
+    return snapshot_dir / f"intent-classes-{version}-{model_slug}-{fingerprint}"
+
+
+def _load_snapshot(path: Path) -> AdaptiveClassifier | None:
+    """Load a saved classifier, or return None if absent or unreadable.
+
+    Prototype tensors are stored as safetensors, which are memory-mapped on
+    load. The unquantized ONNX export is loaded so the embedding backend
+    matches a freshly built classifier.
+    """
+    if not (path / "model.safetensors").is_file():
+        return None
+    try:
+        return AdaptiveClassifier.load(str(path), prefer_quantized=False)
+    except Exception:
+        logger.warning(
+            "Failed to load classifier snapshot %s; rebuilding from label store",
+            path,
+            exc_info=True,
+        )
+        return None
+
+
+def _save_snapshot(clf: AdaptiveClassifier, path: Path) -> None:
+    """Save ``clf`` to ``path`` atomically. Failures are logged, not raised.
+
+    The snapshot is written to a temporary sibling directory and renamed into
+    place, so concurrent workers never observe a partial snapshot; if another
+    worker wins the race its snapshot is kept.
+    """
+    tmp_dir: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=".tmp-intent-classes-", dir=path.parent)
+        clf.save(tmp_dir, include_onnx=True, quantize_onnx=False)
+        Path(tmp_dir).replace(path)
+        tmp_dir = None
+        logger.info("Saved classifier snapshot: %s", path)
+    except OSError as e:
+        if path.is_dir():
+            logger.debug("Classifier snapshot already present: %s", path)
+        else:
+            logger.warning("Failed to save classifier snapshot %s: %s", path, e)
+    except Exception:
+        logger.warning("Failed to save classifier snapshot %s", path, exc_info=True)
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
 
 def _get_classifier() -> tuple[AdaptiveClassifier, str]:
     """Get or initialize the module-level adaptive classifier singleton.
@@ -135,6 +226,22 @@ def _get_classifier() -> tuple[AdaptiveClassifier, str]:
 
     version, examples = _load_label_store(_LABEL_STORE_PATH)
 
+    snapshot_path = (
+        _snapshot_path(_snapshot_dir, version, examples)
+        if _snapshot_dir is not None
+        else None
+    )
+    clf = _load_snapshot(snapshot_path) if snapshot_path is not None else None
+    if clf is not None:
+        _classifier = clf
+        _classifier_version = version
+        logger.info(
+            "AdaptiveClassifier loaded from snapshot: version=%s, path=%s",
+            version,
+            snapshot_path,
+        )
+        return _classifier, _classifier_version
+
     clf = AdaptiveClassifier(
         model_name=_EMBEDDING_MODEL,
         seed=42,  # Fixed seed ensures determinism (R3)
@@ -149,6 +256,9 @@ def _get_classifier() -> tuple[AdaptiveClassifier, str]:
 
     clf.add_examples(all_texts, all_labels)
 
+    if snapshot_path is not None:
+        _save_snapshot(clf, snapshot_path)
+
     _classifier = clf
     _classifier_version = version
 
@@ -162,6 +272,20 @@ def _get_classifier() -> tuple[AdaptiveClassifier, str]:
     return _classifier, _classifier_version
 
 
+def warm_up_classifier() -> str:
+    """Initialize the classifier singleton ahead of the first classification.
+
+    Intended for process start-up so the first hook event does not pay for
+    label store loading and example embedding. Uses the configured snapshot
+    directory when set.
+
+    Returns:
+        Classifier version string from the label store.
+    """
+    _, version = _get_classifier()
+    return version
+
+
 def reset_classifier() -> None:
     """Reset classifier singleton (for testing only).
 
@@ -261,6 +385,65 @@ def classify_intent_adaptive(
     # predict() returns List[Tuple[str, float]] sorted by score descending
     predictions: list[tuple[str, float]] = clf.predict(text, k=top_k)
 
+    return _build_result(predictions, version, confidence_threshold)
+
+
+def classify_intent_adaptive_batch(
+    texts: Sequence[str],
+    *,
+    confidence_threshold: float = UNKNOWN_CONFIDENCE_THRESHOLD,
+    top_k: int = 3,
+    batch_size: int = ADAPTIVE_BATCH_SIZE,
+) -> list[AdaptiveClassificationResult]:
+    """Classify many texts, embedding them in batched model calls.
+
+    Each result matches classify_intent_adaptive for the same text (same
+    short-input guard and unknown policy), but the embedding model runs once
+    per ``batch_size`` distinct texts instead of once per text. Duplicate
+    texts are classified once.
+
+    Args:
+        texts: Texts to classify.
+        confidence_threshold: Minimum confidence to emit a class label.
+            Defaults to UNKNOWN_CONFIDENCE_THRESHOLD (0.4).
+        top_k: Number of top predictions to include in evidence list.
+        batch_size: Number of texts embedded per model call.
+
+    Returns:
+        One AdaptiveClassificationResult per text, in input order.
+
+    Raises:
+        FileNotFoundError: If label store YAML is missing (init only).
+        RuntimeError: If adaptive-classifier fails to predict.
+    """
+    clf, version = _get_classifier()
+
+    # Distinct classifiable texts, in first-occurrence order
+    pending: dict[str, int] = {}
+    for text in texts:
+        if len(text.strip()) >= MIN_CLASSIFIABLE_LENGTH:
+            pending.setdefault(text, len(pending))
+
+    batch_predictions: list[list[tuple[str, float]]] = (
+        clf.predict_batch(list(pending), k=top_k, batch_size=batch_size)
+        if pending
+        else []
+    )
+
+    results: list[AdaptiveClassificationResult] = []
+    for text in texts:
+        index = pending.get(text)
+        predictions = batch_predictions[index] if index is not None else []
+        results.append(_build_result(predictions, version, confidence_threshold))
+    return results
+
+
+def _build_result(
+    predictions: list[tuple[str, float]],
+    version: str,
+    confidence_threshold: float,
+) -> AdaptiveClassificationResult:
+    """Apply the unknown class policy (R2) to classifier predictions."""
     if not predictions:
         return AdaptiveClassificationResult(
             intent_label="unknown",
@@ -302,6 +485,9 @@ __all__ = [
     "UNKNOWN_CONFIDENCE_THRESHOLD",
     "AdaptiveClassificationResult",
     "classify_intent_adaptive",
+    "classify_intent_adaptive_batch",
+    "configure_classifier_snapshot",
     "get_classifier_version",
     "reset_classifier",
+    "warm_up_classifier",
 ]
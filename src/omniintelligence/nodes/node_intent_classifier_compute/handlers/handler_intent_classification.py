@@ -26,7 +26,10 @@ from __future__ import annotations
 import logging
 import re
 import time
-from collections import Counter
+from collections import Counter, deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from omniintelligence.nodes.node_intent_classifier_compute.handlers.handler_langextract import (
@@ -345,6 +348,158 @@ _NORMALIZED_PATTERNS: dict[str, list[str]] = {
 
 DEFAULT_CLASSIFICATION_CONFIG = ModelClassificationConfig()
 
+# =============================================================================
+# Compiled Keyword Matcher
+# =============================================================================
+# Scoring every intent used to compare every token against every pattern of
+# every intent (substring checks in both directions). The matcher below is
+# compiled once per min_pattern_length_for_partial and scores all intents in
+# a single pass over the distinct tokens:
+#   - exact hits: inverted index token -> intents containing that pattern
+#   - "pattern in token": Aho-Corasick automaton over the partial-eligible
+#     patterns
+#   - "token in pattern": index of every substring of those patterns
+# Results (scores and keyword order) are identical to _calculate_intent_score.
+# =============================================================================
+
+
+class _CompiledIntentMatcher:
+    """Precompiled keyword index over _NORMALIZED_PATTERNS.
+
+    Only the structure depends on the config (min_pattern_length); weights
+    are applied at scoring time, so one instance serves every config that
+    shares the same minimum partial-match length.
+    """
+
+    __slots__ = (
+        "_exact",
+        "_fail",
+        "_goto",
+        "_intents",
+        "_output",
+        "_substrings",
+    )
+
+    def __init__(self, min_pattern_length: int) -> None:
+        self._intents: tuple[str, ...] = tuple(_NORMALIZED_PATTERNS)
+
+        exact: dict[str, list[int]] = {}
+        substrings: dict[str, set[int]] = {}
+        long_patterns: list[tuple[str, int]] = []
+        for index, patterns in enumerate(_NORMALIZED_PATTERNS.values()):
+            for pattern in patterns:
+                ids = exact.setdefault(pattern, [])
+                if index not in ids:
+                    ids.append(index)
+                if len(pattern) >= min_pattern_length:
+                    long_patterns.append((pattern, index))
+                    for start in range(len(pattern)):
+                        for end in range(start + 1, len(pattern) + 1):
+                            substrings.setdefault(pattern[start:end], set()).add(index)
+        self._exact: dict[str, frozenset[int]] = {
+            token: frozenset(ids) for token, ids in exact.items()
+        }
+        self._substrings: dict[str, frozenset[int]] = {
+            sub: frozenset(ids) for sub, ids in substrings.items()
+        }
+
+        # Aho-Corasick automaton: goto trie, failure links, merged outputs
+        goto: list[dict[str, int]] = [{}]
+        output: list[set[int]] = [set()]
+        for pattern, index in long_patterns:
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(set())
+                state = next_state
+            output[state].add(index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] |= output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output: list[frozenset[int]] = [frozenset(ids) for ids in output]
+
+    def _partial_intents(self, token: str) -> frozenset[int]:
+        """Intents with a partial-eligible pattern inside or around ``token``."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        hits = self._substrings.get(token, frozenset())
+        state = 0
+        for char in token:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits = hits | output[state]
+        return hits
+
+    def score(
+        self,
+        tf_scores: dict[str, float],
+        config: ModelClassificationConfig,
+    ) -> tuple[dict[str, float], dict[str, list[str]]]:
+        """Score every intent against the distinct tokens in ``tf_scores``.
+
+        Args:
+            tf_scores: Term frequency scores, keyed in first-occurrence order.
+            config: Frozen configuration with scoring weights.
+
+        Returns:
+            Tuple of (intent_scores, intent_keywords) keyed by intent in
+            _NORMALIZED_PATTERNS order.
+        """
+        exact_weight = config.exact_match_weight
+        partial_weight = config.partial_match_weight
+        no_hits: frozenset[int] = frozenset()
+
+        exact_hits: dict[int, list[str]] = {}
+        partial_hits: dict[int, list[str]] = {}
+        for token in tf_scores:
+            exact_ids = self._exact.get(token, no_hits)
+            for index in exact_ids:
+                exact_hits.setdefault(index, []).append(token)
+            for index in self._partial_intents(token) - exact_ids:
+                partial_hits.setdefault(index, []).append(token)
+
+        intent_scores: dict[str, float] = {}
+        intent_keywords: dict[str, list[str]] = {}
+        for index, intent in enumerate(self._intents):
+            # Same accumulation order as _calculate_intent_score: exact hits
+            # in pattern order, then partial hits in token order.
+            matched_keywords = sorted(exact_hits.get(index, ()))
+            score = 0.0
+            for pattern in matched_keywords:
+                score += tf_scores[pattern] * exact_weight
+            for token in partial_hits.get(index, ()):
+                score += tf_scores[token] * partial_weight
+                matched_keywords.append(token)
+            intent_scores[intent] = score
+            intent_keywords[intent] = matched_keywords
+        return intent_scores, intent_keywords
+
+
+@lru_cache(maxsize=8)
+def _get_intent_matcher(min_pattern_length: int) -> _CompiledIntentMatcher:
+    """Return the compiled matcher for a minimum partial-match length."""
+    return _CompiledIntentMatcher(min_pattern_length)
+
+
 # =============================================================================
 # Pure Functional Classification Algorithm
 # =============================================================================
@@ -481,16 +636,9 @@ def classify_intent(
 
         tf_scores = _calculate_term_frequency(tokens)
 
-        # Score each intent category
-        intent_scores: dict[str, float] = {}
-        intent_keywords: dict[str, list[str]] = {}
-
-        for intent, patterns in _NORMALIZED_PATTERNS.items():
-            score, matched_keywords = _calculate_intent_score(
-                tf_scores, patterns, tokens, config
-            )
-            intent_scores[intent] = score
-            intent_keywords[intent] = matched_keywords
+        # Score all intent categories in one pass over the distinct tokens
+        matcher = _get_intent_matcher(config.min_pattern_length_for_partial)
+        intent_scores, intent_keywords = matcher.score(tf_scores, config)
 
         # Apply semantic boosts before normalization so corpus-size effects don't dilute them
         if score_boosts:
@@ -600,6 +748,9 @@ def _calculate_intent_score(
     Exact matches are weighted more heavily than partial matches
     to prioritize clear signals.
 
+    This is the single-intent reference scorer; classify_intent scores all
+    intents at once through _CompiledIntentMatcher, which must agree with it.
+
     Args:
         tf_scores: Term frequency scores for all tokens.
         patterns: Intent-specific keyword patterns (lowercase).
@@ -781,6 +932,38 @@ def _build_error_response(
     )
 
 
+def _compute_semantic_boosts(content: str) -> dict[str, float]:
+    """Compute intent boosts from langextract semantic analysis.
+
+    Any unexpected exception from semantic analysis falls back to empty boosts
+    so TF-IDF classification still succeeds without semantic enrichment.
+    """
+    try:
+        semantic_result = analyze_semantics(content=content)
+        return (
+            map_semantic_to_intent_boost(semantic_result)
+            if semantic_result.get("error") is None
+            else {}
+        )
+    except Exception as e:
+        logger.warning(
+            "Semantic analysis failed, falling back to TF-IDF-only scoring: %s: %s",
+            type(e).__name__,
+            e,
+        )
+        return {}
+
+
+@dataclass(slots=True)
+class _BatchMemo:
+    """Per-batch memo of content-derived work shared between batch items."""
+
+    boosts: dict[str, dict[str, float]] = field(default_factory=dict)
+    results: dict[tuple[str, float | None, int | None], ClassificationResultDict] = (
+        field(default_factory=dict)
+    )
+
+
 def handle_intent_classification(
     input_data: ModelIntentClassificationInput,
     config: ModelClassificationConfig,
@@ -802,6 +985,42 @@ def handle_intent_classification(
         secondary intents (if multi-label), and classification metadata.
         On error, returns a failure response with error details.
     """
+    return _handle_intent_classification(input_data, config, memo=None)
+
+
+def handle_intent_classification_batch(
+    inputs: Sequence[ModelIntentClassificationInput],
+    config: ModelClassificationConfig,
+) -> list[ModelIntentClassificationOutput]:
+    """Classify many inputs in one call.
+
+    Intended for backfills of historical prompts. Each output is the same as
+    handle_intent_classification would return for that input, except for
+    timing fields. Semantic analysis and TF-IDF scoring run once per distinct
+    content (and per distinct confidence_threshold/max_intents context), and
+    per-item failures are isolated exactly as in the single-item handler.
+
+    Args:
+        inputs: Inputs to classify.
+        config: Classification configuration for TF-IDF parameters.
+
+    Returns:
+        One ModelIntentClassificationOutput per input, in input order.
+    """
+    memo = _BatchMemo()
+    return [
+        _handle_intent_classification(input_data, config, memo=memo)
+        for input_data in inputs
+    ]
+
+
+def _handle_intent_classification(
+    input_data: ModelIntentClassificationInput,
+    config: ModelClassificationConfig,
+    *,
+    memo: _BatchMemo | None,
+) -> ModelIntentClassificationOutput:
+    """Classify one input, reusing ``memo`` results when given (batch path)."""
     start_time = time.perf_counter()
 
     try:
@@ -820,35 +1039,29 @@ def handle_intent_classification(
         confidence_threshold = context.get("confidence_threshold")
         max_intents = context.get("max_intents")
 
-        # Semantic enrichment: compute intent boosts from langextract analysis.
-        # Wrapped in try/except so any unexpected exception from semantic analysis
-        # falls back to empty boosts and allows TF-IDF classification to succeed
-        # normally without semantic enrichment.
-        try:
-            semantic_result = analyze_semantics(content=input_data.content)
-            boosts: dict[str, float] = (
-                map_semantic_to_intent_boost(semantic_result)
-                if semantic_result.get("error") is None
-                else {}
-            )
-        except Exception as e:
-            logger.warning(
-                "Semantic analysis failed, falling back to TF-IDF-only scoring: %s: %s",
-                type(e).__name__,
-                e,
+        # Semantic boosts and TF-IDF results depend only on the content (and
+        # the per-item threshold/limit), so a batch computes each once.
+        result_key = (input_data.content, confidence_threshold, max_intents)
+        result = memo.results.get(result_key) if memo is not None else None
+        if result is None:
+            boosts = memo.boosts.get(input_data.content) if memo is not None else None
+            if boosts is None:
+                boosts = _compute_semantic_boosts(input_data.content)
+                if memo is not None:
+                    memo.boosts[input_data.content] = boosts
+
+            # Call pure classification function for TF-IDF classification
+            # Handler applies config defaults when parameters are None
+            result = classify_intent(
+                content=input_data.content,
+                config=config,
+                confidence_threshold=confidence_threshold,
+                multi_label=True,  # Always compute secondary intents
+                max_intents=max_intents,
+                score_boosts=boosts,
             )
-            boosts = {}
-
-        # Call pure classification function for TF-IDF classification
-        # Handler applies config defaults when parameters are None
-        result = classify_intent(
-            content=input_data.content,
-            config=config,
-            confidence_threshold=confidence_threshold,
-            multi_label=True,  # Always compute secondary intents
-            max_intents=max_intents,
-            score_boosts=boosts,
-        )
+            if memo is not None:
+                memo.results[result_key] = result
 
         processing_time = (time.perf_counter() - start_time) * 1000
 
@@ -962,4 +1175,5 @@ __all__ = [
     "INTENT_PATTERNS",
     "classify_intent",
     "handle_intent_classification",
+    "handle_intent_classification_batch",
 ]
@@ -388,6 +388,28 @@ DOMAIN_KEYWORDS: Final[dict[EnumSemanticDomain, frozenset[str]]] = {
     ),
 }
 
+
+def _build_domain_keyword_index() -> dict[str, tuple[EnumSemanticDomain, ...]]:
+    """Invert DOMAIN_KEYWORDS into keyword -> domains (in DOMAIN_KEYWORDS order)."""
+    index: dict[str, tuple[EnumSemanticDomain, ...]] = {}
+    for domain, keywords in DOMAIN_KEYWORDS.items():
+        for keyword in {k.lower() for k in keywords}:
+            index[keyword] = (*index.get(keyword, ()), domain)
+    return index
+
+
+# Precompiled DOMAIN_KEYWORDS index used by _detect_domains (built once).
+# Compound keywords (with "-" or "_") also carry the two phrase spellings
+# checked against the content when the keyword itself is not a token.
+_DOMAIN_KEYWORD_INDEX: Final[dict[str, tuple[EnumSemanticDomain, ...]]] = (
+    _build_domain_keyword_index()
+)
+_DOMAIN_COMPOUND_KEYWORDS: Final[tuple[tuple[str, str, str], ...]] = tuple(
+    (keyword, keyword.replace("-", " "), keyword.replace("_", " "))
+    for keyword in _DOMAIN_KEYWORD_INDEX
+    if "-" in keyword or "_" in keyword
+)
+
 # Theme patterns - broader categories that group related domains
 THEME_PATTERNS: Final[dict[str, list[str]]] = {
     "development": ["code_generation", "refactoring", "debugging", "architecture"],
@@ -786,32 +808,30 @@ def _detect_domains(
     diversity_multiplier = config.scoring.diversity_multiplier
 
     domain_scores: dict[str, float] = {}
-    token_set = set(tokens)
     token_counter = Counter(tokens)
     total_tokens = len(tokens) if tokens else 1
 
-    for domain, keywords in DOMAIN_KEYWORDS.items():
-        # Count keyword matches
-        matches = 0
-        matched_keywords: list[str] = []
-
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-
-            # Exact token match
-            if keyword_lower in token_set:
-                matches += token_counter[keyword_lower]
-                matched_keywords.append(keyword_lower)
-
-            # Partial match for compound keywords
-            elif "-" in keyword_lower or "_" in keyword_lower:
-                # Check if keyword appears in content
-                if (
-                    keyword_lower.replace("-", " ") in content_lower
-                    or keyword_lower.replace("_", " ") in content_lower
-                ):
-                    matches += 1
-                    matched_keywords.append(keyword_lower)
+    # One pass over the distinct tokens via the precompiled keyword index,
+    # instead of scanning every keyword of every domain.
+    domain_matches: dict[str, int] = {}
+    domain_keyword_counts: dict[str, int] = {}
+    for token, count in token_counter.items():
+        for domain in _DOMAIN_KEYWORD_INDEX.get(token, ()):
+            domain_matches[domain] = domain_matches.get(domain, 0) + count
+            domain_keyword_counts[domain] = domain_keyword_counts.get(domain, 0) + 1
+
+    # Partial match for compound keywords that are not themselves tokens
+    for keyword, dashed_phrase, underscored_phrase in _DOMAIN_COMPOUND_KEYWORDS:
+        if keyword not in token_counter and (
+            dashed_phrase in content_lower or underscored_phrase in content_lower
+        ):
+            for domain in _DOMAIN_KEYWORD_INDEX[keyword]:
+                domain_matches[domain] = domain_matches.get(domain, 0) + 1
+                domain_keyword_counts[domain] = domain_keyword_counts.get(domain, 0) + 1
+
+    for domain in DOMAIN_KEYWORDS:
+        matches = domain_matches.get(domain, 0)
+        matched_keyword_count = domain_keyword_counts.get(domain, 0)
 
         if matches > 0:
             # Calculate confidence based on:
@@ -823,7 +843,7 @@ def _detect_domains(
             # Formula: match_base = min(max, initial + (matches * initial))
             match_base = min(
                 match_base_max,
-                match_base_initial + (len(matched_keywords) * match_base_initial),
+                match_base_initial + (matched_keyword_count * match_base_initial),
             )
 
             # Bonus for high match density
@@ -832,7 +852,7 @@ def _detect_domains(
 
             # Bonus for multiple unique keywords (strong domain signal)
             diversity_bonus = min(
-                diversity_bonus_max, len(matched_keywords) * diversity_multiplier
+                diversity_bonus_max, matched_keyword_count * diversity_multiplier
             )
 
             confidence = min(1.0, match_base + density_bonus + diversity_bonus)
@@ -99,8 +99,8 @@ def update_baseline(
         actual_tokens: Actual token count (input + output) for the session.
         actual_latency_ms: Actual wall-clock latency for the session in milliseconds.
     """
-    baseline.token_samples.append(actual_tokens)
-    baseline.latency_samples_ms.append(actual_latency_ms)
+    baseline.token_sketch.add(actual_tokens)
+    baseline.latency_sketch_ms.add(actual_latency_ms)
     baseline.sample_count += 1
 
 
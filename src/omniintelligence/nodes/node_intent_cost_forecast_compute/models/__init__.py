@@ -9,6 +9,7 @@ Exports:
     ModelIntentCostForecastInput: Frozen input for forecast computation.
     ModelIntentCostForecast: Frozen forecast output.
     ModelForecastAccuracyRecord: Frozen actual-vs-forecast accuracy record.
+    ModelQuantileSketch: Mergeable KLL quantile sketch backing baselines.
     build_seeded_baseline: Factory for a single seeded baseline.
     build_all_seeded_baselines: Factory for all 8 seeded baselines.
 """
@@ -23,12 +24,16 @@ from omniintelligence.nodes.node_intent_cost_forecast_compute.models.model_inten
     ModelIntentCostForecast,
     ModelIntentCostForecastInput,
 )
+from omniintelligence.nodes.node_intent_cost_forecast_compute.models.model_quantile_sketch import (
+    ModelQuantileSketch,
+)
 
 __all__ = [
     "ModelCostBaseline",
     "ModelForecastAccuracyRecord",
     "ModelIntentCostForecast",
     "ModelIntentCostForecastInput",
+    "ModelQuantileSketch",
     "build_all_seeded_baselines",
     "build_seeded_baseline",
 ]
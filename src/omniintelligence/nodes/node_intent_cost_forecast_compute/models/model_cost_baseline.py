@@ -8,16 +8,25 @@ Stores p50/p90/p99 token count distributions and latency observations
 used to generate cost and latency forecasts. Baselines are seeded with
 synthetic values on first run to prevent cold-start empty forecasts.
 
+Distributions are held in bounded-memory KLL sketches (see
+model_quantile_sketch) rather than raw sample lists, so long-lived intent
+classes keep a fixed footprint and percentile reads stay cheap. Baselines
+serialize via to_dict/from_dict and merge across workers via merge().
+
 Reference: OMN-2490
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from statistics import mean, median, quantiles
+from typing import Any
 
 from omnibase_core.enums.intelligence.enum_intent_class import EnumIntentClass
 
+from omniintelligence.nodes.node_intent_cost_forecast_compute.models.model_quantile_sketch import (
+    ModelQuantileSketch,
+)
+
 # ---------------------------------------------------------------------------
 # Synthetic seed values per intent class (tokens)
 # Derived from typical Claude API usage patterns.
@@ -54,20 +63,20 @@ class ModelCostBaseline:
     """Mutable historical baseline for a single intent class.
 
     Accumulates token counts and latency observations from completed sessions.
-    Exposes p50/p90/p99 percentile accessors derived from the stored samples.
+    Exposes p50/p90/p99 percentile accessors derived from quantile sketches.
 
     Not frozen — baselines are updated after each session outcome.
 
     Attributes:
         intent_class: The intent class this baseline tracks.
-        token_samples: Raw token count samples (input + output tokens per session).
-        latency_samples_ms: Raw latency samples in milliseconds.
+        token_sketch: Token count distribution (input + output tokens per session).
+        latency_sketch_ms: Latency distribution in milliseconds.
         sample_count: Number of real (non-synthetic) sessions observed.
     """
 
     intent_class: EnumIntentClass
-    token_samples: list[int] = field(default_factory=list)
-    latency_samples_ms: list[float] = field(default_factory=list)
+    token_sketch: ModelQuantileSketch = field(default_factory=ModelQuantileSketch)
+    latency_sketch_ms: ModelQuantileSketch = field(default_factory=ModelQuantileSketch)
     sample_count: int = 0  # real (non-synthetic) observations
 
     # -----------------------------------------------------------------------
@@ -77,32 +86,22 @@ class ModelCostBaseline:
     @property
     def token_p50(self) -> float:
         """Median (p50) token count."""
-        if not self.token_samples:
-            return 0.0
-        return float(median(self.token_samples))
+        return self.token_sketch.quantile(0.5)
 
     @property
     def token_p90(self) -> float:
         """90th-percentile token count."""
-        if len(self.token_samples) < 2:
-            return float(self.token_samples[0]) if self.token_samples else 0.0
-        qs = quantiles(self.token_samples, n=10)
-        return float(qs[8])  # index 8 = 90th percentile
+        return self.token_sketch.quantile(0.9)
 
     @property
     def token_p99(self) -> float:
         """99th-percentile token count."""
-        if len(self.token_samples) < 2:
-            return float(self.token_samples[0]) if self.token_samples else 0.0
-        qs = quantiles(self.token_samples, n=100)
-        return float(qs[98])  # index 98 = 99th percentile
+        return self.token_sketch.quantile(0.99)
 
     @property
     def token_mean(self) -> float:
         """Mean token count."""
-        if not self.token_samples:
-            return 0.0
-        return mean(self.token_samples)
+        return self.token_sketch.mean
 
     # -----------------------------------------------------------------------
     # Latency percentiles
@@ -111,25 +110,57 @@ class ModelCostBaseline:
     @property
     def latency_p50_ms(self) -> float:
         """Median (p50) latency in milliseconds."""
-        if not self.latency_samples_ms:
-            return 0.0
-        return float(median(self.latency_samples_ms))
+        return self.latency_sketch_ms.quantile(0.5)
 
     @property
     def latency_p90_ms(self) -> float:
         """90th-percentile latency in milliseconds."""
-        if len(self.latency_samples_ms) < 2:
-            return float(self.latency_samples_ms[0]) if self.latency_samples_ms else 0.0
-        qs = quantiles(self.latency_samples_ms, n=10)
-        return float(qs[8])
+        return self.latency_sketch_ms.quantile(0.9)
 
     @property
     def latency_p99_ms(self) -> float:
         """99th-percentile latency in milliseconds."""
-        if len(self.latency_samples_ms) < 2:
-            return float(self.latency_samples_ms[0]) if self.latency_samples_ms else 0.0
-        qs = quantiles(self.latency_samples_ms, n=100)
-        return float(qs[98])
+        return self.latency_sketch_ms.quantile(0.99)
+
+    # -----------------------------------------------------------------------
+    # Merge and serialization
+    # -----------------------------------------------------------------------
+
+    def merge(self, other: ModelCostBaseline) -> None:
+        """Fold another worker's baseline for the same intent class into this one.
+
+        Synthetic seeds present in both baselines are counted twice; workers
+        should accumulate deltas in an unseeded ``ModelCostBaseline``.
+
+        Raises:
+            ValueError: If the baselines track different intent classes.
+        """
+        if other.intent_class != self.intent_class:
+            raise ValueError(
+                f"Cannot merge baseline for {other.intent_class} into {self.intent_class}"
+            )
+        self.token_sketch.merge(other.token_sketch)
+        self.latency_sketch_ms.merge(other.latency_sketch_ms)
+        self.sample_count += other.sample_count
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict for persistence."""
+        return {
+            "intent_class": self.intent_class.value,
+            "token_sketch": self.token_sketch.to_dict(),
+            "latency_sketch_ms": self.latency_sketch_ms.to_dict(),
+            "sample_count": self.sample_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ModelCostBaseline:
+        """Restore a baseline serialized by ``to_dict``."""
+        return cls(
+            intent_class=EnumIntentClass(data["intent_class"]),
+            token_sketch=ModelQuantileSketch.from_dict(data["token_sketch"]),
+            latency_sketch_ms=ModelQuantileSketch.from_dict(data["latency_sketch_ms"]),
+            sample_count=int(data["sample_count"]),
+        )
 
     # -----------------------------------------------------------------------
     # Cost estimation
@@ -161,14 +192,14 @@ def build_seeded_baseline(intent_class: EnumIntentClass) -> ModelCostBaseline:
         ModelCostBaseline seeded with synthetic token and latency samples.
     """
     baseline = ModelCostBaseline(intent_class=intent_class)
-    baseline.token_samples.extend(
-        _SYNTHETIC_TOKEN_SEEDS.get(intent_class, [2000, 3000, 4000, 5000, 6000])
-    )
-    baseline.latency_samples_ms.extend(
-        _SYNTHETIC_LATENCY_SEEDS.get(
-            intent_class, [5000.0, 10000.0, 15000.0, 20000.0, 30000.0]
-        )
-    )
+    for tokens in _SYNTHETIC_TOKEN_SEEDS.get(
+        intent_class, [2000, 3000, 4000, 5000, 6000]
+    ):
+        baseline.token_sketch.add(tokens)
+    for latency_ms in _SYNTHETIC_LATENCY_SEEDS.get(
+        intent_class, [5000.0, 10000.0, 15000.0, 20000.0, 30000.0]
+    ):
+        baseline.latency_sketch_ms.add(latency_ms)
     # sample_count stays 0 — synthetic seeds are not real observations
     return baseline
 
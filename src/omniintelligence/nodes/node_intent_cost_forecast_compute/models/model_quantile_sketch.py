@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+# Copyright (c) 2025 OmniNode Team
+"""Mergeable, bounded-memory quantile sketch for cost and latency baselines.
+
+Implements a KLL sketch (Karnin, Lang, Liberty 2016): samples enter level 0,
+and whenever the sketch exceeds its capacity the first full level is sorted
+and every other item is promoted to the next level with doubled weight.
+Level capacities shrink geometrically (factor 2/3) below the top level, so
+the sketch retains roughly 3k values no matter how many samples it has seen.
+
+Error bound:
+    With the default k=200, a quantile query returns a value whose rank is
+    within about 1.7% of the requested rank (normalized rank error, 99%
+    confidence), independent of the number of samples. Until the first
+    compaction (fewer than k samples) the sketch is exact, and queries match
+    ``statistics.quantiles`` (exclusive method) and ``statistics.median``.
+
+The compaction coin flips come from a serialized LCG state, so a sketch is
+deterministic for a given insertion order and round-trips through
+``to_dict``/``from_dict`` without changing future results.
+
+Reference: OMN-2490
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Any
+
+DEFAULT_SKETCH_K: int = 200
+"""Top-level capacity; larger k trades memory for accuracy (error ~ 1/k)."""
+
+_CAPACITY_DECAY: float = 2.0 / 3.0
+_MIN_LEVEL_CAPACITY: int = 2
+
+# 64-bit LCG (Knuth MMIX constants) for compaction offsets
+_LCG_MULTIPLIER: int = 6364136223846793005
+_LCG_INCREMENT: int = 1442695040888963407
+_LCG_MASK: int = (1 << 64) - 1
+_LCG_SEED: int = 0x2490
+
+
+@dataclass
+class ModelQuantileSketch:
+    """KLL quantile sketch over a stream of numeric samples.
+
+    Percentile reads are cached until the next ``add``/``merge``, so repeated
+    forecasts against an unchanged baseline cost O(1) per read.
+
+    Attributes:
+        k: Top-level capacity (accuracy parameter).
+        levels: Retained values per level; an item at level h has weight 2**h.
+        count: Total number of samples observed.
+        total: Sum of all samples observed (exact mean).
+        min_value: Smallest sample observed, or None if empty.
+        max_value: Largest sample observed, or None if empty.
+        rng_state: LCG state driving compaction offsets.
+    """
+
+    k: int = DEFAULT_SKETCH_K
+    levels: list[list[float]] = field(default_factory=lambda: [[]])
+    count: int = 0
+    total: float = 0.0
+    min_value: float | None = None
+    max_value: float | None = None
+    rng_state: int = _LCG_SEED
+    _cdf: tuple[list[float], list[int]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _quantile_cache: dict[float, float] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.k < _MIN_LEVEL_CAPACITY:
+            raise ValueError(f"k must be >= {_MIN_LEVEL_CAPACITY}, got {self.k}")
+        if not self.levels:
+            self.levels = [[]]
+
+    # -----------------------------------------------------------------------
+    # Updates
+    # -----------------------------------------------------------------------
+
+    def add(self, value: float) -> None:
+        """Record one sample."""
+        value = float(value)
+        self.levels[0].append(value)
+        self.count += 1
+        self.total += value
+        self.min_value = value if self.min_value is None else min(self.min_value, value)
+        self.max_value = value if self.max_value is None else max(self.max_value, value)
+        self._compress()
+        self._invalidate()
+
+    def merge(self, other: ModelQuantileSketch) -> None:
+        """Fold another sketch's samples into this one.
+
+        The result has the same error bound as a sketch that saw both
+        streams directly.
+
+        Raises:
+            ValueError: If the sketches were built with different k.
+        """
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        if other.count == 0:
+            return
+        for height, level in enumerate(other.levels):
+            if height == len(self.levels):
+                self.levels.append([])
+            self.levels[height].extend(level)
+        self.count += other.count
+        self.total += other.total
+        for bound in (other.min_value, other.max_value):
+            if bound is not None:
+                self.min_value = (
+                    bound if self.min_value is None else min(self.min_value, bound)
+                )
+                self.max_value = (
+                    bound if self.max_value is None else max(self.max_value, bound)
+                )
+        self._compress()
+        self._invalidate()
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.levels) - height - 1
+        return max(_MIN_LEVEL_CAPACITY, math.ceil(self.k * _CAPACITY_DECAY**depth))
+
+    def _compress(self) -> None:
+        while sum(map(len, self.levels)) > sum(
+            self._capacity(h) for h in range(len(self.levels))
+        ):
+            for height, level in enumerate(self.levels):
+                if len(level) >= self._capacity(height):
+                    self._compact(height)
+                    break
+
+    def _compact(self, height: int) -> None:
+        """Promote every other sorted item of a level to the level above."""
+        if height + 1 == len(self.levels):
+            self.levels.append([])
+        items = sorted(self.levels[height])
+        # An odd item out stays behind so total weight is preserved.
+        leftover = [items.pop()] if len(items) % 2 else []
+        self.rng_state = (self.rng_state * _LCG_MULTIPLIER + _LCG_INCREMENT) & _LCG_MASK
+        offset = self.rng_state >> 63
+        self.levels[height + 1].extend(items[offset::2])
+        self.levels[height] = leftover
+
+    def _invalidate(self) -> None:
+        self._cdf = None
+        self._quantile_cache.clear()
+
+    # -----------------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------------
+
+    @property
+    def is_exact(self) -> bool:
+        """True while no compaction has happened (every sample retained)."""
+        return len(self.levels) == 1
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of all samples, or 0.0 if empty."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0 <= q <= 1), or 0.0 if empty.
+
+        Raises:
+            ValueError: If q is outside [0, 1].
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"q must be in [0, 1], got {q}")
+        cached = self._quantile_cache.get(q)
+        if cached is not None:
+            return cached
+        value = self._exact_quantile(q) if self.is_exact else self._sketch_quantile(q)
+        self._quantile_cache[q] = value
+        return value
+
+    def _exact_quantile(self, q: float) -> float:
+        # Same interpolation as statistics.quantiles(method="exclusive"),
+        # which also yields statistics.median at q=0.5.
+        data = sorted(self.levels[0])
+        size = len(data)
+        if size == 0:
+            return 0.0
+        if size == 1:
+            return data[0]
+        position = q * (size + 1)
+        j = min(max(int(position), 1), size - 1)
+        return data[j - 1] + (data[j] - data[j - 1]) * (position - j)
+
+    def _sketch_quantile(self, q: float) -> float:
+        if q == 0.0 and self.min_value is not None:
+            return self.min_value
+        if q == 1.0 and self.max_value is not None:
+            return self.max_value
+        if self._cdf is None:
+            weighted = sorted(
+                (value, 1 << height)
+                for height, level in enumerate(self.levels)
+                for value in level
+            )
+            self._cdf = (
+                [value for value, _ in weighted],
+                list(accumulate(weight for _, weight in weighted)),
+            )
+        values, cumulative = self._cdf
+        index = bisect_left(cumulative, q * self.count)
+        return values[min(index, len(values) - 1)]
+
+    # -----------------------------------------------------------------------
+    # Serialization
+    # -----------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "k": self.k,
+            "levels": [list(level) for level in self.levels],
+            "count": self.count,
+            "total": self.total,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "rng_state": self.rng_state,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ModelQuantileSketch:
+        """Restore a sketch serialized by ``to_dict``."""
+        return cls(
+            k=int(data["k"]),
+            levels=[[float(v) for v in level] for level in data["levels"]],
+            count=int(data["count"]),
+            total=float(data["total"]),
+            min_value=data.get("min_value"),
+            max_value=data.get("max_value"),
+            rng_state=int(data.get("rng_state", _LCG_SEED)),
+        )
+
+
+__all__ = [
+    "DEFAULT_SKETCH_K",
+    "ModelQuantileSketch",
+]
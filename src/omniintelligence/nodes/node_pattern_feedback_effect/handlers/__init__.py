@@ -23,6 +23,11 @@ Contribution Heuristics:
     session outcomes to individual patterns. See heuristics.py for the pure
     functions that compute weights.
 
+Write Coalescing:
+    SessionOutcomeAggregator buffers outcomes from concurrent sessions and
+    applies them as set-based writes. See handler_outcome_aggregator.py for
+    its coalescing and exactly-once metric semantics.
+
 Usage:
     from omniintelligence.nodes.node_pattern_feedback_effect.handlers import (
         ProtocolPatternRepository,
@@ -55,6 +60,10 @@ from omniintelligence.nodes.node_pattern_feedback_effect.handlers.handler_dispat
     SQL_UPSERT_DISPATCH_EVAL_RESULT,
     record_dispatch_outcome,
 )
+from omniintelligence.nodes.node_pattern_feedback_effect.handlers.handler_outcome_aggregator import (
+    CoalescedSessionResult,
+    SessionOutcomeAggregator,
+)
 from omniintelligence.nodes.node_pattern_feedback_effect.handlers.handler_session_outcome import (
     ROLLING_WINDOW_SIZE,
     compute_and_store_heuristics,
@@ -74,9 +83,11 @@ from omniintelligence.nodes.node_pattern_feedback_effect.handlers.heuristics imp
 __all__ = [
     "AttributionBindingResult",
     "BindSessionResult",
+    "CoalescedSessionResult",
     "ROLLING_WINDOW_SIZE",
     "SQL_UPSERT_DISPATCH_EVAL_RESULT",
     "ContributionWeights",
+    "SessionOutcomeAggregator",
     "apply_heuristic",
     "handle_attribution_binding",
     "compute_and_store_heuristics",
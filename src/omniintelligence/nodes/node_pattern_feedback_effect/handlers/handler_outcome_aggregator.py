@@ -0,0 +1,502 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Write-coalescing aggregator for session outcome rolling metrics.
+
+``record_session_outcome`` normally issues one rolling-metrics UPDATE per
+session, so a pattern injected into many concurrent sessions takes one
+row-level UPDATE (and row lock) per session. The aggregator buffers session
+outcomes for a short window and flushes them together:
+
+- Heuristic writes for every buffered injection in one UPDATE.
+- Injections marked recorded and per-pattern outcome sequences applied in
+  one statement (``SQL_RECORD_COALESCED_OUTCOMES``).
+- Effectiveness scores recomputed once for every touched pattern.
+
+Coalesced Rolling Metrics:
+--------------------------
+Each pattern's outcomes within a window are sent as an ordered string of
+``S``/``F`` characters. The UPDATE derives how many of those outcomes land
+after the rolling window cap is reached (and so decay the opposite counter)
+from the row's current injection count, which makes a single-outcome window
+identical to SQL_UPDATE_METRICS_SUCCESS / SQL_UPDATE_METRICS_FAILURE. For
+longer windows the zero floor and window cap are applied once to the net
+change rather than per outcome; the result only differs when a counter
+touches zero or the cap partway through the window. failure_streak is exact.
+
+Delivery Semantics:
+-------------------
+Callers of ``submit()`` wait until their session has been flushed, so the
+Kafka message is only acknowledged after its writes are committed. Flushes
+run as their own tasks, so cancelling one caller never cancels a flush that
+other callers are waiting on, and every waiting caller is resolved (with a
+result or an error) when its flush ends. If a coalesced flush fails, its
+sessions are retried one at a time so a single bad session only fails its
+own caller. Rolling metrics are derived from the injections the same
+statement moves to ``outcome_recorded = TRUE``, so they commit or roll back
+together: a retried, redelivered or duplicate session whose injections are
+already recorded adds nothing, and each outcome is applied exactly once.
+The heuristic write before it is idempotent and the effectiveness
+recomputation after it is non-critical, so neither can cause a double count.
+Duplicate deliveries of a session that is buffered or being flushed share
+that flush.
+
+Reference:
+    - OMN-1678: Rolling window metric updates with decay approximation
+    - OMN-1679: FEEDBACK-004 contribution heuristic for outcome attribution
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, TypedDict
+from uuid import UUID
+
+from omniintelligence.enums import EnumHeuristicMethod
+from omniintelligence.nodes.node_pattern_feedback_effect.handlers.handler_session_outcome import (
+    ROLLING_WINDOW_SIZE,
+    SQL_UPDATE_AND_RETURN_EFFECTIVENESS_SCORES,
+)
+from omniintelligence.nodes.node_pattern_feedback_effect.handlers.heuristics import (
+    apply_heuristic,
+)
+from omniintelligence.protocols import ProtocolPatternRepository
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_COALESCE_WINDOW_MS: float = 200.0
+"""Maximum time a buffered session outcome waits before it is flushed."""
+
+DEFAULT_MAX_PENDING_SESSIONS: int = 256
+"""Buffered sessions that trigger an immediate flush."""
+
+# =============================================================================
+# SQL Queries
+# =============================================================================
+
+# Store contribution heuristics for many injections at once.
+# Idempotency: only update rows where contribution_heuristic IS NULL.
+# Parameters: $1 = injection_ids, $2 = weights JSON, $3 = methods, $4 = confidences
+SQL_BATCH_UPDATE_INJECTION_HEURISTICS = """
+UPDATE pattern_injections pi
+SET
+    contribution_heuristic = h.weights::jsonb,
+    heuristic_method = h.method,
+    heuristic_confidence = h.confidence,
+    updated_at = NOW()
+FROM unnest($1::uuid[], $2::text[], $3::text[], $4::float8[])
+    AS h(injection_id, weights, method, confidence)
+WHERE pi.injection_id = h.injection_id
+  AND pi.contribution_heuristic IS NULL
+"""
+# Mark the flush's injections recorded and apply each pattern's ordered
+# outcome sequence ('S'/'F' per session) in one statement. Only sessions with
+# at least one injection moved to recorded by THIS statement contribute, so
+# metrics can never be applied twice for the same injections.
+# The decaying suffix is the last GREATEST(injection_count + n - $7, 0)
+# outcomes: those recorded once the window is at its cap.
+# Parameters: $1 = injection_ids, $2 = session ordinals (per injection),
+#             $3 = outcome_success, $4 = failure reasons,
+#             $5 = session ordinals (per pattern), $6 = pattern_ids,
+#             $7 = ROLLING_WINDOW_SIZE
+# Returns one row per marked injection (session_ord set) and one row per
+# updated pattern (id set).
+SQL_RECORD_COALESCED_OUTCOMES = """
+WITH marked AS (
+    UPDATE pattern_injections pi
+    SET
+        outcome_recorded = TRUE,
+        outcome_success = s.success,
+        outcome_failure_reason = s.failure_reason,
+        outcome_recorded_at = NOW()
+    FROM unnest($1::uuid[], $2::int[], $3::boolean[], $4::text[])
+        AS s(injection_id, session_ord, success, failure_reason)
+    WHERE pi.injection_id = s.injection_id
+      AND pi.outcome_recorded = FALSE
+    RETURNING s.session_ord, s.success
+),
+outcome_sequences AS (
+    SELECT
+        p.pattern_id AS id,
+        string_agg(
+            CASE WHEN r.success THEN 'S' ELSE 'F' END, '' ORDER BY r.session_ord
+        ) AS outcomes
+    FROM (SELECT DISTINCT session_ord, success FROM marked) r
+    JOIN unnest($5::int[], $6::uuid[]) AS p(session_ord, pattern_id)
+        ON p.session_ord = r.session_ord
+    GROUP BY p.pattern_id
+),
+d AS (
+    SELECT
+        id,
+        outcomes,
+        length(outcomes) - length(replace(outcomes, 'S', '')) AS successes,
+        length(outcomes) - length(replace(outcomes, 'F', '')) AS failures,
+        length(outcomes) - length(rtrim(outcomes, 'F')) AS trailing_failures
+    FROM outcome_sequences
+),
+applied AS (
+    UPDATE learned_patterns lp
+    SET
+        injection_count_rolling_20 = LEAST(
+            lp.injection_count_rolling_20 + d.successes + d.failures, $7
+        ),
+        success_count_rolling_20 = LEAST(GREATEST(
+            lp.success_count_rolling_20 + d.successes
+            - length(replace(right(
+                d.outcomes,
+                GREATEST(lp.injection_count_rolling_20 + d.successes + d.failures - $7, 0)
+            ), 'S', '')),
+            0
+        ), $7),
+        failure_count_rolling_20 = LEAST(GREATEST(
+            lp.failure_count_rolling_20 + d.failures
+            - length(replace(right(
+                d.outcomes,
+                GREATEST(lp.injection_count_rolling_20 + d.successes + d.failures - $7, 0)
+            ), 'F', '')),
+            0
+        ), $7),
+        failure_streak = CASE
+            WHEN d.successes > 0 THEN d.trailing_failures
+            ELSE lp.failure_streak + d.failures
+        END,
+        updated_at = NOW()
+    FROM d
+    WHERE lp.id = d.id
+    RETURNING lp.id
+)
+SELECT session_ord, NULL::uuid AS id FROM marked
+UNION ALL
+SELECT NULL::int AS session_ord, id FROM applied
+"""
+
+# =============================================================================
+# Type Definitions
+# =============================================================================
+
+
+class CoalescedSessionResult(TypedDict):
+    """Per-session outcome of a coalesced flush."""
+
+    injections_updated: int
+    patterns_updated: int
+    effectiveness_scores: dict[UUID, float] | None
+
+
+@dataclass(slots=True)
+class _PendingSession:
+    """A session outcome buffered until the next flush."""
+
+    success: bool
+    failure_reason: str | None
+    injection_ids: list[UUID]
+    pattern_ids: list[UUID]
+    heuristic: tuple[str, str, float] | None
+    future: asyncio.Future[CoalescedSessionResult] = field(repr=False)
+
+
+# =============================================================================
+# Aggregator
+# =============================================================================
+
+
+class SessionOutcomeAggregator:
+    """Buffers session outcomes and flushes them as set-based writes.
+
+    Sessions are flushed when ``max_pending_sessions`` are buffered or
+    ``window_ms`` after the first one arrived, whichever comes first.
+    Flushes run one at a time so a pattern's outcomes are applied in
+    arrival order across flushes.
+
+    Call ``flush()`` before shutting down so buffered sessions are written.
+    """
+
+    def __init__(
+        self,
+        repository: ProtocolPatternRepository,
+        *,
+        window_ms: float = DEFAULT_COALESCE_WINDOW_MS,
+        max_pending_sessions: int = DEFAULT_MAX_PENDING_SESSIONS,
+    ) -> None:
+        if window_ms < 0:
+            raise ValueError(f"window_ms must be >= 0, got {window_ms}")
+        if max_pending_sessions < 1:
+            raise ValueError(
+                f"max_pending_sessions must be >= 1, got {max_pending_sessions}"
+            )
+        self._repository = repository
+        self._window_s = window_ms / 1000.0
+        self._max_pending_sessions = max_pending_sessions
+        self._flush_lock = asyncio.Lock()
+        self._pending: dict[UUID, _PendingSession] = {}
+        self._in_flight: dict[UUID, _PendingSession] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered sessions not yet handed to a flush."""
+        return len(self._pending)
+
+    async def submit(
+        self,
+        *,
+        session_id: UUID,
+        success: bool,
+        failure_reason: str | None,
+        injection_rows: list[Mapping[str, Any]],
+        heuristic_method: EnumHeuristicMethod,
+    ) -> CoalescedSessionResult:
+        """Buffer a session outcome and wait until it has been flushed.
+
+        Args:
+            session_id: The Claude Code session ID.
+            success: Whether the session succeeded.
+            failure_reason: Failure reason, already cleared for successes.
+            injection_rows: Unrecorded injections for the session, in
+                canonical (injected_at, injection_id) order.
+            heuristic_method: Method for computing contribution attribution.
+
+        Returns:
+            Per-session counts and effectiveness scores from the flush.
+
+        Raises:
+            Exception: Propagates database errors from the flush.
+        """
+        pending = self._pending.get(session_id) or self._in_flight.get(session_id)
+        if pending is None:
+            pending = self._buffer(
+                success=success,
+                failure_reason=failure_reason,
+                injection_rows=injection_rows,
+                heuristic_method=heuristic_method,
+            )
+            self._pending[session_id] = pending
+            if len(self._pending) >= self._max_pending_sessions:
+                self._start_flush()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(
+                    self._window_s, self._on_timer
+                )
+        # Shield so a cancelled caller does not cancel the shared future.
+        return await asyncio.shield(pending.future)
+
+    async def flush(self) -> None:
+        """Flush buffered sessions and wait for in-flight flushes."""
+        self._start_flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    def _buffer(
+        self,
+        *,
+        success: bool,
+        failure_reason: str | None,
+        injection_rows: list[Mapping[str, Any]],
+        heuristic_method: EnumHeuristicMethod,
+    ) -> _PendingSession:
+        ordered_pattern_ids: list[UUID] = []
+        for row in injection_rows:
+            ordered_pattern_ids.extend(row.get("pattern_ids") or [])
+
+        heuristic: tuple[str, str, float] | None = None
+        if ordered_pattern_ids:
+            weights, confidence = apply_heuristic(
+                method=heuristic_method,
+                ordered_pattern_ids=ordered_pattern_ids,
+            )
+            heuristic = (json.dumps(weights), heuristic_method.value, confidence)
+
+        return _PendingSession(
+            success=success,
+            failure_reason=failure_reason,
+            injection_ids=[row["injection_id"] for row in injection_rows],
+            pattern_ids=list(dict.fromkeys(ordered_pattern_ids)),
+            heuristic=heuristic,
+            future=asyncio.get_running_loop().create_future(),
+        )
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._start_flush()
+
+    def _start_flush(self) -> None:
+        """Cut the buffered sessions into a batch and flush it in a task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Batches are cut in arrival order, and their tasks reach the lock in
+        # creation order (asyncio.Lock wakes waiters FIFO), so they also
+        # flush in order.
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        self._in_flight.update(batch)
+        task = asyncio.get_running_loop().create_task(self._run_flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _run_flush(self, batch: dict[UUID, _PendingSession]) -> None:
+        try:
+            async with self._flush_lock:
+                await self._flush_batch(batch)
+        finally:
+            for session_id, pending in batch.items():
+                self._in_flight.pop(session_id, None)
+                # Only reached if the flush task itself was cancelled.
+                if not pending.future.done():
+                    pending.future.set_exception(
+                        RuntimeError("Coalesced session outcome flush was cancelled")
+                    )
+
+    async def _flush_batch(self, batch: dict[UUID, _PendingSession]) -> None:
+        try:
+            results = await self._write_batch(batch)
+        except Exception:  # broad-catch-ok: asyncpg driver boundary
+            logger.warning(
+                "Coalesced session outcome flush failed; retrying per session",
+                exc_info=True,
+                extra={"session_count": len(batch)},
+            )
+        else:
+            for session_id, pending in batch.items():
+                if not pending.future.done():
+                    pending.future.set_result(results[session_id])
+            return
+
+        # A failing caller re-raises, so its message is not acknowledged and
+        # is redelivered; the other sessions still complete.
+        for session_id, pending in batch.items():
+            try:
+                result = await self._write_batch({session_id: pending})
+            except Exception as exc:  # broad-catch-ok: asyncpg driver boundary
+                logger.warning(
+                    "Session outcome write failed",
+                    exc_info=True,
+                    extra={"session_id": str(session_id)},
+                )
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+                continue
+            if not pending.future.done():
+                pending.future.set_result(result[session_id])
+
+    async def _write_batch(
+        self, batch: dict[UUID, _PendingSession]
+    ) -> dict[UUID, CoalescedSessionResult]:
+        repository = self._repository
+
+        # Step 1: contribution heuristics (idempotent, safe to repeat)
+        heuristic_rows = [
+            (injection_id, *pending.heuristic)
+            for pending in batch.values()
+            if pending.heuristic is not None
+            for injection_id in pending.injection_ids
+        ]
+        if heuristic_rows:
+            injection_ids, weights, methods, confidences = zip(
+                *heuristic_rows, strict=True
+            )
+            await repository.execute(
+                SQL_BATCH_UPDATE_INJECTION_HEURISTICS,
+                list(injection_ids),
+                list(weights),
+                list(methods),
+                list(confidences),
+            )
+
+        # Step 2: mark injections recorded and apply rolling metrics in one
+        # statement, so a failure anywhere leaves both untouched and a retry
+        # cannot count an already-recorded session again.
+        session_ids = list(batch)
+        mark_rows = [
+            (injection_id, ordinal, pending.success, pending.failure_reason)
+            for ordinal, pending in enumerate(batch.values())
+            for injection_id in pending.injection_ids
+        ]
+        pattern_rows = [
+            (ordinal, pattern_id)
+            for ordinal, pending in enumerate(batch.values())
+            for pattern_id in pending.pattern_ids
+        ]
+        injections_updated: dict[UUID, int] = {}
+        updated_ids: set[UUID] = set()
+        if mark_rows:
+            injection_ids, ordinals, successes, reasons = zip(*mark_rows, strict=True)
+            pattern_ordinals, pattern_ids_by_session = (
+                zip(*pattern_rows, strict=True) if pattern_rows else ((), ())
+            )
+            rows = await repository.fetch(
+                SQL_RECORD_COALESCED_OUTCOMES,
+                list(injection_ids),
+                list(ordinals),
+                list(successes),
+                list(reasons),
+                list(pattern_ordinals),
+                list(pattern_ids_by_session),
+                ROLLING_WINDOW_SIZE,
+            )
+            for row in rows:
+                if row["id"] is not None:
+                    updated_ids.add(row["id"])
+                else:
+                    session_id = session_ids[row["session_ord"]]
+                    injections_updated[session_id] = (
+                        injections_updated.get(session_id, 0) + 1
+                    )
+
+        # Step 3: effectiveness scores (non-critical, as in the per-session path)
+        pattern_ids = sorted(updated_ids)
+        scores: dict[UUID, float] | None = {}
+        if pattern_ids:
+            try:
+                score_rows = await repository.fetch(
+                    SQL_UPDATE_AND_RETURN_EFFECTIVENESS_SCORES, pattern_ids
+                )
+                scores = {row["id"]: float(row["quality_score"]) for row in score_rows}
+            except Exception:  # broad-catch-ok: asyncpg driver boundary
+                scores = None
+                logger.warning(
+                    "Effectiveness scoring failed for coalesced flush — "
+                    "scores will be stale until next successful recomputation",
+                    exc_info=True,
+                    extra={
+                        "event": "effectiveness_scoring_failed",
+                        "pattern_count": len(pattern_ids),
+                    },
+                )
+
+        return {
+            session_id: CoalescedSessionResult(
+                injections_updated=injections_updated.get(session_id, 0),
+                patterns_updated=(
+                    sum(1 for pid in pending.pattern_ids if pid in updated_ids)
+                    if session_id in injections_updated
+                    else 0
+                ),
+                effectiveness_scores=(
+                    {pid: scores[pid] for pid in pending.pattern_ids if pid in scores}
+                    if scores is not None
+                    else None
+                ),
+            )
+            for session_id, pending in batch.items()
+        }
+
+
+__all__ = [
+    "DEFAULT_COALESCE_WINDOW_MS",
+    "DEFAULT_MAX_PENDING_SESSIONS",
+    "CoalescedSessionResult",
+    "SessionOutcomeAggregator",
+]
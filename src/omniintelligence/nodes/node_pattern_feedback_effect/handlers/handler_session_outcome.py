@@ -53,7 +53,7 @@ import json
 import logging
 from collections.abc import Mapping
 from datetime import UTC, datetime
-from typing import Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 from uuid import UUID
 
 from omnibase_core.integrations.claude_code import (
@@ -76,6 +76,11 @@ from omniintelligence.nodes.node_pattern_feedback_effect.models import (
 from omniintelligence.protocols import ProtocolKafkaPublisher, ProtocolPatternRepository
 from omniintelligence.utils.pg_status import parse_pg_status_count
 
+if TYPE_CHECKING:
+    from omniintelligence.nodes.node_pattern_feedback_effect.handlers.handler_outcome_aggregator import (
+        SessionOutcomeAggregator,
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -279,6 +284,7 @@ async def record_session_outcome(
     correlation_id: UUID | None = None,
     heuristic_method: EnumHeuristicMethod = EnumHeuristicMethod.EQUAL_SPLIT,
     producer: ProtocolKafkaPublisher | None = None,
+    aggregator: SessionOutcomeAggregator | None = None,
 ) -> ModelSessionOutcomeResult:
     """Record the outcome of a Claude Code session and update pattern metrics.
 
@@ -305,6 +311,11 @@ async def record_session_outcome(
             scoring. Operation succeeds regardless of Kafka availability — if
             producer is None or publish fails, a warning is logged and the
             primary outcome recording is unaffected.
+        aggregator: Optional write-coalescing aggregator. When provided,
+            steps 3-6 are buffered and flushed together with other sessions
+            as set-based writes, and this call returns once the flush has
+            committed. See handler_outcome_aggregator.py for the exactly-once
+            metric semantics of that path.
 
     Returns:
         ModelSessionOutcomeResult with status, counts, and effectiveness scores.
@@ -419,108 +430,124 @@ async def record_session_outcome(
         {pid for row in injection_rows for pid in (row["pattern_ids"] or [])}
     )
 
-    # Step 3: Mark injections as recorded
     # Clear failure_reason if success (don't store stale error messages)
     effective_failure_reason = failure_reason if not success else None
 
-    update_status = await repository.execute(
-        SQL_MARK_INJECTIONS_RECORDED,
-        session_id,
-        success,
-        effective_failure_reason,
-    )
-
-    # Parse number of updated rows from status string (e.g., "UPDATE 5")
-    injections_updated = parse_pg_status_count(update_status)
-
-    logger.debug(
-        "Marked injections as recorded",
-        extra={
-            "correlation_id": str(correlation_id) if correlation_id else None,
-            "session_id": str(session_id),
-            "injections_updated": injections_updated,
-            "pattern_count": len(pattern_ids),
-        },
-    )
-
-    # Step 4: Compute and store contribution heuristics
-    await compute_and_store_heuristics(
-        injection_rows=injection_rows,
-        heuristic_method=heuristic_method,
-        repository=repository,
-    )
+    effectiveness_scores: dict[UUID, float] | None = {}
+    if aggregator is not None:
+        # Steps 3-6 coalesced with concurrent sessions into set-based writes
+        coalesced = await aggregator.submit(
+            session_id=session_id,
+            success=success,
+            failure_reason=effective_failure_reason,
+            injection_rows=injection_rows,
+            heuristic_method=heuristic_method,
+        )
+        injections_updated = coalesced["injections_updated"]
+        patterns_updated = coalesced["patterns_updated"]
+        effectiveness_scores = coalesced["effectiveness_scores"]
+    else:
+        # Step 3: Mark injections as recorded
+        update_status = await repository.execute(
+            SQL_MARK_INJECTIONS_RECORDED,
+            session_id,
+            success,
+            effective_failure_reason,
+        )
 
-    logger.debug(
-        "Computed contribution heuristics",
-        extra={
-            "correlation_id": str(correlation_id) if correlation_id else None,
-            "session_id": str(session_id),
-            "heuristic_method": heuristic_method.value,
-            "injection_count": len(injection_rows),
-        },
-    )
+        # Parse number of updated rows from status string (e.g., "UPDATE 5")
+        injections_updated = parse_pg_status_count(update_status)
+
+        logger.debug(
+            "Marked injections as recorded",
+            extra={
+                "correlation_id": str(correlation_id) if correlation_id else None,
+                "session_id": str(session_id),
+                "injections_updated": injections_updated,
+                "pattern_count": len(pattern_ids),
+            },
+        )
 
-    # Step 5: Update rolling metrics for all patterns
-    patterns_updated = 0
-    if pattern_ids:
-        patterns_updated = await update_pattern_rolling_metrics(
-            pattern_ids=pattern_ids,
-            success=success,
+        # Step 4: Compute and store contribution heuristics
+        await compute_and_store_heuristics(
+            injection_rows=injection_rows,
+            heuristic_method=heuristic_method,
             repository=repository,
         )
 
-    logger.debug(
-        "Updated pattern rolling metrics",
-        extra={
-            "correlation_id": str(correlation_id) if correlation_id else None,
-            "session_id": str(session_id),
-            "patterns_updated": patterns_updated,
-            "success": success,
-        },
-    )
+        logger.debug(
+            "Computed contribution heuristics",
+            extra={
+                "correlation_id": str(correlation_id) if correlation_id else None,
+                "session_id": str(session_id),
+                "heuristic_method": heuristic_method.value,
+                "injection_count": len(injection_rows),
+            },
+        )
 
-    # Step 6: Recompute effectiveness scores from updated rolling metrics
-    # If scoring fails, the critical operations (marking injections recorded
-    # + updating rolling metrics) already succeeded. We signal the failure
-    # to the caller via None (distinct from {} which means "no patterns to
-    # score") so they can detect persistent scoring degradation.
-    effectiveness_scores: dict[UUID, float] | None = {}
-    if pattern_ids:
-        try:
-            effectiveness_scores = await update_effectiveness_scores(
+        # Step 5: Update rolling metrics for all patterns
+        patterns_updated = 0
+        if pattern_ids:
+            patterns_updated = await update_pattern_rolling_metrics(
                 pattern_ids=pattern_ids,
+                success=success,
                 repository=repository,
             )
-        except Exception:
-            # NOTE: Broad catch is intentional -- effectiveness scoring is non-critical
-            # and must not block session outcome recording. Infrastructure exceptions
-            # (asyncpg errors) are expected; programming errors will be visible via
-            # the exc_info=True traceback in logs.
-            effectiveness_scores = None
-            logger.warning(
-                "Effectiveness scoring failed — critical path unaffected, "
-                "scores will be stale until next successful recomputation",
-                exc_info=True,
-                extra={
-                    "event": "effectiveness_scoring_failed",
-                    "correlation_id": str(correlation_id) if correlation_id else None,
-                    "session_id": str(session_id),
-                    "pattern_count": len(pattern_ids),
-                },
-            )
 
-    logger.debug(
-        "Updated effectiveness scores",
-        extra={
-            "correlation_id": str(correlation_id) if correlation_id else None,
-            "session_id": str(session_id),
-            "scores": (
-                {str(k): v for k, v in effectiveness_scores.items()}
-                if effectiveness_scores is not None
-                else None
-            ),
-        },
-    )
+        logger.debug(
+            "Updated pattern rolling metrics",
+            extra={
+                "correlation_id": str(correlation_id) if correlation_id else None,
+                "session_id": str(session_id),
+                "patterns_updated": patterns_updated,
+                "success": success,
+            },
+        )
+
+        # Step 6: Recompute effectiveness scores from updated rolling metrics
+        # If scoring fails, the critical operations (marking injections recorded
+        # + updating rolling metrics) already succeeded. We signal the failure
+        # to the caller via None (distinct from {} which means "no patterns to
+        # score") so they can detect persistent scoring degradation.
+        if pattern_ids:
+            try:
+                effectiveness_scores = await update_effectiveness_scores(
+                    pattern_ids=pattern_ids,
+                    repository=repository,
+                )
+            except Exception:
+                # NOTE: Broad catch is intentional -- effectiveness scoring is
+                # non-critical and must not block session outcome recording.
+                # Infrastructure exceptions (asyncpg errors) are expected;
+                # programming errors will be visible via the exc_info=True
+                # traceback in logs.
+                effectiveness_scores = None
+                logger.warning(
+                    "Effectiveness scoring failed — critical path unaffected, "
+                    "scores will be stale until next successful recomputation",
+                    exc_info=True,
+                    extra={
+                        "event": "effectiveness_scoring_failed",
+                        "correlation_id": (
+                            str(correlation_id) if correlation_id else None
+                        ),
+                        "session_id": str(session_id),
+                        "pattern_count": len(pattern_ids),
+                    },
+                )
+
+        logger.debug(
+            "Updated effectiveness scores",
+            extra={
+                "correlation_id": str(correlation_id) if correlation_id else None,
+                "session_id": str(session_id),
+                "scores": (
+                    {str(k): v for k, v in effectiveness_scores.items()}
+                    if effectiveness_scores is not None
+                    else None
+                ),
+            },
+        )
 
     # Step 6b: Emit quality-assessment commands for each updated pattern (OMN-8144)
     # Non-blocking — Kafka is optional; primary operation already completed above.
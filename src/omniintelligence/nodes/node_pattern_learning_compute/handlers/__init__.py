@@ -86,6 +86,9 @@ from omniintelligence.nodes.node_pattern_learning_compute.handlers.replay import
     ReplayArtifactEmitter,
     assert_json_safe,
 )
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.similarity_matrix import (
+    SimilarityMatrix,
+)
 from omniintelligence.nodes.node_pattern_learning_compute.handlers.union_find import (
     UnionFind,
 )
@@ -114,6 +117,7 @@ __all__ = [
     "PatternScoreComponentsDict",
     "PatternSignatureDict",
     "ReplayArtifactEmitter",
+    "SimilarityMatrix",
     "SimilarityResultDict",
     "SimilarityWeightsDict",
     "StructuralFeaturesDict",
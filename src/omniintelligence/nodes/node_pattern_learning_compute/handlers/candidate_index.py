@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Candidate pair generation (blocking) for pattern clustering.
+
+Lossless blocking stage for single-linkage clustering.
+Instead of scoring every (i, j) pair, only pairs that CAN clear the
+similarity threshold are enumerated, using a prefix-filtered inverted
+index over the token-set components of the similarity function.
+
+Why This Is Lossless:
+    The weighted similarity is a sum of five components, each in [0.0, 1.0]:
+
+        sim = w_k*J_kw + w_p*J_pat + w_l*J_lbl + w_s*S_struct + w_c*C_ctx
+
+    For any subset S of the Jaccard components, bounding every component
+    outside S by 1.0 gives:
+
+        sim >= threshold  =>  sum_{c in S} w_c*J_c >= threshold - sum_{c not in S} w_c
+                          =>  max_{c in S} J_c >= tau_S
+        where tau_S = (threshold - sum_{c not in S} w_c) / sum_{c in S} w_c
+
+    So whenever tau_S > 0, a pair clearing the threshold must have Jaccard
+    >= tau_S on at least one indexed component. Standard prefix filtering
+    (AllPairs) then guarantees that two sets with Jaccard >= tau share at
+    least one token within their first |A| - ceil(tau*|A|) + 1 tokens under
+    a shared global token order. Indexing only those prefix tokens therefore
+    finds every qualifying pair, and no pair that could clear the threshold
+    is ever dropped.
+
+Index Selection:
+    Every non-empty subset of {keyword, pattern, label} with tau_S > 0 is a
+    valid (lossless) index. Low-cardinality components such as labels produce
+    very long posting lists, so the subset with the smallest estimated probe
+    cost (sum of posting-list pairs) is selected. When no subset is valid
+    (e.g. the threshold is lower than the structural + context weights), the
+    generator falls back to exhaustive enumeration.
+
+Determinism Guarantees:
+    - Global token order: ascending document frequency, ties by token string
+    - Index subset selection: minimum cost, ties by fixed component order
+    - Pairs are yielded grouped by the larger index in ascending order, with
+      the smaller index ascending within each group
+    - Output depends only on the (sorted) input, never on hash ordering
+
+Usage:
+    from omniintelligence.nodes.node_pattern_learning_compute.handlers.candidate_index import (
+        iter_candidate_pairs,
+    )
+
+    for i, j in iter_candidate_pairs(sorted_features, threshold, weights):
+        ...  # i < j, score the pair exactly
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from itertools import combinations
+
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.protocols import (
+    ExtractedFeaturesDict,
+    SimilarityWeightsDict,
+)
+
+# Token-set components eligible for indexing, in fixed tie-break order.
+# Maps the similarity weight key to the ExtractedFeaturesDict field.
+_INDEXABLE_COMPONENTS: tuple[tuple[str, str], ...] = (
+    ("keyword", "keywords"),
+    ("pattern", "pattern_indicators"),
+    ("label", "labels"),
+)
+
+_ALL_WEIGHT_KEYS: tuple[str, ...] = (
+    "keyword",
+    "pattern",
+    "structural",
+    "label",
+    "context",
+)
+
+# Conservative margin applied to the derived Jaccard bound so floating point
+# rounding in the weighted sum can never cause a qualifying pair to be pruned.
+_BOUND_EPSILON: float = 1e-9
+
+
+def _required_jaccard(
+    subset: tuple[str, ...],
+    threshold: float,
+    weights: SimilarityWeightsDict,
+) -> float | None:
+    """Compute the minimum Jaccard an indexed component must reach.
+
+    Args:
+        subset: Weight keys of the indexed Jaccard components.
+        threshold: Clustering similarity threshold.
+        weights: Validated similarity weights.
+
+    Returns:
+        The conservative bound tau_S, or None if the subset cannot prune
+        (tau_S <= 0 or the indexed components carry no weight).
+    """
+    indexed_weight = sum(weights[key] for key in subset)  # type: ignore[literal-required]
+    if indexed_weight <= 0.0:
+        return None
+    # Components outside the index (including structural and context) are
+    # bounded by 1.0, i.e. contribute at most their full weight.
+    unindexed_weight = sum(
+        weights[key]  # type: ignore[literal-required]
+        for key in _ALL_WEIGHT_KEYS
+        if key not in subset
+    )
+    remaining = threshold - unindexed_weight
+    tau = remaining / indexed_weight - _BOUND_EPSILON
+    if tau <= 0.0:
+        return None
+    return tau
+
+
+def _prefix_length(set_size: int, tau: float) -> int:
+    """Number of leading tokens (in global order) that must be indexed.
+
+    Args:
+        set_size: Size of the token set.
+        tau: Required Jaccard similarity.
+
+    Returns:
+        Prefix length in [0, set_size].
+    """
+    if set_size == 0:
+        return 0
+    length = set_size - math.ceil(tau * set_size) + 1
+    return max(0, min(set_size, length))
+
+
+def _ordered_token_sets(
+    features: Sequence[ExtractedFeaturesDict],
+    field: str,
+) -> list[tuple[str, ...]]:
+    """Deduplicate each item's tokens and sort them rarest-first.
+
+    Args:
+        features: Items sorted by item_id.
+        field: ExtractedFeaturesDict field holding the token tuple.
+
+    Returns:
+        Per-item token tuples ordered by (document frequency, token).
+    """
+    token_sets = [frozenset(f[field]) for f in features]  # type: ignore[literal-required]
+    document_frequency: Counter[str] = Counter()
+    for tokens in token_sets:
+        document_frequency.update(tokens)
+    return [
+        tuple(sorted(tokens, key=lambda t: (document_frequency[t], t)))
+        for tokens in token_sets
+    ]
+
+
+def _probe_cost(ordered: list[tuple[str, ...]], tau: float) -> int:
+    """Estimate candidate pairs produced by indexing one component.
+
+    Args:
+        ordered: Per-item rarest-first token tuples.
+        tau: Required Jaccard similarity for this component.
+
+    Returns:
+        Sum over prefix tokens of posting-list pairs.
+    """
+    prefix_frequency: Counter[str] = Counter()
+    for tokens in ordered:
+        prefix_frequency.update(tokens[: _prefix_length(len(tokens), tau)])
+    return sum(f * (f - 1) // 2 for f in prefix_frequency.values())
+
+
+def select_index_components(
+    features: Sequence[ExtractedFeaturesDict],
+    threshold: float,
+    weights: SimilarityWeightsDict,
+) -> tuple[tuple[str, ...], float] | None:
+    """Choose which token-set components to index for candidate generation.
+
+    Args:
+        features: Items sorted by item_id.
+        threshold: Clustering similarity threshold.
+        weights: Validated similarity weights.
+
+    Returns:
+        (weight keys to index, required Jaccard bound), or None when no
+        lossless index exists and all pairs must be scored.
+    """
+    ordered_by_key = {
+        key: _ordered_token_sets(features, field)
+        for key, field in _INDEXABLE_COMPONENTS
+    }
+    keys = tuple(key for key, _ in _INDEXABLE_COMPONENTS)
+
+    best: tuple[int, tuple[str, ...], float] | None = None
+    for size in range(1, len(keys) + 1):
+        for subset in combinations(keys, size):
+            tau = _required_jaccard(subset, threshold, weights)
+            if tau is None:
+                continue
+            cost = sum(_probe_cost(ordered_by_key[key], tau) for key in subset)
+            # Strict < keeps the first subset in fixed order on ties
+            if best is None or cost < best[0]:
+                best = (cost, subset, tau)
+
+    if best is None:
+        return None
+    return best[1], best[2]
+
+
+def iter_candidate_pairs(
+    features: Sequence[ExtractedFeaturesDict],
+    threshold: float,
+    weights: SimilarityWeightsDict,
+) -> Iterator[tuple[int, int]]:
+    """Yield every index pair (i, j), i < j, that may clear the threshold.
+
+    The result is a superset of the pairs whose exact similarity is
+    >= threshold, so single-linkage clustering over these candidates
+    produces exactly the same partition as exhaustive pairwise scoring.
+
+    Args:
+        features: Items sorted by item_id (indices refer to this order).
+        threshold: Clustering similarity threshold.
+        weights: Validated similarity weights.
+
+    Yields:
+        Candidate pairs (i, j) with i < j. Pairs are grouped by j ascending,
+        and i is ascending within each group. Each pair is yielded once.
+    """
+    n = len(features)
+    selection = select_index_components(features, threshold, weights)
+
+    if selection is None:
+        # No lossless pruning possible: enumerate all pairs.
+        for j in range(1, n):
+            for i in range(j):
+                yield i, j
+        return
+
+    subset, tau = selection
+    field_by_key = dict(_INDEXABLE_COMPONENTS)
+    ordered_sets = [_ordered_token_sets(features, field_by_key[key]) for key in subset]
+
+    # One inverted index per component: token -> item indices (ascending).
+    # Items are indexed incrementally, so probing only sees earlier items.
+    indexes: list[dict[str, list[int]]] = [{} for _ in subset]
+
+    for j in range(n):
+        candidates: set[int] = set()
+        for ordered, index in zip(ordered_sets, indexes, strict=True):
+            tokens = ordered[j]
+            prefix = tokens[: _prefix_length(len(tokens), tau)]
+            for token in prefix:
+                postings = index.get(token)
+                if postings is not None:
+                    candidates.update(postings)
+            for token in prefix:
+                index.setdefault(token, []).append(j)
+
+        for i in sorted(candidates):
+            yield i, j
+
+
+__all__ = ["iter_candidate_pairs", "select_index_components"]
@@ -40,9 +40,8 @@ from __future__ import annotations
 import hashlib
 from typing import Final
 
-from omniintelligence.nodes.node_pattern_learning_compute.handlers.handler_pattern_clustering import (
-    compute_similarity,
-)
+import numpy as np
+
 from omniintelligence.nodes.node_pattern_learning_compute.handlers.presets import (
     DEFAULT_DEDUPLICATION_THRESHOLD,
     DEFAULT_SIMILARITY_WEIGHTS,
@@ -58,6 +57,9 @@ from omniintelligence.nodes.node_pattern_learning_compute.handlers.protocols imp
     PatternSignatureResultDict,
     SimilarityWeightsDict,
 )
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.similarity_matrix import (
+    SimilarityMatrix,
+)
 
 # =============================================================================
 # Constants
@@ -175,7 +177,8 @@ def deduplicate_patterns(
     Algorithm:
         1. Sort clusters by cluster_id for determinism
         2. For each pair (A, B) where A < B in sort order:
-           - Compute similarity using centroid features
+           - Compute similarity using centroid features (one vectorized
+             SimilarityMatrix row per surviving A)
            - If similarity >= threshold: drop the weaker cluster
            - If threshold - margin <= similarity < threshold: emit warning
         3. Return surviving clusters in original sorted order
@@ -262,6 +265,13 @@ def deduplicate_patterns(
         c["cluster_id"]: c for c in sorted_clusters
     }
 
+    # Encode centroid features once for vectorized similarity rows
+    engine = SimilarityMatrix(
+        [c["centroid_features"] for c in sorted_clusters],
+        weights,
+    )
+    near_threshold_lower = similarity_threshold - near_threshold_margin
+
     # Step 2: Pairwise comparison in sorted order
     n = len(sorted_clusters)
     for i in range(n):
@@ -272,7 +282,12 @@ def deduplicate_patterns(
         if cluster_a_id not in alive:
             continue
 
-        for j in range(i + 1, n):
+        # Similarity of A to every later cluster using centroid features.
+        # Pairs below the warning zone neither merge nor warn, so only
+        # the remaining j (ascending) need to be visited.
+        row = engine.block_similarities([i], range(i + 1, n))[0]
+        for offset in np.flatnonzero(row >= near_threshold_lower).tolist():
+            j = i + 1 + offset
             cluster_b = sorted_clusters[j]
             cluster_b_id = cluster_b["cluster_id"]
 
@@ -280,16 +295,9 @@ def deduplicate_patterns(
             if cluster_b_id not in alive:
                 continue
 
-            # Compute similarity using centroid features
-            sim_result = compute_similarity(
-                cluster_a["centroid_features"],
-                cluster_b["centroid_features"],
-                weights,
-            )
-            similarity = sim_result["similarity"]
+            similarity = float(row[offset])
 
             # Check near-threshold (warning zone)
-            near_threshold_lower = similarity_threshold - near_threshold_margin
             is_near_threshold = (
                 near_threshold_lower <= similarity < similarity_threshold
             )
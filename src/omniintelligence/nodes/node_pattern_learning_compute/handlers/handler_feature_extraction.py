@@ -59,6 +59,7 @@ from omniintelligence.nodes.node_pattern_learning_compute.handlers.utils import
 from omniintelligence.nodes.node_pattern_learning_compute.models import (
     TrainingDataItemDict,
 )
+from omniintelligence.utils.parse_cache import parse_python
 
 # =============================================================================
 # Public API
@@ -109,7 +110,7 @@ def extract_features(item: TrainingDataItemDict) -> ExtractedFeaturesDict:
 
     # Attempt AST parsing
     try:
-        tree = ast.parse(code_snippet)
+        tree = parse_python(code_snippet)
     except SyntaxError:
         # Graceful fallback for syntax errors
         return _create_minimal_features(
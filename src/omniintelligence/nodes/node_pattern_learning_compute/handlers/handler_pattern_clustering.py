@@ -8,15 +8,24 @@ pipeline. It computes similarity between extracted features and clusters similar
 patterns together using single-linkage clustering.
 
 Algorithm Overview:
-    1. Compute pairwise similarity matrix between all feature sets
-    2. Apply single-linkage clustering (merge if ANY pair >= threshold)
+    1. Generate candidate pairs via a lossless prefix-filtered token index
+       (see candidate_index); pairs that cannot clear the threshold are
+       never scored
+    2. Apply single-linkage clustering (merge if ANY pair >= threshold),
+       skipping candidates that are already connected
     3. Select medoid (most representative member) as centroid
     4. Emit replay artifacts for debugging and comparison
 
+    Steps 1-3 score pairs in bulk through SimilarityMatrix, which encodes
+    the features once per run and reproduces compute_similarity() scores
+    bit for bit.
+
 Determinism Guarantees (CRITICAL):
     All operations are deterministic given the same input:
     - Items sorted by item_id before processing
-    - Edges built in sorted (i, j) order where i < j
+    - Candidate pairs generated in a deterministic order (i < j)
+    - Union-Find root = smallest index, so the partition does not depend
+      on edge order and matches exhaustive pairwise scoring exactly
     - Cluster leader = smallest item_id in cluster
     - cluster_id assigned by sorted leader order
     - Medoid tie-break by smallest item_id
@@ -49,12 +58,19 @@ Usage:
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Sequence
+
+import numpy as np
 
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.candidate_index import (
+    iter_candidate_pairs,
+)
 from omniintelligence.nodes.node_pattern_learning_compute.handlers.exceptions import (
     PatternLearningValidationError,
 )
 from omniintelligence.nodes.node_pattern_learning_compute.handlers.presets import (
     DEFAULT_CLUSTERING_THRESHOLD,
+    DEFAULT_MAX_CLUSTERING_INPUT_ITEMS,
     DEFAULT_SIMILARITY_WEIGHTS,
     ONEX_PATTERN_KEYWORDS,
 )
@@ -69,6 +85,16 @@ from omniintelligence.nodes.node_pattern_learning_compute.handlers.replay import
     NULL_EMITTER,
     ReplayArtifactEmitter,
 )
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.similarity_matrix import (
+    MAX_CLASS_COUNT_DIFF,
+    MAX_CYCLOMATIC_COMPLEXITY_DIFF,
+    MAX_FUNCTION_COUNT_DIFF,
+    MAX_LINE_COUNT_DIFF,
+    MAX_NESTING_DEPTH_DIFF,
+    STRUCTURAL_WEIGHTS,
+    SimilarityMatrix,
+    sequential_sum,
+)
 from omniintelligence.nodes.node_pattern_learning_compute.handlers.union_find import (
     UnionFind,
 )
@@ -79,37 +105,8 @@ from omniintelligence.nodes.node_pattern_learning_compute.handlers.utils import
     validate_similarity_weights,
 )
 
-# =============================================================================
-# Constants for Structural Similarity Computation
-# =============================================================================
-
-# Maximum expected differences for structural feature normalization.
-# These values define the scaling factors for computing normalized distances.
-_MAX_CLASS_COUNT_DIFF: float = 20.0
-_MAX_FUNCTION_COUNT_DIFF: float = 50.0
-_MAX_NESTING_DEPTH_DIFF: float = 10.0
-_MAX_LINE_COUNT_DIFF: float = 500.0
-_MAX_CYCLOMATIC_COMPLEXITY_DIFF: float = 50.0
-
-# Weights for combining structural sub-features into a single similarity score.
-# These weights prioritize function count and complexity as primary indicators
-# of structural similarity.
-_STRUCTURAL_WEIGHTS: dict[str, float] = {
-    "class_count": 0.15,
-    "function_count": 0.25,
-    "max_nesting_depth": 0.15,
-    "line_count": 0.15,
-    "cyclomatic_complexity": 0.20,
-    "has_type_hints": 0.05,
-    "has_docstrings": 0.05,
-}
-
-# Validate weights sum to 1.0 at module load time
-_structural_weights_sum = sum(_STRUCTURAL_WEIGHTS.values())
-assert abs(_structural_weights_sum - 1.0) < 1e-9, (
-    f"_STRUCTURAL_WEIGHTS must sum to 1.0, got {_structural_weights_sum}"
-)
-
+# Candidate pairs scored per vectorized SimilarityMatrix call
+_PAIR_BATCH_SIZE: int = 4096
 
 # =============================================================================
 # Private Helper Functions
@@ -219,7 +216,7 @@ def _compute_structural_similarity(
                 compute_normalized_distance(
                     float(struct_a["class_count"]),
                     float(struct_b["class_count"]),
-                    _MAX_CLASS_COUNT_DIFF,
+                    MAX_CLASS_COUNT_DIFF,
                 )
             ),
         ),
@@ -229,7 +226,7 @@ def _compute_structural_similarity(
                 compute_normalized_distance(
                     float(struct_a["function_count"]),
                     float(struct_b["function_count"]),
-                    _MAX_FUNCTION_COUNT_DIFF,
+                    MAX_FUNCTION_COUNT_DIFF,
                 )
             ),
         ),
@@ -239,7 +236,7 @@ def _compute_structural_similarity(
                 compute_normalized_distance(
                     float(struct_a["max_nesting_depth"]),
                     float(struct_b["max_nesting_depth"]),
-                    _MAX_NESTING_DEPTH_DIFF,
+                    MAX_NESTING_DEPTH_DIFF,
                 )
             ),
         ),
@@ -249,7 +246,7 @@ def _compute_structural_similarity(
                 compute_normalized_distance(
                     float(struct_a["line_count"]),
                     float(struct_b["line_count"]),
-                    _MAX_LINE_COUNT_DIFF,
+                    MAX_LINE_COUNT_DIFF,
                 )
             ),
         ),
@@ -259,7 +256,7 @@ def _compute_structural_similarity(
                 compute_normalized_distance(
                     float(struct_a["cyclomatic_complexity"]),
                     float(struct_b["cyclomatic_complexity"]),
-                    _MAX_CYCLOMATIC_COMPLEXITY_DIFF,
+                    MAX_CYCLOMATIC_COMPLEXITY_DIFF,
                 )
             ),
         ),
@@ -275,16 +272,32 @@ def _compute_structural_similarity(
     ]
 
     # Weighted combination using sum() to preserve original floating point behavior
-    total_similarity = sum(
-        _STRUCTURAL_WEIGHTS[name] * sim for name, sim in similarities
-    )
+    total_similarity = sum(STRUCTURAL_WEIGHTS[name] * sim for name, sim in similarities)
 
     return total_similarity
 
 
+def _member_engine(
+    members: list[ExtractedFeaturesDict],
+    weights: SimilarityWeightsDict,
+    engine: SimilarityMatrix | None,
+    member_indices: Sequence[int] | None,
+) -> tuple[SimilarityMatrix, Sequence[int]]:
+    """Resolve the engine and row indices addressing members.
+
+    Falls back to encoding a standalone engine over members when no shared
+    engine is supplied.
+    """
+    if engine is None or member_indices is None:
+        return SimilarityMatrix(members, weights), range(len(members))
+    return engine, member_indices
+
+
 def _select_medoid(
     members: list[ExtractedFeaturesDict],
     weights: SimilarityWeightsDict,
+    engine: SimilarityMatrix | None = None,
+    member_indices: Sequence[int] | None = None,
 ) -> ExtractedFeaturesDict:
     """Select the medoid (most representative member) of a cluster.
 
@@ -297,6 +310,10 @@ def _select_medoid(
     Args:
         members: List of cluster members (ExtractedFeaturesDict).
         weights: Similarity weights to use for medoid computation.
+        engine: Optional shared SimilarityMatrix that already encodes the
+            members. Used together with member_indices.
+        member_indices: Row of each member in engine (members[i] is row
+            member_indices[i]). A standalone engine is built when omitted.
 
     Returns:
         The medoid member (most representative features).
@@ -318,20 +335,24 @@ def _select_medoid(
     if len(members) == 1:
         return members[0]
 
-    # Compute average similarity for each member to all others
-    avg_similarities: list[tuple[str, float, ExtractedFeaturesDict]] = []
-
-    for i, member_i in enumerate(members):
-        total_sim = 0.0
-        count = 0
-        for j, member_j in enumerate(members):
-            if i != j:
-                result = compute_similarity(member_i, member_j, weights)
-                total_sim += result["similarity"]
-                count += 1
+    engine, member_indices = _member_engine(members, weights, engine, member_indices)
+
+    # Average similarity of each member to all others, computed in row
+    # blocks so large clusters never materialize the full (k, k) matrix.
+    # The diagonal is zeroed and rows are summed left-to-right so totals
+    # match a scalar running sum over j != i exactly.
+    averages = np.empty(len(members), dtype=np.float64)
+    for offset, block in engine.iter_row_blocks(member_indices):
+        rows = np.arange(block.shape[0])
+        block[rows, rows + offset] = 0.0
+        averages[offset : offset + block.shape[0]] = sequential_sum(block, axis=1) / (
+            len(members) - 1
+        )
 
-        avg_sim = total_sim / count if count > 0 else 0.0
-        avg_similarities.append((member_i["item_id"], avg_sim, member_i))
+    avg_similarities: list[tuple[str, float, ExtractedFeaturesDict]] = [
+        (member["item_id"], float(avg_sim), member)
+        for member, avg_sim in zip(members, averages, strict=True)
+    ]
 
     # Sort by: (negative avg_similarity for descending, item_id for ascending tie-break)
     avg_similarities.sort(key=lambda x: (-x[1], x[0]))
@@ -343,6 +364,8 @@ def _select_medoid(
 def _compute_intra_cluster_similarity(
     members: list[ExtractedFeaturesDict],
     weights: SimilarityWeightsDict,
+    engine: SimilarityMatrix | None = None,
+    member_indices: Sequence[int] | None = None,
 ) -> float:
     """Compute average pairwise similarity within a cluster.
 
@@ -352,6 +375,10 @@ def _compute_intra_cluster_similarity(
     Args:
         members: List of cluster members.
         weights: Similarity weights for computation.
+        engine: Optional shared SimilarityMatrix that already encodes the
+            members. Used together with member_indices.
+        member_indices: Row of each member in engine. A standalone engine is
+            built when omitted.
 
     Returns:
         Average intra-cluster similarity in [0.0, 1.0].
@@ -359,17 +386,19 @@ def _compute_intra_cluster_similarity(
     if len(members) <= 1:
         return 1.0
 
-    total_sim = 0.0
-    count = 0
+    engine, member_indices = _member_engine(members, weights, engine, member_indices)
 
-    for i in range(len(members)):
-        for j in range(i + 1, len(members)):
-            result = compute_similarity(members[i], members[j], weights)
-            total_sim += result["similarity"]
-            count += 1
-
-    # Single-member cluster has perfect self-similarity
-    return total_sim / count if count > 0 else 1.0
+    # Upper triangle in row-major (i < j) order. The running total is
+    # carried across row blocks and seeds each block's sequential sum, so
+    # the result equals a single scalar running sum over all pairs.
+    total = 0.0
+    count = 0
+    for offset, block in engine.iter_row_blocks(member_indices):
+        rows, cols = np.triu_indices(block.shape[0], k=offset + 1, m=len(members))
+        upper = block[rows, cols]
+        total = float(sequential_sum(np.concatenate(([total], upper))))
+        count += upper.size
+    return total / count
 
 
 # =============================================================================
@@ -484,21 +513,26 @@ def cluster_patterns(
     features_list: list[ExtractedFeaturesDict],
     threshold: float = DEFAULT_CLUSTERING_THRESHOLD,
     weights: SimilarityWeightsDict | None = None,
-    max_input_items: int = 500,
+    max_input_items: int = DEFAULT_MAX_CLUSTERING_INPUT_ITEMS,
     replay_emitter: ReplayArtifactEmitter = NULL_EMITTER,
+    *,
+    use_candidate_index: bool = True,
 ) -> list[PatternClusterDict]:
     """Cluster similar patterns using single-linkage clustering.
 
     Algorithm:
         1. Sort items by item_id for determinism
-        2. Build similarity edges in sorted (i, j) order where i < j
-        3. Apply single-linkage clustering (merge if ANY pair >= threshold)
+        2. Generate candidate pairs (i < j) from the prefix-filtered token
+           index, or all pairs when use_candidate_index is False
+        3. Apply single-linkage clustering (merge if ANY pair >= threshold);
+           candidates already in the same component are not re-scored
         4. Assign cluster_id by sorted leader (smallest item_id in cluster)
         5. Select medoid as centroid for each cluster
 
     Determinism Guarantees:
         - Items sorted by item_id before processing
         - Edges built in deterministic order
+        - Candidate index is lossless: output is identical with and without it
         - Cluster leader = smallest item_id in cluster
         - cluster_id assigned in sorted leader order: cluster-0001, cluster-0002, ...
         - Medoid tie-break by smallest item_id
@@ -511,9 +545,13 @@ def cluster_patterns(
         weights: Optional custom similarity weights.
             Defaults to DEFAULT_SIMILARITY_WEIGHTS.
         max_input_items: Maximum allowed input items. Raises error if exceeded.
-            Defaults to 500 to prevent O(n^2) explosion.
+            Defaults to DEFAULT_MAX_CLUSTERING_INPUT_ITEMS (50,000) as a
+            safety net against worst-case O(n^2) inputs.
         replay_emitter: Emitter for replay artifacts. Defaults to NULL_EMITTER
             which discards artifacts (useful for tests).
+        use_candidate_index: Score only candidate pairs from the lossless
+            blocking index. Set to False to score every pair (reference
+            path used for parity checks and benchmarks).
 
     Returns:
         List of PatternClusterDict, each containing:
@@ -552,7 +590,7 @@ def cluster_patterns(
         raise PatternLearningValidationError(
             f"Input size {len(features_list)} exceeds maximum allowed "
             f"{max_input_items}. Reduce input size or increase max_input_items "
-            f"(warning: O(n^2) memory/time complexity)."
+            f"(warning: worst-case O(n^2) memory/time complexity)."
         )
 
     # Handle empty input
@@ -581,13 +619,34 @@ def cluster_patterns(
     # for single-linkage clustering (deterministic: smaller index becomes root)
     uf = UnionFind(n)
 
-    # Compute pairwise similarities and build edges
+    # Encode features once; reused for edges, medoids and intra-similarity
+    engine = SimilarityMatrix(sorted_features, weights)
+
+    # Compute similarities for candidate pairs and build edges
     # Single-linkage: merge if ANY pair >= threshold
-    for i in range(n):
-        for j in range(i + 1, n):
-            result = compute_similarity(sorted_features[i], sorted_features[j], weights)
-            if result["similarity"] >= threshold:
-                uf.union(i, j)
+    if use_candidate_index:
+        candidate_pairs = iter_candidate_pairs(sorted_features, threshold, weights)
+    else:
+        candidate_pairs = ((i, j) for i in range(n) for j in range(i + 1, n))
+
+    def score_batch(batch: list[tuple[int, int]]) -> None:
+        rows, cols = np.asarray(batch, dtype=np.intp).T
+        passing = engine.pair_similarities(rows, cols) >= threshold
+        for i, j in zip(rows[passing].tolist(), cols[passing].tolist(), strict=True):
+            uf.union(i, j)
+
+    batch: list[tuple[int, int]] = []
+    for i, j in candidate_pairs:
+        # Already linked through another edge: scoring cannot change the
+        # partition, so skip the pair
+        if uf.connected(i, j):
+            continue
+        batch.append((i, j))
+        if len(batch) >= _PAIR_BATCH_SIZE:
+            score_batch(batch)
+            batch = []
+    if batch:
+        score_batch(batch)
 
     # Step 3: Group items by cluster root
     clusters_by_root = uf.components()
@@ -654,11 +713,13 @@ def cluster_patterns(
             # No pattern_type means no agreement possible
             label_agreement = 0.0
 
-        # Select medoid as centroid
-        centroid = _select_medoid(members, weights)
-
-        # Compute internal similarity
-        internal_sim = _compute_intra_cluster_similarity(members, weights)
+        # Select medoid as centroid and compute internal similarity from the
+        # shared engine (member_indices are ascending, so rows follow the
+        # same item_id order as members)
+        centroid = _select_medoid(members, weights, engine, member_indices)
+        internal_sim = _compute_intra_cluster_similarity(
+            members, weights, engine, member_indices
+        )
 
         # Invariant checks (enforced at construction)
         assert len(member_pattern_indicators) == len(member_ids_sorted), (
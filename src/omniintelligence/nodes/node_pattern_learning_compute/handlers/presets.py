@@ -103,6 +103,14 @@ and merged. Higher threshold = more conservative (fewer merges).
 POLICY NOTE: Prefer false negatives (keep separate) over false positives
 (merge incorrectly). You can merge later; you can't un-merge.
 """
+DEFAULT_MAX_CLUSTERING_INPUT_ITEMS: Final[int] = 50_000
+"""Default maximum number of items accepted by cluster_patterns.
+
+Candidate pairs are generated by a lossless blocking index, so typical
+inputs cost far less than O(n^2). This limit is a safety net against
+degenerate inputs (e.g. thousands of near-identical snippets) where the
+candidate set approaches all pairs.
+"""
 NEAR_THRESHOLD_MARGIN: Final[float] = 0.05
 """Margin around threshold for near-threshold warnings.
 
@@ -169,6 +177,7 @@ ONEX coding conventions.
 __all__ = [
     "DEFAULT_CLUSTERING_THRESHOLD",
     "DEFAULT_DEDUPLICATION_THRESHOLD",
+    "DEFAULT_MAX_CLUSTERING_INPUT_ITEMS",
     "DEFAULT_MIN_FREQUENCY",
     "DEFAULT_PROMOTION_THRESHOLD",
     "DEFAULT_SIMILARITY_WEIGHTS",
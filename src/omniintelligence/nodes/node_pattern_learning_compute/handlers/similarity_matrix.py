@@ -0,0 +1,460 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Vectorized similarity engine for pattern learning.
+
+NumPy-backed encoding of ExtractedFeaturesDict lists that
+computes the 5-component weighted similarity for many pairs at once. The
+encoding is built once per run and reused by clustering, medoid selection,
+intra-cluster similarity and deduplication.
+
+Feature Encoding:
+    - keyword / pattern / label / context token sets: binary CSR matrices
+      (one row per item, one column per distinct token) plus row sizes
+    - structural counts: dense (n, 5) float64 matrix
+    - structural booleans: dense (n, 2) bool matrix
+
+Bit-Identical Guarantee (CRITICAL):
+    Every score equals compute_similarity() exactly, not just approximately.
+    The vectorized path performs the same IEEE-754 operations in the same
+    order as the scalar path:
+    - Jaccard: int intersection / int union (both exact in float64)
+    - Structural: 1.0 - min(|a - b| / max_diff, 1.0), combined in
+      STRUCTURAL_WEIGHTS order with the Neumaier-compensated summation
+      that builtin sum() applies to floats (Python >= 3.12)
+    - Final score: weighted components summed left-to-right
+      (keyword, pattern, structural, label, context)
+    Reductions over scores (medoid averages, intra-cluster means) must use
+    sequential accumulation (np.cumsum), never pairwise np.sum, to match the
+    scalar running totals.
+
+Usage:
+    from omniintelligence.nodes.node_pattern_learning_compute.handlers.similarity_matrix import (
+        SimilarityMatrix,
+    )
+
+    engine = SimilarityMatrix(sorted_features, weights)
+    scores = engine.pair_similarities(rows, cols)     # 1-D, one per pair
+    block = engine.block_similarities(members, members)  # 2-D
+    for offset, rows in engine.iter_row_blocks(members):  # bounded memory
+        ...
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import sparse
+
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.presets import (
+    ONEX_PATTERN_KEYWORDS,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.protocols import (
+    ExtractedFeaturesDict,
+    SimilarityWeightsDict,
+)
+
+# =============================================================================
+# Constants for Structural Similarity Computation
+# =============================================================================
+
+# Maximum expected differences for structural feature normalization.
+# These values define the scaling factors for computing normalized distances.
+MAX_CLASS_COUNT_DIFF: float = 20.0
+MAX_FUNCTION_COUNT_DIFF: float = 50.0
+MAX_NESTING_DEPTH_DIFF: float = 10.0
+MAX_LINE_COUNT_DIFF: float = 500.0
+MAX_CYCLOMATIC_COMPLEXITY_DIFF: float = 50.0
+
+# Weights for combining structural sub-features into a single similarity score.
+# These weights prioritize function count and complexity as primary indicators
+# of structural similarity.
+STRUCTURAL_WEIGHTS: dict[str, float] = {
+    "class_count": 0.15,
+    "function_count": 0.25,
+    "max_nesting_depth": 0.15,
+    "line_count": 0.15,
+    "cyclomatic_complexity": 0.20,
+    "has_type_hints": 0.05,
+    "has_docstrings": 0.05,
+}
+
+# Validate weights sum to 1.0 at module load time
+_structural_weights_sum = sum(STRUCTURAL_WEIGHTS.values())
+assert abs(_structural_weights_sum - 1.0) < 1e-9, (
+    f"STRUCTURAL_WEIGHTS must sum to 1.0, got {_structural_weights_sum}"
+)
+
+# Numeric structural features in STRUCTURAL_WEIGHTS order, with their
+# normalization ranges. Column order of SimilarityMatrix._numeric.
+_NUMERIC_STRUCTURAL_FEATURES: tuple[tuple[str, float], ...] = (
+    ("class_count", MAX_CLASS_COUNT_DIFF),
+    ("function_count", MAX_FUNCTION_COUNT_DIFF),
+    ("max_nesting_depth", MAX_NESTING_DEPTH_DIFF),
+    ("line_count", MAX_LINE_COUNT_DIFF),
+    ("cyclomatic_complexity", MAX_CYCLOMATIC_COMPLEXITY_DIFF),
+)
+
+# Boolean structural features in STRUCTURAL_WEIGHTS order.
+# Column order of SimilarityMatrix._flags.
+_BOOLEAN_STRUCTURAL_FEATURES: tuple[str, ...] = ("has_type_hints", "has_docstrings")
+
+# Upper bound on the number of scores materialized by one row block in
+# SimilarityMatrix.iter_row_blocks. Each block allocates several temporaries
+# of this size, so 1M elements keeps peak memory in the tens of megabytes
+# regardless of cluster size.
+SIMILARITY_BLOCK_MAX_ELEMENTS: int = 1_000_000
+
+# Score used when neither item carries context tokens (see
+# handler_pattern_clustering._compute_context_similarity).
+_CONTEXT_BOTH_EMPTY_SIMILARITY: float = 0.5
+
+
+# =============================================================================
+# Encoding Helpers
+# =============================================================================
+
+
+def _encode_token_sets(
+    token_sets: Sequence[frozenset[str]],
+) -> tuple[sparse.csr_matrix, NDArray[np.int64]]:
+    """Encode token sets as a binary CSR matrix.
+
+    Args:
+        token_sets: One deduplicated token set per item.
+
+    Returns:
+        (csr matrix of shape (n, vocabulary), row sizes).
+    """
+    vocabulary: dict[str, int] = {}
+    indptr = [0]
+    indices: list[int] = []
+    for tokens in token_sets:
+        for token in sorted(tokens):
+            indices.append(vocabulary.setdefault(token, len(vocabulary)))
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (
+            np.ones(len(indices), dtype=np.int64),
+            np.asarray(indices, dtype=np.int64),
+            np.asarray(indptr, dtype=np.int64),
+        ),
+        shape=(len(token_sets), max(len(vocabulary), 1)),
+    )
+    sizes = np.diff(matrix.indptr).astype(np.int64)
+    return matrix, sizes
+
+
+def _jaccard(
+    intersection: NDArray[np.int64],
+    size_a: NDArray[np.int64],
+    size_b: NDArray[np.int64],
+) -> NDArray[np.float64]:
+    """Vectorized jaccard_similarity (0.0 when both sets are empty)."""
+    union = size_a + size_b - intersection
+    result = np.zeros(union.shape, dtype=np.float64)
+    np.divide(intersection, union, out=result, where=union > 0)
+    return result
+
+
+def _builtin_float_sum(terms: Sequence[NDArray[np.float64]]) -> NDArray[np.float64]:
+    """Elementwise equivalent of builtin sum() over a sequence of floats.
+
+    CPython >= 3.12 sums floats with Neumaier's compensated algorithm, so
+    a plain left-to-right `+` can differ from sum() in the last bit. This
+    mirrors the CPython loop: the first term seeds the total, each further
+    term updates the compensation, and a non-zero finite compensation is
+    added once at the end.
+
+    Args:
+        terms: Equally shaped arrays, in summation order.
+
+    Returns:
+        Array of elementwise sums identical to sum() of the scalar terms.
+    """
+    total = terms[0].copy()
+    compensation = np.zeros_like(total)
+    for term in terms[1:]:
+        t = total + term
+        compensation += np.where(
+            np.abs(total) >= np.abs(term),
+            (total - t) + term,
+            (term - t) + total,
+        )
+        total = t
+    apply = (compensation != 0.0) & np.isfinite(compensation)
+    return np.where(apply, total + compensation, total)
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+
+class SimilarityMatrix:
+    """Encoded feature matrix computing weighted similarities in bulk.
+
+    Rows are addressed by position in the features sequence passed to the
+    constructor. Callers are responsible for the ordering (cluster_patterns
+    passes features sorted by item_id).
+
+    Attributes:
+        n: Number of encoded items.
+        weights: Similarity weights applied to every score.
+
+    Examples:
+        >>> engine = SimilarityMatrix(features, DEFAULT_SIMILARITY_WEIGHTS)
+        >>> engine.pair_similarities(np.array([0]), np.array([1]))[0] == (
+        ...     compute_similarity(features[0], features[1])["similarity"]
+        ... )
+        True
+    """
+
+    def __init__(
+        self,
+        features: Sequence[ExtractedFeaturesDict],
+        weights: SimilarityWeightsDict,
+    ) -> None:
+        """Encode features for vectorized similarity computation.
+
+        Args:
+            features: Feature dicts to encode (row i = features[i]).
+            weights: Validated similarity weights.
+        """
+        self._n = len(features)
+        self._weights = weights
+
+        keyword_sets = [frozenset(f["keywords"]) for f in features]
+        self._keywords, self._keyword_sizes = _encode_token_sets(keyword_sets)
+        self._patterns, self._pattern_sizes = _encode_token_sets(
+            [frozenset(f["pattern_indicators"]) for f in features]
+        )
+        self._labels, self._label_sizes = _encode_token_sets(
+            [frozenset(f["labels"]) for f in features]
+        )
+        self._context, self._context_sizes = _encode_token_sets(
+            [tokens & ONEX_PATTERN_KEYWORDS for tokens in keyword_sets]
+        )
+
+        # TypedDict keys are iterated dynamically, so read the structural
+        # dicts as plain mappings
+        structural: list[dict[str, object]] = [dict(f["structural"]) for f in features]
+        self._numeric = np.array(
+            [
+                [float(s[name]) for name, _ in _NUMERIC_STRUCTURAL_FEATURES]  # type: ignore[arg-type]
+                for s in structural
+            ],
+            dtype=np.float64,
+        ).reshape(self._n, len(_NUMERIC_STRUCTURAL_FEATURES))
+        self._flags = np.array(
+            [
+                [bool(s[name]) for name in _BOOLEAN_STRUCTURAL_FEATURES]
+                for s in structural
+            ],
+            dtype=np.bool_,
+        ).reshape(self._n, len(_BOOLEAN_STRUCTURAL_FEATURES))
+
+    @property
+    def n(self) -> int:
+        """Number of encoded items."""
+        return self._n
+
+    @property
+    def weights(self) -> SimilarityWeightsDict:
+        """Similarity weights applied to every score."""
+        return self._weights
+
+    def pair_similarities(
+        self,
+        rows: NDArray[np.intp],
+        cols: NDArray[np.intp],
+    ) -> NDArray[np.float64]:
+        """Compute similarities for aligned index pairs (rows[k], cols[k]).
+
+        Args:
+            rows: First item index of each pair.
+            cols: Second item index of each pair (same length as rows).
+
+        Returns:
+            1-D array of weighted similarities, one per pair.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+
+        def intersect(matrix: sparse.csr_matrix) -> NDArray[np.int64]:
+            if rows.size == 0:
+                return np.zeros(0, dtype=np.int64)
+            product = matrix[rows].multiply(matrix[cols])
+            return np.asarray(product.sum(axis=1), dtype=np.int64).ravel()
+
+        return self._combine(
+            keyword_inter=intersect(self._keywords),
+            pattern_inter=intersect(self._patterns),
+            label_inter=intersect(self._labels),
+            context_inter=intersect(self._context),
+            rows=rows,
+            cols=cols,
+        )
+
+    def block_similarities(
+        self,
+        rows: Sequence[int] | NDArray[np.intp],
+        cols: Sequence[int] | NDArray[np.intp],
+    ) -> NDArray[np.float64]:
+        """Compute the similarity block between two index sets.
+
+        Args:
+            rows: Item indices for the block rows.
+            cols: Item indices for the block columns.
+
+        Returns:
+            2-D array of shape (len(rows), len(cols)) where entry [a, b] is
+            the similarity between items rows[a] and cols[b].
+        """
+        row_idx = np.asarray(rows, dtype=np.intp)
+        col_idx = np.asarray(cols, dtype=np.intp)
+
+        def intersect(matrix: sparse.csr_matrix) -> NDArray[np.int64]:
+            product = matrix[row_idx] @ matrix[col_idx].T
+            return np.asarray(product.toarray(), dtype=np.int64)
+
+        grid_rows, grid_cols = np.meshgrid(row_idx, col_idx, indexing="ij")
+        return self._combine(
+            keyword_inter=intersect(self._keywords),
+            pattern_inter=intersect(self._patterns),
+            label_inter=intersect(self._labels),
+            context_inter=intersect(self._context),
+            rows=grid_rows,
+            cols=grid_cols,
+        )
+
+    def iter_row_blocks(
+        self,
+        indices: Sequence[int] | NDArray[np.intp],
+        max_block_elements: int | None = None,
+    ) -> Iterator[tuple[int, NDArray[np.float64]]]:
+        """Yield the (k, k) similarity block of indices in row chunks.
+
+        Never materializes more than max_block_elements scores at once
+        (at least one full row), so memory stays bounded for large clusters.
+
+        Args:
+            indices: Item indices for both block rows and columns.
+            max_block_elements: Maximum scores per yielded block. Defaults
+                to SIMILARITY_BLOCK_MAX_ELEMENTS.
+
+        Yields:
+            (offset, block) where block has shape (rows, k) and block[a, b]
+            is the similarity between items indices[offset + a] and
+            indices[b].
+        """
+        if max_block_elements is None:
+            max_block_elements = SIMILARITY_BLOCK_MAX_ELEMENTS
+        index_array = np.asarray(indices, dtype=np.intp)
+        k = index_array.size
+        rows_per_block = max(1, max_block_elements // max(k, 1))
+        for offset in range(0, k, rows_per_block):
+            yield (
+                offset,
+                self.block_similarities(
+                    index_array[offset : offset + rows_per_block], index_array
+                ),
+            )
+
+    def _combine(
+        self,
+        *,
+        keyword_inter: NDArray[np.int64],
+        pattern_inter: NDArray[np.int64],
+        label_inter: NDArray[np.int64],
+        context_inter: NDArray[np.int64],
+        rows: NDArray[np.intp],
+        cols: NDArray[np.intp],
+    ) -> NDArray[np.float64]:
+        """Combine component intersections into weighted similarities.
+
+        Operation order mirrors compute_similarity() exactly.
+        """
+        keyword_sim = _jaccard(
+            keyword_inter, self._keyword_sizes[rows], self._keyword_sizes[cols]
+        )
+        pattern_sim = _jaccard(
+            pattern_inter, self._pattern_sizes[rows], self._pattern_sizes[cols]
+        )
+        label_sim = _jaccard(
+            label_inter, self._label_sizes[rows], self._label_sizes[cols]
+        )
+
+        # Structural: weighted terms in STRUCTURAL_WEIGHTS order, combined
+        # exactly like sum() in _compute_structural_similarity
+        structural_terms: list[NDArray[np.float64]] = []
+        for column, (name, max_diff) in enumerate(_NUMERIC_STRUCTURAL_FEATURES):
+            distance = np.minimum(
+                np.abs(self._numeric[rows, column] - self._numeric[cols, column])
+                / max_diff,
+                1.0,
+            )
+            structural_terms.append(STRUCTURAL_WEIGHTS[name] * (1.0 - distance))
+        for column, name in enumerate(_BOOLEAN_STRUCTURAL_FEATURES):
+            match = np.where(
+                self._flags[rows, column] == self._flags[cols, column], 1.0, 0.0
+            )
+            structural_terms.append(STRUCTURAL_WEIGHTS[name] * match)
+        structural_sim = _builtin_float_sum(structural_terms)
+
+        # Context: 0.5 if both empty, 0.0 if one empty, else Jaccard
+        ctx_a = self._context_sizes[rows]
+        ctx_b = self._context_sizes[cols]
+        context_sim = np.where(
+            (ctx_a == 0) & (ctx_b == 0),
+            _CONTEXT_BOTH_EMPTY_SIMILARITY,
+            np.where(
+                (ctx_a == 0) | (ctx_b == 0),
+                0.0,
+                _jaccard(context_inter, ctx_a, ctx_b),
+            ),
+        )
+
+        weights = self._weights
+        return (
+            weights["keyword"] * keyword_sim
+            + weights["pattern"] * pattern_sim
+            + weights["structural"] * structural_sim
+            + weights["label"] * label_sim
+            + weights["context"] * context_sim
+        )
+
+
+def sequential_sum(values: NDArray[np.float64], axis: int = -1) -> NDArray[np.float64]:
+    """Sum values left-to-right along an axis, matching a Python running total.
+
+    np.sum uses pairwise summation, which can differ from `total += x` in
+    the last bit. np.cumsum accumulates strictly in order, so its final
+    element equals the scalar running total exactly.
+
+    Args:
+        values: Array to reduce.
+        axis: Axis to reduce along.
+
+    Returns:
+        Array with `axis` removed; 0.0 where the axis is empty.
+    """
+    if values.shape[axis] == 0:
+        return np.zeros(np.delete(values.shape, axis), dtype=np.float64)
+    return np.take(np.cumsum(values, axis=axis), -1, axis=axis)
+
+
+__all__ = [
+    "MAX_CLASS_COUNT_DIFF",
+    "MAX_CYCLOMATIC_COMPLEXITY_DIFF",
+    "MAX_FUNCTION_COUNT_DIFF",
+    "MAX_LINE_COUNT_DIFF",
+    "MAX_NESTING_DEPTH_DIFF",
+    "SIMILARITY_BLOCK_MAX_ELEMENTS",
+    "STRUCTURAL_WEIGHTS",
+    "SimilarityMatrix",
+    "sequential_sum",
+]
@@ -8,9 +8,13 @@ Ticket: OMN-2424
 """
 
 from omniintelligence.nodes.node_pattern_projection_effect.handlers.handler_projection import (
+    next_projection_sequence,
     publish_projection,
+    publish_projection_delta,
 )
 
 __all__ = [
+    "next_projection_sequence",
     "publish_projection",
+    "publish_projection_delta",
 ]
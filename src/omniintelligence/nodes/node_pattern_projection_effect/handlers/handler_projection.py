@@ -2,12 +2,18 @@
 # SPDX-License-Identifier: MIT
 
 # Copyright (c) 2025 OmniNode Team
-"""Handler functions for pattern projection snapshot publishing.
+"""Handler functions for pattern projection snapshot and delta publishing.
 
 Projection publish logic: querying all
 validated/provisional patterns and publishing a full materialized snapshot
 to the pattern-projection Kafka topic.
 
+Delta projection: publish_projection_delta fetches only the patterns touched
+by a (coalesced) burst of lifecycle events and publishes one
+ModelPatternProjectionDeltaEvent per changed pattern, keyed by pattern id,
+to the compacted pattern-projection-delta topic. In delta mode, full
+snapshots become periodic or explicit rebuilds.
+
 Design Principles:
     - Fire-and-forget Kafka emission: failures are logged but never propagated.
       The handler always returns a result; the snapshot is best-effort.
@@ -24,10 +30,16 @@ Reference:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Iterable, MutableMapping
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
+from omniintelligence.models.events.model_pattern_projection_delta_event import (
+    ModelPatternProjectionDeltaEvent,
+)
 from omniintelligence.models.events.model_pattern_projection_event import (
     ModelPatternProjectionEvent,
 )
@@ -60,6 +72,24 @@ _PROJECTION_VERSION: int = 1
 
 Increment when the snapshot schema changes incompatibly.
 """
+_PROJECTION_STATUSES: frozenset[str] = frozenset({"validated", "provisional"})
+"""Pattern statuses included in the projection (mirrors query_patterns_projection)."""
+_DELTA_VERSION: int = 1
+"""Current schema version for ModelPatternProjectionDeltaEvent."""
+
+
+def next_projection_sequence(previous: int) -> int:
+    """Return the projection sequence that follows ``previous``.
+
+    Strictly greater than ``previous`` (a per-publisher monotonic counter) and
+    never below the current wall clock in microseconds, so a restarted
+    publisher starting from 0 continues above the sequences it published
+    before. A wall-clock step backwards cannot reorder sequences within a
+    process.
+    """
+    return max(previous + 1, time.time_ns() // 1_000)
+
+
 # =============================================================================
 # Handler
 # =============================================================================
@@ -73,19 +103,21 @@ async def publish_projection(
     publish_topic: str | None,
     trigger_event_type: str = "unknown",
     triggering_pattern_id: UUID | None = None,
-) -> ModelPatternProjectionEvent:
+    sequence: int | None = None,
+) -> tuple[ModelPatternProjectionEvent, bool]:
     """Query all validated patterns and publish a full materialized snapshot.
 
     On each trigger (pattern promoted, deprecated, or lifecycle-transitioned):
     1. Query all validated/provisional patterns via pattern_query_store
     2. Build a ModelPatternProjectionEvent snapshot with explicit snapshot_at
     3. Publish the snapshot to the projection topic (fire-and-forget)
-    4. Return the snapshot model regardless of Kafka publish outcome
+    4. Return the snapshot model and whether it was published
 
     Fire-and-Forget Emission:
         If the Kafka producer is None or raises, the exception is caught and
         logged. The handler always returns the built snapshot. Callers receive
-        the snapshot model even if Kafka publication failed.
+        the snapshot model even if Kafka publication failed; the published
+        flag tells them whether consumers actually received it.
 
     Args:
         pattern_query_store: REQUIRED store for querying validated patterns.
@@ -99,10 +131,15 @@ async def publish_projection(
             (e.g. "PatternPromoted"). Used for logging only.
         triggering_pattern_id: Pattern ID from the triggering event.
             Used for logging only.
+        sequence: Optional projection sequence stamped on the snapshot (delta
+            mode rebuilds carry the sequence of the deltas published with
+            them, see next_projection_sequence).
 
     Returns:
-        ModelPatternProjectionEvent containing the full pattern snapshot.
-        Always returned — Kafka failures do not prevent snapshot construction.
+        Tuple of (snapshot, published). The snapshot is always returned —
+        Kafka failures do not prevent snapshot construction. published is
+        True only when the patterns were queried successfully and the
+        snapshot was published to Kafka.
     """
     snapshot_id = uuid4()
     snapshot_at = datetime.now(UTC)
@@ -143,13 +180,17 @@ async def publish_projection(
             )
             # Return an empty snapshot rather than propagating the error.
             # The snapshot_at must still be set to maintain model validity.
-            return ModelPatternProjectionEvent(
-                snapshot_id=snapshot_id,
-                snapshot_at=snapshot_at,
-                patterns=[],
-                total_count=0,
-                version=_PROJECTION_VERSION,
-                correlation_id=correlation_id,
+            return (
+                ModelPatternProjectionEvent(
+                    snapshot_id=snapshot_id,
+                    snapshot_at=snapshot_at,
+                    patterns=[],
+                    total_count=0,
+                    version=_PROJECTION_VERSION,
+                    correlation_id=correlation_id,
+                    sequence=sequence,
+                ),
+                False,
             )
 
         if not raw_rows:
@@ -190,6 +231,7 @@ async def publish_projection(
         total_count=len(all_patterns),
         version=_PROJECTION_VERSION,
         correlation_id=correlation_id,
+        sequence=sequence,
     )
 
     logger.info(
@@ -202,6 +244,7 @@ async def publish_projection(
     )
 
     # Step 3: Publish snapshot to Kafka (fire-and-forget)
+    published = False
     if producer is not None:
         if publish_topic is None:
             logger.warning(
@@ -220,6 +263,7 @@ async def publish_projection(
                     key=str(snapshot_id),
                     value=snapshot.model_dump(mode="json"),
                 )
+                published = True
                 logger.debug(
                     "Pattern projection snapshot published to Kafka "
                     "(snapshot_id=%s, topic=%s, total_count=%d, correlation_id=%s)",
@@ -250,9 +294,177 @@ async def publish_projection(
                     },
                 )
 
-    return snapshot
+    return snapshot, published
+
+
+async def publish_projection_delta(
+    pattern_query_store: ProtocolPatternQueryStore,
+    producer: ProtocolKafkaPublisher | None,
+    *,
+    pattern_ids: Iterable[UUID],
+    correlation_id: UUID | None,
+    publish_topic: str | None,
+    sequence: int,
+    last_published: MutableMapping[UUID, ModelPatternSummary] | None = None,
+) -> list[ModelPatternProjectionDeltaEvent]:
+    """Publish projection deltas for the given patterns only.
+
+    1. Fetch the current projection rows for pattern_ids (by id, any status)
+    2. Classify each pattern as an upsert (validated/provisional) or a
+       remove (any other status, or no longer in the store)
+    3. Skip patterns whose state consumers already hold (last_published)
+    4. Publish each remaining delta keyed by pattern id (fire-and-forget)
+
+    Fire-and-Forget Emission:
+        Query and Kafka failures are logged, never raised. last_published is
+        only updated for deltas that were actually published, so a failed
+        pattern is re-sent the next time it changes (and is covered by the
+        next full snapshot regardless).
+
+    Args:
+        pattern_query_store: REQUIRED store for fetching projection rows by id.
+        producer: Optional Kafka publisher. When None, deltas are built but
+            not published.
+        pattern_ids: Patterns touched since the last flush (duplicates ignored).
+        correlation_id: Correlation ID threaded into every delta.
+        publish_topic: Full Kafka topic string for delta events (compacted).
+        sequence: Projection sequence stamped on every delta. Must increase
+            across calls from the same publisher (see next_projection_sequence).
+        last_published: Optional caller-owned map of every pattern the
+            consumers currently hold (e.g. seeded from the last snapshot).
+            Patterns whose state equals their entry are skipped, and removals
+            of patterns absent from the map are not published. Updated in
+            place as deltas are published.
+
+    Returns:
+        The deltas that were built (published or not), in pattern_ids order.
+    """
+    ordered_ids = list(dict.fromkeys(pattern_ids))
+    if not ordered_ids:
+        return []
+
+    projected_at = datetime.now(UTC)
+    log_extra = {"correlation_id": str(correlation_id) if correlation_id else None}
+
+    # Step 1: Fetch current rows for the touched patterns
+    current: dict[UUID, ModelPatternSummary] = {}
+    unparseable: set[UUID] = set()
+    for start in range(0, len(ordered_ids), _QUERY_LIMIT):
+        chunk = ordered_ids[start : start + _QUERY_LIMIT]
+        try:
+            raw_rows = await pattern_query_store.query_patterns_projection_by_ids(
+                pattern_ids=chunk
+            )
+        except Exception as query_exc:
+            sanitized = get_log_sanitizer().sanitize(str(query_exc))
+            logger.error(
+                "Failed to query patterns for projection delta "
+                "(pattern_count=%d, correlation_id=%s, error=%s)",
+                len(ordered_ids),
+                correlation_id,
+                sanitized,
+                extra=log_extra,
+            )
+            return []
+
+        for row in raw_rows:
+            try:
+                pattern = ModelPatternSummary.model_validate(row)
+            except Exception as parse_exc:
+                raw_id = row.get("id") if isinstance(row, dict) else None
+                if raw_id is not None:
+                    unparseable.add(UUID(str(raw_id)))
+                sanitized_parse = get_log_sanitizer().sanitize(str(parse_exc))
+                logger.warning(
+                    "Failed to parse pattern row for projection delta "
+                    "(pattern_id=%s, correlation_id=%s, error=%s)",
+                    raw_id,
+                    correlation_id,
+                    sanitized_parse,
+                    extra=log_extra,
+                )
+                continue
+            current[pattern.id] = pattern
+
+    # Step 2: Build deltas for patterns whose projected state changed
+    deltas: list[ModelPatternProjectionDeltaEvent] = []
+    for pattern_id in ordered_ids:
+        if pattern_id in unparseable:
+            continue
+        pattern = current.get(pattern_id)
+        state = (
+            pattern
+            if pattern is not None
+            and pattern.status in _PROJECTION_STATUSES
+            and pattern.confidence >= _MIN_CONFIDENCE
+            else None
+        )
+        if last_published is not None and last_published.get(pattern_id) == state:
+            continue
+        deltas.append(
+            ModelPatternProjectionDeltaEvent(
+                pattern_id=pattern_id,
+                operation="upsert" if state is not None else "remove",
+                pattern=state,
+                sequence=sequence,
+                projected_at=projected_at,
+                version=_DELTA_VERSION,
+                correlation_id=correlation_id,
+            )
+        )
+
+    logger.info(
+        "Pattern projection deltas built (touched=%d, changed=%d, correlation_id=%s)",
+        len(ordered_ids),
+        len(deltas),
+        correlation_id,
+        extra=log_extra,
+    )
+
+    if producer is None or not deltas:
+        return deltas
+    if publish_topic is None:
+        logger.warning(
+            "publish_topic is None but producer is available — skipping delta publish "
+            "(changed=%d, correlation_id=%s)",
+            len(deltas),
+            correlation_id,
+            extra=log_extra,
+        )
+        return deltas
+
+    # Step 3: Publish deltas keyed by pattern id (fire-and-forget)
+    async def _publish(delta: ModelPatternProjectionDeltaEvent) -> None:
+        try:
+            await producer.publish(
+                topic=publish_topic,
+                key=str(delta.pattern_id),
+                value=delta.model_dump(mode="json"),
+            )
+        except Exception as kafka_exc:
+            sanitized_kafka = get_log_sanitizer().sanitize(str(kafka_exc))
+            logger.error(
+                "Kafka publish failed for pattern projection delta — fire-and-forget, "
+                "not propagating (pattern_id=%s, topic=%s, correlation_id=%s, error=%s)",
+                delta.pattern_id,
+                publish_topic,
+                correlation_id,
+                sanitized_kafka,
+                extra=log_extra,
+            )
+            return
+        if last_published is not None:
+            if delta.pattern is None:
+                last_published.pop(delta.pattern_id, None)
+            else:
+                last_published[delta.pattern_id] = delta.pattern
+
+    await asyncio.gather(*(_publish(delta) for delta in deltas))
+    return deltas
 
 
 __all__ = [
+    "next_projection_sequence",
     "publish_projection",
+    "publish_projection_delta",
 ]
@@ -14,6 +14,7 @@ Reference:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -96,6 +97,19 @@ class MockPatternQueryStore:
 
         return self.rows[offset : offset + limit]
 
+    async def query_patterns_projection_by_ids(
+        self,
+        *,
+        pattern_ids: Sequence[UUID],
+    ) -> list[dict[str, Any]]:
+        """Return the rows (any status) whose id is in pattern_ids."""
+        self.query_calls.append({"pattern_ids": list(pattern_ids)})
+        if self.simulate_error is not None:
+            raise self.simulate_error
+
+        wanted = {str(pattern_id) for pattern_id in pattern_ids}
+        return [row for row in self.rows if str(row["id"]) in wanted]
+
     def reset(self) -> None:
         """Reset all state for test isolation."""
         self.rows.clear()
@@ -14,6 +14,7 @@ Covers:
 6. correlation_id threaded through to snapshot payload
 7. No datetime.now() in ModelPatternProjectionEvent — snapshot_at is injected
 8. Protocol compliance of mock implementations
+9. Per-pattern deltas: upsert/remove classification and change suppression
 
 Reference:
     - OMN-2424: Pattern projection snapshot publisher
@@ -29,8 +30,12 @@ from pydantic import ValidationError
 from omniintelligence.models.events.model_pattern_projection_event import (
     ModelPatternProjectionEvent,
 )
+from omniintelligence.models.repository.model_pattern_summary import (
+    ModelPatternSummary,
+)
 from omniintelligence.nodes.node_pattern_projection_effect.handlers.handler_projection import (
     publish_projection,
+    publish_projection_delta,
 )
 
 from .conftest import MockKafkaPublisher, MockPatternQueryStore, make_pattern_row
@@ -57,13 +62,14 @@ class TestSnapshotConstruction:
             for i in range(3)
         ]
 
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=mock_producer,
             correlation_id=sample_correlation_id,
             publish_topic="onex.evt.omniintelligence.pattern-projection.v1",
         )
 
+        assert published
         assert isinstance(result, ModelPatternProjectionEvent)
         assert result.total_count == 3
         assert len(result.patterns) == 3
@@ -77,13 +83,15 @@ class TestSnapshotConstruction:
         sample_correlation_id: UUID,
     ) -> None:
         """ModelPatternProjectionEvent is immutable after construction (frozen=True)."""
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=mock_producer,
             correlation_id=sample_correlation_id,
             publish_topic="onex.evt.omniintelligence.pattern-projection.v1",
         )
 
+        assert published
+
         # Pydantic frozen models raise ValidationError on direct attribute assignment
         with pytest.raises(ValidationError):
             result.total_count = 999
@@ -96,13 +104,14 @@ class TestSnapshotConstruction:
         sample_correlation_id: UUID,
     ) -> None:
         """correlation_id from trigger event appears in the snapshot payload."""
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=mock_producer,
             correlation_id=sample_correlation_id,
             publish_topic="onex.evt.omniintelligence.pattern-projection.v1",
         )
 
+        assert published
         assert result.correlation_id == sample_correlation_id
 
     @pytest.mark.asyncio
@@ -113,13 +122,14 @@ class TestSnapshotConstruction:
         sample_correlation_id: UUID,
     ) -> None:
         """snapshot_at is a timezone-aware datetime (AwareDatetime constraint)."""
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=mock_producer,
             correlation_id=sample_correlation_id,
             publish_topic="onex.evt.omniintelligence.pattern-projection.v1",
         )
 
+        assert published
         assert result.snapshot_at.tzinfo is not None
 
     @pytest.mark.asyncio
@@ -132,13 +142,14 @@ class TestSnapshotConstruction:
         """Returns an empty snapshot (total_count=0) when store has no patterns."""
         mock_query_store.rows = []
 
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=mock_producer,
             correlation_id=sample_correlation_id,
             publish_topic="onex.evt.omniintelligence.pattern-projection.v1",
         )
 
+        assert published
         assert result.total_count == 0
         assert result.patterns == []
 
@@ -190,13 +201,15 @@ class TestKafkaEmission:
         topic = "onex.evt.omniintelligence.pattern-projection.v1"
 
         # Must NOT raise
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=mock_producer,
             correlation_id=sample_correlation_id,
             publish_topic=topic,
         )
 
+        assert not published
+
         # Snapshot is still built and returned
         assert result.total_count == 1
 
@@ -209,13 +222,14 @@ class TestKafkaEmission:
         """When producer is None, snapshot is built but nothing is published."""
         mock_query_store.rows = [make_pattern_row()]
 
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=None,
             correlation_id=sample_correlation_id,
             publish_topic="onex.evt.omniintelligence.pattern-projection.v1",
         )
 
+        assert not published
         assert result.total_count == 1  # snapshot still built
 
     @pytest.mark.asyncio
@@ -228,13 +242,15 @@ class TestKafkaEmission:
         """When publish_topic is None (misconfiguration), skips publish but still builds snapshot."""
         mock_query_store.rows = [make_pattern_row()]
 
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=mock_producer,
             correlation_id=sample_correlation_id,
             publish_topic=None,
         )
 
+        assert not published
+
         # Snapshot built but Kafka not called
         assert result.total_count == 1
         assert len(mock_producer.published_events) == 0
@@ -259,13 +275,14 @@ class TestErrorResilience:
         """When the query store raises, an empty snapshot is returned (not propagated)."""
         mock_query_store.simulate_error = ConnectionError("DB unavailable")
 
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=mock_producer,
             correlation_id=sample_correlation_id,
             publish_topic="onex.evt.omniintelligence.pattern-projection.v1",
         )
 
+        assert not published
         assert result.total_count == 0
         assert result.patterns == []
         assert result.correlation_id == sample_correlation_id
@@ -279,13 +296,14 @@ class TestErrorResilience:
         """correlation_id=None is valid — snapshot built with None correlation."""
         mock_query_store.rows = [make_pattern_row()]
 
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=mock_query_store,
             producer=mock_producer,
             correlation_id=None,
             publish_topic="onex.evt.omniintelligence.pattern-projection.v1",
         )
 
+        assert published
         assert result.total_count == 1
         assert result.correlation_id is None
 
@@ -318,14 +336,170 @@ class TestPagination:
         ]
         store = MockPatternQueryStore(rows=all_rows)
 
-        result = await publish_projection(
+        result, published = await publish_projection(
             pattern_query_store=store,
             producer=mock_producer,
             correlation_id=sample_correlation_id,
             publish_topic="onex.evt.omniintelligence.pattern-projection.v1",
         )
 
+        assert published
         assert result.total_count == total_rows
         assert len(result.patterns) == total_rows
         # At least 2 query calls were made
         assert len(store.query_calls) >= 2
+
+
+# =============================================================================
+# Test Class: Projection Deltas
+# =============================================================================
+
+_DELTA_TOPIC = "onex.evt.omniintelligence.pattern-projection-delta.v1"
+
+
+@pytest.mark.unit
+class TestProjectionDelta:
+    """Tests verifying per-pattern delta publication."""
+
+    @pytest.mark.asyncio
+    async def test_validated_pattern_published_as_upsert_keyed_by_id(
+        self,
+        mock_query_store: MockPatternQueryStore,
+        mock_producer: MockKafkaPublisher,
+        sample_correlation_id: UUID,
+    ) -> None:
+        """A validated pattern yields one upsert delta keyed by its id."""
+        pattern_id = uuid4()
+        mock_query_store.rows = [
+            make_pattern_row(pattern_id=str(pattern_id)),
+            make_pattern_row(pattern_id=str(uuid4()), signature="untouched"),
+        ]
+
+        deltas = await publish_projection_delta(
+            pattern_query_store=mock_query_store,
+            producer=mock_producer,
+            pattern_ids=[pattern_id, pattern_id],
+            correlation_id=sample_correlation_id,
+            publish_topic=_DELTA_TOPIC,
+            sequence=1,
+        )
+
+        assert len(deltas) == 1
+        assert deltas[0].operation == "upsert"
+        assert deltas[0].pattern is not None
+        assert deltas[0].pattern.id == pattern_id
+        assert deltas[0].correlation_id == sample_correlation_id
+        assert len(mock_producer.published_events) == 1
+        topic, key, value = mock_producer.published_events[0]
+        assert topic == _DELTA_TOPIC
+        assert key == str(pattern_id)
+        assert value["operation"] == "upsert"
+
+    @pytest.mark.asyncio
+    async def test_left_projection_published_as_remove(
+        self,
+        mock_query_store: MockPatternQueryStore,
+        mock_producer: MockKafkaPublisher,
+    ) -> None:
+        """Deprecated and deleted patterns consumers hold are removed."""
+        deprecated_id, deleted_id = uuid4(), uuid4()
+        mock_query_store.rows = [
+            make_pattern_row(pattern_id=str(deprecated_id), status="deprecated"),
+        ]
+        last_published = {
+            pid: ModelPatternSummary.model_validate(
+                make_pattern_row(pattern_id=str(pid))
+            )
+            for pid in (deprecated_id, deleted_id)
+        }
+
+        deltas = await publish_projection_delta(
+            pattern_query_store=mock_query_store,
+            producer=mock_producer,
+            pattern_ids=[deprecated_id, deleted_id],
+            correlation_id=None,
+            publish_topic=_DELTA_TOPIC,
+            sequence=1,
+            last_published=last_published,
+        )
+
+        assert [(d.pattern_id, d.operation) for d in deltas] == [
+            (deprecated_id, "remove"),
+            (deleted_id, "remove"),
+        ]
+        assert all(d.pattern is None for d in deltas)
+        assert last_published == {}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_and_unknown_patterns_suppressed(
+        self,
+        mock_query_store: MockPatternQueryStore,
+        mock_producer: MockKafkaPublisher,
+    ) -> None:
+        """No delta for a pattern already held, or a removal never held."""
+        held_id, never_held_id = uuid4(), uuid4()
+        held_row = make_pattern_row(pattern_id=str(held_id))
+        mock_query_store.rows = [
+            held_row,
+            make_pattern_row(pattern_id=str(never_held_id), status="candidate"),
+        ]
+        last_published = {held_id: ModelPatternSummary.model_validate(held_row)}
+
+        deltas = await publish_projection_delta(
+            pattern_query_store=mock_query_store,
+            producer=mock_producer,
+            pattern_ids=[held_id, never_held_id],
+            correlation_id=None,
+            publish_topic=_DELTA_TOPIC,
+            sequence=1,
+            last_published=last_published,
+        )
+
+        assert deltas == []
+        assert mock_producer.published_events == []
+
+    @pytest.mark.asyncio
+    async def test_query_error_returns_no_deltas(
+        self,
+        mock_query_store: MockPatternQueryStore,
+        mock_producer: MockKafkaPublisher,
+    ) -> None:
+        """Query store errors are swallowed and nothing is published."""
+        mock_query_store.simulate_error = RuntimeError("db down")
+
+        deltas = await publish_projection_delta(
+            pattern_query_store=mock_query_store,
+            producer=mock_producer,
+            pattern_ids=[uuid4()],
+            correlation_id=None,
+            publish_topic=_DELTA_TOPIC,
+            sequence=1,
+        )
+
+        assert deltas == []
+        assert mock_producer.published_events == []
+
+    @pytest.mark.asyncio
+    async def test_kafka_error_leaves_last_published_untouched(
+        self,
+        mock_query_store: MockPatternQueryStore,
+        mock_producer: MockKafkaPublisher,
+    ) -> None:
+        """A failed publish is not recorded, so the change is re-sent later."""
+        pattern_id = uuid4()
+        mock_query_store.rows = [make_pattern_row(pattern_id=str(pattern_id))]
+        mock_producer.simulate_error = RuntimeError("broker down")
+        last_published: dict[UUID, ModelPatternSummary] = {}
+
+        deltas = await publish_projection_delta(
+            pattern_query_store=mock_query_store,
+            producer=mock_producer,
+            pattern_ids=[pattern_id],
+            correlation_id=None,
+            publish_topic=_DELTA_TOPIC,
+            sequence=1,
+            last_published=last_published,
+        )
+
+        assert len(deltas) == 1
+        assert last_published == {}
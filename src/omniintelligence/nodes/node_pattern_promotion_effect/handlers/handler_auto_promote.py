@@ -32,6 +32,7 @@ Design Principles:
     - Pure functions for criteria evaluation (no I/O)
     - Evidence tier read from denormalized column (fast, no joins)
     - Calls existing ``apply_transition()`` for actual state changes
+    - Gate snapshot data fetched once per chunk of eligible patterns
     - Protocol-based dependency injection for testability
     - asyncpg-style positional parameters ($1, $2, etc.)
 
@@ -42,7 +43,9 @@ Reference:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Protocol, TypedDict, cast, runtime_checkable
 from uuid import UUID, uuid4
@@ -98,6 +101,14 @@ MIN_SUCCESS_RATE: float = 0.6
 """Minimum success rate required for any promotion (60%)."""
 MAX_FAILURE_STREAK: int = 3
 """Maximum consecutive failures allowed for promotion eligibility."""
+DEFAULT_PROMOTION_CHUNK_SIZE: int = 100
+"""Patterns per gate snapshot query and transition batch."""
+DEFAULT_PROMOTION_MAX_CONCURRENCY: int = 1
+"""Transitions applied concurrently within a chunk.
+
+Defaults to sequential application so repositories backed by a single
+connection keep working; pool-backed callers can raise it.
+"""
 _VALID_EVIDENCE_TIERS: frozenset[str] = frozenset(
     {"unmeasured", "observed", "measured", "verified"}
 )
@@ -155,20 +166,29 @@ WHERE lp.status = 'provisional'
 ORDER BY lp.created_at ASC
 LIMIT 500
 """
-# Count measured attributions for a pattern (for gate snapshot)
-SQL_COUNT_ATTRIBUTIONS = """
-SELECT COUNT(*) as count
-FROM pattern_measured_attributions
-WHERE pattern_id = $1
-"""
-# Get latest run result for a pattern (for gate snapshot)
-SQL_LATEST_RUN_RESULT = """
-SELECT measured_attribution_json->>'run_result' as run_result
-FROM pattern_measured_attributions
-WHERE pattern_id = $1
-  AND run_id IS NOT NULL
-ORDER BY created_at DESC
-LIMIT 1
+# Gate snapshot data for a chunk of patterns in one round trip: attribution
+# count (GROUP BY) and latest run result (DISTINCT ON, served by
+# idx_pattern_attributions_pattern_created). Patterns without attributions
+# return no row; callers default them to count=0 / run_result=None.
+SQL_FETCH_GATE_SNAPSHOT_DATA = """
+SELECT counts.pattern_id,
+       counts.count,
+       latest.run_result
+FROM (
+    SELECT pattern_id, COUNT(*) AS count
+    FROM pattern_measured_attributions
+    WHERE pattern_id = ANY($1::uuid[])
+    GROUP BY pattern_id
+) counts
+LEFT JOIN (
+    SELECT DISTINCT ON (pattern_id)
+           pattern_id,
+           measured_attribution_json->>'run_result' AS run_result
+    FROM pattern_measured_attributions
+    WHERE pattern_id = ANY($1::uuid[])
+      AND run_id IS NOT NULL
+    ORDER BY pattern_id, created_at DESC
+) latest ON latest.pattern_id = counts.pattern_id
 """
 # =============================================================================
 # Type Definitions
@@ -397,72 +417,78 @@ def _calculate_success_rate(pattern: PatternMetricsRow) -> float:
     return max(0.0, min(1.0, success_count / total))
 
 
-async def _build_enriched_gate_snapshot(
-    pattern: PatternMetricsRow,
+async def _fetch_gate_snapshot_data(
+    pattern_ids: list[UUID],
     *,
     conn: ProtocolPatternRepository,
     correlation_id: UUID,
-) -> ModelGateSnapshot:
-    """Build gate snapshot enriched with evidence tier data.
+) -> dict[UUID, tuple[int, str | None]]:
+    """Fetch attribution count and latest run result for a chunk of patterns.
 
     Args:
-        pattern: Pattern record from SQL query.
-        conn: Database connection for attribution count lookup.
+        pattern_ids: Pattern IDs to look up.
+        conn: Database connection for attribution lookups.
         correlation_id: Correlation ID for traceability in warning logs.
 
     Returns:
-        ModelGateSnapshot with evidence tier fields populated.
+        Mapping of pattern ID to (attribution_count, latest_run_result).
+        Patterns without attributions are absent. Unknown run results are
+        mapped to None. On database error the mapping is empty so every
+        pattern falls back to conservative defaults.
     """
-    pattern_id = pattern["id"]
-    raw_evidence_tier = pattern.get("evidence_tier", "unmeasured")
-    # Validate against known values to prevent Pydantic ValidationError.
-    # Cast is safe: we check membership in _VALID_EVIDENCE_TIERS which
-    # exactly matches EvidenceTierLiteral, or assign None.
-    evidence_tier: EvidenceTierLiteral | None = (
-        cast(EvidenceTierLiteral, raw_evidence_tier)
-        if raw_evidence_tier in _VALID_EVIDENCE_TIERS
-        else None
-    )
-
-    # Count measured attributions
-    attribution_count = 0
     try:
-        count_row = await conn.fetchrow(SQL_COUNT_ATTRIBUTIONS, pattern_id)
-        if count_row:
-            attribution_count = count_row["count"]
+        rows = await conn.fetch(SQL_FETCH_GATE_SNAPSHOT_DATA, pattern_ids)
     except Exception:  # broad-catch-ok: asyncpg driver boundary
         # asyncpg raises driver-specific exceptions (InterfaceError,
         # PostgresError, etc.) that are not stable across versions. We log
         # with exc_info=True so the full traceback is visible, then fall
-        # through with attribution_count=0 so promotion evaluation can still
-        # proceed with conservative defaults.
+        # through with empty data so promotion evaluation can still proceed
+        # with attribution_count=0 and latest_run_result=None.
         logger.warning(
-            "Failed to count attributions for gate snapshot",
+            "Failed to fetch attribution data for gate snapshots",
             extra={
                 "correlation_id": str(correlation_id),
-                "pattern_id": str(pattern_id),
+                "pattern_count": len(pattern_ids),
             },
             exc_info=True,
         )
-
-    # Get latest run result (validate against known values)
-    latest_run_result = None
-    try:
-        run_row = await conn.fetchrow(SQL_LATEST_RUN_RESULT, pattern_id)
-        if run_row:
-            raw_result = run_row.get("run_result")
-            latest_run_result = raw_result if raw_result in _VALID_RUN_RESULTS else None
-    except Exception:  # broad-catch-ok: asyncpg driver boundary
-        # Same rationale as attribution count above. DB errors yield
-        # latest_run_result=None (conservative default).
-        logger.warning(
-            "Failed to get latest run result for gate snapshot",
-            extra={
-                "correlation_id": str(correlation_id),
-                "pattern_id": str(pattern_id),
-            },
-            exc_info=True,
+        return {}
+
+    snapshot_data: dict[UUID, tuple[int, str | None]] = {}
+    for row in rows:
+        raw_result = row.get("run_result")
+        snapshot_data[row["pattern_id"]] = (
+            row.get("count", 0) or 0,
+            raw_result if raw_result in _VALID_RUN_RESULTS else None,
         )
+    return snapshot_data
+
+
+def _build_gate_snapshot(
+    pattern: PatternMetricsRow,
+    *,
+    attribution_count: int,
+    latest_run_result: str | None,
+) -> ModelGateSnapshot:
+    """Build gate snapshot enriched with evidence tier data.
+
+    Args:
+        pattern: Pattern record from SQL query.
+        attribution_count: Number of measured attributions for the pattern.
+        latest_run_result: Validated result of the most recent pipeline run.
+
+    Returns:
+        ModelGateSnapshot with evidence tier fields populated.
+    """
+    raw_evidence_tier = pattern.get("evidence_tier", "unmeasured")
+    # Validate against known values to prevent Pydantic ValidationError.
+    # Cast is safe: we check membership in _VALID_EVIDENCE_TIERS which
+    # exactly matches EvidenceTierLiteral, or assign None.
+    evidence_tier: EvidenceTierLiteral | None = (
+        cast(EvidenceTierLiteral, raw_evidence_tier)
+        if raw_evidence_tier in _VALID_EVIDENCE_TIERS
+        else None
+    )
 
     return ModelGateSnapshot(
         success_rate_rolling_20=_calculate_success_rate(pattern),
@@ -495,6 +521,187 @@ def _build_candidate_promotion_reason(
     )
 
 
+def _build_provisional_promotion_reason(
+    pattern: PatternMetricsRow, gate_snapshot: ModelGateSnapshot
+) -> str:
+    """Build a descriptive reason string for provisional promotion."""
+    return (
+        f"Auto-promoted: evidence_tier={pattern.get('evidence_tier')}, "
+        f"success_rate={gate_snapshot.success_rate_rolling_20:.2%}"
+    )
+
+
+def _select_eligible_patterns(
+    raw_patterns: list[Mapping[str, Any]],
+    *,
+    status: EnumPatternLifecycleStatus,
+    criteria: Callable[[PatternMetricsRow], bool],
+    correlation_id: UUID,
+) -> list[PatternMetricsRow]:
+    """Filter fetched rows down to well-formed patterns that meet criteria."""
+    eligible: list[PatternMetricsRow] = []
+    for _raw_pattern in raw_patterns:
+        # Cast contract: the fetch queries return rows matching PatternMetricsRow shape
+        pattern = cast(PatternMetricsRow, _raw_pattern)
+        # Runtime guard: verify critical fields exist before proceeding.
+        # If SQL columns change, this surfaces the error explicitly instead
+        # of silently returning None on TypedDict key access.
+        if "id" not in pattern or "pattern_signature" not in pattern:
+            # Runtime guard: cast() does not validate keys at runtime.
+            # mypy marks this as unreachable because the base TypedDict
+            # guarantees these keys, but asyncpg rows may not conform.
+            logger.warning(  # type: ignore[unreachable]
+                "Skipping %s pattern: missing required fields (id, pattern_signature)",
+                status.value,
+                extra={
+                    "correlation_id": str(correlation_id),
+                    "available_keys": list(pattern.keys())
+                    if hasattr(pattern, "keys")
+                    else "N/A",
+                },
+            )
+            continue
+        if criteria(pattern):
+            eligible.append(pattern)
+    return eligible
+
+
+async def _promote_pattern(
+    pattern: PatternMetricsRow,
+    *,
+    snapshot_data: dict[UUID, tuple[int, str | None]],
+    repository: ProtocolPatternRepository,
+    apply_transition_fn: ProtocolApplyTransition,
+    idempotency_store: ProtocolIdempotencyStore | None,
+    producer: ProtocolKafkaPublisher,
+    correlation_id: UUID,
+    publish_topic: str | None,
+    from_status: EnumPatternLifecycleStatus,
+    to_status: EnumPatternLifecycleStatus,
+    build_reason: Callable[[PatternMetricsRow, ModelGateSnapshot], str],
+) -> AutoPromoteResult:
+    """Apply a single promotion transition, isolating any failure."""
+    pattern_id = pattern["id"]
+    gate_snapshot: ModelGateSnapshot | None = None
+    request_id = uuid4()
+    now = datetime.now(UTC)
+
+    try:
+        attribution_count, latest_run_result = snapshot_data.get(pattern_id, (0, None))
+        gate_snapshot = _build_gate_snapshot(
+            pattern,
+            attribution_count=attribution_count,
+            latest_run_result=latest_run_result,
+        )
+        transition_result = await apply_transition_fn(
+            repository,
+            idempotency_store,
+            producer,
+            request_id=request_id,
+            correlation_id=correlation_id,
+            pattern_id=pattern_id,
+            from_status=from_status,
+            to_status=to_status,
+            trigger="auto_promote_evidence_gate",
+            actor="auto_promote_handler",
+            reason=build_reason(pattern, gate_snapshot),
+            gate_snapshot=gate_snapshot,
+            transition_at=now,
+            publish_topic=publish_topic,
+        )
+
+        return AutoPromoteResult(
+            pattern_id=pattern_id,
+            from_status=from_status.value,
+            to_status=to_status.value,
+            promoted=transition_result.success and not transition_result.duplicate,
+            reason=transition_result.reason or "auto_promote_evidence_gate",
+            evidence_tier=pattern.get("evidence_tier", "unknown"),
+            gate_snapshot=gate_snapshot.model_dump(mode="json"),
+        )
+
+    except Exception as exc:  # broad-catch-ok: asyncpg driver boundary
+        sanitized_err = get_log_sanitizer().sanitize(str(exc))
+        logger.error(
+            "Failed to promote %s pattern",
+            from_status.value,
+            extra={
+                "correlation_id": str(correlation_id),
+                "pattern_id": str(pattern_id),
+                "error": sanitized_err,
+            },
+            exc_info=True,
+        )
+        return AutoPromoteResult(
+            pattern_id=pattern_id,
+            from_status=from_status.value,
+            to_status=to_status.value,
+            promoted=False,
+            reason=f"promotion_failed: {type(exc).__name__}: {sanitized_err}",
+            evidence_tier=pattern.get("evidence_tier", "unknown"),
+            gate_snapshot=gate_snapshot.model_dump(mode="json")
+            if gate_snapshot is not None
+            else {},
+        )
+
+
+async def _promote_eligible_patterns(
+    patterns: list[PatternMetricsRow],
+    *,
+    repository: ProtocolPatternRepository,
+    apply_transition_fn: ProtocolApplyTransition,
+    idempotency_store: ProtocolIdempotencyStore | None,
+    producer: ProtocolKafkaPublisher,
+    correlation_id: UUID,
+    publish_topic: str | None,
+    from_status: EnumPatternLifecycleStatus,
+    to_status: EnumPatternLifecycleStatus,
+    build_reason: Callable[[PatternMetricsRow, ModelGateSnapshot], str],
+    chunk_size: int,
+    max_concurrency: int,
+) -> list[AutoPromoteResult]:
+    """Promote eligible patterns chunk by chunk.
+
+    Each chunk costs one gate snapshot query plus its transitions, which run
+    at most ``max_concurrency`` at a time. Results keep input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(
+        pattern: PatternMetricsRow,
+        snapshot_data: dict[UUID, tuple[int, str | None]],
+    ) -> AutoPromoteResult:
+        async with semaphore:
+            return await _promote_pattern(
+                pattern,
+                snapshot_data=snapshot_data,
+                repository=repository,
+                apply_transition_fn=apply_transition_fn,
+                idempotency_store=idempotency_store,
+                producer=producer,
+                correlation_id=correlation_id,
+                publish_topic=publish_topic,
+                from_status=from_status,
+                to_status=to_status,
+                build_reason=build_reason,
+            )
+
+    results: list[AutoPromoteResult] = []
+    for start in range(0, len(patterns), chunk_size):
+        chunk = patterns[start : start + chunk_size]
+        snapshot_data = await _fetch_gate_snapshot_data(
+            [pattern["id"] for pattern in chunk],
+            conn=repository,
+            correlation_id=correlation_id,
+        )
+        results.extend(
+            await asyncio.gather(
+                *(_bounded(pattern, snapshot_data) for pattern in chunk)
+            )
+        )
+    return results
+
+
 # =============================================================================
 # Handler Functions
 # =============================================================================
@@ -508,6 +715,8 @@ async def handle_auto_promote_check(
     producer: ProtocolKafkaPublisher,
     correlation_id: UUID | None = None,
     publish_topic: str | None = None,
+    chunk_size: int = DEFAULT_PROMOTION_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_PROMOTION_MAX_CONCURRENCY,
 ) -> AutoPromoteCheckResult:
     """Check and auto-promote patterns based on evidence tier gating.
 
@@ -517,7 +726,9 @@ async def handle_auto_promote_check(
 
     Calls ``apply_transition()`` for each eligible pattern to ensure
     the standard transition machinery (idempotency, audit trail, Kafka)
-    is used.
+    is used. Eligible patterns are processed in chunks: gate snapshot data
+    for a whole chunk is fetched with a single query instead of two
+    queries per pattern.
 
     Args:
         repository: Database repository for pattern queries.
@@ -538,10 +749,22 @@ async def handle_auto_promote_check(
             the contract-declared publish topic). Callers that need to override
             the topic should pass an explicit string. ``None`` is a valid
             "use the default" signal, not a programming error.
+        chunk_size: Eligible patterns per gate snapshot query and transition
+            batch.
+        max_concurrency: Maximum transitions in flight within a chunk. Only
+            raise above 1 when ``repository`` is backed by a connection pool.
 
     Returns:
         AutoPromoteCheckResult with per-pattern promotion details.
+
+    Raises:
+        ValueError: If chunk_size or max_concurrency < 1.
     """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
     # Generate the fallback correlation_id ONCE so both candidate and
     # provisional phases share the same trace ID (M4 fix).
     effective_correlation_id: UUID = correlation_id or uuid4()
@@ -553,10 +776,6 @@ async def handle_auto_promote_check(
         },
     )
 
-    results: list[AutoPromoteResult] = []
-    candidates_promoted = 0
-    provisionals_promoted = 0
-
     # Phase 1: CANDIDATE -> PROVISIONAL
     candidate_patterns = await repository.fetch(SQL_FETCH_CANDIDATE_PATTERNS)
     logger.debug(
@@ -566,96 +785,25 @@ async def handle_auto_promote_check(
             "pattern_count": len(candidate_patterns),
         },
     )
-
-    for _raw_pattern in candidate_patterns:
-        # Cast contract: SQL_FETCH_CANDIDATE_PATTERNS returns rows matching PatternMetricsRow shape
-        pattern = cast(PatternMetricsRow, _raw_pattern)
-        # Runtime guard: verify critical fields exist before proceeding.
-        # If SQL columns change, this surfaces the error explicitly instead
-        # of silently returning None on TypedDict key access.
-        if "id" not in pattern or "pattern_signature" not in pattern:
-            # Runtime guard: cast() does not validate keys at runtime.
-            # mypy marks this as unreachable because the base TypedDict
-            # guarantees these keys, but asyncpg rows may not conform.
-            logger.warning(  # type: ignore[unreachable]
-                "Skipping candidate pattern: missing required fields (id, pattern_signature)",
-                extra={
-                    "correlation_id": str(effective_correlation_id),
-                    "available_keys": list(pattern.keys())
-                    if hasattr(pattern, "keys")
-                    else "N/A",
-                },
-            )
-            continue
-        if not meets_candidate_to_provisional_criteria(pattern):
-            continue
-
-        pattern_id = pattern["id"]
-        gate_snapshot: ModelGateSnapshot | None = None
-        request_id = uuid4()
-        now = datetime.now(UTC)
-
-        try:
-            gate_snapshot = await _build_enriched_gate_snapshot(
-                pattern, conn=repository, correlation_id=effective_correlation_id
-            )
-            transition_result = await apply_transition_fn(
-                repository,
-                idempotency_store,
-                producer,
-                request_id=request_id,
-                correlation_id=effective_correlation_id,
-                pattern_id=pattern_id,
-                from_status=EnumPatternLifecycleStatus.CANDIDATE,
-                to_status=EnumPatternLifecycleStatus.PROVISIONAL,
-                trigger="auto_promote_evidence_gate",
-                actor="auto_promote_handler",
-                reason=_build_candidate_promotion_reason(pattern, gate_snapshot),
-                gate_snapshot=gate_snapshot,
-                transition_at=now,
-                publish_topic=publish_topic,
-            )
-
-            promoted = transition_result.success and not transition_result.duplicate
-            if promoted:
-                candidates_promoted += 1
-
-            results.append(
-                AutoPromoteResult(
-                    pattern_id=pattern_id,
-                    from_status="candidate",
-                    to_status="provisional",
-                    promoted=promoted,
-                    reason=transition_result.reason or "auto_promote_evidence_gate",
-                    evidence_tier=pattern.get("evidence_tier", "unknown"),
-                    gate_snapshot=gate_snapshot.model_dump(mode="json"),
-                )
-            )
-
-        except Exception as exc:  # broad-catch-ok: asyncpg driver boundary
-            sanitized_err = get_log_sanitizer().sanitize(str(exc))
-            logger.error(
-                "Failed to promote candidate pattern",
-                extra={
-                    "correlation_id": str(effective_correlation_id),
-                    "pattern_id": str(pattern_id),
-                    "error": sanitized_err,
-                },
-                exc_info=True,
-            )
-            results.append(
-                AutoPromoteResult(
-                    pattern_id=pattern_id,
-                    from_status="candidate",
-                    to_status="provisional",
-                    promoted=False,
-                    reason=f"promotion_failed: {type(exc).__name__}: {sanitized_err}",
-                    evidence_tier=pattern.get("evidence_tier", "unknown"),
-                    gate_snapshot=gate_snapshot.model_dump(mode="json")
-                    if gate_snapshot is not None
-                    else {},
-                )
-            )
+    candidate_results = await _promote_eligible_patterns(
+        _select_eligible_patterns(
+            candidate_patterns,
+            status=EnumPatternLifecycleStatus.CANDIDATE,
+            criteria=meets_candidate_to_provisional_criteria,
+            correlation_id=effective_correlation_id,
+        ),
+        repository=repository,
+        apply_transition_fn=apply_transition_fn,
+        idempotency_store=idempotency_store,
+        producer=producer,
+        correlation_id=effective_correlation_id,
+        publish_topic=publish_topic,
+        from_status=EnumPatternLifecycleStatus.CANDIDATE,
+        to_status=EnumPatternLifecycleStatus.PROVISIONAL,
+        build_reason=_build_candidate_promotion_reason,
+        chunk_size=chunk_size,
+        max_concurrency=max_concurrency,
+    )
 
     # Phase 2: PROVISIONAL -> VALIDATED
     provisional_patterns = await repository.fetch(
@@ -668,95 +816,28 @@ async def handle_auto_promote_check(
             "pattern_count": len(provisional_patterns),
         },
     )
+    provisional_results = await _promote_eligible_patterns(
+        _select_eligible_patterns(
+            provisional_patterns,
+            status=EnumPatternLifecycleStatus.PROVISIONAL,
+            criteria=meets_provisional_to_validated_criteria,
+            correlation_id=effective_correlation_id,
+        ),
+        repository=repository,
+        apply_transition_fn=apply_transition_fn,
+        idempotency_store=idempotency_store,
+        producer=producer,
+        correlation_id=effective_correlation_id,
+        publish_topic=publish_topic,
+        from_status=EnumPatternLifecycleStatus.PROVISIONAL,
+        to_status=EnumPatternLifecycleStatus.VALIDATED,
+        build_reason=_build_provisional_promotion_reason,
+        chunk_size=chunk_size,
+        max_concurrency=max_concurrency,
+    )
 
-    for _raw_pattern in provisional_patterns:
-        # Cast contract: SQL_FETCH_PROVISIONAL_PATTERNS returns rows matching PatternMetricsRow shape
-        pattern = cast(PatternMetricsRow, _raw_pattern)
-        # Runtime guard: verify critical fields exist before proceeding.
-        if "id" not in pattern or "pattern_signature" not in pattern:
-            # Runtime guard: cast() does not validate keys at runtime.
-            # mypy marks this as unreachable because the base TypedDict
-            # guarantees these keys, but asyncpg rows may not conform.
-            logger.warning(  # type: ignore[unreachable]
-                "Skipping provisional pattern: missing required fields (id, pattern_signature)",
-                extra={
-                    "correlation_id": str(effective_correlation_id),
-                    "available_keys": list(pattern.keys())
-                    if hasattr(pattern, "keys")
-                    else "N/A",
-                },
-            )
-            continue
-        if not meets_provisional_to_validated_criteria(pattern):
-            continue
-
-        pattern_id = pattern["id"]
-        gate_snapshot = None
-        request_id = uuid4()
-        now = datetime.now(UTC)
-
-        try:
-            gate_snapshot = await _build_enriched_gate_snapshot(
-                pattern, conn=repository, correlation_id=effective_correlation_id
-            )
-            transition_result = await apply_transition_fn(
-                repository,
-                idempotency_store,
-                producer,
-                request_id=request_id,
-                correlation_id=effective_correlation_id,
-                pattern_id=pattern_id,
-                from_status=EnumPatternLifecycleStatus.PROVISIONAL,
-                to_status=EnumPatternLifecycleStatus.VALIDATED,
-                trigger="auto_promote_evidence_gate",
-                actor="auto_promote_handler",
-                reason=f"Auto-promoted: evidence_tier={pattern.get('evidence_tier')}, "
-                f"success_rate={gate_snapshot.success_rate_rolling_20:.2%}",
-                gate_snapshot=gate_snapshot,
-                transition_at=now,
-                publish_topic=publish_topic,
-            )
-
-            promoted = transition_result.success and not transition_result.duplicate
-            if promoted:
-                provisionals_promoted += 1
-
-            results.append(
-                AutoPromoteResult(
-                    pattern_id=pattern_id,
-                    from_status="provisional",
-                    to_status="validated",
-                    promoted=promoted,
-                    reason=transition_result.reason or "auto_promote_evidence_gate",
-                    evidence_tier=pattern.get("evidence_tier", "unknown"),
-                    gate_snapshot=gate_snapshot.model_dump(mode="json"),
-                )
-            )
-
-        except Exception as exc:  # broad-catch-ok: asyncpg driver boundary
-            sanitized_err = get_log_sanitizer().sanitize(str(exc))
-            logger.error(
-                "Failed to promote provisional pattern",
-                extra={
-                    "correlation_id": str(effective_correlation_id),
-                    "pattern_id": str(pattern_id),
-                    "error": sanitized_err,
-                },
-                exc_info=True,
-            )
-            results.append(
-                AutoPromoteResult(
-                    pattern_id=pattern_id,
-                    from_status="provisional",
-                    to_status="validated",
-                    promoted=False,
-                    reason=f"promotion_failed: {type(exc).__name__}: {sanitized_err}",
-                    evidence_tier=pattern.get("evidence_tier", "unknown"),
-                    gate_snapshot=gate_snapshot.model_dump(mode="json")
-                    if gate_snapshot is not None
-                    else {},
-                )
-            )
+    candidates_promoted = sum(1 for r in candidate_results if r["promoted"])
+    provisionals_promoted = sum(1 for r in provisional_results if r["promoted"])
 
     logger.info(
         "Evidence-gated auto-promote check complete",
@@ -774,7 +855,7 @@ async def handle_auto_promote_check(
         candidates_promoted=candidates_promoted,
         provisionals_checked=len(provisional_patterns),
         provisionals_promoted=provisionals_promoted,
-        results=results,
+        results=candidate_results + provisional_results,
     )
 
 
@@ -784,6 +865,8 @@ __all__ = [
     "BOOTSTRAP_MIN_CONFIDENCE",
     "BOOTSTRAP_MIN_DISTINCT_DAYS",
     "BOOTSTRAP_MIN_RECURRENCE",
+    "DEFAULT_PROMOTION_CHUNK_SIZE",
+    "DEFAULT_PROMOTION_MAX_CONCURRENCY",
     "MAX_FAILURE_STREAK",
     "MIN_INJECTION_COUNT_PROVISIONAL",
     "MIN_INJECTION_COUNT_VALIDATED",
@@ -83,7 +83,7 @@ class ProtocolHandler(Protocol):
                 HTTP: "GET", "POST", "PUT", "DELETE"
                 Bolt: "query", "write"
                 PostgreSQL: "query", "execute"
-                Kafka: "produce", "consume"
+                Kafka: "produce", "produce_batch", "consume"
             params: Operation-specific parameters.
             correlation_id: Optional correlation ID for tracing.
 
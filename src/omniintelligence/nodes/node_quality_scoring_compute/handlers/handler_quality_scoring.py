@@ -41,10 +41,16 @@ from __future__ import annotations
 import ast
 import re
 import sys
+import tokenize
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Final, Literal, get_args
 
 from omnibase_core.models.primitives.model_semver import ModelSemVer
 
+from omniintelligence.utils.parse_cache import get_parse_cache
+
 from .enum_onex_strictness_level import OnexStrictnessLevel
 from .exceptions import QualityScoringComputeError, QualityScoringValidationError
 from .presets import get_threshold_for_preset, get_weights_for_preset
@@ -137,6 +143,7 @@ _COMMENT_PATTERN: Final[re.Pattern[str]] = re.compile(r"#[^\n]*")
 _STRING_PATTERN: Final[re.Pattern[str]] = re.compile(
     r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\''
 )
+_NON_NEWLINE_PATTERN: Final[re.Pattern[str]] = re.compile(r"[^\r\n]")
 
 # Pre-compiled patterns for temporal relevance scoring
 _COMPILED_TODO_PATTERN: Final[re.Pattern[str]] = re.compile(
@@ -532,8 +539,10 @@ def score_code_quality(
 def _compute_all_dimensions(content: str) -> DimensionScores:
     """Compute all quality dimension scores.
 
-    Parses the AST once and passes it to dimension functions that need it,
-    optimizing performance by avoiding redundant parsing.
+    Parses the AST once and walks it once (``_collect_tree_metrics``), then
+    passes the collected counters to the dimension functions. The parse (and
+    the comment/string-stripped source) comes from the shared parse cache, so
+    other compute nodes that see the same content reuse it.
 
     Args:
         content: Python source code to analyze.
@@ -545,26 +554,114 @@ def _compute_all_dimensions(content: str) -> DimensionScores:
         SyntaxError: If the content cannot be parsed as valid Python.
     """
     # Parse AST once for all dimensions that need it
-    tree = ast.parse(content)
+    parsed = get_parse_cache().get_or_parse(content)
+    tree = parsed.tree
+    stripped_content = parsed.derive(
+        "quality_scoring.stripped",
+        lambda source: _strip_comments_and_strings(source, parsed.tokens),
+    )
+    metrics = _collect_tree_metrics(tree)
 
     # Use radon for accurate McCabe cyclomatic complexity if available (OMN-1452),
     # otherwise fall back to the AST approximation.
     if _RADON_AVAILABLE:
         complexity_score = _compute_radon_complexity_score(content)
     else:
-        complexity_score = _compute_complexity_score(tree)
+        complexity_score = _compute_complexity_score(tree, metrics=metrics)
 
     return {
         "complexity": complexity_score,
-        "maintainability": _compute_maintainability_score(tree),
-        "documentation": _compute_documentation_score(tree, content),
+        "maintainability": _compute_maintainability_score(tree, metrics=metrics),
+        "documentation": _compute_documentation_score(tree, content, metrics=metrics),
         "temporal_relevance": _compute_temporal_relevance_score(content),
-        "patterns": _compute_patterns_score(tree, content),
-        "architectural": _compute_architectural_score(tree),
+        "patterns": _compute_patterns_score(
+            tree, content, stripped_content=stripped_content, metrics=metrics
+        ),
+        "architectural": _compute_architectural_score(tree, metrics=metrics),
     }
 
 
-def _strip_comments_and_strings(content: str) -> str:
+@dataclass(slots=True)
+class _TreeMetrics:
+    """AST counters needed by the dimension functions.
+
+    Collected by ``_collect_tree_metrics`` in a single traversal so that
+    scoring one file walks its tree once instead of once per check.
+    """
+
+    # Maintainability: per-function length/naming scores, then class naming
+    function_scores: list[float] = field(default_factory=list)
+    class_name_scores: list[float] = field(default_factory=list)
+    # Complexity (AST approximation)
+    function_count: int = 0
+    complexity_count: int = 0
+    # Documentation
+    needs_docstring: int = 0
+    has_docstring: int = 0
+    # Patterns
+    mutable_defaults: int = 0
+    # Architectural
+    multiple_inheritance_classes: int = 0
+    imports_inside_functions: int = 0
+    class_organization_issues: int = 0
+
+
+def _collect_tree_metrics(tree: ast.AST) -> _TreeMetrics:
+    """Collect every AST counter used by the dimension functions in one pass.
+
+    Visits nodes in the same breadth-first order as ``ast.walk`` so the
+    maintainability score lists (and their float sums) match a per-dimension
+    walk exactly. Each queued node carries the number of enclosing function
+    definitions, which is how many times the former nested walk counted an
+    import inside a function.
+
+    Args:
+        tree: Parsed AST of the Python source code.
+
+    Returns:
+        _TreeMetrics with all counters populated.
+    """
+    metrics = _TreeMetrics()
+    todo: deque[tuple[ast.AST, int]] = deque([(tree, 0)])
+
+    while todo:
+        node, function_depth = todo.popleft()
+        is_function = isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef)
+        child_depth = function_depth + 1 if is_function else function_depth
+        todo.extend((child, child_depth) for child in ast.iter_child_nodes(node))
+
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            metrics.function_count += 1
+            metrics.function_scores.extend(_function_maintainability_scores(node))
+            metrics.mutable_defaults += _count_function_mutable_defaults(node)
+        elif isinstance(node, ast.If | ast.While | ast.For | ast.AsyncFor):
+            metrics.complexity_count += 1
+        elif isinstance(node, ast.BoolOp):
+            # Count and/or operators
+            metrics.complexity_count += len(node.values) - 1
+        elif isinstance(node, ast.Try | ast.ExceptHandler | ast.comprehension):
+            metrics.complexity_count += 1
+        elif isinstance(node, ast.Import | ast.ImportFrom):
+            metrics.imports_inside_functions += function_depth
+        elif isinstance(node, ast.ClassDef):
+            metrics.class_name_scores.append(_class_name_score(node))
+            if len(node.bases) > 1:
+                metrics.multiple_inheritance_classes += 1
+            metrics.class_organization_issues += _class_organization_issues(node)
+
+        if isinstance(
+            node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef | ast.Module
+        ):
+            metrics.needs_docstring += 1
+            if ast.get_docstring(node):
+                metrics.has_docstring += 1
+
+    return metrics
+
+
+def _strip_comments_and_strings(
+    content: str, tokens: Sequence[tokenize.TokenInfo] = ()
+) -> str:
     """Strip comments and string literals from Python source code.
 
     This is used to prevent false positives when detecting anti-patterns
@@ -573,11 +670,16 @@ def _strip_comments_and_strings(content: str) -> str:
 
     Args:
         content: Python source code to process.
+        tokens: Token stream of ``content`` (``ParsedSource.tokens`` from the
+            parse cache). When given, comment and string tokens are blanked
+            by position instead of rescanning the source with regexes.
 
     Returns:
         Content with comments and string literals replaced with whitespace
         to preserve line structure for any line-based analysis.
     """
+    if tokens:
+        return _blank_token_spans(content, tokens)
     # Replace strings first (they may contain # which looks like comments)
     result = _STRING_PATTERN.sub(lambda m: " " * len(m.group(0)), content)
     # Then replace comments
@@ -585,6 +687,41 @@ def _strip_comments_and_strings(content: str) -> str:
     return result
 
 
+def _blank_token_spans(content: str, tokens: Sequence[tokenize.TokenInfo]) -> str:
+    """Blank COMMENT, STRING and whole f-string token spans, keeping newlines."""
+    # tokenize reports (row, col) with rows split on "\n" only
+    line_starts = [0]
+    for line in content.split("\n"):
+        line_starts.append(line_starts[-1] + len(line) + 1)
+
+    spans: list[tuple[int, int]] = []
+    fstring_depth = 0
+    fstring_start = 0
+    for token in tokens:
+        if token.type == tokenize.FSTRING_START:
+            if fstring_depth == 0:
+                fstring_start = line_starts[token.start[0] - 1] + token.start[1]
+            fstring_depth += 1
+        elif token.type == tokenize.FSTRING_END:
+            fstring_depth -= 1
+            if fstring_depth == 0:
+                end = line_starts[token.end[0] - 1] + token.end[1]
+                spans.append((fstring_start, end))
+        elif fstring_depth == 0 and token.type in (tokenize.STRING, tokenize.COMMENT):
+            start = line_starts[token.start[0] - 1] + token.start[1]
+            end = line_starts[token.end[0] - 1] + token.end[1]
+            spans.append((start, end))
+
+    parts: list[str] = []
+    position = 0
+    for start, end in spans:
+        parts.append(content[position:start])
+        parts.append(_NON_NEWLINE_PATTERN.sub(" ", content[start:end]))
+        position = end
+    parts.append(content[position:])
+    return "".join(parts)
+
+
 def _count_mutable_default_arguments(tree: ast.AST) -> int:
     """Count mutable default arguments in function definitions using AST.
 
@@ -602,30 +739,45 @@ def _count_mutable_default_arguments(tree: ast.AST) -> int:
     Returns:
         Count of mutable default arguments (empty list or empty dict literals).
     """
+    return sum(
+        _count_function_mutable_defaults(node)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef)
+    )
+
+
+def _count_function_mutable_defaults(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> int:
+    """Count empty list/dict literal defaults in one function signature."""
     count = 0
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            # Check regular argument defaults
-            for default in node.args.defaults:
-                if isinstance(default, ast.List) and len(default.elts) == 0:
-                    count += 1  # Empty list default: = []
-                elif isinstance(default, ast.Dict) and len(default.keys) == 0:
-                    count += 1  # Empty dict default: = {}
-
-            # Check keyword-only argument defaults
-            # kw_defaults can contain None for kw-only args without defaults
-            for kw_default in node.args.kw_defaults:
-                if kw_default is not None:
-                    if isinstance(kw_default, ast.List) and len(kw_default.elts) == 0:
-                        count += 1  # Empty list default: = []
-                    elif isinstance(kw_default, ast.Dict) and len(kw_default.keys) == 0:
-                        count += 1  # Empty dict default: = {}
+    # Check regular argument defaults
+    for default in node.args.defaults:
+        if isinstance(default, ast.List) and len(default.elts) == 0:
+            count += 1  # Empty list default: = []
+        elif isinstance(default, ast.Dict) and len(default.keys) == 0:
+            count += 1  # Empty dict default: = {}
+
+    # Check keyword-only argument defaults
+    # kw_defaults can contain None for kw-only args without defaults
+    for kw_default in node.args.kw_defaults:
+        if kw_default is not None:
+            if isinstance(kw_default, ast.List) and len(kw_default.elts) == 0:
+                count += 1  # Empty list default: = []
+            elif isinstance(kw_default, ast.Dict) and len(kw_default.keys) == 0:
+                count += 1  # Empty dict default: = {}
 
     return count
 
 
-def _compute_patterns_score(tree: ast.AST, content: str) -> float:
+def _compute_patterns_score(
+    tree: ast.AST,
+    content: str,
+    *,
+    stripped_content: str | None = None,
+    metrics: _TreeMetrics | None = None,
+) -> float:
     """Compute ONEX pattern adherence score.
 
     Checks for positive ONEX patterns (frozen models, TypedDict, etc.)
@@ -640,6 +792,9 @@ def _compute_patterns_score(tree: ast.AST, content: str) -> float:
     Args:
         tree: Parsed AST of the Python source code.
         content: Python source code to analyze.
+        stripped_content: Precomputed ``_strip_comments_and_strings(content)``.
+            Computed here when not provided.
+        metrics: Precomputed tree metrics. The tree is walked when not provided.
 
     Returns:
         Score from 0.0 (no patterns/many anti-patterns) to 1.0 (excellent).
@@ -657,7 +812,8 @@ def _compute_patterns_score(tree: ast.AST, content: str) -> float:
     anti_count = 0
 
     # Strip comments and strings to avoid false positives in regex matching
-    stripped_content = _strip_comments_and_strings(content)
+    if stripped_content is None:
+        stripped_content = _strip_comments_and_strings(content)
 
     # Regex-based anti-patterns (dict[str, Any], **kwargs, : Any)
     for pattern in _COMPILED_ANTI_PATTERNS_REGEX:
@@ -665,7 +821,10 @@ def _compute_patterns_score(tree: ast.AST, content: str) -> float:
         anti_count += len(matches)
 
     # AST-based mutable default detection (more accurate than regex)
-    anti_count += _count_mutable_default_arguments(tree)
+    if metrics is not None:
+        anti_count += metrics.mutable_defaults
+    else:
+        anti_count += _count_mutable_default_arguments(tree)
 
     # Note: Handler pattern is an architectural concern (module organization),
     # not a patterns concern. It's properly handled in _compute_architectural_score()
@@ -680,59 +839,25 @@ def _compute_patterns_score(tree: ast.AST, content: str) -> float:
     return max(0.0, min(1.0, base_score - penalty + PATTERN_BASELINE_SCORE))
 
 
-def _compute_maintainability_score(tree: ast.AST) -> float:
+def _compute_maintainability_score(
+    tree: ast.AST, *, metrics: _TreeMetrics | None = None
+) -> float:
     """Compute code maintainability score.
 
     Evaluates function length, naming conventions, and overall structure.
 
     Args:
         tree: Parsed AST of the Python source code.
+        metrics: Precomputed tree metrics. The tree is walked when not provided.
 
     Returns:
         Score from 0.0 (poor maintainability) to 1.0 (excellent).
     """
-    scores: list[float] = []
+    if metrics is None:
+        metrics = _collect_tree_metrics(tree)
 
-    # Check function lengths
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            # Count lines in function
-            if node.end_lineno and node.lineno:
-                func_length = node.end_lineno - node.lineno + 1
-                # Score: 1.0 for <= IDEAL_FUNCTION_LENGTH lines, decreasing to 0.0 at 100+ lines
-                length_score = max(
-                    0.0,
-                    min(
-                        1.0,
-                        1.0
-                        - (func_length - IDEAL_FUNCTION_LENGTH)
-                        / FUNCTION_LENGTH_SCORING_RANGE,
-                    ),
-                )
-                scores.append(length_score)
-
-            # Check naming convention (snake_case for functions)
-            # Order matters: check dunder methods first, then private, then public snake_case
-            if node.name.startswith("__") and node.name.endswith("__"):
-                # Dunder methods (__init__, __str__, __repr__, etc.) are standard Python
-                # conventions and should receive full score
-                scores.append(1.0)
-            elif node.name.startswith(
-                "_"
-            ):  # Private is acceptable but slightly lower score
-                scores.append(0.9)
-            elif re.match(r"^[a-z][a-z0-9_]*$", node.name):  # Public snake_case
-                scores.append(1.0)
-            else:
-                scores.append(0.5)
-
-    # Check class naming (PascalCase)
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            if re.match(r"^[A-Z][a-zA-Z0-9]*$", node.name):
-                scores.append(1.0)
-            else:
-                scores.append(0.6)
+    # Function length/naming scores first, then class naming (PascalCase)
+    scores = [*metrics.function_scores, *metrics.class_name_scores]
 
     if not scores:
         return NO_ITEMS_MAINTAINABILITY_SCORE  # No functions/classes, moderate score
@@ -741,6 +866,56 @@ def _compute_maintainability_score(tree: ast.AST) -> float:
     return max(0.0, min(1.0, sum(scores) / len(scores)))
 
 
+def _function_maintainability_scores(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> list[float]:
+    """Score one function's length and naming convention.
+
+    Args:
+        node: Function definition node.
+
+    Returns:
+        Length score (when line numbers are available) followed by naming score.
+    """
+    scores: list[float] = []
+
+    # Count lines in function
+    if node.end_lineno and node.lineno:
+        func_length = node.end_lineno - node.lineno + 1
+        # Score: 1.0 for <= IDEAL_FUNCTION_LENGTH lines, decreasing to 0.0 at 100+ lines
+        length_score = max(
+            0.0,
+            min(
+                1.0,
+                1.0
+                - (func_length - IDEAL_FUNCTION_LENGTH) / FUNCTION_LENGTH_SCORING_RANGE,
+            ),
+        )
+        scores.append(length_score)
+
+    # Check naming convention (snake_case for functions)
+    # Order matters: check dunder methods first, then private, then public snake_case
+    if node.name.startswith("__") and node.name.endswith("__"):
+        # Dunder methods (__init__, __str__, __repr__, etc.) are standard Python
+        # conventions and should receive full score
+        scores.append(1.0)
+    elif node.name.startswith("_"):  # Private is acceptable but slightly lower score
+        scores.append(0.9)
+    elif re.match(r"^[a-z][a-z0-9_]*$", node.name):  # Public snake_case
+        scores.append(1.0)
+    else:
+        scores.append(0.5)
+
+    return scores
+
+
+def _class_name_score(node: ast.ClassDef) -> float:
+    """Score a class name: 1.0 for PascalCase, 0.6 otherwise."""
+    if re.match(r"^[A-Z][a-zA-Z0-9]*$", node.name):
+        return 1.0
+    return 0.6
+
+
 def _mccabe_to_score(avg_complexity: float) -> float:
     """Map average McCabe cyclomatic complexity to a 0.0-1.0 score.
 
@@ -822,7 +997,9 @@ def radon_available() -> bool:
     return bool(_RADON_AVAILABLE)
 
 
-def _compute_complexity_score(tree: ast.AST) -> float:
+def _compute_complexity_score(
+    tree: ast.AST, *, metrics: _TreeMetrics | None = None
+) -> float:
     """Compute complexity score (inverted - lower complexity is better).
 
     Approximates cyclomatic complexity by counting control flow statements.
@@ -831,24 +1008,18 @@ def _compute_complexity_score(tree: ast.AST) -> float:
 
     Args:
         tree: Parsed AST of the Python source code.
+        metrics: Precomputed tree metrics. The tree is walked when not provided.
 
     Returns:
         Score from 0.0 (high complexity) to 1.0 (low complexity).
     """
-    # Count complexity indicators
-    complexity_count = 0
-    function_count = 0
+    if metrics is None:
+        metrics = _collect_tree_metrics(tree)
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            function_count += 1
-        elif isinstance(node, ast.If | ast.While | ast.For | ast.AsyncFor):
-            complexity_count += 1
-        elif isinstance(node, ast.BoolOp):
-            # Count and/or operators
-            complexity_count += len(node.values) - 1
-        elif isinstance(node, ast.Try | ast.ExceptHandler | ast.comprehension):
-            complexity_count += 1
+    # Complexity indicators: branches, loops, boolean operators, try/except,
+    # and comprehensions (counted during collection)
+    complexity_count = metrics.complexity_count
+    function_count = metrics.function_count
 
     if function_count == 0:
         # No functions, use raw complexity
@@ -863,7 +1034,9 @@ def _compute_complexity_score(tree: ast.AST) -> float:
     return max(0.0, 1.0 - avg_complexity / MAX_AVG_COMPLEXITY)
 
 
-def _compute_documentation_score(tree: ast.AST, content: str) -> float:
+def _compute_documentation_score(
+    tree: ast.AST, content: str, *, metrics: _TreeMetrics | None = None
+) -> float:
     """Compute documentation coverage score.
 
     Evaluates docstring presence and comment ratio.
@@ -871,22 +1044,17 @@ def _compute_documentation_score(tree: ast.AST, content: str) -> float:
     Args:
         tree: Parsed AST of the Python source code.
         content: Raw source code content for comment analysis.
+        metrics: Precomputed tree metrics. The tree is walked when not provided.
 
     Returns:
         Score from 0.0 (no documentation) to 1.0 (well documented).
     """
-    # Count items that should have docstrings
-    needs_docstring = 0
-    has_docstring = 0
+    if metrics is None:
+        metrics = _collect_tree_metrics(tree)
 
-    for node in ast.walk(tree):
-        if isinstance(
-            node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef | ast.Module
-        ):
-            needs_docstring += 1
-            docstring = ast.get_docstring(node)
-            if docstring:
-                has_docstring += 1
+    # Items that should have docstrings (modules, classes, functions)
+    needs_docstring = metrics.needs_docstring
+    has_docstring = metrics.has_docstring
 
     # Calculate docstring coverage
     if needs_docstring == 0:
@@ -944,7 +1112,9 @@ def _compute_temporal_relevance_score(  # stub-ok: temporal-relevance-todo-in-do
     return max(0.0, 1.0 - penalty)
 
 
-def _compute_architectural_score(tree: ast.AST) -> float:
+def _compute_architectural_score(
+    tree: ast.AST, *, metrics: _TreeMetrics | None = None
+) -> float:
     """Compute architectural compliance score.
 
     Evaluates module organization, class structure, and import patterns for
@@ -958,12 +1128,19 @@ def _compute_architectural_score(tree: ast.AST) -> float:
     6. Handler pattern: Rewards private pure functions with type annotations
     7. Class organization: Checks ClassVar and model_config placement
 
+    Checks 2, 4 and 7 use the whole-tree counters from ``metrics``; the other
+    checks only look at top-level statements.
+
     Args:
         tree: Parsed AST of the Python source code.
+        metrics: Precomputed tree metrics. The tree is walked when not provided.
 
     Returns:
         Score from 0.0 (poor architecture) to 1.0 (good architecture).
     """
+    if metrics is None:
+        metrics = _collect_tree_metrics(tree)
+
     scores: list[float] = []
     bonuses: list[float] = []
     penalties: list[float] = []
@@ -989,10 +1166,9 @@ def _compute_architectural_score(tree: ast.AST) -> float:
     # Check 2: Multiple inheritance penalty
     # =========================================================================
     # Single inheritance (e.g., class MyModel(BaseModel)) is encouraged in ONEX patterns
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            if len(node.bases) > 1:  # Multiple inheritance - penalize
-                scores.append(1.0 - MULTIPLE_INHERITANCE_PENALTY)
+    scores.extend(
+        [1.0 - MULTIPLE_INHERITANCE_PENALTY] * metrics.multiple_inheritance_classes
+    )
 
     # =========================================================================
     # Check 3: __all__ exports - modules with public items should define __all__
@@ -1006,7 +1182,7 @@ def _compute_architectural_score(tree: ast.AST) -> float:
     # =========================================================================
     # Check 4: Circular import risk - imports inside functions
     # =========================================================================
-    imports_inside_functions = _count_imports_inside_functions(tree)
+    imports_inside_functions = metrics.imports_inside_functions
     if imports_inside_functions > 0:
         # Penalize each import inside a function, capped at a maximum
         penalty = min(imports_inside_functions * IMPORTS_INSIDE_FUNCTION_PENALTY, 0.5)
@@ -1028,7 +1204,7 @@ def _compute_architectural_score(tree: ast.AST) -> float:
     # =========================================================================
     # Check 7: Class organization (ClassVar/model_config at top)
     # =========================================================================
-    class_org_issues = _check_class_organization(tree)
+    class_org_issues = metrics.class_organization_issues
     if class_org_issues > 0:
         penalties.append(min(class_org_issues * CLASS_ORGANIZATION_PENALTY, 0.3))
 
@@ -1079,24 +1255,6 @@ def _check_has_public_items(tree: ast.AST) -> bool:
     return False
 
 
-def _count_imports_inside_functions(tree: ast.AST) -> int:
-    """Count imports that occur inside function bodies (circular import risk).
-
-    Args:
-        tree: Parsed AST of the Python source code.
-
-    Returns:
-        Number of import statements found inside functions.
-    """
-    count = 0
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            for child in ast.walk(node):
-                if isinstance(child, ast.Import | ast.ImportFrom):
-                    count += 1
-    return count
-
-
 def _check_import_grouping(tree: ast.AST) -> bool:
     """Check if imports are grouped properly (stdlib, third-party, local).
 
@@ -1223,41 +1381,37 @@ def _check_handler_pattern(tree: ast.AST) -> float:
     return 0.0
 
 
-def _check_class_organization(tree: ast.AST) -> int:
+def _class_organization_issues(node: ast.ClassDef) -> int:
     """Check class organization (ClassVar and model_config placement).
 
     Well-organized classes should have ClassVar declarations and model_config
     at the top of the class body, before methods.
 
     Args:
-        tree: Parsed AST of the Python source code.
+        node: Class definition node.
 
     Returns:
-        Number of class organization issues found.
+        Number of class organization issues found in this class body.
     """
     issues = 0
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            seen_method = False
-            for item in node.body:
-                if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
-                    seen_method = True
-                elif isinstance(item, ast.AnnAssign) and seen_method:
-                    # Annotated assignment after method - could be ClassVar out of place
-                    if item.annotation:
-                        ann_str = (
-                            ast.unparse(item.annotation)
-                            if hasattr(ast, "unparse")
-                            else ""
-                        )
-                        if "ClassVar" in ann_str:
-                            issues += 1
-                elif isinstance(item, ast.Assign) and seen_method:
-                    # Check if this is model_config after methods
-                    for target in item.targets:
-                        if isinstance(target, ast.Name) and target.id == "model_config":
-                            issues += 1
+    seen_method = False
+
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
+            seen_method = True
+        elif isinstance(item, ast.AnnAssign) and seen_method:
+            # Annotated assignment after method - could be ClassVar out of place
+            if item.annotation:
+                ann_str = (
+                    ast.unparse(item.annotation) if hasattr(ast, "unparse") else ""
+                )
+                if "ClassVar" in ann_str:
+                    issues += 1
+        elif isinstance(item, ast.Assign) and seen_method:
+            # Check if this is model_config after methods
+            for target in item.targets:
+                if isinstance(target, ast.Name) and target.id == "model_config":
+                    issues += 1
 
     return issues
 
@@ -55,6 +55,7 @@ from omniintelligence.nodes.node_semantic_analysis_compute.handlers.protocols im
     SemanticImportMetadata,
     create_empty_features,
 )
+from omniintelligence.utils.parse_cache import parse_python
 
 # =============================================================================
 # Constants
@@ -245,7 +246,7 @@ def _parse_python_ast(content: str) -> tuple[ast.Module | None, list[str]]:
     errors: list[str] = []
 
     try:
-        tree = ast.parse(content)
+        tree = parse_python(content)
         return tree, errors
     except SyntaxError as e:
         error_msg = f"Syntax error at line {e.lineno}: {e.msg}"
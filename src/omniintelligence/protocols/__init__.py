@@ -13,7 +13,7 @@ Reference:
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from uuid import UUID
 
@@ -216,6 +216,18 @@ class ProtocolPatternQueryStore(Protocol):
         """
         ...
 
+    async def query_patterns_projection_by_ids(
+        self,
+        *,
+        pattern_ids: Sequence[UUID],
+    ) -> list[dict[str, Any]]:  # any-ok: raw asyncpg row dicts from DB
+        """Fetch projection rows for specific patterns, regardless of status.
+
+        Used by delta projection: ids missing from the result (or rows whose
+        status left validated/provisional) are published as removals.
+        """
+        ...
+
 
 @runtime_checkable
 class ProtocolDecisionRecordRepository(Protocol):
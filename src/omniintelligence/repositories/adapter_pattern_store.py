@@ -28,7 +28,9 @@ Usage:
 from __future__ import annotations
 
 import copy
+import json
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -531,6 +533,63 @@ class AdapterPatternStore:
             return []
         return [result]
 
+    async def query_patterns_after(
+        self,
+        *,
+        after_status_rank: int,
+        after_confidence: float,
+        after_id: UUID,
+        domain: str | None = None,
+        language: str | None = None,
+        min_confidence: float = 0.7,
+        limit: int = 50,
+        project_scope: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Keyset-paginated variant of query_patterns.
+
+        Returns the page that follows the row identified by
+        (after_status_rank, after_confidence, after_id) in query_patterns
+        order. Unlike OFFSET paging, the cost does not grow with page depth
+        and rows promoted between fetches do not shift later pages.
+
+        Like query_patterns, this is an API-layer method and intentionally
+        NOT part of the ProtocolPatternStore protocol.
+
+        Args:
+            after_status_rank: Status rank of the previous page's last row
+                (0 = validated, 1 = provisional).
+            after_confidence: Confidence of the previous page's last row.
+            after_id: ID of the previous page's last row.
+            domain: Optional domain identifier to filter by.
+            language: Optional programming language to filter by.
+            min_confidence: Minimum confidence threshold (0.0-1.0, default 0.7).
+            limit: Maximum number of patterns to return (1-200, default 50).
+            project_scope: Optional project scope filter (OMN-1607).
+
+        Returns:
+            List of pattern dicts matching the query criteria.
+        """
+        args = self._build_positional_args(
+            "query_patterns_after",
+            {
+                "domain_id": domain,
+                "language": language,
+                "min_confidence": min_confidence,
+                "limit": limit,
+                "project_scope": project_scope,
+                "after_status_rank": after_status_rank,
+                "after_confidence": after_confidence,
+                "after_id": str(after_id),
+            },
+        )
+        result = await self._runtime.call("query_patterns_after", *args)
+
+        if isinstance(result, list):
+            return result
+        if result is None:
+            return []
+        return [result]
+
     async def query_patterns_projection(
         self,
         *,
@@ -561,6 +620,31 @@ class AdapterPatternStore:
             return []
         return [result]
 
+    async def query_patterns_projection_by_ids(
+        self,
+        *,
+        pattern_ids: Sequence[UUID],
+    ) -> list[dict[str, Any]]:
+        """Fetch projection rows (truncated pattern_signature) for specific patterns.
+
+        Unlike query_patterns_projection, rows are returned regardless of
+        status so delta projection can emit removals for patterns that left
+        the validated/provisional set.
+        """
+        if not pattern_ids:
+            return []
+        args = self._build_positional_args(
+            "query_patterns_projection_by_ids",
+            {"pattern_ids": json.dumps([str(pid) for pid in pattern_ids])},
+        )
+        result = await self._runtime.call("query_patterns_projection_by_ids", *args)
+
+        if isinstance(result, list):
+            return result
+        if result is None:
+            return []
+        return [result]
+
     async def store_with_version_transition(
         self,
         *,
@@ -11,11 +11,14 @@ Reference: OMN-6167
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections.abc import Callable, Hashable, Sequence
 from typing import TYPE_CHECKING, Protocol
 
 import numpy as np
 from scipy.optimize import linear_sum_assignment
+from scipy.sparse import csr_matrix
 
 from omniintelligence.review_pairing.models_calibration import (
     ModelCalibrationFindingTuple,
@@ -27,6 +30,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EMBEDDING_CACHE_SIZE = 10_000
+"""Description embeddings kept per engine, keyed by description hash."""
+
 
 class EmbeddingClientProtocol(Protocol):
     """Protocol for embedding clients used by the alignment engine."""
@@ -52,6 +58,8 @@ class FindingAlignmentEngine:
             Falls back to Jaccard similarity when None.
         category_families: Maps family names to related category lists
             for fuzzy category matching.
+        embedding_cache_size: Maximum number of description embeddings
+            kept across align() calls.
     """
 
     def __init__(
@@ -59,9 +67,12 @@ class FindingAlignmentEngine:
         similarity_threshold: float = 0.7,
         embedding_client: EmbeddingClientProtocol | None = None,
         category_families: dict[str, list[str]] | None = None,
+        embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
     ) -> None:
         self._threshold = similarity_threshold
         self._embedding_client = embedding_client
+        self._embedding_cache_size = embedding_cache_size
+        self._embedding_cache: dict[str, np.ndarray] = {}
         self._category_families = category_families or {}
         self._category_to_family: dict[str, str] = {}
         for family, categories in self._category_families.items():
@@ -170,27 +181,23 @@ class FindingAlignmentEngine:
         challenger: list[ModelCalibrationFindingTuple],
     ) -> np.ndarray:
         """Build NxM composite similarity matrix."""
-        n = len(ground_truth)
-        m = len(challenger)
-
         desc_sims = await self._description_similarities(
             [gt.description for gt in ground_truth],
             [ch.description for ch in challenger],
         )
-
-        matrix = np.zeros((n, m))
-        for i in range(n):
-            for j in range(m):
-                cat_sim = self._category_similarity(
-                    ground_truth[i].category, challenger[j].category
-                )
-                loc_sim = self._location_similarity(
-                    ground_truth[i].location, challenger[j].location
-                )
-                desc_sim = desc_sims[i][j]
-                matrix[i, j] = 0.2 * cat_sim + 0.1 * loc_sim + 0.7 * desc_sim
-
-        return matrix
+        # Findings share a handful of categories and files, so the scalar
+        # comparisons run once per distinct value pair and are broadcast.
+        cat_sims = _broadcast_pairwise(
+            [gt.category for gt in ground_truth],
+            [ch.category for ch in challenger],
+            self._category_similarity,
+        )
+        loc_sims = _broadcast_pairwise(
+            [gt.location for gt in ground_truth],
+            [ch.location for ch in challenger],
+            self._location_similarity,
+        )
+        return 0.2 * cat_sims + 0.1 * loc_sims + 0.7 * desc_sims
 
     def _category_similarity(self, a: str, b: str) -> float:
         """Compute category similarity: 1.0 exact, 0.5 same family, 0.0 otherwise."""
@@ -218,49 +225,63 @@ class FindingAlignmentEngine:
         self,
         gt_descs: list[str],
         ch_descs: list[str],
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         """Compute description similarity matrix.
 
         Uses embedding client if available, falls back to Jaccard.
         """
         if self._embedding_client is not None:
             return await self._embedding_description_similarities(gt_descs, ch_descs)
-        return self._jaccard_description_similarities(gt_descs, ch_descs)
+        return _jaccard_similarity_matrix(gt_descs, ch_descs)
 
     async def _embedding_description_similarities(
         self,
         gt_descs: list[str],
         ch_descs: list[str],
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         """Compute cosine similarity using embeddings."""
-        assert self._embedding_client is not None
-        all_texts = gt_descs + ch_descs
-        embeddings = await self._embedding_client.embed_batch(all_texts)
-
-        gt_embs = embeddings[: len(gt_descs)]
-        ch_embs = embeddings[len(gt_descs) :]
+        gt_embs = await self._embed(gt_descs + ch_descs)
+        ch_embs = gt_embs[len(gt_descs) :]
+        gt_embs = gt_embs[: len(gt_descs)]
+        return gt_embs @ ch_embs.T
 
-        result: list[list[float]] = []
-        for gt_emb in gt_embs:
-            row: list[float] = []
-            for ch_emb in ch_embs:
-                row.append(_cosine_similarity(gt_emb, ch_emb))
-            result.append(row)
-        return result
+    async def _embed(self, texts: list[str]) -> np.ndarray:
+        """Return unit-normalised embeddings for texts, one row per text.
 
-    def _jaccard_description_similarities(
-        self,
-        gt_descs: list[str],
-        ch_descs: list[str],
-    ) -> list[list[float]]:
-        """Compute Jaccard similarity for all pairs."""
-        result: list[list[float]] = []
-        for gt in gt_descs:
-            row: list[float] = []
-            for ch in ch_descs:
-                row.append(_jaccard_similarity(gt, ch))
-            result.append(row)
-        return result
+        Embeddings are cached by description hash for the lifetime of the
+        engine, so findings that recur across calibration runs are embedded
+        once. Zero vectors stay zero, giving a cosine similarity of 0.0.
+        """
+        assert self._embedding_client is not None
+        keys = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+
+        rows = {
+            key: self._embedding_cache[key]
+            for key in keys
+            if key in self._embedding_cache
+        }
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in rows:
+                missing.setdefault(key, text)
+        if missing:
+            embeddings = await self._embedding_client.embed_batch(
+                list(missing.values())
+            )
+            vectors = np.asarray(embeddings, dtype=np.float64)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = np.divide(
+                vectors, norms, out=np.zeros_like(vectors), where=norms > 0.0
+            )
+            for key, vector in zip(missing, vectors, strict=True):
+                rows[key] = vector
+                if self._embedding_cache_size <= 0:
+                    continue
+                if len(self._embedding_cache) >= self._embedding_cache_size:
+                    del self._embedding_cache[next(iter(self._embedding_cache))]
+                self._embedding_cache[key] = vector
+
+        return np.stack([rows[key] for key in keys])
 
     def _get_model_version(self) -> str:
         """Return the embedding model version identifier."""
@@ -269,26 +290,66 @@ class FindingAlignmentEngine:
         return "jaccard-v1"
 
 
-def _jaccard_similarity(a: str, b: str) -> float:
-    """Compute Jaccard similarity on word tokens."""
-    tokens_a = set(a.lower().split())
-    tokens_b = set(b.lower().split())
-    if not tokens_a and not tokens_b:
-        return 1.0
-    if not tokens_a or not tokens_b:
-        return 0.0
-    intersection = tokens_a & tokens_b
-    union = tokens_a | tokens_b
-    return len(intersection) / len(union)
-
-
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Compute cosine similarity between two vectors."""
-    arr_a = np.array(a)
-    arr_b = np.array(b)
-    dot = float(np.dot(arr_a, arr_b))
-    norm_a = float(np.linalg.norm(arr_a))
-    norm_b = float(np.linalg.norm(arr_b))
-    if norm_a == 0.0 or norm_b == 0.0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+def _broadcast_pairwise[T: Hashable](
+    a: Sequence[T],
+    b: Sequence[T],
+    similarity: Callable[[T, T], float],
+) -> np.ndarray:
+    """Evaluate similarity once per distinct value pair into an NxM matrix."""
+    unique_a, index_a = _unique_with_index(a)
+    unique_b, index_b = _unique_with_index(b)
+    unique_sims = np.array(
+        [[similarity(x, y) for y in unique_b] for x in unique_a],
+        dtype=np.float64,
+    )
+    return unique_sims[np.ix_(index_a, index_b)]
+
+
+def _unique_with_index[T: Hashable](values: Sequence[T]) -> tuple[list[T], np.ndarray]:
+    """Return the distinct values and, for each input, its index among them."""
+    positions: dict[T, int] = {}
+    index = np.array(
+        [positions.setdefault(v, len(positions)) for v in values], dtype=np.intp
+    )
+    return list(positions), index
+
+
+def _jaccard_similarity_matrix(a: list[str], b: list[str]) -> np.ndarray:
+    """Compute Jaccard similarity on word tokens for all pairs.
+
+    Token sets become rows of sparse binary matrices, so intersection sizes
+    for every pair come from a single sparse product. Two empty descriptions
+    score 1.0; an empty description against a non-empty one scores 0.0.
+    """
+    vocabulary: dict[str, int] = {}
+    token_ids_a = [
+        {vocabulary.setdefault(t, len(vocabulary)) for t in text.lower().split()}
+        for text in a
+    ]
+    token_ids_b = [
+        {vocabulary.setdefault(t, len(vocabulary)) for t in text.lower().split()}
+        for text in b
+    ]
+    rows_a = _binary_rows(token_ids_a, len(vocabulary))
+    rows_b = _binary_rows(token_ids_b, len(vocabulary))
+
+    intersection = (rows_a @ rows_b.T).toarray()
+    sizes_a = np.array([len(ids) for ids in token_ids_a], dtype=np.float64)
+    sizes_b = np.array([len(ids) for ids in token_ids_b], dtype=np.float64)
+    union = sizes_a[:, None] + sizes_b[None, :] - intersection
+    return np.divide(
+        intersection,
+        union,
+        out=np.ones_like(intersection),
+        where=union > 0.0,
+    )
+
+
+def _binary_rows(token_ids: list[set[int]], vocabulary_size: int) -> csr_matrix:
+    """Build a sparse 0/1 matrix with one row per token-id set."""
+    indptr = np.cumsum([0] + [len(ids) for ids in token_ids])
+    indices = np.fromiter(
+        (i for ids in token_ids for i in ids), dtype=np.int64, count=int(indptr[-1])
+    )
+    data = np.ones(len(indices), dtype=np.float64)
+    return csr_matrix((data, indices, indptr), shape=(len(token_ids), vocabulary_size))
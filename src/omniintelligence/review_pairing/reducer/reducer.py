@@ -37,11 +37,14 @@ Reference: OMN-2568
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import math
 import os
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum, unique
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 from omniintelligence.review_pairing.models import ModelFindingFixPair
@@ -140,7 +143,8 @@ class PromotionGateResult:
         gate_name: Name of the gate that blocked promotion (empty if passed).
         gate_detail: Human-readable detail on why the gate failed.
         occurrence_count: Number of confirmed pairs in the cluster.
-        similarity_score: Edit-distance similarity across diff transforms.
+        similarity_score: Edit-distance similarity across diff transforms
+            (an upper bound when the transform_convergence gate failed).
         reintroduction_rate: Fraction of reverted fixes.
         tool_version_stability: Fraction sharing majority tool_version.
     """
@@ -203,10 +207,29 @@ class PatternCandidate:
 # ---------------------------------------------------------------------------
 
 
+_MAX_SIMILARITY_CHARS: int = 2000
+"""Characters of a normalised diff compared; longer diffs are truncated."""
+
+_INITIAL_DISTANCE_BOUND: int = 32
+"""Band half-width of the first bounded distance search for a pair."""
+
+_DISTANCE_CACHE_SIZE: int = 4096
+"""Maximum number of memoised pairwise edit distances."""
+
+# Memoised edit distances keyed by the content hashes of both strings.
+# Values are ``(distance, max_distance)`` as returned by the bounded search:
+# exact when ``distance <= max_distance``, otherwise only known to exceed
+# ``max_distance``.
+_distance_cache: dict[tuple[bytes, bytes], tuple[int, int]] = {}
+
+
+@lru_cache(maxsize=1024)
 def _normalize_diff(diff: str) -> str:
     """Normalise a diff hunk string for similarity comparison.
 
     Strips leading +/- markers and whitespace for token-level comparison.
+    Memoised because the same pair's diff is re-normalised on every
+    evaluation of its cluster.
     """
     lines = []
     for line in diff.splitlines():
@@ -216,62 +239,197 @@ def _normalize_diff(diff: str) -> str:
     return "\n".join(lines)
 
 
-def _edit_similarity(a: str, b: str) -> float:
-    """Compute normalised edit-distance similarity between two strings.
+def _bounded_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Compute the Levenshtein distance between two strings, up to a bound.
 
-    Returns a value in [0.0, 1.0] where 1.0 = identical.
+    Common prefixes and suffixes are stripped first, then only the diagonal
+    band of width ``2 * max_distance + 1`` is evaluated (Ukkonen): a cell
+    further than ``max_distance`` from the diagonal cannot lie on a path of
+    cost ``<= max_distance``. The search stops as soon as every cell in a
+    row exceeds the bound.
 
-    Uses the standard Wagner-Fischer dynamic-programming algorithm.
+    Returns:
+        The exact distance if it is ``<= max_distance``, otherwise
+        ``max_distance + 1``.
+    """
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    a, b = a[prefix:], b[prefix:]
+    suffix = 0
+    limit = min(len(a), len(b))
+    while suffix < limit and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    if suffix:
+        a, b = a[:-suffix], b[:-suffix]
+
+    la, lb = len(a), len(b)
+    over = max_distance + 1
+    if abs(la - lb) > max_distance:
+        return over
+    if not a or not b:
+        return max(la, lb)
+
+    prev = [j if j <= max_distance else over for j in range(lb + 1)]
+    for i in range(1, la + 1):
+        lo = max(1, i - max_distance)
+        hi = min(lb, i + max_distance)
+        curr = [over] * (lb + 1)
+        if i <= max_distance:
+            curr[0] = i
+        row_min = curr[0]
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            if ca == b[j - 1]:
+                cost = prev[j - 1]
+            else:
+                cost = 1 + min(prev[j], curr[j - 1], prev[j - 1])
+            cost = min(cost, over)
+            curr[j] = cost
+            row_min = min(row_min, cost)
+        if row_min > max_distance:
+            return over
+        prev = curr
+
+    return prev[lb]
+
+
+def _cached_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """``_bounded_edit_distance`` memoised by the content hashes of a and b."""
+    digest_a = hashlib.blake2b(a.encode(), digest_size=16).digest()
+    digest_b = hashlib.blake2b(b.encode(), digest_size=16).digest()
+    key = (digest_a, digest_b) if digest_a <= digest_b else (digest_b, digest_a)
+
+    cached = _distance_cache.get(key)
+    if cached is not None:
+        distance, bound = cached
+        if distance <= bound:
+            return distance
+        if max_distance <= bound:
+            # Known to exceed a bound at least as large as this one.
+            return max_distance + 1
+
+    # Widen the band geometrically (Ukkonen's doubling): similar diffs
+    # resolve in a narrow band, and total work stays within a constant
+    # factor of the final band.
+    bound = min(max_distance, _INITIAL_DISTANCE_BOUND)
+    distance = _bounded_edit_distance(a, b, bound)
+    while distance > bound and bound < max_distance:
+        bound = min(max_distance, bound * 2)
+        distance = _bounded_edit_distance(a, b, bound)
+    if key not in _distance_cache and len(_distance_cache) >= _DISTANCE_CACHE_SIZE:
+        del _distance_cache[next(iter(_distance_cache))]
+    _distance_cache[key] = (distance, bound)
+    return distance
+
+
+def _bounded_edit_similarity(
+    a: str, b: str, min_similarity: float
+) -> tuple[float, bool]:
+    """Edit-distance similarity with the distance search bounded.
+
+    Returns:
+        ``(similarity, exact)``. When ``exact`` is False the pair is known
+        to score below ``min_similarity`` and ``similarity`` is an upper
+        bound on its true value.
     """
     if a == b:
-        return 1.0
+        return 1.0, True
     if not a or not b:
-        return 0.0
+        return 0.0, True
 
     # Work on characters; truncate very long strings to cap runtime
-    MAX = 2000
-    a = a[:MAX]
-    b = b[:MAX]
+    a = a[:_MAX_SIMILARITY_CHARS]
+    b = b[:_MAX_SIMILARITY_CHARS]
 
-    la, lb = len(a), len(b)
-    prev = list(range(lb + 1))
-    for i, ca in enumerate(a, 1):
-        curr = [i] + [0] * lb
-        for j, cb in enumerate(b, 1):
-            if ca == cb:
-                curr[j] = prev[j - 1]
-            else:
-                curr[j] = 1 + min(prev[j], curr[j - 1], prev[j - 1])
-        prev = curr
+    longest = max(len(a), len(b))
+    # The epsilon keeps an exact-threshold distance inside the band despite
+    # float rounding of (1 - min_similarity) * longest.
+    max_distance = min(longest, int((1.0 - max(min_similarity, 0.0)) * longest + 1e-9))
+    distance = _cached_edit_distance(a, b, max_distance)
+    return 1.0 - min(distance, longest) / longest, distance <= max_distance
 
-    distance = prev[lb]
-    return 1.0 - distance / max(la, lb)
 
+def _edit_similarity(a: str, b: str, *, min_similarity: float = 0.0) -> float:
+    """Compute normalised edit-distance similarity between two strings.
+
+    Returns a value in [0.0, 1.0] where 1.0 = identical.
+
+    Args:
+        a: First string.
+        b: Second string.
+        min_similarity: Similarity below which the exact value is not
+            needed; the distance search stops once it is ruled out.
 
-def _transform_similarity(pairs: list[ModelFindingFixPair]) -> float:
+    Returns:
+        The exact similarity if it is ``>= min_similarity``, otherwise an
+        upper bound on it that is below ``min_similarity``.
+    """
+    return _bounded_edit_similarity(a, b, min_similarity)[0]
+
+
+def _transform_similarity(
+    pairs: list[ModelFindingFixPair],
+    *,
+    threshold: float | None = None,
+) -> float:
     """Compute average pairwise edit-distance similarity of diff transforms.
 
     Uses the concatenated diff hunks from each pair as the transform
     representation. Returns 1.0 for a single pair (trivially convergent).
 
+    When ``threshold`` is given only the ``>= threshold`` decision has to be
+    exact. Every pair is first scored with its distance search bounded at
+    the threshold, which is cheap for both near-identical and unrelated
+    diffs. Pairs that fell below it are then re-scored one at a time with
+    the lowest similarity that still lets the average reach the threshold,
+    stopping as soon as one falls short.
+
     Args:
         pairs: Confirmed ``ModelFindingFixPair`` records in the cluster.
+        threshold: Optional convergence threshold for early exit.
 
     Returns:
-        Average similarity in [0.0, 1.0].
+        Average similarity in [0.0, 1.0]. When the average is below
+        ``threshold`` the result may be an upper bound, still below it.
     """
     if len(pairs) <= 1:
         return 1.0
 
     normalized = [_normalize_diff("\n".join(p.diff_hunks)) for p in pairs]
+    index_pairs = [
+        (i, j) for i in range(len(normalized)) for j in range(i + 1, len(normalized))
+    ]
+    count = len(index_pairs)
+    min_similarity = threshold if threshold is not None else 0.0
+
+    scored = [
+        _bounded_edit_similarity(normalized[i], normalized[j], min_similarity)
+        for i, j in index_pairs
+    ]
+    scores = [similarity for similarity, _ in scored]
+    if threshold is None:
+        return sum(scores) / count
+    below_threshold = math.nextafter(threshold, 0.0)
+    total = sum(scores)
+    if total < threshold * count:
+        return min(total / count, below_threshold)
+
+    # Inexact scores are upper bounds; refine them until the average is
+    # exact or provably below the threshold.
+    for k, (i, j) in enumerate(index_pairs):
+        if scored[k][1]:
+            continue
+        rest = total - scores[k]
+        scores[k], exact = _bounded_edit_similarity(
+            normalized[i], normalized[j], threshold * count - rest
+        )
+        total = rest + scores[k]
+        if not exact:
+            return min(total / count, below_threshold)
 
-    total, count = 0.0, 0
-    for i in range(len(normalized)):
-        for j in range(i + 1, len(normalized)):
-            total += _edit_similarity(normalized[i], normalized[j])
-            count += 1
-
-    return total / count if count else 1.0
+    return sum(scores) / count
 
 
 def _tool_version_stability(pairs: list[ModelFindingFixPair]) -> float:
@@ -447,7 +605,9 @@ class PatternCandidateReducer:
             )
 
         # Gate 3: transform convergence
-        similarity = _transform_similarity(pairs)
+        similarity = _transform_similarity(
+            pairs, threshold=TRANSFORM_SIMILARITY_THRESHOLD
+        )
         if similarity < TRANSFORM_SIMILARITY_THRESHOLD:
             return PromotionGateResult(
                 passed=False,
@@ -6,7 +6,9 @@
 Stores routing decision episodes and provides batched tensor sampling
 for policy gradient training. Supports GAE advantage computation.
 
-Memory budget: under 500MB for 10K episodes.
+Episodes are stored column-wise in contiguous tensors used as a ring
+buffer: about 1MB for 10K episodes with 20-dim observations, well under
+the 500MB budget.
 
 Ticket: OMN-5562
 """
@@ -81,12 +83,22 @@ class Batch:
 # ---------------------------------------------------------------------------
 
 
+_INITIAL_CAPACITY = 1024
+"""Rows allocated on first insert; storage doubles up to max_episodes."""
+
+
 class EpisodeReplayBuffer:
     """Memory-efficient replay buffer for offline RL training.
 
-    Episodes are stored as Python objects and converted to tensors only
-    on sample(). This keeps memory usage proportional to episode count
-    rather than tensor allocation overhead.
+    Episode fields are stored in preallocated column tensors (observations,
+    actions, rewards, value estimates, log-probs) used as a ring buffer.
+    Inserts are O(1): once at capacity, each new episode overwrites the
+    oldest. Sampling gathers rows by index, so batches are built without
+    touching per-episode Python objects. Storage grows geometrically up to
+    ``max_episodes`` and is released by clear().
+
+    Only the fields needed for training are retained; ``timestamp`` and
+    ``episode_id`` are not stored.
 
     GAE advantage computation is trivial for one-step routing decisions:
         advantage = reward - value_estimate
@@ -96,6 +108,8 @@ class EpisodeReplayBuffer:
             when capacity is exceeded.
         gamma: Discount factor for GAE computation.
         gae_lambda: Lambda parameter for GAE computation.
+        pin_memory: Return batches in pinned (page-locked) memory for faster
+            host-to-GPU copies. Ignored when CUDA is unavailable.
     """
 
     def __init__(
@@ -103,11 +117,27 @@ class EpisodeReplayBuffer:
         max_episodes: int = 100_000,
         gamma: float = 0.99,
         gae_lambda: float = 0.95,
+        pin_memory: bool = False,
     ) -> None:
-        self._episodes: list[Episode] = []
+        if max_episodes < 1:
+            msg = f"max_episodes must be >= 1, got {max_episodes}"
+            raise ValueError(msg)
         self._max_episodes = max_episodes
         self._gamma = gamma
         self._gae_lambda = gae_lambda
+        self._pin_memory = pin_memory and torch.cuda.is_available()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._obs_dim: int | None = None
+        self._capacity = 0
+        self._start = 0  # physical row of the oldest episode
+        self._size = 0
+        self._observations = torch.empty((0, 0), dtype=torch.float32)
+        self._actions = torch.empty(0, dtype=torch.long)
+        self._rewards = torch.empty(0, dtype=torch.float64)
+        self._value_estimates = torch.empty(0, dtype=torch.float64)
+        self._log_probs = torch.empty(0, dtype=torch.float32)
 
     def add(self, episode: Episode) -> None:
         """Add an episode to the buffer.
@@ -116,19 +146,100 @@ class EpisodeReplayBuffer:
 
         Args:
             episode: A single routing decision episode.
+
+        Raises:
+            ValueError: If the observation dimension differs from the
+                episodes already in the buffer.
         """
-        if len(self._episodes) >= self._max_episodes:
-            self._episodes.pop(0)
-        self._episodes.append(episode)
+        self.add_batch([episode])
 
     def add_batch(self, episodes: list[Episode]) -> None:
         """Add multiple episodes to the buffer.
 
         Args:
             episodes: List of episodes to add.
+
+        Raises:
+            ValueError: If an observation dimension differs from the
+                episodes already in the buffer.
         """
+        if not episodes:
+            return
+        # Episodes that would be evicted within this call are never stored.
+        episodes = episodes[-self._max_episodes :]
+
+        obs_dim = self._obs_dim
+        if obs_dim is None:
+            obs_dim = len(episodes[0].observation)
         for ep in episodes:
-            self.add(ep)
+            if len(ep.observation) != obs_dim:
+                msg = (
+                    f"Observation dimension {len(ep.observation)} does not "
+                    f"match buffer dimension {obs_dim}"
+                )
+                raise ValueError(msg)
+
+        columns = (
+            torch.tensor(
+                [ep.observation for ep in episodes], dtype=torch.float32
+            ).reshape(len(episodes), obs_dim),
+            torch.tensor([ep.action for ep in episodes], dtype=torch.long),
+            torch.tensor([ep.reward for ep in episodes], dtype=torch.float64),
+            torch.tensor([ep.value_estimate for ep in episodes], dtype=torch.float64),
+            torch.tensor([ep.log_prob for ep in episodes], dtype=torch.float32),
+        )
+
+        self._obs_dim = obs_dim
+        count = len(episodes)
+        required = self._size + count
+        if required > self._capacity and self._capacity < self._max_episodes:
+            self._grow(required)
+
+        # Write at the logical end, wrapping around (and overwriting the
+        # oldest episodes) once the storage is full.
+        write_at = (self._start + self._size) % self._capacity
+        head = min(count, self._capacity - write_at)
+        storage = (
+            self._observations,
+            self._actions,
+            self._rewards,
+            self._value_estimates,
+            self._log_probs,
+        )
+        for target, column in zip(storage, columns, strict=True):
+            target[write_at : write_at + head] = column[:head]
+            target[: count - head] = column[head:]
+
+        overflow = max(0, self._size + count - self._capacity)
+        self._size = min(self._size + count, self._capacity)
+        self._start = (self._start + overflow) % self._capacity
+
+    def _grow(self, required: int) -> None:
+        """Reallocate storage for at least ``required`` rows, oldest first."""
+        capacity = min(
+            self._max_episodes,
+            max(required, 2 * self._capacity, _INITIAL_CAPACITY),
+        )
+        order = self._ordered_indices()
+        obs_dim = self._obs_dim or 0
+
+        def _resized(column: torch.Tensor, shape: tuple[int, ...]) -> torch.Tensor:
+            resized = torch.zeros(shape, dtype=column.dtype)
+            if self._size:
+                resized[: self._size] = column.index_select(0, order)
+            return resized
+
+        self._observations = _resized(self._observations, (capacity, obs_dim))
+        self._actions = _resized(self._actions, (capacity,))
+        self._rewards = _resized(self._rewards, (capacity,))
+        self._value_estimates = _resized(self._value_estimates, (capacity,))
+        self._log_probs = _resized(self._log_probs, (capacity,))
+        self._capacity = capacity
+        self._start = 0
+
+    def _ordered_indices(self) -> torch.Tensor:
+        """Physical row indices of stored episodes, oldest first."""
+        return (torch.arange(self._size) + self._start) % max(self._capacity, 1)
 
     def sample(self, batch_size: int) -> Batch:
         """Sample a random batch of episodes as tensors.
@@ -142,98 +253,91 @@ class EpisodeReplayBuffer:
         Raises:
             ValueError: If the buffer is empty.
         """
-        if not self._episodes:
+        if not self._size:
             msg = "Cannot sample from an empty buffer"
             raise ValueError(msg)
 
-        actual_size = min(batch_size, len(self._episodes))
-        sampled = random.sample(self._episodes, actual_size)
-        return self._to_batch(sampled)
+        actual_size = min(batch_size, self._size)
+        positions = torch.tensor(
+            random.sample(range(self._size), actual_size), dtype=torch.long
+        )
+        return self._to_batch((positions + self._start) % self._capacity)
 
     def sample_all(self) -> Batch:
         """Return all episodes as a single batch.
 
         Returns:
-            Batch containing all buffered episodes.
+            Batch containing all buffered episodes, oldest first.
 
         Raises:
             ValueError: If the buffer is empty.
         """
-        if not self._episodes:
+        if not self._size:
             msg = "Cannot sample from an empty buffer"
             raise ValueError(msg)
-        return self._to_batch(self._episodes)
+        return self._to_batch(self._ordered_indices())
 
     def clear(self) -> None:
-        """Remove all episodes from the buffer."""
-        self._episodes.clear()
+        """Remove all episodes from the buffer and release its storage."""
+        self._reset()
 
     def __len__(self) -> int:
         """Return the number of episodes in the buffer."""
-        return len(self._episodes)
+        return self._size
 
     @property
     def observation_dim(self) -> int | None:
         """Return the observation dimension, or None if buffer is empty."""
-        if not self._episodes:
+        if not self._size:
             return None
-        return len(self._episodes[0].observation)
+        return self._obs_dim
 
-    def _to_batch(self, episodes: list[Episode]) -> Batch:
-        """Convert a list of episodes to a Batch of tensors.
+    def _to_batch(self, indices: torch.Tensor) -> Batch:
+        """Gather stored rows into a Batch of tensors.
 
         Computes GAE advantages for one-step episodes:
             advantage = reward - value_estimate
 
         Args:
-            episodes: Episodes to convert.
+            indices: Physical row indices to gather.
 
         Returns:
             Batch with correctly shaped tensors.
         """
-        observations = torch.tensor(
-            [ep.observation for ep in episodes],
-            dtype=torch.float32,
-        )
-        actions = torch.tensor(
-            [ep.action for ep in episodes],
-            dtype=torch.long,
-        )
-        rewards = torch.tensor(
-            [ep.reward for ep in episodes],
-            dtype=torch.float32,
-        )
-        log_probs = torch.tensor(
-            [ep.log_prob for ep in episodes],
-            dtype=torch.float32,
-        )
+        rewards = self._rewards.index_select(0, indices)
+        value_estimates = self._value_estimates.index_select(0, indices)
 
         # GAE for one-step routing: advantage = reward - value_estimate
-        advantages = torch.tensor(
-            [ep.reward - ep.value_estimate for ep in episodes],
-            dtype=torch.float32,
+        advantages = (rewards - value_estimates).to(torch.float32)
+
+        tensors = (
+            self._observations.index_select(0, indices),
+            self._actions.index_select(0, indices),
+            rewards.to(torch.float32),
+            advantages,
+            self._log_probs.index_select(0, indices),
         )
+        if self._pin_memory:
+            tensors = tuple(t.pin_memory() for t in tensors)
+        observations, actions, rewards_f32, advantages, log_probs = tensors
 
         return Batch(
             observations=observations,
             actions=actions,
-            rewards=rewards,
+            rewards=rewards_f32,
             advantages=advantages,
             log_probs=log_probs,
         )
 
     def memory_estimate_bytes(self) -> int:
-        """Estimate current memory usage in bytes."""
-        if not self._episodes:
-            return 0
-
-        obs_dim = len(self._episodes[0].observation) if self._episodes else 0
-        per_episode = (
-            obs_dim * 8  # observation floats
-            + 8  # action int
-            + 8  # reward float
-            + 8  # value_estimate float
-            + 8  # log_prob float
-            + 200  # Python object overhead estimate
+        """Return the bytes allocated for episode storage."""
+        return sum(
+            column.element_size() * column.nelement()
+            for column in (
+                self._observations,
+                self._actions,
+                self._rewards,
+                self._value_estimates,
+                self._log_probs,
+            )
         )
-        return per_episode * len(self._episodes)
@@ -7,7 +7,7 @@ The exporter:
 
 1. Loads a trained ``PPOPolicy`` checkpoint.
 2. Generates a scenario grid covering all observation combinations.
-3. Runs policy inference on each scenario.
+3. Runs batched policy inference over the whole scenario grid.
 4. Maps policy decisions to Bifrost routing rules.
 5. Exports as YAML parseable by ``ModelBifrostConfig``.
 
@@ -32,6 +32,7 @@ import os
 import sys
 import time
 from collections import Counter, defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -80,6 +81,9 @@ BACKEND_MODELS: dict[str, str] = {
     "embedding": "qwen3-embedding-8b",
 }
 
+#: Scenarios per policy forward pass during export and fidelity checks.
+INFERENCE_BATCH_SIZE: int = 4096
+
 #: Namespace UUID for deterministic rule_id generation.
 _RULE_NAMESPACE = UUID("a1b2c3d4-e5f6-7890-abcd-ef1234567890")
 
@@ -203,6 +207,7 @@ class PolicyExporter:
         policy: A trained PPOPolicy instance.
         backend_urls: Optional override for backend base URLs.
         backend_models: Optional override for backend model names.
+        inference_batch_size: Scenarios per policy forward pass.
     """
 
     def __init__(
@@ -211,8 +216,14 @@ class PolicyExporter:
         *,
         backend_urls: dict[str, str] | None = None,
         backend_models: dict[str, str] | None = None,
+        inference_batch_size: int = INFERENCE_BATCH_SIZE,
     ) -> None:
+        if inference_batch_size < 1:
+            raise ValueError(
+                f"inference_batch_size must be >= 1, got {inference_batch_size}"
+            )
         self._policy = policy
+        self._inference_batch_size = inference_batch_size
         self._backend_urls = backend_urls or BACKEND_URLS
         self._backend_models = backend_models or BACKEND_MODELS
 
@@ -239,8 +250,8 @@ class PolicyExporter:
 
         # Collect action distributions per task type
         task_action_counts: dict[str, Counter[int]] = defaultdict(Counter)
-        for scenario in scenarios:
-            action = self._infer_action(scenario.observation)
+        actions = self._infer_actions([s.observation for s in scenarios])
+        for scenario, action in zip(scenarios, actions, strict=True):
             # Determine task type from one-hot
             task_idx = scenario.observation.task_type_onehot.index(
                 max(scenario.observation.task_type_onehot)
@@ -313,12 +324,11 @@ class PolicyExporter:
 
         report = FidelityReport()
 
-        for scenario in scenarios:
+        actions = self._infer_actions([s.observation for s in scenarios])
+        for scenario, policy_action in zip(scenarios, actions, strict=True):
             report.total_scenarios += 1
             report.bucket_counts[scenario.bucket] += 1
 
-            # Get policy action
-            policy_action = self._infer_action(scenario.observation)
             policy_backend = ACTION_TO_BACKEND[RoutingAction(policy_action)]
 
             # Get config action: find matching rule
@@ -443,12 +453,25 @@ class PolicyExporter:
 
     # ── Internals ────────────────────────────────────────────────────────
 
-    def _infer_action(self, obs: RoutingObservation) -> int:
-        """Run policy inference and return the argmax action index."""
+    def _infer_actions(self, observations: Sequence[RoutingObservation]) -> list[int]:
+        """Run batched policy inference and return argmax action indices.
+
+        Observations are stacked into one tensor and deduplicated, so the
+        oversampled degraded scenarios cost a single row each. Unique rows
+        are fed to the policy in chunks of ``inference_batch_size``.
+        """
+        if not observations:
+            return []
+        stacked = torch.stack([obs.to_tensor() for obs in observations])
+        unique, inverse = torch.unique(stacked, dim=0, return_inverse=True)
         with torch.no_grad():
-            tensor = obs.to_tensor().unsqueeze(0)
-            logits, _ = self._policy(tensor)
-            return int(torch.argmax(logits, dim=-1).item())
+            unique_actions = torch.cat(
+                [
+                    torch.argmax(self._policy(chunk)[0], dim=-1)
+                    for chunk in torch.split(unique, self._inference_batch_size)
+                ]
+            )
+        return unique_actions[inverse].tolist()
 
     def _build_backends(self) -> dict[str, dict[str, Any]]:
         """Build the backends section of the config."""
@@ -664,6 +687,7 @@ __all__: list[str] = [
     "ACTION_TO_BACKEND",
     "BACKEND_MODELS",
     "BACKEND_URLS",
+    "INFERENCE_BATCH_SIZE",
     "FidelityReport",
     "PolicyExporter",
     "main",
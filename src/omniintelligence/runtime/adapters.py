@@ -13,6 +13,7 @@ Adapters:
     - AdapterIdempotencyStoreInfra: omnibase_infra idempotency store -> ProtocolIdempotencyStore
     - AdapterKafkaPublisher: event bus -> ProtocolKafkaPublisher
     - AdapterIntentClassifier: handle_intent_classification -> ProtocolIntentClassifier
+      (plus compute_batch for bulk classification)
 
 Design:
     Each adapter is a thin explicit boundary that prevents accidental coupling
@@ -28,7 +29,7 @@ from __future__ import annotations
 
 import json
 import logging
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from uuid import UUID
 
@@ -251,6 +252,27 @@ class AdapterIntentClassifier:
             config=self._config,
         )
 
+    async def compute_batch(
+        self,
+        inputs: Sequence[ModelIntentClassificationInput],
+    ) -> list[ModelIntentClassificationOutput]:
+        """Classify many inputs in one call (e.g. historical prompt backfills).
+
+        Args:
+            inputs: ModelIntentClassificationInput instances.
+
+        Returns:
+            One ModelIntentClassificationOutput per input, in input order.
+        """
+        from omniintelligence.nodes.node_intent_classifier_compute.handlers import (
+            handle_intent_classification_batch,
+        )
+
+        return handle_intent_classification_batch(
+            inputs=inputs,
+            config=self._config,
+        )
+
 
 __all__ = [
     "AdapterIdempotencyStoreInfra",
@@ -166,7 +166,9 @@ def collect_publish_topics_for_dispatch(
 
     Only the first publish topic per contract is used.  When a contract
     declares multiple publish topics (e.g. ``node_pattern_storage_effect``),
-    only the first entry is returned.
+    only the first entry is returned, except for topics listed in the
+    secondary key table (``"pattern_projection_delta"`` →
+    ``node_pattern_projection_effect``'s delta topic).
 
     Args:
         node_packages: Override list of node packages to scan.  Defaults to
@@ -185,6 +187,13 @@ def collect_publish_topics_for_dispatch(
         "pattern_projection": "omniintelligence.nodes.node_pattern_projection_effect",
         "pattern_storage": "omniintelligence.nodes.node_pattern_storage_effect",
     }
+    # Extra dispatch keys for non-first publish topics, matched by topic name.
+    _SECONDARY_DISPATCH_KEYS: dict[str, tuple[str, str]] = {
+        "pattern_projection_delta": (
+            "omniintelligence.nodes.node_pattern_projection_effect",
+            ".pattern-projection-delta.",
+        ),
+    }
 
     if node_packages is not None:
         # Override: prefer known dispatch keys, fall back to package-tail derivation
@@ -208,6 +217,11 @@ def collect_publish_topics_for_dispatch(
         if topics:
             result[key] = topics[0]
 
+    for key, (package, marker) in _SECONDARY_DISPATCH_KEYS.items():
+        match = next((t for t in _read_publish_topics(package) if marker in t), None)
+        if match is not None:
+            result[key] = match
+
     logger.debug(
         "Collected %d publish topics for dispatch engine: %s",
         len(result),
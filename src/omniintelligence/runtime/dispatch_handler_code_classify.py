@@ -99,16 +99,15 @@ def create_code_classify_dispatch_handler(
         for entity in entities:
             eid = str(entity["id"])
 
-            # Idempotency check (Invariant 8)
-            meta_info = await repository.get_entity_enrichment_metadata(eid)
-            if meta_info:
-                existing = meta_info.get("enrichment_metadata", {}).get("classify", {})
-                if (
-                    existing.get("config_hash") == config_hash
-                    and existing.get("stage_version") == STAGE_VERSION
-                    and meta_info.get("file_hash") == persisted.file_hash
-                ):
-                    continue  # Skip — already classified with same inputs
+            # Idempotency check (Invariant 8) from the row already fetched
+            meta = entity.get("enrichment_metadata")
+            existing = (meta if isinstance(meta, dict) else {}).get("classify", {})
+            if (
+                existing.get("config_hash") == config_hash
+                and existing.get("stage_version") == STAGE_VERSION
+                and entity.get("file_hash") == persisted.file_hash
+            ):
+                continue  # Skip — already classified with same inputs
 
             # Classify
             methods = entity.get("methods") or []
@@ -8,6 +8,16 @@ Consumes code-entities-extracted.v1 events (parallel with persist handler),
 embeds entity text via LLM_EMBEDDING_URL, stores in Qdrant code_patterns
 collection, and writes entity nodes + relationship edges to Memgraph.
 
+Embedding is batched: all entity texts of an event are sent to the
+embedding endpoint in batches of up to EMBEDDING_BATCH_SIZE inputs, through
+one long-lived pooled client shared by every event the handler processes.
+EMBEDDING_MAX_CONCURRENCY bounds the number of in-flight batch requests
+across concurrently dispatched events; call ``close()`` on shutdown to
+release a client the handler created. Memgraph writes use UNWIND batches
+of GRAPH_WRITE_BATCH_SIZE rows and the node/edge MERGEs of the Postgres ->
+Memgraph sync (dispatch_handler_graph_storage), so both writers converge on
+the same nodes and edges.
+
 Graceful degradation: if Qdrant or Memgraph is unavailable, logs a warning
 and continues. Postgres (persist handler) is the source of truth.
 
@@ -18,19 +28,33 @@ Related:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from collections.abc import Awaitable, Callable
 from typing import Any, Protocol, runtime_checkable
 from uuid import uuid4
 
-import httpx
 from omnibase_core.models.events.model_event_envelope import ModelEventEnvelope
 from omnibase_core.protocols.handler.protocol_handler_context import (
     ProtocolHandlerContext,
 )
 
+from omniintelligence.clients.embedding_client_local_openai import (
+    EmbeddingClientLocalOpenAI,
+)
+from omniintelligence.nodes.node_embedding_generation_effect.models.model_embedding_client_config import (
+    ModelEmbeddingClientConfig,
+)
 from omniintelligence.runtime.contract_topics import canonical_topic_to_dispatch_alias
+from omniintelligence.runtime.dispatch_handler_graph_storage import (
+    edge_merge_writes,
+    node_merge_writes,
+)
+from omniintelligence.runtime.graph_batch_writer import (
+    GRAPH_WRITE_BATCH_SIZE,
+    write_rows_batched,
+)
 from omniintelligence.topics import IntentTopic
 
 logger = logging.getLogger(__name__)
@@ -60,6 +84,16 @@ class ProtocolBoltHandler(Protocol):
     ) -> Any: ...
 
 
+@runtime_checkable
+class ProtocolEmbeddingBatchClient(Protocol):
+    """Minimal protocol for batched embedding generation.
+
+    Satisfied by EmbeddingClientLocalOpenAI and EmbeddingClient.
+    """
+
+    async def get_embeddings_batch(self, texts: list[str]) -> list[list[float]]: ...
+
+
 # =============================================================================
 # Dispatch alias
 # =============================================================================
@@ -72,36 +106,64 @@ DISPATCH_ALIAS_CODE_ENTITIES_EXTRACTED_EMBED = canonical_topic_to_dispatch_alias
 QDRANT_COLLECTION = "code_patterns"
 """Qdrant collection name for code entity embeddings."""
 
+try:
+    EMBEDDING_BATCH_SIZE: int = max(
+        1, int(os.environ.get("INTELLIGENCE_CODE_EMBED_BATCH_SIZE", "64"))
+    )
+except ValueError:
+    EMBEDDING_BATCH_SIZE = 64
+"""Maximum entity texts sent in one /v1/embeddings request.
+
+Configurable via INTELLIGENCE_CODE_EMBED_BATCH_SIZE environment variable.
+Files with at most this many entities are embedded in a single round trip."""
+
+try:
+    EMBEDDING_MAX_CONCURRENCY: int = max(
+        1, int(os.environ.get("INTELLIGENCE_CODE_EMBED_MAX_CONCURRENCY", "4"))
+    )
+except ValueError:
+    EMBEDDING_MAX_CONCURRENCY = 4
+"""Maximum in-flight embedding batch requests per handler, across events.
+
+Configurable via INTELLIGENCE_CODE_EMBED_MAX_CONCURRENCY environment variable."""
+
 
 # =============================================================================
 # Handler Factory
 # =============================================================================
 
 
-def create_code_embed_graph_dispatch_handler(
-    *,
-    qdrant_client: ProtocolQdrantClient | None = None,
-    bolt_handler: ProtocolBoltHandler | None = None,
-    embedding_url: str | None = None,
-) -> Callable[
-    [ModelEventEnvelope[object], ProtocolHandlerContext],
-    Awaitable[str],
-]:
-    """Create a dispatch handler that embeds entities in Qdrant and graphs in Memgraph.
+class CodeEmbedGraphHandler:
+    """Dispatch handler: embed entities in Qdrant and graph them in Memgraph.
 
-    Consumes code-entities-extracted.v1 events (same event as persist handler —
-    parallel consumption).
-
-    Args:
-        qdrant_client: Optional Qdrant client for vector storage.
-        bolt_handler: Optional Memgraph/Neo4j handler for graph storage.
-        embedding_url: LLM embedding endpoint. Defaults to LLM_EMBEDDING_URL env var.
-
-    Returns:
-        Async handler function with signature (envelope, context) -> str.
+    Holds the embedding client and concurrency limit shared by every event it
+    processes. A client created lazily from embedding_url is owned by the
+    handler and released by ``close()``; an injected client is left to its
+    owner.
     """
 
-    async def _handle(
+    def __init__(
+        self,
+        *,
+        qdrant_client: ProtocolQdrantClient | None,
+        bolt_handler: ProtocolBoltHandler | None,
+        embedding_url: str | None,
+        embedding_client: ProtocolEmbeddingBatchClient | None,
+        embedding_batch_size: int,
+        embedding_max_concurrency: int,
+        graph_batch_size: int,
+    ) -> None:
+        self._qdrant_client = qdrant_client
+        self._bolt_handler = bolt_handler
+        self._embedding_url = embedding_url
+        self._embedding_client = embedding_client
+        self._owned_client: EmbeddingClientLocalOpenAI | None = None
+        self._embedding_batch_size = embedding_batch_size
+        self._semaphore = asyncio.Semaphore(embedding_max_concurrency)
+        self._graph_batch_size = graph_batch_size
+
+    async def __call__(
+        self,
         envelope: ModelEventEnvelope[object],
         context: ProtocolHandlerContext,
     ) -> str:
@@ -118,49 +180,206 @@ def create_code_embed_graph_dispatch_handler(
         event = ModelCodeEntitiesExtractedEvent(**payload)
 
         # Embed entities in Qdrant
-        if qdrant_client is not None:
-            _embedding_url = embedding_url or os.environ["LLM_EMBEDDING_URL"]
-            await _embed_entities(qdrant_client, event, _embedding_url)
+        if self._qdrant_client is not None:
+            await _embed_entities(
+                self._qdrant_client,
+                event,
+                self._get_embedding_client(),
+                batch_size=self._embedding_batch_size,
+                semaphore=self._semaphore,
+            )
 
         # Write to Memgraph
-        if bolt_handler is not None:
-            await _graph_entities(bolt_handler, event)
+        if self._bolt_handler is not None:
+            await _graph_entities(
+                self._bolt_handler, event, batch_size=self._graph_batch_size
+            )
 
         logger.info(
             "Embed+graph complete: %d entities (qdrant=%s, memgraph=%s, file=%s:%s)",
             event.entity_count,
-            qdrant_client is not None,
-            bolt_handler is not None,
+            self._qdrant_client is not None,
+            self._bolt_handler is not None,
             event.repo_name,
             event.file_path,
         )
 
         return "ok"
 
-    return _handle
+    async def close(self) -> None:
+        """Close the embedding client created by this handler, if any."""
+        client, self._owned_client = self._owned_client, None
+        if client is not None:
+            if self._embedding_client is client:
+                self._embedding_client = None
+            await client.close()
+
+    def _get_embedding_client(self) -> ProtocolEmbeddingBatchClient:
+        # No await between check and assignment, so concurrent events
+        # cannot create duplicate clients.
+        if self._embedding_client is None:
+            self._owned_client = _create_embedding_client(
+                self._embedding_url or os.environ["LLM_EMBEDDING_URL"]
+            )
+            self._embedding_client = self._owned_client
+        return self._embedding_client
+
+
+def create_code_embed_graph_dispatch_handler(
+    *,
+    qdrant_client: ProtocolQdrantClient | None = None,
+    bolt_handler: ProtocolBoltHandler | None = None,
+    embedding_url: str | None = None,
+    embedding_client: ProtocolEmbeddingBatchClient | None = None,
+    embedding_batch_size: int = EMBEDDING_BATCH_SIZE,
+    embedding_max_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
+    graph_batch_size: int = GRAPH_WRITE_BATCH_SIZE,
+) -> CodeEmbedGraphHandler:
+    """Create a dispatch handler that embeds entities in Qdrant and graphs in Memgraph.
+
+    Consumes code-entities-extracted.v1 events (same event as persist handler —
+    parallel consumption).
+
+    Args:
+        qdrant_client: Optional Qdrant client for vector storage.
+        bolt_handler: Optional Memgraph/Neo4j handler for graph storage.
+        embedding_url: LLM embedding endpoint. Defaults to LLM_EMBEDDING_URL env var.
+            Ignored when embedding_client is provided.
+        embedding_client: Optional batched embedding client, owned by the
+            caller. When None, an EmbeddingClientLocalOpenAI for embedding_url
+            is created on first use, reused for every subsequent event and
+            closed by the handler's close().
+        embedding_batch_size: Maximum texts per embedding request.
+        embedding_max_concurrency: Maximum concurrent embedding requests,
+            shared by all events processed by this handler.
+        graph_batch_size: Maximum rows per UNWIND write to Memgraph.
+
+    Returns:
+        CodeEmbedGraphHandler, an async callable (envelope, context) -> str.
+
+    Raises:
+        ValueError: If embedding_batch_size, embedding_max_concurrency or
+            graph_batch_size < 1.
+    """
+    if embedding_batch_size < 1:
+        raise ValueError(
+            f"embedding_batch_size must be >= 1, got {embedding_batch_size}"
+        )
+    if embedding_max_concurrency < 1:
+        raise ValueError(
+            f"embedding_max_concurrency must be >= 1, got {embedding_max_concurrency}"
+        )
+
+    if graph_batch_size < 1:
+        raise ValueError(f"graph_batch_size must be >= 1, got {graph_batch_size}")
+
+    return CodeEmbedGraphHandler(
+        qdrant_client=qdrant_client,
+        bolt_handler=bolt_handler,
+        embedding_url=embedding_url,
+        embedding_client=embedding_client,
+        embedding_batch_size=embedding_batch_size,
+        embedding_max_concurrency=embedding_max_concurrency,
+        graph_batch_size=graph_batch_size,
+    )
+
+
+def _create_embedding_client(embedding_url: str) -> EmbeddingClientLocalOpenAI:
+    """Create the long-lived pooled client used when none is injected."""
+    config = ModelEmbeddingClientConfig(
+        base_url=embedding_url,
+        # Vector dimension is owned by the Qdrant collection, not checked here
+        embedding_dimension=0,
+    )
+    return EmbeddingClientLocalOpenAI(config)
+
+
+def _entity_embedding_text(entity: Any) -> str:
+    """Compose the text embedded for a code entity."""
+    parts = [entity.entity_name]
+    if entity.docstring:
+        parts.append(entity.docstring)
+    if entity.bases:
+        parts.append(f"bases: {', '.join(entity.bases)}")
+    if entity.methods:
+        method_names = [str(m.get("name", "")) for m in entity.methods]
+        parts.append(f"methods: {', '.join(method_names)}")
+    return " | ".join(parts)
+
+
+async def _embed_batch(
+    embedding_client: ProtocolEmbeddingBatchClient,
+    texts: list[str],
+    semaphore: asyncio.Semaphore,
+) -> list[list[float]] | None:
+    """Embed one batch of texts. Returns None on failure (graceful degradation)."""
+    try:
+        async with semaphore:
+            embeddings = await embedding_client.get_embeddings_batch(texts)
+    except Exception:
+        logger.warning(
+            "Embedding batch request failed for %d texts (first: %.50s...)",
+            len(texts),
+            texts[0],
+            exc_info=True,
+        )
+        return None
+    if len(embeddings) != len(texts):
+        logger.warning(
+            "Embedding batch returned %d vectors for %d texts",
+            len(embeddings),
+            len(texts),
+        )
+        return None
+    return embeddings
+
+
+async def _embed_texts(
+    embedding_client: ProtocolEmbeddingBatchClient,
+    texts: list[str],
+    *,
+    batch_size: int,
+    semaphore: asyncio.Semaphore,
+) -> list[list[float] | None]:
+    """Embed texts in batches of batch_size, concurrently up to the semaphore.
+
+    Returns:
+        One entry per input text, in input order. Entries are None for texts
+        whose batch failed.
+    """
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    results = await asyncio.gather(
+        *(_embed_batch(embedding_client, batch, semaphore) for batch in batches)
+    )
+    embeddings: list[list[float] | None] = []
+    for batch, batch_embeddings in zip(batches, results, strict=True):
+        if batch_embeddings is None:
+            embeddings.extend([None] * len(batch))
+        else:
+            embeddings.extend(batch_embeddings)
+    return embeddings
 
 
 async def _embed_entities(
     qdrant_client: ProtocolQdrantClient,
     event: Any,
-    embedding_url: str,
+    embedding_client: ProtocolEmbeddingBatchClient,
+    *,
+    batch_size: int,
+    semaphore: asyncio.Semaphore,
 ) -> None:
     """Embed entities in Qdrant. Graceful degradation on failure."""
     try:
+        entities = list(event.entities)
+        embeddings = await _embed_texts(
+            embedding_client,
+            [_entity_embedding_text(entity) for entity in entities],
+            batch_size=batch_size,
+            semaphore=semaphore,
+        )
+
         points = []
-        for entity in event.entities:
-            # Compose text for embedding
-            parts = [entity.name]
-            if entity.docstring:
-                parts.append(entity.docstring)
-            if entity.bases:
-                parts.append(f"bases: {', '.join(entity.bases)}")
-            if entity.methods:
-                parts.append(f"methods: {', '.join(entity.methods)}")
-            text = " | ".join(parts)
-
-            # Get embedding from LLM
-            embedding = await _get_embedding(text, embedding_url)
+        for entity, embedding in zip(entities, embeddings, strict=True):
             if embedding is None:
                 continue
 
@@ -169,14 +388,13 @@ async def _embed_entities(
                     "id": str(uuid4()),
                     "vector": embedding,
                     "payload": {
-                        "entity_id": entity.entity_id,
-                        "entity_type": entity.entity_type.value
-                        if hasattr(entity.entity_type, "value")
-                        else str(entity.entity_type),
-                        "name": entity.name,
-                        "file_path": entity.file_path,
+                        "entity_id": entity.id,
+                        "entity_type": entity.entity_type,
+                        "name": entity.entity_name,
+                        "qualified_name": entity.qualified_name,
+                        "file_path": entity.source_path,
                         "source_repo": entity.source_repo,
-                        "line_start": entity.line_start,
+                        "line_start": entity.line_number,
                     },
                 }
             )
@@ -196,71 +414,74 @@ async def _embed_entities(
         )
 
 
-async def _get_embedding(text: str, embedding_url: str) -> list[float] | None:
-    """Get embedding vector from LLM endpoint."""
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{embedding_url}/v1/embeddings",
-                json={"input": text, "model": "default"},
-            )
-            response.raise_for_status()
-            embedding: list[float] = response.json()["data"][0]["embedding"]
-            return embedding
-    except Exception:
-        logger.warning("Embedding request failed for text preview: %.50s...", text)
-        return None
+def _bolt_writer(
+    bolt_handler: ProtocolBoltHandler, cypher: str
+) -> Callable[[list[dict[str, Any]]], Awaitable[object]]:
+    """Adapt a bolt handler to the write_rows_batched writer signature."""
+
+    async def write(rows: list[dict[str, Any]]) -> object:
+        return await bolt_handler.write(cypher, parameters={"rows": rows})
+
+    return write
 
 
 async def _graph_entities(
     bolt_handler: ProtocolBoltHandler,
     event: Any,
+    *,
+    batch_size: int,
 ) -> None:
-    """Write entity nodes and relationship edges to Memgraph. Graceful degradation."""
+    """Write entity nodes and relationship edges to Memgraph. Graceful degradation.
+
+    Uses the node and edge MERGEs of the Postgres -> Memgraph sync (labels
+    from entity_type, keyed by qualified_name + source_repo, upper-cased edge
+    types, injectable relationships only), so this writer and the sync
+    converge on the same graph. Writes go in UNWIND batches of batch_size
+    rows per label and per edge type.
+    """
     try:
-        # MERGE entity nodes
-        for entity in event.entities:
-            entity_type_str = (
-                entity.entity_type.value
-                if hasattr(entity.entity_type, "value")
-                else str(entity.entity_type)
-            )
-            await bolt_handler.write(
-                "MERGE (e:CodeEntity {entity_id: $entity_id}) "
-                "SET e.name = $name, e.entity_type = $entity_type, "
-                "e.file_path = $file_path, e.source_repo = $source_repo",
-                parameters={
-                    "entity_id": entity.entity_id,
-                    "name": entity.name,
-                    "entity_type": entity_type_str,
-                    "file_path": entity.file_path,
-                    "source_repo": entity.source_repo,
-                },
+        node_writes = node_merge_writes(
+            [entity.model_dump() for entity in event.entities]
+        )
+        nodes_written = 0
+        for cypher, rows in node_writes:
+            nodes_written += len(
+                await write_rows_batched(
+                    _bolt_writer(bolt_handler, cypher),
+                    rows,
+                    batch_size,
+                    describe=lambda row: f"node {row['qn']}",
+                )
             )
 
-        # MERGE relationship edges
-        for rel in event.relationships:
-            rel_type_str = (
-                rel.relationship_type.value
-                if hasattr(rel.relationship_type, "value")
-                else str(rel.relationship_type)
-            )
-            await bolt_handler.write(
-                "MATCH (s:CodeEntity {entity_id: $source_id}) "
-                "MATCH (t:CodeEntity {entity_id: $target_id}) "
-                f"MERGE (s)-[r:{rel_type_str} {{confidence: $confidence, trust_tier: $trust_tier}}]->(t)",
-                parameters={
-                    "source_id": rel.source_entity_id,
-                    "target_id": rel.target_entity_id,
-                    "confidence": rel.confidence,
-                    "trust_tier": rel.trust_tier,
-                },
+        # Edge endpoints are qualified names; the sync skips relationships
+        # that are not injected into context, so they are not graphed here
+        edge_writes = edge_merge_writes(
+            [
+                (
+                    {**rel.model_dump(), "source_repo": event.repo_name},
+                    rel.source_entity,
+                    rel.target_entity,
+                )
+                for rel in event.relationships
+                if rel.inject_into_context
+            ]
+        )
+        edges_written = 0
+        for cypher, rows in edge_writes:
+            edges_written += len(
+                await write_rows_batched(
+                    _bolt_writer(bolt_handler, cypher),
+                    rows,
+                    batch_size,
+                    describe=lambda row: f"edge {row['src_qn']} -> {row['tgt_qn']}",
+                )
             )
 
         logger.debug(
             "Wrote %d nodes, %d edges to Memgraph",
-            len(event.entities),
-            len(event.relationships),
+            nodes_written,
+            edges_written,
         )
     except Exception:
         logger.warning(
@@ -273,6 +494,11 @@ async def _graph_entities(
 
 __all__ = [
     "DISPATCH_ALIAS_CODE_ENTITIES_EXTRACTED_EMBED",
+    "EMBEDDING_BATCH_SIZE",
+    "EMBEDDING_MAX_CONCURRENCY",
+    "GRAPH_WRITE_BATCH_SIZE",
     "QDRANT_COLLECTION",
+    "CodeEmbedGraphHandler",
+    "ProtocolEmbeddingBatchClient",
     "create_code_embed_graph_dispatch_handler",
 ]
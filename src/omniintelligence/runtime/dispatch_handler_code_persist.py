@@ -12,9 +12,14 @@ Design Decisions:
     - ``parse_status == "success"``: persist entities + reconcile stale.
     - ``parse_status == "partial"``: persist entities but SKIP reconciliation
       to avoid deleting valid entities from a prior successful parse.
-    - Relationship upsert requires resolving entity qualified names to UUIDs.
+    - Entities and relationships are each upserted in a single bulk
+      statement; relationship endpoints are resolved from qualified names to
+      UUIDs server-side, so a file costs a constant number of round trips.
     - Reconciliation deletes entities and relationships that were present in
       a prior extraction but are no longer emitted (zombie cleanup).
+    - After a file is committed, the optional graph sync scheduler is asked
+      for a (coalesced, background) Postgres -> Memgraph sync, so the graph
+      follows Postgres without a full-table reload per file.
 
 Related:
     - OMN-5662: Wire crawl -> extract pipeline via Kafka events
@@ -58,6 +63,7 @@ def create_code_persist_dispatch_handler(
     *,
     repository: Any | None = None,
     publisher: Any | None = None,
+    graph_sync: Any | None = None,
     correlation_id: UUID | None = None,
 ) -> DispatchHandler:
     """Create a dispatch engine handler for code-entities-extracted events.
@@ -69,6 +75,8 @@ def create_code_persist_dispatch_handler(
         repository: ``RepositoryCodeEntity`` instance for DB operations.
             If None, the handler will attempt to import from a registry
             at call time.
+        graph_sync: Optional ``GraphSyncScheduler``. When set,
+            ``request_sync()`` is called after each persisted file.
         correlation_id: Optional fixed correlation ID for tracing.
 
     Returns:
@@ -139,48 +147,37 @@ def create_code_persist_dispatch_handler(
             ctx_correlation_id,
         )
 
-        # Upsert entities
-        entity_qualified_names: list[str] = []
+        # Upsert all entities in one statement
+        entity_dicts: list[dict[str, Any]] = []
         for entity in extracted_event.entities:
             entity_dict = entity.model_dump()
             entity_dict["file_hash"] = extracted_event.file_hash
             entity_dict["source_path"] = extracted_event.file_path
             entity_dict["source_repo"] = extracted_event.repo_name
-            await repository.upsert_entity(entity_dict)
-            entity_qualified_names.append(entity.qualified_name)
-
-        # Upsert relationships (resolve qualified names to entity IDs)
-        relationship_keys: list[tuple[str, str, str]] = []
-        for rel in extracted_event.relationships:
-            source_id = await repository.get_entity_id_by_qualified_name(
-                rel.source_entity, extracted_event.repo_name
-            )
-            target_id = await repository.get_entity_id_by_qualified_name(
-                rel.target_entity, extracted_event.repo_name
-            )
-
-            if source_id is None or target_id is None:
-                logger.debug(
-                    "Skipping relationship %s -> %s (%s): entity not found",
-                    rel.source_entity,
-                    rel.target_entity,
-                    rel.relationship_type,
-                )
-                continue
-
-            rel_dict: dict[str, Any] = {
-                "source_entity_id": source_id,
-                "target_entity_id": target_id,
-                "relationship_type": rel.relationship_type,
-                "trust_tier": rel.trust_tier,
-                "confidence": rel.confidence,
-                "evidence": rel.evidence,
-                "inject_into_context": rel.inject_into_context,
-                "source_repo": extracted_event.repo_name,
-            }
-            await repository.upsert_relationship(rel_dict)
-            relationship_keys.append(
-                (rel.source_entity, rel.target_entity, rel.relationship_type)
+            entity_dicts.append(entity_dict)
+        entity_ids_by_name: dict[str, str] = await repository.upsert_entities(
+            entity_dicts
+        )
+        entity_qualified_names = [e.qualified_name for e in extracted_event.entities]
+
+        # Upsert all relationships; qualified names are resolved to entity IDs
+        # server-side and relationships with unknown endpoints are skipped.
+        relationship_keys: list[
+            tuple[str, str, str]
+        ] = await repository.upsert_relationships(
+            [rel.model_dump() for rel in extracted_event.relationships],
+            extracted_event.repo_name,
+        )
+        skipped_relationships = len(extracted_event.relationships) - len(
+            relationship_keys
+        )
+        if skipped_relationships > 0:
+            logger.debug(
+                "Skipped %d duplicate or unresolvable relationships "
+                "(file=%s, correlation_id=%s)",
+                skipped_relationships,
+                extracted_event.file_path,
+                ctx_correlation_id,
             )
 
         # Reconciliation: only on successful parse (Invariant section 6)
@@ -221,6 +218,10 @@ def create_code_persist_dispatch_handler(
                 ctx_correlation_id,
             )
 
+        # Propagate the committed rows to Memgraph (coalesced, non-blocking)
+        if graph_sync is not None:
+            graph_sync.request_sync()
+
         # Emit persisted event for downstream enrichment (Part 2: OMN-5677)
         if publisher is not None and entity_qualified_names:
             from datetime import UTC, datetime
@@ -229,14 +230,12 @@ def create_code_persist_dispatch_handler(
                 ModelCodeEntitiesPersistedEvent,
             )
 
-            # Collect entity IDs by re-querying (they were just upserted)
-            entity_ids: list[str] = []
-            for qn in entity_qualified_names:
-                eid = await repository.get_entity_id_by_qualified_name(
-                    qn, extracted_event.repo_name
-                )
-                if eid:
-                    entity_ids.append(eid)
+            # Entity IDs come straight from the bulk upsert's RETURNING rows
+            entity_ids = [
+                entity_ids_by_name[qn]
+                for qn in entity_qualified_names
+                if qn in entity_ids_by_name
+            ]
 
             if entity_ids:
                 persisted_event = ModelCodeEntitiesPersistedEvent(
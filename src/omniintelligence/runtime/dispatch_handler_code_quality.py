@@ -6,6 +6,10 @@
 Consumes ``code-entities-persisted.v1``, runs quality scoring on each entity,
 and updates Postgres with the results.
 
+Each source file is read and parsed once per event; entities are scored on
+their own statement slice (falling back to the whole file when no slice
+matches), and all scores are written in one bulk update.
+
 Idempotency: skips entities where (file_hash, config_hash, stage_version)
 matches the stored enrichment_metadata.quality tuple.
 
@@ -67,6 +71,7 @@ def create_code_quality_dispatch_handler(
     ) -> str:
         from omniintelligence.nodes.node_ast_extraction_compute.handlers.handler_quality_score import (
             QualityScorer,
+            extract_entity_sources,
         )
         from omniintelligence.nodes.node_ast_extraction_compute.models.model_code_entities_persisted_event import (
             ModelCodeEntitiesPersistedEvent,
@@ -95,33 +100,50 @@ def create_code_quality_dispatch_handler(
 
         scorer = QualityScorer(quality_config)
         entities = await repository.get_entities_by_ids(persisted.entity_ids)
-        scored_count = 0
 
+        # Idempotency check (Invariant 8) from the rows just fetched
+        pending: list[dict[str, Any]] = []
         for entity in entities:
-            eid = str(entity["id"])
-
-            # Idempotency check (Invariant 8)
-            meta_info = await repository.get_entity_enrichment_metadata(eid)
-            if meta_info:
-                existing = meta_info.get("enrichment_metadata", {}).get("quality", {})
-                if (
-                    existing.get("config_hash") == config_hash
-                    and existing.get("stage_version") == STAGE_VERSION
-                    and meta_info.get("file_hash") == persisted.file_hash
-                ):
-                    continue  # Skip — already scored with same inputs
-
-            # Try to read source code for quality analysis
-            source_code = _read_source_file(
-                persisted.repo_name, entity.get("source_path", "")
-            )
+            meta = entity.get("enrichment_metadata")
+            existing = (meta if isinstance(meta, dict) else {}).get("quality", {})
+            if (
+                existing.get("config_hash") == config_hash
+                and existing.get("stage_version") == STAGE_VERSION
+                and entity.get("file_hash") == persisted.file_hash
+            ):
+                continue  # Skip — already scored with same inputs
+            pending.append(entity)
+
+        # Read and parse each source file once
+        files: dict[str, tuple[str | None, dict[int, str]]] = {}
+        scores: list[tuple[str, float, str]] = []
+        for entity in pending:
+            source_path = entity.get("source_path", "")
+            if source_path not in files:
+                source = _read_source_file(persisted.repo_name, source_path)
+                files[source_path] = (
+                    source,
+                    extract_entity_sources(source) if source else {},
+                )
+            file_source, entity_sources = files[source_path]
+
+            entity_type = entity.get("entity_type", "function")
+            source_code = file_source
+            if entity_type != "module":
+                source_code = entity_sources.get(
+                    entity.get("line_number") or 0, file_source
+                )
 
             result = scorer.score(
                 source_code=source_code,
-                entity_type=entity.get("entity_type", "function"),
+                entity_type=entity_type,
                 entity_name=entity.get("entity_name", ""),
             )
+            scores.append(
+                (str(entity["id"]), result.overall_score, json.dumps(result.dimensions))
+            )
 
+        if scores:
             meta_patch = json.dumps(
                 {
                     "quality": {
@@ -131,13 +153,8 @@ def create_code_quality_dispatch_handler(
                     }
                 }
             )
-            await repository.update_quality_score(
-                entity_id=eid,
-                quality_score=result.overall_score,
-                quality_dimensions=json.dumps(result.dimensions),
-                enrichment_meta_patch=meta_patch,
-            )
-            scored_count += 1
+            await repository.update_quality_scores(scores, meta_patch)
+        scored_count = len(scores)
 
         logger.info(
             "Quality scoring complete (file=%s, scored=%d/%d, cid=%s)",
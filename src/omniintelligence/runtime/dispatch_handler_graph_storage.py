@@ -18,6 +18,22 @@ Architecture Decisions:
     - Split file: NOT in dispatch_handlers.py (already large)
     - Memgraph is derived, not source of truth: full rebuild from Postgres at any time
     - MERGE for idempotency: won't duplicate nodes/edges on re-run
+    - Bulk writes: nodes grouped by label and edges by type, written with
+      parameterized `UNWIND $rows AS row MERGE ...` batches of batch_size rows
+      (one round trip per batch instead of per row)
+    - Per-batch error isolation: a failed batch is retried row by row, so a
+      bad row only loses itself and counts match per-row writes
+    - Incremental mode: only entities/relationships whose updated_at is past
+      the persisted high-water mark are streamed, in keyset pages of
+      page_size rows, so memory is bounded by one page. Hard-deleted rows
+      are read from tombstone tables (AFTER DELETE triggers) and removed
+      from Memgraph (zombie deletion). The mark only advances when every
+      row of the run was written; re-reading a window is safe (MERGE).
+    - Dispatch path: GraphSyncScheduler is triggered by the code-persist
+      handler after each committed file. Requests arriving while a sync runs
+      coalesce into one follow-up run. Runs are incremental; a failure (e.g.
+      migration 029 not applied) is logged and recorded, and the next run
+      retries the same window. Full snapshot syncs only run on request.
     - Memgraph unavailable -> graceful skip: log warning, return 0 counts (Invariant §11)
     - Label from entity_type: maps class->Class, protocol->Protocol, model->Model, etc.
     - Uses neo4j async driver: Memgraph is bolt-compatible with neo4j driver
@@ -29,12 +45,20 @@ Related:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from neo4j import AsyncDriver, AsyncGraphDatabase
 
+from omniintelligence.runtime.graph_batch_writer import (
+    GRAPH_WRITE_BATCH_SIZE,
+    write_rows_batched,
+)
+
 logger = logging.getLogger(__name__)
 
 # Entity type -> Memgraph node label mapping
@@ -47,6 +71,132 @@ ENTITY_TYPE_TO_LABEL: dict[str, str] = {
     "constant": "Constant",
 }
 
+_NODE_MERGE_CYPHER = (
+    "UNWIND $rows AS row "
+    "MERGE (n:{label} {{qualified_name: row.qn, source_repo: row.repo}}) "
+    "SET n.entity_name = row.name, n.source_path = row.path, "
+    "n.classification = row.cls, n.entity_type = row.etype"
+)
+
+try:
+    GRAPH_SYNC_PAGE_SIZE: int = max(
+        1, int(os.environ.get("INTELLIGENCE_GRAPH_SYNC_PAGE_SIZE", "5000"))
+    )
+except ValueError:
+    GRAPH_SYNC_PAGE_SIZE = 5000
+"""Rows fetched from Postgres per page in incremental mode.
+
+Configurable via INTELLIGENCE_GRAPH_SYNC_PAGE_SIZE environment variable."""
+
+GRAPH_SYNC_KEY = "code_graph"
+"""Sync stream key for the persisted high-water mark (code_graph_sync_state)."""
+
+_WATERMARK_OVERLAP = timedelta(seconds=60)
+"""Re-read window before the stored high-water mark.
+
+updated_at is set from NOW() (transaction start), so a transaction that
+commits after a sync read its upper bound can carry an older timestamp.
+Re-reading this window on the next run picks such rows up; MERGE makes the
+overlap idempotent."""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MIN_UUID = "00000000-0000-0000-0000-000000000000"
+
+_EDGE_MERGE_CYPHER = (
+    "UNWIND $rows AS row "
+    "MATCH (s {{qualified_name: row.src_qn}}), (t {{qualified_name: row.tgt_qn}}) "
+    "MERGE (s)-[r:{edge_type}]->(t) "
+    "SET r.confidence = row.conf, r.trust_tier = row.tier, "
+    "r.source_repo = row.repo"
+)
+
+_NODE_DELETE_CYPHER = (
+    "UNWIND $rows AS row "
+    "MATCH (n {qualified_name: row.qn, source_repo: row.repo}) "
+    "DETACH DELETE n"
+)
+
+_EDGE_DELETE_CYPHER = (
+    "UNWIND $rows AS row "
+    "MATCH (s {{qualified_name: row.src_qn}})-[r:{edge_type}]->"
+    "(t {{qualified_name: row.tgt_qn}}) "
+    "DELETE r"
+)
+
+
+def _node_row(entity: dict[str, Any]) -> dict[str, Any]:
+    """Build the UNWIND parameter row for an entity node."""
+    return {
+        "qn": entity.get("qualified_name", ""),
+        "repo": entity.get("source_repo", ""),
+        "name": entity.get("entity_name", ""),
+        "path": entity.get("source_path", ""),
+        "cls": entity.get("classification"),
+        "etype": entity.get("entity_type", ""),
+        "id": str(entity.get("id", "")),
+    }
+
+
+def _group_node_rows(
+    entities: Sequence[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Group node rows by Memgraph label (first-seen order)."""
+    rows_by_label: dict[str, list[dict[str, Any]]] = {}
+    for entity in entities:
+        label = ENTITY_TYPE_TO_LABEL.get(entity.get("entity_type", ""), "Entity")
+        rows_by_label.setdefault(label, []).append(_node_row(entity))
+    return rows_by_label
+
+
+def _edge_type(rel: dict[str, Any]) -> str:
+    """Memgraph edge type for a relationship row."""
+    return str(rel.get("relationship_type", "RELATES_TO")).upper()
+
+
+def _edge_row(rel: dict[str, Any], src_qn: str, tgt_qn: str) -> dict[str, Any]:
+    """Build the UNWIND parameter row for a relationship edge."""
+    return {
+        "src_qn": src_qn,
+        "tgt_qn": tgt_qn,
+        "conf": rel.get("confidence", 1.0),
+        "tier": rel.get("trust_tier", "strong"),
+        "repo": rel.get("source_repo", ""),
+    }
+
+
+def node_merge_writes(
+    entities: Sequence[dict[str, Any]],
+) -> list[tuple[str, list[dict[str, Any]]]]:
+    """Return (cypher, rows) node MERGE writes, one per Memgraph label.
+
+    Shared with the code embed+graph handler so every writer produces the
+    same nodes (label, key and property names) as this sync.
+    """
+    return [
+        (_NODE_MERGE_CYPHER.format(label=label), rows)
+        for label, rows in _group_node_rows(entities).items()
+    ]
+
+
+def edge_merge_writes(
+    edges: Sequence[tuple[dict[str, Any], str, str]],
+) -> list[tuple[str, list[dict[str, Any]]]]:
+    """Return (cypher, rows) edge MERGE writes, one per edge type.
+
+    Args:
+        edges: (relationship row, source qualified name, target qualified
+            name) triples. Only injectable relationships should be passed.
+    """
+    rows_by_type: dict[str, list[dict[str, Any]]] = {}
+    for rel, src_qn, tgt_qn in edges:
+        rows_by_type.setdefault(_edge_type(rel), []).append(
+            _edge_row(rel, src_qn, tgt_qn)
+        )
+    return [
+        (_EDGE_MERGE_CYPHER.format(edge_type=edge_type), rows)
+        for edge_type, rows in rows_by_type.items()
+    ]
+
 
 async def handle_graph_storage(
     *,
@@ -54,24 +204,46 @@ async def handle_graph_storage(
     driver: AsyncDriver | None = None,
     memgraph_uri: str | None = None,
     rebuild: bool = False,
+    batch_size: int = GRAPH_WRITE_BATCH_SIZE,
+    incremental: bool = False,
+    page_size: int = GRAPH_SYNC_PAGE_SIZE,
 ) -> dict[str, int]:
     """Sync entities and relationships from Postgres to Memgraph.
 
     Reads all entities and injectable relationships from the Postgres repository
     (single source of truth) and writes them to Memgraph using MERGE for
-    idempotent upserts.
+    idempotent upserts. Nodes are grouped by label and edges by type, and
+    each group is written in UNWIND batches of batch_size rows.
+
+    With incremental=True, only rows changed or deleted since the persisted
+    high-water mark are synced, streamed in pages of page_size rows.
 
     Args:
         repository: Postgres repository (source of truth). Must implement
-            get_all_entities_and_relationships() and update_graph_synced_at().
+            get_all_entities_and_relationships() and update_graph_synced_at();
+            incremental mode uses the graph sync methods of
+            RepositoryCodeEntity instead of get_all_entities_and_relationships().
         driver: Optional pre-configured neo4j AsyncDriver. If None, a new
             driver is created from memgraph_uri.
         memgraph_uri: Memgraph bolt URI. Only used if driver is None.
         rebuild: If True, drop all nodes/edges and rebuild from scratch.
+            In incremental mode the stored high-water mark is ignored.
+        batch_size: Maximum rows per UNWIND write.
+        incremental: If True, sync only changes since the high-water mark.
+        page_size: Rows per Postgres page in incremental mode.
 
     Returns:
-        dict with 'nodes_written' and 'edges_written' counts.
+        dict with 'nodes_written' and 'edges_written' counts. Incremental mode
+        also returns 'nodes_deleted' and 'edges_deleted'.
+
+    Raises:
+        ValueError: If batch_size or page_size < 1.
     """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    if page_size < 1:
+        raise ValueError(f"page_size must be >= 1, got {page_size}")
+
     owns_driver = driver is None
 
     if driver is None:
@@ -91,6 +263,15 @@ async def handle_graph_storage(
         if rebuild:
             await _rebuild_graph(driver)
 
+        if incremental:
+            return await _sync_incremental(
+                driver,
+                repository,
+                batch_size=batch_size,
+                page_size=page_size,
+                ignore_watermark=rebuild,
+            )
+
         entities, relationships = await repository.get_all_entities_and_relationships()
 
         if not entities:
@@ -107,73 +288,57 @@ async def handle_graph_storage(
             if entity_id and qn:
                 id_to_qn[entity_id] = qn
 
+        # Resolve edges (first-seen order)
+        edges: list[tuple[dict[str, Any], str, str]] = []
+        for rel in relationships:
+            # Resolve entity IDs to qualified names for Memgraph MATCH
+            src_qn = id_to_qn.get(str(rel.get("source_entity_id", "")), "")
+            tgt_qn = id_to_qn.get(str(rel.get("target_entity_id", "")), "")
+            if not src_qn or not tgt_qn:
+                logger.debug(
+                    "Skipping relationship with unresolvable entity IDs: "
+                    "source=%s, target=%s",
+                    rel.get("source_entity_id"),
+                    rel.get("target_entity_id"),
+                )
+                continue
+
+            edges.append((rel, src_qn, tgt_qn))
+
         nodes_written = 0
         edges_written = 0
-        synced_ids: list[str] = []
+        written_ids: set[str] = set()
 
         async with driver.session() as session:
             # Write entity nodes
-            for entity in entities:
-                label = ENTITY_TYPE_TO_LABEL.get(
-                    entity.get("entity_type", ""), "Entity"
+            for cypher, rows in node_merge_writes(entities):
+                written = await _write_rows(
+                    session,
+                    cypher,
+                    rows,
+                    batch_size,
+                    describe=lambda row: f"node {row['qn']}",
                 )
-                try:
-                    await session.run(
-                        f"MERGE (n:{label} {{qualified_name: $qn, source_repo: $repo}}) "
-                        f"SET n.entity_name = $name, n.source_path = $path, "
-                        f"n.classification = $cls, n.entity_type = $etype",
-                        qn=entity.get("qualified_name", ""),
-                        repo=entity.get("source_repo", ""),
-                        name=entity.get("entity_name", ""),
-                        path=entity.get("source_path", ""),
-                        cls=entity.get("classification"),
-                        etype=entity.get("entity_type", ""),
-                    )
-                    nodes_written += 1
-                    entity_id = str(entity.get("id", ""))
-                    if entity_id:
-                        synced_ids.append(entity_id)
-                except Exception:
-                    logger.exception(
-                        "Failed to write node: %s",
-                        entity.get("qualified_name"),
-                    )
+                nodes_written += len(written)
+                written_ids.update(row["id"] for row in written if row["id"])
 
             # Write relationship edges
-            for rel in relationships:
-                # Resolve entity IDs to qualified names for Memgraph MATCH
-                src_qn = id_to_qn.get(str(rel.get("source_entity_id", "")), "")
-                tgt_qn = id_to_qn.get(str(rel.get("target_entity_id", "")), "")
-                if not src_qn or not tgt_qn:
-                    logger.debug(
-                        "Skipping relationship with unresolvable entity IDs: "
-                        "source=%s, target=%s",
-                        rel.get("source_entity_id"),
-                        rel.get("target_entity_id"),
-                    )
-                    continue
-
-                edge_type = rel.get("relationship_type", "RELATES_TO").upper()
-                try:
-                    await session.run(
-                        f"MATCH (s {{qualified_name: $src_qn}}), "
-                        f"(t {{qualified_name: $tgt_qn}}) "
-                        f"MERGE (s)-[r:{edge_type}]->(t) "
-                        f"SET r.confidence = $conf, r.trust_tier = $tier, "
-                        f"r.source_repo = $repo",
-                        src_qn=src_qn,
-                        tgt_qn=tgt_qn,
-                        conf=rel.get("confidence", 1.0),
-                        tier=rel.get("trust_tier", "strong"),
-                        repo=rel.get("source_repo", ""),
-                    )
-                    edges_written += 1
-                except Exception:
-                    logger.exception(
-                        "Failed to write edge: %s -> %s",
-                        src_qn,
-                        tgt_qn,
-                    )
+            for cypher, rows in edge_merge_writes(edges):
+                written = await _write_rows(
+                    session,
+                    cypher,
+                    rows,
+                    batch_size,
+                    describe=lambda row: f"edge {row['src_qn']} -> {row['tgt_qn']}",
+                )
+                edges_written += len(written)
+
+        # Preserve repository order for the synced-at update
+        synced_ids = [
+            entity_id
+            for entity in entities
+            if (entity_id := str(entity.get("id", ""))) in written_ids
+        ]
 
         # Update Postgres timestamps
         if synced_ids:
@@ -191,6 +356,216 @@ async def handle_graph_storage(
             await driver.close()
 
 
+async def _sync_incremental(
+    driver: AsyncDriver,
+    repository: Any,
+    *,
+    batch_size: int,
+    page_size: int,
+    ignore_watermark: bool,
+) -> dict[str, int]:
+    """Sync rows changed since the high-water mark, page by page.
+
+    Order: deleted nodes, deleted/non-injectable edges, changed nodes,
+    changed injectable edges. Deletions run first so an entity deleted and
+    re-created inside one window ends up present.
+
+    Returns:
+        dict with nodes_written, edges_written, nodes_deleted, edges_deleted.
+    """
+    state = await repository.get_graph_sync_state(GRAPH_SYNC_KEY)
+    until: datetime = state["now"]
+    watermark: datetime | None = None if ignore_watermark else state["high_water_mark"]
+    since = _EPOCH if watermark is None else watermark - _WATERMARK_OVERLAP
+
+    counts = {
+        "nodes_written": 0,
+        "edges_written": 0,
+        "nodes_deleted": 0,
+        "edges_deleted": 0,
+    }
+    complete = True
+
+    async def _write(
+        session: Any,
+        cypher: str,
+        rows: list[dict[str, Any]],
+        counter: str,
+        describe: Callable[[dict[str, Any]], str],
+    ) -> list[dict[str, Any]]:
+        nonlocal complete
+        written = await _write_rows(
+            session, cypher, rows, batch_size, describe=describe
+        )
+        counts[counter] += len(written)
+        if len(written) < len(rows):
+            complete = False
+        return written
+
+    async with driver.session() as session:
+        # 1. Zombie nodes (DETACH DELETE also drops their edges)
+        after_seq = 0
+        while True:
+            page = await repository.get_entity_tombstones_page(
+                since=since, until=until, after_seq=after_seq, limit=page_size
+            )
+            if not page:
+                break
+            await _write(
+                session,
+                _NODE_DELETE_CYPHER,
+                [{"qn": t["qualified_name"], "repo": t["source_repo"]} for t in page],
+                "nodes_deleted",
+                lambda row: f"node delete {row['qn']}",
+            )
+            after_seq = page[-1]["seq"]
+            if len(page) < page_size:
+                break
+
+        # 2. Zombie edges (endpoints already deleted are handled by step 1)
+        after_seq = 0
+        while True:
+            page = await repository.get_relationship_tombstones_page(
+                since=since, until=until, after_seq=after_seq, limit=page_size
+            )
+            if not page:
+                break
+            rows_by_type: dict[str, list[dict[str, Any]]] = {}
+            for tombstone in page:
+                src_qn = tombstone["source_qualified_name"]
+                tgt_qn = tombstone["target_qualified_name"]
+                if src_qn and tgt_qn:
+                    rows_by_type.setdefault(_edge_type(tombstone), []).append(
+                        {"src_qn": src_qn, "tgt_qn": tgt_qn}
+                    )
+            for edge_type, rows in rows_by_type.items():
+                await _write(
+                    session,
+                    _EDGE_DELETE_CYPHER.format(edge_type=edge_type),
+                    rows,
+                    "edges_deleted",
+                    lambda row: f"edge delete {row['src_qn']} -> {row['tgt_qn']}",
+                )
+            after_seq = page[-1]["seq"]
+            if len(page) < page_size:
+                break
+
+        # 3. Changed entities
+        cursor: tuple[datetime, str] = (since, _MIN_UUID)
+        while True:
+            entities = await repository.get_entities_changed_page(
+                after_updated_at=cursor[0],
+                after_id=cursor[1],
+                until=until,
+                limit=page_size,
+            )
+            if not entities:
+                break
+            written_ids: set[str] = set()
+            for label, rows in _group_node_rows(entities).items():
+                written = await _write(
+                    session,
+                    _NODE_MERGE_CYPHER.format(label=label),
+                    rows,
+                    "nodes_written",
+                    lambda row: f"node {row['qn']}",
+                )
+                written_ids.update(row["id"] for row in written if row["id"])
+            synced_ids = [
+                entity_id
+                for entity in entities
+                if (entity_id := str(entity["id"])) in written_ids
+            ]
+            if synced_ids:
+                await repository.update_graph_synced_at(synced_ids)
+            cursor = (entities[-1]["updated_at"], str(entities[-1]["id"]))
+            if len(entities) < page_size:
+                break
+
+        # 4. Changed relationships: merge injectable, delete the rest
+        cursor = (since, _MIN_UUID)
+        while True:
+            relationships = await repository.get_relationships_changed_page(
+                after_updated_at=cursor[0],
+                after_id=cursor[1],
+                until=until,
+                limit=page_size,
+            )
+            if not relationships:
+                break
+            merge_by_type: dict[str, list[dict[str, Any]]] = {}
+            delete_by_type: dict[str, list[dict[str, Any]]] = {}
+            for rel in relationships:
+                target = merge_by_type if rel["inject_into_context"] else delete_by_type
+                target.setdefault(_edge_type(rel), []).append(
+                    _edge_row(
+                        rel,
+                        rel["source_qualified_name"],
+                        rel["target_qualified_name"],
+                    )
+                )
+            for edge_type, rows in delete_by_type.items():
+                await _write(
+                    session,
+                    _EDGE_DELETE_CYPHER.format(edge_type=edge_type),
+                    rows,
+                    "edges_deleted",
+                    lambda row: f"edge delete {row['src_qn']} -> {row['tgt_qn']}",
+                )
+            for edge_type, rows in merge_by_type.items():
+                await _write(
+                    session,
+                    _EDGE_MERGE_CYPHER.format(edge_type=edge_type),
+                    rows,
+                    "edges_written",
+                    lambda row: f"edge {row['src_qn']} -> {row['tgt_qn']}",
+                )
+            cursor = (relationships[-1]["updated_at"], str(relationships[-1]["id"]))
+            if len(relationships) < page_size:
+                break
+
+    if complete:
+        await repository.set_graph_sync_watermark(GRAPH_SYNC_KEY, until)
+        await repository.prune_graph_tombstones(until - _WATERMARK_OVERLAP)
+    else:
+        logger.warning(
+            "Incremental graph sync had write failures; high-water mark "
+            "not advanced (window will be retried)"
+        )
+
+    logger.info(
+        "Incremental graph sync complete: %d nodes, %d edges written, "
+        "%d nodes, %d edges deleted (since=%s)",
+        counts["nodes_written"],
+        counts["edges_written"],
+        counts["nodes_deleted"],
+        counts["edges_deleted"],
+        watermark,
+    )
+    return counts
+
+
+async def _write_rows(
+    session: Any,
+    cypher: str,
+    rows: Sequence[dict[str, Any]],
+    batch_size: int,
+    *,
+    describe: Callable[[dict[str, Any]], str],
+) -> list[dict[str, Any]]:
+    """Write rows with an UNWIND query through a neo4j session.
+
+    Returns:
+        Rows that were written successfully, in input order.
+    """
+
+    async def write(batch: list[dict[str, Any]]) -> object:
+        result = await session.run(cypher, rows=batch)
+        return await result.consume()
+
+    return await write_rows_batched(write, rows, batch_size, describe=describe)
+
+
 async def _rebuild_graph(driver: AsyncDriver) -> None:
     """Drop all nodes and edges, then rebuild from Postgres."""
     logger.warning("Rebuilding Memgraph graph from Postgres (full drop + replay)")
@@ -199,7 +574,140 @@ async def _rebuild_graph(driver: AsyncDriver) -> None:
     logger.info("Graph cleared — rebuilding from Postgres")
 
 
+class GraphSyncScheduler:
+    """Coalescing Postgres -> Memgraph sync trigger for the dispatch path.
+
+    request_sync() is cheap and non-blocking: it marks the graph dirty and
+    starts a background run if none is in flight. A run loops until no new
+    request arrived while it was syncing, so a burst of persisted files costs
+    one or two syncs rather than one per file, and no request is lost (each
+    run reads up to the database clock at its start).
+
+    Runs use incremental mode. A failed run is logged and recorded
+    (last_error, consecutive_failures) without advancing the high-water
+    mark, so the next requested run retries the same window; it never falls
+    back to a full snapshot sync. Snapshot syncs run only when requested via
+    request_sync(snapshot=True). The driver is created lazily from
+    memgraph_uri (or MEMGRAPH_URI) and kept for the scheduler's lifetime.
+    """
+
+    def __init__(
+        self,
+        *,
+        repository: Any,  # RepositoryCodeEntity
+        driver: AsyncDriver | None = None,
+        memgraph_uri: str | None = None,
+        batch_size: int = GRAPH_WRITE_BATCH_SIZE,
+        page_size: int = GRAPH_SYNC_PAGE_SIZE,
+    ) -> None:
+        self._repository = repository
+        self._driver = driver
+        self._owns_driver = driver is None
+        self._memgraph_uri = memgraph_uri
+        self._batch_size = batch_size
+        self._page_size = page_size
+        self._pending = False
+        self._snapshot_requested = False
+        self._task: asyncio.Task[None] | None = None
+        self._consecutive_failures = 0
+        self._last_error: Exception | None = None
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Scheduled runs that failed since the last successful one."""
+        return self._consecutive_failures
+
+    @property
+    def last_error(self) -> Exception | None:
+        """Error of the most recent scheduled run, or None if it succeeded."""
+        return self._last_error
+
+    def request_sync(self, *, snapshot: bool = False) -> None:
+        """Schedule a sync; coalesces with any run already in flight.
+
+        Args:
+            snapshot: Run a full snapshot sync instead of an incremental one
+                (e.g. an operator-triggered resync). Kept until a snapshot
+                run succeeds.
+        """
+        self._pending = True
+        self._snapshot_requested = self._snapshot_requested or snapshot
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def sync_once(self, *, snapshot: bool = False) -> dict[str, int]:
+        """Run one sync now: incremental unless snapshot is True.
+
+        Raises:
+            Exception: Propagates sync failures. An incremental failure leaves
+                the high-water mark in place, so the next run retries it.
+        """
+        driver = await self._get_driver()
+        if driver is None:
+            return {"nodes_written": 0, "edges_written": 0}
+        return await handle_graph_storage(
+            repository=self._repository,
+            driver=driver,
+            batch_size=self._batch_size,
+            incremental=not snapshot,
+            page_size=self._page_size,
+        )
+
+    async def close(self) -> None:
+        """Drain scheduled runs, then close the owned driver."""
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._owns_driver and self._driver is not None:
+            await self._driver.close()
+            self._driver = None
+
+    async def _run(self) -> None:
+        while self._pending:
+            self._pending = False
+            snapshot, self._snapshot_requested = self._snapshot_requested, False
+            try:
+                await self.sync_once(snapshot=snapshot)
+            except Exception as exc:
+                self._consecutive_failures += 1
+                self._last_error = exc
+                self._snapshot_requested = self._snapshot_requested or snapshot
+                logger.error(
+                    "%s graph sync failed (%d consecutive failures); "
+                    "the next requested sync retries it",
+                    "Snapshot" if snapshot else "Incremental",
+                    self._consecutive_failures,
+                    exc_info=True,
+                )
+            else:
+                self._consecutive_failures = 0
+                self._last_error = None
+
+    async def _get_driver(self) -> AsyncDriver | None:
+        if self._driver is not None:
+            return self._driver
+        uri = self._memgraph_uri or os.environ.get("MEMGRAPH_URI")
+        if not uri:
+            logger.debug("MEMGRAPH_URI not set — skipping graph sync")
+            return None
+        driver = AsyncGraphDatabase.driver(uri)
+        try:
+            await driver.verify_connectivity()
+        except Exception:
+            await driver.close()
+            logger.warning("Memgraph unavailable at %s — skipping graph sync", uri)
+            return None
+        self._driver = driver
+        return driver
+
+
 __all__ = [
     "ENTITY_TYPE_TO_LABEL",
+    "GRAPH_SYNC_KEY",
+    "GRAPH_SYNC_PAGE_SIZE",
+    "GRAPH_WRITE_BATCH_SIZE",
+    "GraphSyncScheduler",
+    "edge_merge_writes",
     "handle_graph_storage",
+    "node_merge_writes",
 ]
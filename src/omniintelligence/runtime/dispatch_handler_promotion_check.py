@@ -6,12 +6,17 @@ Routes promotion-check-requested commands to the auto-promote handler,
 which evaluates all candidate and provisional patterns against promotion
 gates (including the bootstrap path for cold-start patterns).
 
+Eligible patterns are promoted in chunks of PROMOTION_CHUNK_SIZE, with up to
+PROMOTION_MAX_CONCURRENCY transitions in flight per chunk. The runtime
+repository is pool-backed, so concurrent transitions each get a connection.
+
 Reference: OMN-5498 - Create promotion-check dispatch handler.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
@@ -32,6 +37,26 @@ DISPATCH_ALIAS_PROMOTION_CHECK = canonical_topic_to_dispatch_alias(
 )
 """Dispatch-compatible alias for promotion-check commands."""
 
+try:
+    PROMOTION_CHUNK_SIZE: int = max(
+        1, int(os.environ.get("INTELLIGENCE_PROMOTION_CHUNK_SIZE", "100"))
+    )
+except ValueError:
+    PROMOTION_CHUNK_SIZE = 100
+"""Eligible patterns per gate snapshot query and transition batch.
+
+Configurable via INTELLIGENCE_PROMOTION_CHUNK_SIZE environment variable."""
+
+try:
+    PROMOTION_MAX_CONCURRENCY: int = max(
+        1, int(os.environ.get("INTELLIGENCE_PROMOTION_MAX_CONCURRENCY", "4"))
+    )
+except ValueError:
+    PROMOTION_MAX_CONCURRENCY = 4
+"""Maximum lifecycle transitions in flight within a promotion chunk.
+
+Configurable via INTELLIGENCE_PROMOTION_MAX_CONCURRENCY environment variable."""
+
 
 def create_promotion_check_dispatch_handler(
     *,
@@ -39,6 +64,8 @@ def create_promotion_check_dispatch_handler(
     idempotency_store: ProtocolIdempotencyStore | None = None,
     kafka_producer: ProtocolKafkaPublisher | None = None,
     publish_topic: str | None = None,
+    chunk_size: int = PROMOTION_CHUNK_SIZE,
+    max_concurrency: int = PROMOTION_MAX_CONCURRENCY,
 ) -> Any:  # any-ok: dispatch handler callable
     """Create a dispatch handler that runs the auto-promotion check.
 
@@ -50,10 +77,20 @@ def create_promotion_check_dispatch_handler(
         idempotency_store: Optional idempotency store for transition dedup.
         kafka_producer: Optional Kafka publisher for transition events.
         publish_topic: Optional topic override for transition events.
+        chunk_size: Eligible patterns per gate snapshot query and
+            transition batch.
+        max_concurrency: Maximum transitions in flight within a chunk.
 
     Returns:
         Async handler function compatible with MessageDispatchEngine.
+
+    Raises:
+        ValueError: If chunk_size or max_concurrency < 1.
     """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
 
     async def handle(
         envelope: Any,  # any-ok: ModelEventEnvelope[object]
@@ -94,6 +131,8 @@ def create_promotion_check_dispatch_handler(
             producer=producer,  # type: ignore[arg-type]
             correlation_id=correlation_id,
             publish_topic=publish_topic,
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
         )
 
         logger.info(
@@ -118,5 +157,7 @@ def create_promotion_check_dispatch_handler(
 
 __all__ = [
     "DISPATCH_ALIAS_PROMOTION_CHECK",
+    "PROMOTION_CHUNK_SIZE",
+    "PROMOTION_MAX_CONCURRENCY",
     "create_promotion_check_dispatch_handler",
 ]
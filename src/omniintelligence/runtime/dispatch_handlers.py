@@ -31,6 +31,7 @@ Related:
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import json
 import logging
@@ -38,7 +39,7 @@ import os
 import time
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal
 from uuid import UUID, uuid4
 
 from omnibase_core.enums.enum_execution_shape import EnumMessageCategory
@@ -61,9 +62,15 @@ from omniintelligence.nodes.node_pattern_compliance_effect.handlers.protocols im
     ProtocolLlmClient,
 )
 from omniintelligence.runtime.contract_topics import canonical_topic_to_dispatch_alias
+from omniintelligence.runtime.lifecycle_emitter import BufferedLifecycleEmitter
 from omniintelligence.topics import IntelligenceCommandTopic, IntentTopic
 from omniintelligence.utils.log_sanitizer import get_log_sanitizer
 
+if TYPE_CHECKING:
+    from omniintelligence.nodes.node_pattern_feedback_effect.handlers import (
+        SessionOutcomeAggregator,
+    )
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -859,11 +866,29 @@ def create_claude_hook_dispatch_handler(
 # Bridge Handler: Session Outcome
 # =============================================================================
 
+SESSION_OUTCOME_COALESCE_MS: float = 0.0
+"""Window over which session outcomes are coalesced into set-based writes.
+
+0 (the default) records each session outcome with its own statements. A
+positive value routes outcomes through a SessionOutcomeAggregator, which pays
+off when outcomes are dispatched concurrently (see
+OMNIINTELLIGENCE_DISPATCH_MICRO_BATCH).
+
+Configurable via INTELLIGENCE_SESSION_OUTCOME_COALESCE_MS environment variable.
+"""
+try:
+    SESSION_OUTCOME_COALESCE_MS = max(
+        0.0, float(os.environ.get("INTELLIGENCE_SESSION_OUTCOME_COALESCE_MS", "0"))
+    )
+except ValueError:
+    SESSION_OUTCOME_COALESCE_MS = 0.0
+
 
 def create_session_outcome_dispatch_handler(
     *,
     repository: ProtocolPatternRepository,
     correlation_id: UUID | None = None,
+    aggregator: SessionOutcomeAggregator | None = None,
 ) -> Callable[
     [ModelEventEnvelope[object], ProtocolHandlerContext],
     Awaitable[str],
@@ -877,6 +902,9 @@ def create_session_outcome_dispatch_handler(
     Args:
         repository: REQUIRED database repository for pattern feedback recording.
         correlation_id: Optional fixed correlation ID for tracing.
+        aggregator: Optional write-coalescing aggregator shared by all
+            invocations of the handler. When None, each session outcome is
+            recorded with its own statements.
 
     Returns:
         Async handler function with signature (envelope, context) -> str.
@@ -961,6 +989,7 @@ def create_session_outcome_dispatch_handler(
             failure_reason=failure_reason,
             repository=repository,
             correlation_id=ctx_correlation_id,
+            aggregator=aggregator,
         )
 
         logger.info(
@@ -1648,6 +1677,265 @@ try:
 except ValueError:
     _PROJECTION_THROTTLE_SECONDS = 60.0
 
+_PROJECTION_MODE: str = (
+    os.environ.get("INTELLIGENCE_PROJECTION_MODE", "snapshot").strip().lower()
+)
+"""Projection publishing mode: "snapshot" (default) or "delta".
+
+snapshot: every lifecycle trigger publishes a full materialized snapshot.
+delta: triggers are coalesced over a debounce window and only changed
+patterns are published to the compacted pattern-projection-delta topic;
+full snapshots become periodic rebuilds (see PatternProjectionCoalescer).
+
+Configurable via INTELLIGENCE_PROJECTION_MODE environment variable.
+"""
+
+try:
+    _PROJECTION_DEBOUNCE_SECONDS: float = max(
+        0.0, float(os.environ.get("INTELLIGENCE_PROJECTION_DEBOUNCE_SECONDS", "2.0"))
+    )
+except ValueError:
+    _PROJECTION_DEBOUNCE_SECONDS = 2.0
+"""Delta mode: quiet period after the first trigger before a flush.
+
+Configurable via INTELLIGENCE_PROJECTION_DEBOUNCE_SECONDS environment variable.
+"""
+
+try:
+    _PROJECTION_SNAPSHOT_INTERVAL_SECONDS: float = max(
+        1.0,
+        float(
+            os.environ.get("INTELLIGENCE_PROJECTION_SNAPSHOT_INTERVAL_SECONDS", "900")
+        ),
+    )
+except ValueError:
+    _PROJECTION_SNAPSHOT_INTERVAL_SECONDS = 900.0
+"""Delta mode: minimum interval between full snapshot rebuilds.
+
+Configurable via INTELLIGENCE_PROJECTION_SNAPSHOT_INTERVAL_SECONDS environment
+variable.
+"""
+
+
+def _projection_trigger_fields(
+    payload: object,
+) -> tuple[str, UUID | None, UUID | None]:
+    """Extract (event_type, pattern_id, correlation_id) from a lifecycle payload.
+
+    The payload is any lifecycle event; only the routing fields are read.
+    Missing or malformed fields come back as "unknown" / None.
+    """
+    trigger_event_type = "unknown"
+    triggering_pattern_id: UUID | None = None
+    payload_correlation_id: UUID | None = None
+
+    if isinstance(payload, dict):
+        raw_event_type = payload.get("event_type")
+        if raw_event_type is not None:
+            trigger_event_type = str(raw_event_type)
+
+        raw_pattern_id = payload.get("pattern_id")
+        if raw_pattern_id is not None:
+            with contextlib.suppress(ValueError, AttributeError):
+                triggering_pattern_id = UUID(str(raw_pattern_id))
+
+        raw_corr = payload.get("correlation_id")
+        if raw_corr is not None:
+            with contextlib.suppress(ValueError, AttributeError):
+                payload_correlation_id = UUID(str(raw_corr))
+
+    return trigger_event_type, triggering_pattern_id, payload_correlation_id
+
+
+class PatternProjectionCoalescer:
+    """Debounced delta-projection dispatch handler.
+
+    Lifecycle triggers are buffered by pattern id. The first trigger after a
+    flush starts a ``debounce_seconds`` timer; when it fires, every pattern
+    touched in the window is projected once via publish_projection_delta,
+    which publishes only patterns whose projected state changed to the
+    compacted delta topic (keyed by pattern id).
+
+    Full snapshots are rebuilds rather than per-event output. A flush also
+    publishes a snapshot when:
+
+    - it is the first flush since startup (seeds consumers and the
+      last-published state used to suppress unchanged deltas),
+    - ``snapshot_interval_seconds`` have passed since the last snapshot, or
+    - a trigger without a pattern id arrived (explicit rebuild).
+
+    A snapshot that could not be queried or published stays due and is
+    retried on the next flush. Until the first snapshot succeeds, deltas are
+    not suppressed: every touched pattern is published, removals included. Each flush takes the next projection sequence
+    (next_projection_sequence) for its deltas and its snapshot.
+
+    Triggers still buffered at shutdown are not lost for consumers: the first
+    flush after restart publishes a snapshot. Call ``flush()`` to publish
+    buffered triggers immediately.
+    """
+
+    def __init__(
+        self,
+        *,
+        pattern_query_store: ProtocolPatternQueryStore,
+        kafka_producer: ProtocolKafkaPublisher | None,
+        snapshot_topic: str | None,
+        delta_topic: str,
+        debounce_seconds: float = _PROJECTION_DEBOUNCE_SECONDS,
+        snapshot_interval_seconds: float = _PROJECTION_SNAPSHOT_INTERVAL_SECONDS,
+        correlation_id: UUID | None = None,
+    ) -> None:
+        if debounce_seconds < 0:
+            raise ValueError(f"debounce_seconds must be >= 0, got {debounce_seconds}")
+        if snapshot_interval_seconds <= 0:
+            raise ValueError(
+                "snapshot_interval_seconds must be > 0, "
+                f"got {snapshot_interval_seconds}"
+            )
+        self._pattern_query_store = pattern_query_store
+        self._kafka_producer = kafka_producer
+        self._snapshot_topic = snapshot_topic
+        self._delta_topic = delta_topic
+        self._debounce_seconds = debounce_seconds
+        self._snapshot_interval_seconds = snapshot_interval_seconds
+        self._correlation_id = correlation_id
+        # Insertion-ordered set of touched pattern ids.
+        self._pending: dict[UUID, None] = {}
+        self._pending_correlation_id: UUID | None = None
+        self._rebuild_requested = False
+        self._last_published: dict[UUID, Any] = {}  # any-ok: ModelPatternSummary
+        self._last_snapshot_at: float | None = None
+        self._sequence = 0
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_flushes: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of distinct patterns buffered for the next flush."""
+        return len(self._pending)
+
+    async def __call__(
+        self,
+        envelope: ModelEventEnvelope[object],
+        context: ProtocolHandlerContext,
+    ) -> str:
+        """Dispatch handler: buffer the trigger and arm the debounce timer."""
+        trigger_event_type, pattern_id, payload_correlation_id = (
+            _projection_trigger_fields(envelope.payload)
+        )
+        self._pending_correlation_id = (
+            payload_correlation_id
+            or self._correlation_id
+            or getattr(context, "correlation_id", None)
+            or self._pending_correlation_id
+        )
+        if pattern_id is None:
+            self._rebuild_requested = True
+        else:
+            self._pending[pattern_id] = None
+
+        logger.debug(
+            "Pattern projection trigger buffered "
+            "(trigger=%s, pattern_id=%s, pending=%d, correlation_id=%s)",
+            trigger_event_type,
+            pattern_id,
+            len(self._pending),
+            self._pending_correlation_id,
+        )
+
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._debounce_seconds, self._on_timer
+            )
+        return "ok"
+
+    async def flush(self) -> None:
+        """Project buffered triggers now and wait for in-flight flushes."""
+        await self._flush_pending()
+        if self._timer_flushes:
+            await asyncio.gather(*self._timer_flushes)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self._flush_pending())
+        self._timer_flushes.add(task)
+        task.add_done_callback(self._timer_flushes.discard)
+
+    async def _flush_pending(self) -> None:
+        from omniintelligence.nodes.node_pattern_projection_effect.handlers import (
+            next_projection_sequence,
+            publish_projection,
+            publish_projection_delta,
+        )
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        async with self._flush_lock:
+            pattern_ids, self._pending = list(self._pending), {}
+            rebuild, self._rebuild_requested = self._rebuild_requested, False
+            flush_correlation_id = self._pending_correlation_id or uuid4()
+            snapshot_due = (
+                rebuild
+                or self._last_snapshot_at is None
+                or time.monotonic() - self._last_snapshot_at
+                >= self._snapshot_interval_seconds
+            )
+            if not pattern_ids and not snapshot_due:
+                return
+            self._sequence = next_projection_sequence(self._sequence)
+
+            # Deltas first, against the state consumers last saw, so the
+            # compacted topic stays current even when a snapshot follows.
+            # Until a snapshot has been published that state is unknown (the
+            # compacted topic may still hold upserts from before a restart),
+            # so every touched pattern is published, removals included.
+            deltas = await publish_projection_delta(
+                pattern_query_store=self._pattern_query_store,
+                producer=self._kafka_producer,
+                pattern_ids=pattern_ids,
+                correlation_id=flush_correlation_id,
+                publish_topic=self._delta_topic,
+                sequence=self._sequence,
+                last_published=(
+                    self._last_published if self._last_snapshot_at is not None else None
+                ),
+            )
+
+            snapshot_published = False
+            if snapshot_due:
+                snapshot, snapshot_published = await publish_projection(
+                    pattern_query_store=self._pattern_query_store,
+                    producer=self._kafka_producer,
+                    correlation_id=flush_correlation_id,
+                    publish_topic=self._snapshot_topic,
+                    trigger_event_type="ProjectionRebuild",
+                    sequence=self._sequence,
+                )
+                if snapshot_published:
+                    self._last_published = {
+                        pattern.id: pattern for pattern in snapshot.patterns
+                    }
+                    self._last_snapshot_at = time.monotonic()
+                elif rebuild:
+                    # First-flush and interval snapshots stay due through
+                    # _last_snapshot_at; keep an explicit rebuild due too.
+                    self._rebuild_requested = True
+
+            logger.info(
+                "Pattern projection flush complete (touched=%d, deltas=%d, "
+                "snapshot=%s, snapshot_published=%s, sequence=%d, "
+                "correlation_id=%s)",
+                len(pattern_ids),
+                len(deltas),
+                snapshot_due,
+                snapshot_published,
+                self._sequence,
+                flush_correlation_id,
+            )
+
 
 def create_pattern_projection_dispatch_handler(
     *,
@@ -1655,6 +1943,9 @@ def create_pattern_projection_dispatch_handler(
     kafka_producer: ProtocolKafkaPublisher | None = None,
     publish_topic: str | None = None,
     correlation_id: UUID | None = None,
+    delta_topic: str | None = None,
+    debounce_seconds: float = _PROJECTION_DEBOUNCE_SECONDS,
+    snapshot_interval_seconds: float = _PROJECTION_SNAPSHOT_INTERVAL_SECONDS,
 ) -> Callable[
     [ModelEventEnvelope[object], ProtocolHandlerContext],
     Awaitable[str],
@@ -1670,11 +1961,19 @@ def create_pattern_projection_dispatch_handler(
     excessive snapshots during bulk extraction. Lifecycle events
     (promoted, transitioned) always trigger immediately.
 
+    When delta_topic is given, returns a PatternProjectionCoalescer instead:
+    triggers are debounced and only changed patterns are published as deltas,
+    with full snapshots as periodic rebuilds.
+
     Args:
         pattern_query_store: REQUIRED store for querying all validated patterns.
         kafka_producer: Optional Kafka producer (graceful degradation if absent).
         publish_topic: Full topic for projection events (from contract).
         correlation_id: Optional fixed correlation ID for tracing.
+        delta_topic: Compacted topic for per-pattern deltas. Enables delta mode.
+        debounce_seconds: Delta mode coalescing window.
+        snapshot_interval_seconds: Delta mode minimum interval between
+            full snapshot rebuilds.
 
     Returns:
         Async handler function with signature (envelope, context) -> str.
@@ -1683,6 +1982,17 @@ def create_pattern_projection_dispatch_handler(
         OMN-2424: Pattern projection snapshot publisher
         OMN-5611: Wire pattern-stored events to projection handler
     """
+    if delta_topic is not None:
+        return PatternProjectionCoalescer(
+            pattern_query_store=pattern_query_store,
+            kafka_producer=kafka_producer,
+            snapshot_topic=publish_topic,
+            delta_topic=delta_topic,
+            debounce_seconds=debounce_seconds,
+            snapshot_interval_seconds=snapshot_interval_seconds,
+            correlation_id=correlation_id,
+        )
+
     import time as _time
 
     _last_projection_time: list[float] = [0.0]  # mutable container for closure
@@ -1700,28 +2010,14 @@ def create_pattern_projection_dispatch_handler(
             correlation_id or getattr(context, "correlation_id", None) or uuid4()
         )
 
-        payload = envelope.payload
-
         # Extract optional fields for logging context -- payload is any lifecycle event.
         # We don't parse the full model; we just need the routing fields for tracing.
-        trigger_event_type = "unknown"
-        triggering_pattern_id: UUID | None = None
-
-        if isinstance(payload, dict):
-            raw_event_type = payload.get("event_type")
-            if raw_event_type is not None:
-                trigger_event_type = str(raw_event_type)
-
-            raw_pattern_id = payload.get("pattern_id")
-            if raw_pattern_id is not None:
-                with contextlib.suppress(ValueError, AttributeError):
-                    triggering_pattern_id = UUID(str(raw_pattern_id))
-
-            # Extract correlation_id from payload if available (override ctx fallback)
-            raw_corr = payload.get("correlation_id")
-            if raw_corr is not None:
-                with contextlib.suppress(ValueError, AttributeError):
-                    ctx_correlation_id = UUID(str(raw_corr))
+        trigger_event_type, triggering_pattern_id, payload_correlation_id = (
+            _projection_trigger_fields(envelope.payload)
+        )
+        # correlation_id from payload, if available, overrides the ctx fallback
+        if payload_correlation_id is not None:
+            ctx_correlation_id = payload_correlation_id
 
         # Throttle pattern-stored triggers to avoid excessive snapshots
         # during bulk pattern extraction. Lifecycle events (promoted,
@@ -2088,6 +2384,9 @@ def create_intelligence_dispatch_engine(
     bolt_handler: Any = None,
     code_entity_store: Any = None,
     debug_store: Any = None,
+    code_entity_repository: Any = None,
+    graph_sync: Any = None,
+    code_embed_graph_handler: Any = None,
 ) -> MessageDispatchEngine:
     """Create and configure a MessageDispatchEngine for Intelligence domain.
 
@@ -2120,6 +2419,13 @@ def create_intelligence_dispatch_engine(
         llm_client: Optional LLM client (ProtocolLlmClient) for compliance
             evaluation (OMN-2339). When None, compliance-evaluate commands
             are still registered but will return LLM-error results.
+        code_entity_repository: Optional RepositoryCodeEntity used by the
+            code-persist handler.
+        graph_sync: Optional GraphSyncScheduler triggered by the code-persist
+            handler after each committed file (incremental Memgraph sync).
+        code_embed_graph_handler: Optional CodeEmbedGraphHandler owned (and
+            closed) by the caller. When None, one is created from
+            qdrant_client and bolt_handler.
 
     Returns:
         Frozen MessageDispatchEngine ready for dispatch.
@@ -2169,8 +2475,19 @@ def create_intelligence_dispatch_engine(
     )
 
     # --- Handler 2: session-outcome ---
+    session_outcome_aggregator: SessionOutcomeAggregator | None = None
+    if SESSION_OUTCOME_COALESCE_MS > 0:
+        from omniintelligence.nodes.node_pattern_feedback_effect.handlers import (
+            SessionOutcomeAggregator,
+        )
+
+        session_outcome_aggregator = SessionOutcomeAggregator(
+            repository,
+            window_ms=SESSION_OUTCOME_COALESCE_MS,
+        )
     session_outcome_handler = create_session_outcome_dispatch_handler(
         repository=repository,
+        aggregator=session_outcome_aggregator,
     )
     engine.register_handler(
         handler_id="intelligence-session-outcome-handler",
@@ -2335,6 +2652,11 @@ def create_intelligence_dispatch_engine(
             pattern_query_store=_projection_store,
             kafka_producer=kafka_producer,
             publish_topic=topics.get("pattern_projection"),
+            delta_topic=(
+                topics.get("pattern_projection_delta")
+                if _PROJECTION_MODE == "delta"
+                else None
+            ),
         )
         engine.register_handler(
             handler_id="intelligence-pattern-projection-handler",
@@ -2610,7 +2932,10 @@ def create_intelligence_dispatch_engine(
         create_code_persist_dispatch_handler,
     )
 
-    code_persist_handler = create_code_persist_dispatch_handler()
+    code_persist_handler = create_code_persist_dispatch_handler(
+        repository=code_entity_repository,
+        graph_sync=graph_sync,
+    )
     engine.register_handler(
         handler_id="intelligence-code-persist-handler",
         handler=code_persist_handler,
@@ -2640,10 +2965,11 @@ def create_intelligence_dispatch_engine(
         create_code_embed_graph_dispatch_handler,
     )
 
-    code_embed_graph_handler = create_code_embed_graph_dispatch_handler(
-        qdrant_client=qdrant_client,
-        bolt_handler=bolt_handler,
-    )
+    if code_embed_graph_handler is None:
+        code_embed_graph_handler = create_code_embed_graph_dispatch_handler(
+            qdrant_client=qdrant_client,
+            bolt_handler=bolt_handler,
+        )
     engine.register_handler(
         handler_id="intelligence-code-embed-graph-handler",
         handler=code_embed_graph_handler,
@@ -3209,111 +3535,106 @@ def create_intelligence_dispatch_engine(
 # =============================================================================
 
 
-def create_dispatch_callback(
+_SettleAction = Literal["ack", "nack"]
+"""Outcome of processing one event bus message: acknowledge or redeliver."""
+
+
+async def _dispatch_message(
+    msg: object,
+    *,
     engine: MessageDispatchEngine,
     dispatch_topic: str,
-    *,
-    correlation_id: UUID | None = None,
-    kafka_producer: ProtocolKafkaPublisher | None = None,
-) -> Callable[[object], Awaitable[None]]:
-    """Create an event bus callback that routes messages through the dispatch engine.
+    correlation_id: UUID | None,
+    lifecycle_emitter: BufferedLifecycleEmitter | None,
+) -> _SettleAction:
+    """Decode, dispatch, and classify one event bus message.
 
-    The callback:
-    1. Deserializes the raw message value from bytes to dict
-    2. Wraps it in a ModelEventEnvelope with category derived from dispatch_topic
-    3. Calls engine.dispatch() with the dispatch-compatible topic alias
-    4. Acks the message on success, nacks on failure
+    Shared by the per-message and micro-batched callbacks. Never raises:
+    every failure is logged and mapped to an ack (permanent) or nack
+    (transient) decision, which the caller applies via _settle_message().
 
     Args:
+        msg: Raw event bus message (or plain dict from the in-memory bus).
         engine: Frozen MessageDispatchEngine.
         dispatch_topic: Dispatch-compatible topic alias to pass to dispatch().
         correlation_id: Optional fixed correlation ID for tracing.
+        lifecycle_emitter: Optional buffered emitter for operation lifecycle
+            events (OMN-6125). Enqueueing never waits on Kafka.
 
     Returns:
-        Async callback compatible with event bus subscribe(on_message=...).
+        "ack" when the message must not be redelivered, "nack" otherwise.
     """
+    msg_correlation_id = correlation_id or uuid4()
 
-    async def _on_message(msg: object) -> None:
-        """Event bus callback: raw message -> dispatch engine."""
-        msg_correlation_id = correlation_id or uuid4()
-
-        try:
-            # Extract raw value from message
-            if hasattr(msg, "value"):
-                raw_value = msg.value
-                if isinstance(raw_value, bytes | bytearray):
-                    try:
-                        decoded_value = raw_value.decode("utf-8")
-                    except UnicodeDecodeError as ude:
-                        # Invalid UTF-8 will never become valid on retry --
-                        # ACK to prevent infinite redelivery.
-                        safe_preview = get_log_sanitizer().sanitize(
-                            repr(raw_value[:200])
-                        )
-                        logger.error(
-                            "Invalid UTF-8 in message body, ACKing to "
-                            "prevent infinite retry (error=%s, "
-                            "raw_preview=%s, correlation_id=%s). "
-                            "Message discarded (permanent parse failure).",
-                            ude,
-                            safe_preview,
-                            msg_correlation_id,
-                        )
-                        if hasattr(msg, "ack"):
-                            await msg.ack()
-                        return
-                    payload_dict = json.loads(decoded_value)
-                elif isinstance(raw_value, str):
-                    payload_dict = json.loads(raw_value)
-                elif isinstance(raw_value, dict):
-                    payload_dict = raw_value
-                else:
-                    logger.warning(
-                        "Unexpected message value type %s (correlation_id=%s)",
-                        type(raw_value).__name__,
+    try:
+        # Extract raw value from message
+        if hasattr(msg, "value"):
+            raw_value = msg.value
+            if isinstance(raw_value, bytes | bytearray):
+                try:
+                    decoded_value = raw_value.decode("utf-8")
+                except UnicodeDecodeError as ude:
+                    # Invalid UTF-8 will never become valid on retry --
+                    # ACK to prevent infinite redelivery.
+                    safe_preview = get_log_sanitizer().sanitize(repr(raw_value[:200]))
+                    logger.error(
+                        "Invalid UTF-8 in message body, ACKing to "
+                        "prevent infinite retry (error=%s, "
+                        "raw_preview=%s, correlation_id=%s). "
+                        "Message discarded (permanent parse failure).",
+                        ude,
+                        safe_preview,
                         msg_correlation_id,
                     )
-                    if hasattr(msg, "nack"):
-                        await msg.nack()
-                    return
-            elif isinstance(msg, dict):
-                payload_dict = msg
+                    return "ack"
+                payload_dict = json.loads(decoded_value)
+            elif isinstance(raw_value, str):
+                payload_dict = json.loads(raw_value)
+            elif isinstance(raw_value, dict):
+                payload_dict = raw_value
             else:
                 logger.warning(
-                    "Unexpected message type %s (correlation_id=%s)",
-                    type(msg).__name__,
+                    "Unexpected message value type %s (correlation_id=%s)",
+                    type(raw_value).__name__,
                     msg_correlation_id,
                 )
-                if hasattr(msg, "nack"):
-                    await msg.nack()
-                return
-
-            # Extract correlation_id from payload if available
-            payload_correlation_id = payload_dict.get("correlation_id")
-            if payload_correlation_id:
-                with contextlib.suppress(ValueError, AttributeError):
-                    msg_correlation_id = UUID(str(payload_correlation_id))
-
-            # Derive message category from dispatch_topic so EVENT topics
-            # produce EVENT envelopes (not hard-coded COMMAND).
-            topic_category = EnumMessageCategory.from_topic(dispatch_topic)
-            envelope: ModelEventEnvelope[object] = ModelEventEnvelope(
-                payload=payload_dict,
-                correlation_id=msg_correlation_id,
-                event_type=dispatch_topic,
-                metadata=ModelEnvelopeMetadata(
-                    tags={
-                        "message_category": topic_category.value
-                        if topic_category
-                        else "command",
-                    },
-                ),
+                return "nack"
+        elif isinstance(msg, dict):
+            payload_dict = msg
+        else:
+            logger.warning(
+                "Unexpected message type %s (correlation_id=%s)",
+                type(msg).__name__,
+                msg_correlation_id,
             )
+            return "nack"
+
+        # Extract correlation_id from payload if available
+        payload_correlation_id = payload_dict.get("correlation_id")
+        if payload_correlation_id:
+            with contextlib.suppress(ValueError, AttributeError):
+                msg_correlation_id = UUID(str(payload_correlation_id))
+
+        # Derive message category from dispatch_topic so EVENT topics
+        # produce EVENT envelopes (not hard-coded COMMAND).
+        topic_category = EnumMessageCategory.from_topic(dispatch_topic)
+        envelope: ModelEventEnvelope[object] = ModelEventEnvelope(
+            payload=payload_dict,
+            correlation_id=msg_correlation_id,
+            event_type=dispatch_topic,
+            metadata=ModelEnvelopeMetadata(
+                tags={
+                    "message_category": topic_category.value
+                    if topic_category
+                    else "command",
+                },
+            ),
+        )
 
-            # OMN-6125: Emit operation-started lifecycle event
-            operation_id = str(uuid4())
-            await _emit_operation_started(
-                kafka_producer=kafka_producer,
+        # OMN-6125: Emit operation-started lifecycle event
+        operation_id = str(uuid4())
+        if lifecycle_emitter is not None:
+            await lifecycle_emitter.started(
                 operation_id=operation_id,
                 operation_type=dispatch_topic,
                 correlation_id=str(msg_correlation_id),
@@ -3322,187 +3643,362 @@ def create_dispatch_callback(
                 else None,
             )
 
-            # Dispatch through the engine
-            dispatch_start = time.perf_counter()
-            result = await engine.dispatch(
-                topic=dispatch_topic,
-                envelope=envelope,
-            )
-            dispatch_duration_ms = int((time.perf_counter() - dispatch_start) * 1000)
+        # Dispatch through the engine
+        dispatch_start = time.perf_counter()
+        result = await engine.dispatch(
+            topic=dispatch_topic,
+            envelope=envelope,
+        )
+        dispatch_duration_ms = int((time.perf_counter() - dispatch_start) * 1000)
 
-            # OMN-6125: Emit operation-completed lifecycle event
-            dispatch_status = "success" if result.is_successful() else "failure"
-            await _emit_operation_completed(
-                kafka_producer=kafka_producer,
+        # OMN-6125: Emit operation-completed lifecycle event
+        if lifecycle_emitter is not None:
+            await lifecycle_emitter.completed(
                 operation_id=operation_id,
                 operation_type=dispatch_topic,
                 correlation_id=str(msg_correlation_id),
-                status=dispatch_status,
+                status="success" if result.is_successful() else "failure",
                 duration_ms=dispatch_duration_ms,
             )
 
-            logger.debug(
-                "Dispatch result: status=%s, handler=%s, duration=%.2fms "
-                "(correlation_id=%s)",
-                result.status,
-                result.handler_id,
-                result.duration_ms,
-                msg_correlation_id,
-            )
+        logger.debug(
+            "Dispatch result: status=%s, handler=%s, duration=%.2fms "
+            "(correlation_id=%s)",
+            result.status,
+            result.handler_id,
+            result.duration_ms,
+            msg_correlation_id,
+        )
 
-            # Gate ack/nack on dispatch status.
-            # Distinguish permanent failures (structural reshape errors that
-            # will never succeed on retry) from transient failures (DB errors,
-            # network issues).  Permanent failures are ACK'd with an ERROR log
-            # to prevent infinite NACK loops (GAP-9, OMN-2423).
-            if result.is_successful():
-                if hasattr(msg, "ack"):
-                    await msg.ack()
-            else:
-                error_msg = result.error_message or ""
-                is_permanent = _is_permanent_dispatch_failure(error_msg)
-                if is_permanent:
-                    logger.error(
-                        "Permanent dispatch failure, ACKing to prevent NACK loop "
-                        "(status=%s, error=%s, correlation_id=%s). "
-                        "Message discarded (permanent parse/reshape failure).",
-                        result.status,
-                        error_msg,
-                        msg_correlation_id,
-                    )
-                    if hasattr(msg, "ack"):
-                        await msg.ack()
-                else:
-                    logger.warning(
-                        "Transient dispatch failure, nacking message for retry "
-                        "(status=%s, error=%s, correlation_id=%s)",
-                        result.status,
-                        error_msg,
-                        msg_correlation_id,
-                    )
-                    if hasattr(msg, "nack"):
-                        await msg.nack()
-
-        except json.JSONDecodeError as e:
-            # Malformed JSON will never succeed on retry -- ACK to prevent
-            # infinite redelivery. Log truncated raw bytes for diagnosis.
-            raw_preview = ""
-            if hasattr(msg, "value"):
-                raw_bytes = msg.value
-                if isinstance(raw_bytes, bytes | bytearray):
-                    raw_preview = repr(raw_bytes[:200])
-                elif isinstance(raw_bytes, str):
-                    raw_preview = raw_bytes[:200]
-            sanitized_preview = get_log_sanitizer().sanitize(raw_preview)
+        # Gate ack/nack on dispatch status.
+        # Distinguish permanent failures (structural reshape errors that
+        # will never succeed on retry) from transient failures (DB errors,
+        # network issues).  Permanent failures are ACK'd with an ERROR log
+        # to prevent infinite NACK loops (GAP-9, OMN-2423).
+        if result.is_successful():
+            return "ack"
+
+        error_msg = result.error_message or ""
+        if _is_permanent_dispatch_failure(error_msg):
             logger.error(
-                "Malformed JSON in message body, ACKing to prevent infinite retry "
-                "(error=%s, raw_preview=%s, correlation_id=%s). "
-                "Message discarded (permanent parse failure).",
-                e,
-                sanitized_preview,
+                "Permanent dispatch failure, ACKing to prevent NACK loop "
+                "(status=%s, error=%s, correlation_id=%s). "
+                "Message discarded (permanent parse/reshape failure).",
+                result.status,
+                error_msg,
                 msg_correlation_id,
             )
-            if hasattr(msg, "ack"):
-                await msg.ack()
+            return "ack"
 
-        except Exception as e:
-            logger.exception(
-                "Failed to dispatch message via engine: %s (correlation_id=%s)",
-                get_log_sanitizer().sanitize(str(e)),
-                msg_correlation_id,
-            )
-            if hasattr(msg, "nack"):
-                await msg.nack()
+        logger.warning(
+            "Transient dispatch failure, nacking message for retry "
+            "(status=%s, error=%s, correlation_id=%s)",
+            result.status,
+            error_msg,
+            msg_correlation_id,
+        )
+        return "nack"
+
+    except json.JSONDecodeError as e:
+        # Malformed JSON will never succeed on retry -- ACK to prevent
+        # infinite redelivery. Log truncated raw bytes for diagnosis.
+        raw_preview = ""
+        if hasattr(msg, "value"):
+            raw_bytes = msg.value
+            if isinstance(raw_bytes, bytes | bytearray):
+                raw_preview = repr(raw_bytes[:200])
+            elif isinstance(raw_bytes, str):
+                raw_preview = raw_bytes[:200]
+        sanitized_preview = get_log_sanitizer().sanitize(raw_preview)
+        logger.error(
+            "Malformed JSON in message body, ACKing to prevent infinite retry "
+            "(error=%s, raw_preview=%s, correlation_id=%s). "
+            "Message discarded (permanent parse failure).",
+            e,
+            sanitized_preview,
+            msg_correlation_id,
+        )
+        return "ack"
+
+    except Exception as e:
+        logger.exception(
+            "Failed to dispatch message via engine: %s (correlation_id=%s)",
+            get_log_sanitizer().sanitize(str(e)),
+            msg_correlation_id,
+        )
+        return "nack"
+
+
+async def _settle_message(msg: object, action: _SettleAction) -> None:
+    """Apply an ack/nack decision if the message supports it."""
+    settle = getattr(msg, action, None)
+    if settle is not None:
+        await settle()
+
+
+def create_dispatch_callback(
+    engine: MessageDispatchEngine,
+    dispatch_topic: str,
+    *,
+    correlation_id: UUID | None = None,
+    lifecycle_emitter: BufferedLifecycleEmitter | None = None,
+) -> Callable[[object], Awaitable[None]]:
+    """Create an event bus callback that routes messages through the dispatch engine.
+
+    The callback:
+    1. Deserializes the raw message value from bytes to dict
+    2. Wraps it in a ModelEventEnvelope with category derived from dispatch_topic
+    3. Calls engine.dispatch() with the dispatch-compatible topic alias
+    4. Acks the message on success, nacks on failure
+
+    Operation lifecycle events are queued on a BufferedLifecycleEmitter and
+    published in the background, so dispatch latency does not depend on the
+    lifecycle topics.
+
+    Args:
+        engine: Frozen MessageDispatchEngine.
+        dispatch_topic: Dispatch-compatible topic alias to pass to dispatch().
+        correlation_id: Optional fixed correlation ID for tracing.
+        lifecycle_emitter: Optional emitter for operation lifecycle events.
+            The caller owns it and must close() it on shutdown.
+
+    Returns:
+        Async callback compatible with event bus subscribe(on_message=...).
+    """
+
+    async def _on_message(msg: object) -> None:
+        """Event bus callback: raw message -> dispatch engine."""
+        action = await _dispatch_message(
+            msg,
+            engine=engine,
+            dispatch_topic=dispatch_topic,
+            correlation_id=correlation_id,
+            lifecycle_emitter=lifecycle_emitter,
+        )
+        await _settle_message(msg, action)
 
     return _on_message
 
 
 # =============================================================================
-# Operation Lifecycle Event Helpers (OMN-6125)
+# Micro-Batched Event Bus Callback
 # =============================================================================
 
 
-async def _emit_operation_started(
-    *,
-    kafka_producer: ProtocolKafkaPublisher | None,
-    operation_id: str,
-    operation_type: str,
-    correlation_id: str,
-    session_id: str | None,
-) -> None:
-    """Fire-and-forget emission of operation-started lifecycle event.
-
-    Silently logs and returns on any failure -- never blocks the caller.
+DISPATCH_BATCH_MAX_SIZE: int = 64
+"""Maximum number of messages drained into one micro-batch.
+
+Configurable via INTELLIGENCE_DISPATCH_BATCH_MAX_SIZE environment variable.
+"""
+try:
+    DISPATCH_BATCH_MAX_SIZE = max(
+        1, int(os.environ.get("INTELLIGENCE_DISPATCH_BATCH_MAX_SIZE", "64"))
+    )
+except ValueError:
+    DISPATCH_BATCH_MAX_SIZE = 64
+
+DISPATCH_BATCH_MAX_WAIT_MS: float = 50.0
+"""Maximum time a partially filled micro-batch waits before it is dispatched.
+
+Configurable via INTELLIGENCE_DISPATCH_BATCH_MAX_WAIT_MS environment variable.
+"""
+try:
+    DISPATCH_BATCH_MAX_WAIT_MS = max(
+        0.0, float(os.environ.get("INTELLIGENCE_DISPATCH_BATCH_MAX_WAIT_MS", "50"))
+    )
+except ValueError:
+    DISPATCH_BATCH_MAX_WAIT_MS = 50.0
+
+DISPATCH_BATCH_MAX_CONCURRENCY: int = 8
+"""Maximum concurrent dispatches per topic within a micro-batch.
+
+Configurable via INTELLIGENCE_DISPATCH_BATCH_MAX_CONCURRENCY environment variable.
+"""
+try:
+    DISPATCH_BATCH_MAX_CONCURRENCY = max(
+        1, int(os.environ.get("INTELLIGENCE_DISPATCH_BATCH_MAX_CONCURRENCY", "8"))
+    )
+except ValueError:
+    DISPATCH_BATCH_MAX_CONCURRENCY = 8
+
+
+class BatchedDispatchCallback:
+    """Micro-batching event bus callback for one dispatch topic.
+
+    Messages are buffered until ``max_batch_size`` messages have arrived or
+    ``max_wait_ms`` has elapsed since the first buffered message, then the
+    batch is dispatched concurrently:
+
+    - Messages sharing a Kafka key are dispatched sequentially in arrival
+      order, so per-key (per-partition) ordering is preserved. Messages
+      without a key are independent of each other.
+    - At most ``max_concurrency`` keys are in flight at once.
+    - Ack/nack decisions are applied in arrival (offset) order only after
+      the whole batch has finished. After a nack, later messages from the
+      same partition (``topic``/``partition`` attributes; messages without
+      a partition share one) are nacked as well, so a cumulative commit
+      never skips a failed offset. Redelivered successes rely on handler
+      idempotency.
+    - Batches are settled one at a time, so ordering holds across batches.
+
+    The call that fills a batch awaits its dispatch, which applies
+    back-pressure to the consume loop. Call ``flush()`` before unsubscribing
+    or shutting down so buffered messages are not left unacknowledged.
     """
-    if kafka_producer is None:
-        return
-    try:
-        from omniintelligence.constants import TOPIC_OPERATION_STARTED_V1
-        from omniintelligence.models.events.model_operation_lifecycle_event import (
-            ModelOperationStartedEvent,
-        )
 
-        event = ModelOperationStartedEvent(
-            operation_id=operation_id,
-            operation_type=operation_type,
-            correlation_id=correlation_id,
-            session_id=session_id,
-            started_at=datetime.now(UTC),
-        )
-        await kafka_producer.publish(
-            topic=TOPIC_OPERATION_STARTED_V1,
-            key=correlation_id,
-            value=event.model_dump(mode="json"),
-        )
-    except Exception:
-        logger.warning(
-            "Failed to emit operation-started event (non-blocking)",
-            exc_info=True,
-        )
+    def __init__(
+        self,
+        engine: MessageDispatchEngine,
+        dispatch_topic: str,
+        *,
+        max_batch_size: int = DISPATCH_BATCH_MAX_SIZE,
+        max_wait_ms: float = DISPATCH_BATCH_MAX_WAIT_MS,
+        max_concurrency: int = DISPATCH_BATCH_MAX_CONCURRENCY,
+        correlation_id: UUID | None = None,
+        lifecycle_emitter: BufferedLifecycleEmitter | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must be >= 0, got {max_wait_ms}")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self._engine = engine
+        self._dispatch_topic = dispatch_topic
+        self._max_batch_size = max_batch_size
+        self._max_wait_s = max_wait_ms / 1000.0
+        self._correlation_id = correlation_id
+        self._lifecycle_emitter = lifecycle_emitter
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._settle_lock = asyncio.Lock()
+        self._pending: list[object] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_flushes: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered messages not yet handed to a batch."""
+        return len(self._pending)
+
+    async def __call__(self, msg: object) -> None:
+        """Event bus callback: buffer the message and dispatch when due."""
+        self._pending.append(msg)
+        if len(self._pending) >= self._max_batch_size:
+            await self._flush_pending()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._max_wait_s, self._on_timer
+            )
 
+    async def flush(self) -> None:
+        """Dispatch buffered messages and wait for in-flight batches."""
+        await self._flush_pending()
+        if self._timer_flushes:
+            await asyncio.gather(*self._timer_flushes)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self._flush_pending())
+        self._timer_flushes.add(task)
+        task.add_done_callback(self._timer_flushes.discard)
+
+    async def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Snapshot before taking the lock: batches are cut in arrival order
+        # and asyncio.Lock wakes waiters FIFO, so they also settle in order.
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        async with self._settle_lock:
+            actions = await self._dispatch_batch(batch)
+            # Kafka commits are cumulative: acking an offset after a nacked
+            # one on the same partition would commit past the failure. Once a
+            # partition has a nack, nack the rest of it in this batch too.
+            failed_partitions: set[tuple[object, object]] = set()
+            for msg, action in zip(batch, actions, strict=True):
+                partition = (
+                    getattr(msg, "topic", None),
+                    getattr(msg, "partition", None),
+                )
+                if action == "nack":
+                    failed_partitions.add(partition)
+                elif partition in failed_partitions:
+                    action = "nack"
+                await _settle_message(msg, action)
+
+    async def _dispatch_batch(self, batch: list[object]) -> list[_SettleAction]:
+        # Group positions by key; dict insertion order keeps first-seen order.
+        lanes: dict[object, list[int]] = {}
+        for position, msg in enumerate(batch):
+            key = getattr(msg, "key", None)
+            lanes.setdefault(("key", key) if key is not None else position, []).append(
+                position
+            )
+
+        actions: list[_SettleAction] = ["nack"] * len(batch)
+
+        async def _run_lane(positions: list[int]) -> None:
+            async with self._semaphore:
+                for position in positions:
+                    actions[position] = await _dispatch_message(
+                        batch[position],
+                        engine=self._engine,
+                        dispatch_topic=self._dispatch_topic,
+                        correlation_id=self._correlation_id,
+                        lifecycle_emitter=self._lifecycle_emitter,
+                    )
+
+        await asyncio.gather(*(_run_lane(positions) for positions in lanes.values()))
+        return actions
 
-async def _emit_operation_completed(
+
+def create_batched_dispatch_callback(
+    engine: MessageDispatchEngine,
+    dispatch_topic: str,
     *,
-    kafka_producer: ProtocolKafkaPublisher | None,
-    operation_id: str,
-    operation_type: str,
-    correlation_id: str,
-    status: str,
-    duration_ms: int,
-) -> None:
-    """Fire-and-forget emission of operation-completed lifecycle event.
-
-    Silently logs and returns on any failure -- never blocks the caller.
-    """
-    if kafka_producer is None:
-        return
-    try:
-        from omniintelligence.constants import TOPIC_OPERATION_COMPLETED_V1
-        from omniintelligence.models.events.model_operation_lifecycle_event import (
-            ModelOperationCompletedEvent,
-        )
+    max_batch_size: int = DISPATCH_BATCH_MAX_SIZE,
+    max_wait_ms: float = DISPATCH_BATCH_MAX_WAIT_MS,
+    max_concurrency: int = DISPATCH_BATCH_MAX_CONCURRENCY,
+    correlation_id: UUID | None = None,
+    lifecycle_emitter: BufferedLifecycleEmitter | None = None,
+) -> BatchedDispatchCallback:
+    """Create an opt-in micro-batching alternative to create_dispatch_callback.
 
-        event = ModelOperationCompletedEvent(
-            operation_id=operation_id,
-            operation_type=operation_type,
-            correlation_id=correlation_id,
-            status=status,
-            duration_ms=duration_ms,
-            completed_at=datetime.now(UTC),
-        )
-        await kafka_producer.publish(
-            topic=TOPIC_OPERATION_COMPLETED_V1,
-            key=correlation_id,
-            value=event.model_dump(mode="json"),
-        )
-    except Exception:
-        logger.warning(
-            "Failed to emit operation-completed event (non-blocking)",
-            exc_info=True,
-        )
+    Per-message decoding, dispatch, and ack/nack classification are identical
+    to create_dispatch_callback(); only scheduling differs. See
+    BatchedDispatchCallback for ordering guarantees.
+
+    Args:
+        engine: Frozen MessageDispatchEngine.
+        dispatch_topic: Dispatch-compatible topic alias to pass to dispatch().
+        max_batch_size: Messages drained per batch before dispatching.
+        max_wait_ms: Maximum buffering delay for a partial batch.
+        max_concurrency: Concurrent dispatches allowed for this topic.
+        correlation_id: Optional fixed correlation ID for tracing.
+        lifecycle_emitter: Optional emitter for operation lifecycle events.
+            The caller owns it and must close() it on shutdown.
+
+    Returns:
+        Async callback compatible with event bus subscribe(on_message=...).
+
+    Raises:
+        ValueError: If any limit is out of range.
+    """
+    return BatchedDispatchCallback(
+        engine,
+        dispatch_topic,
+        max_batch_size=max_batch_size,
+        max_wait_ms=max_wait_ms,
+        max_concurrency=max_concurrency,
+        correlation_id=correlation_id,
+        lifecycle_emitter=lifecycle_emitter,
+    )
 
 
 __all__ = [
+    "BatchedDispatchCallback",
     "DISPATCH_ALIAS_CI_FAILURE_TRACKER",
     "DISPATCH_ALIAS_CI_FINGERPRINT",
     "DISPATCH_ALIAS_CI_RECOVERY",
@@ -3518,6 +4014,12 @@ __all__ = [
     "DISPATCH_ALIAS_PATTERN_STORED",
     "DISPATCH_ALIAS_SESSION_OUTCOME",
     "DISPATCH_ALIAS_TOOL_CONTENT",
+    "DISPATCH_BATCH_MAX_CONCURRENCY",
+    "DISPATCH_BATCH_MAX_SIZE",
+    "DISPATCH_BATCH_MAX_WAIT_MS",
+    "PatternProjectionCoalescer",
+    "SESSION_OUTCOME_COALESCE_MS",
+    "create_batched_dispatch_callback",
     "create_ci_failure_tracker_dispatch_handler",
     "create_ci_fingerprint_dispatch_handler",
     "create_claude_hook_dispatch_handler",
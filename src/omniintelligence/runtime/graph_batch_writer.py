@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+# Copyright (c) 2025 OmniNode Team
+"""Batched UNWIND writes to Memgraph with per-batch error isolation.
+
+Shared by the code embed+graph dispatch handler (per-event writes through a
+bolt handler) and the Postgres -> Memgraph graph storage sync (snapshot and
+incremental modes, through a neo4j session). Callers adapt their client to a
+single ``write(rows)`` coroutine; this module owns batching, retry and the
+batch size setting.
+
+Architecture Decisions:
+    - One query per batch of batch_size rows (`UNWIND $rows AS row ...`)
+      instead of one round trip per row
+    - A failed batch is retried row by row, so a bad row only loses itself
+      and counts match per-row writes
+    - Written rows are returned (not just counted) so callers can mark
+      exactly the synced rows in Postgres
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Awaitable, Callable, Sequence
+from itertools import batched
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    GRAPH_WRITE_BATCH_SIZE: int = max(
+        1, int(os.environ.get("INTELLIGENCE_GRAPH_WRITE_BATCH_SIZE", "1000"))
+    )
+except ValueError:
+    GRAPH_WRITE_BATCH_SIZE = 1000
+"""Maximum rows per UNWIND write to Memgraph.
+
+Configurable via INTELLIGENCE_GRAPH_WRITE_BATCH_SIZE environment variable."""
+
+
+async def write_rows_batched(
+    write: Callable[[list[dict[str, Any]]], Awaitable[object]],
+    rows: Sequence[dict[str, Any]],
+    batch_size: int,
+    *,
+    describe: Callable[[dict[str, Any]], str] = str,
+) -> list[dict[str, Any]]:
+    """Write rows in batches, isolating failures to the rows that cause them.
+
+    Args:
+        write: Coroutine function that writes one UNWIND batch; it receives
+            the batch rows and raises on failure.
+        rows: Parameter rows to write.
+        batch_size: Maximum rows per write.
+        describe: Formats a row for failure logs.
+
+    Returns:
+        Rows that were written successfully, in input order.
+    """
+    written: list[dict[str, Any]] = []
+    for batch in batched(rows, batch_size):
+        try:
+            await write(list(batch))
+            written.extend(batch)
+            continue
+        except Exception:
+            if len(batch) == 1:
+                logger.warning(
+                    "Memgraph write failed for %s", describe(batch[0]), exc_info=True
+                )
+                continue
+            logger.warning(
+                "Memgraph batch write of %d rows failed; retrying row by row",
+                len(batch),
+                exc_info=True,
+            )
+
+        for row in batch:
+            try:
+                await write([row])
+                written.append(row)
+            except Exception:
+                logger.warning(
+                    "Memgraph write failed for %s", describe(row), exc_info=True
+                )
+    return written
+
+
+__all__ = [
+    "GRAPH_WRITE_BATCH_SIZE",
+    "write_rows_batched",
+]
@@ -0,0 +1,342 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Buffered operation lifecycle emitter for the dispatch callbacks.
+
+Operation-started / operation-completed telemetry (OMN-6125) used to be
+published inline, adding two awaited Kafka round-trips to every dispatched
+message. BufferedLifecycleEmitter moves those publishes off the critical
+path: the dispatch callback only enqueues, and a background task publishes
+in batches.
+
+Behavior:
+    - Size/time flushing: the buffer is flushed when it holds
+      ``flush_batch_size`` operations or every ``flush_interval_ms``.
+    - Coalescing: a completed event whose started event is still buffered
+      is merged into the same buffer record, so a fast operation costs one
+      buffer slot and is published as an adjacent started/completed pair.
+      Both wire events are still produced; consumers are unchanged.
+    - Overflow: when ``max_buffer_size`` records are pending, new events are
+      dropped and counted (``overflow="drop"``, the default) or the caller
+      waits for the next flush (``overflow="block"``).
+    - Fail-open: publish failures are logged and counted, never raised.
+
+Event timestamps are captured at enqueue time, so deferred publishing does
+not skew ``started_at`` / ``completed_at``.
+
+Usage:
+    emitter = BufferedLifecycleEmitter(kafka_producer)
+    await emitter.started(operation_id=..., operation_type=..., ...)
+    await emitter.completed(operation_id=..., status="success", ...)
+    await emitter.close()  # publishes everything still buffered
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Literal
+
+from omniintelligence.constants import (
+    TOPIC_OPERATION_COMPLETED_V1,
+    TOPIC_OPERATION_STARTED_V1,
+)
+from omniintelligence.models.events.model_operation_lifecycle_event import (
+    ModelOperationCompletedEvent,
+    ModelOperationStartedEvent,
+)
+from omniintelligence.protocols import ProtocolKafkaPublisher
+
+logger = logging.getLogger(__name__)
+
+
+LIFECYCLE_MAX_BUFFER_SIZE: int = 10_000
+"""Maximum buffered operations before overflow handling applies.
+
+Configurable via INTELLIGENCE_LIFECYCLE_MAX_BUFFER_SIZE environment variable.
+"""
+try:
+    LIFECYCLE_MAX_BUFFER_SIZE = max(
+        1, int(os.environ.get("INTELLIGENCE_LIFECYCLE_MAX_BUFFER_SIZE", "10000"))
+    )
+except ValueError:
+    LIFECYCLE_MAX_BUFFER_SIZE = 10_000
+
+LIFECYCLE_FLUSH_BATCH_SIZE: int = 256
+"""Buffered operations that trigger an early flush.
+
+Configurable via INTELLIGENCE_LIFECYCLE_FLUSH_BATCH_SIZE environment variable.
+"""
+try:
+    LIFECYCLE_FLUSH_BATCH_SIZE = max(
+        1, int(os.environ.get("INTELLIGENCE_LIFECYCLE_FLUSH_BATCH_SIZE", "256"))
+    )
+except ValueError:
+    LIFECYCLE_FLUSH_BATCH_SIZE = 256
+
+LIFECYCLE_FLUSH_INTERVAL_MS: float = 250.0
+"""Maximum time an event waits in the buffer before it is published.
+
+Also bounds the coalescing window: operations that complete within it are
+buffered as a single record.
+
+Configurable via INTELLIGENCE_LIFECYCLE_FLUSH_INTERVAL_MS environment variable.
+"""
+try:
+    LIFECYCLE_FLUSH_INTERVAL_MS = max(
+        1.0,
+        float(os.environ.get("INTELLIGENCE_LIFECYCLE_FLUSH_INTERVAL_MS", "250")),
+    )
+except ValueError:
+    LIFECYCLE_FLUSH_INTERVAL_MS = 250.0
+
+
+@dataclass(slots=True)
+class _PendingOperation:
+    """Buffered lifecycle events for one operation (either may be absent)."""
+
+    started: ModelOperationStartedEvent | None = None
+    completed: ModelOperationCompletedEvent | None = None
+
+
+@dataclass(slots=True)
+class _EmitterStats:
+    enqueued: int = 0
+    coalesced: int = 0
+    published: int = 0
+    dropped: int = 0
+    failed: int = 0
+
+
+class BufferedLifecycleEmitter:
+    """Queue operation lifecycle events and publish them in batches.
+
+    The emitter must be used from a single event loop. Its flush task is
+    started lazily on the first enqueued event.
+    """
+
+    def __init__(
+        self,
+        kafka_producer: ProtocolKafkaPublisher,
+        *,
+        max_buffer_size: int = LIFECYCLE_MAX_BUFFER_SIZE,
+        flush_batch_size: int = LIFECYCLE_FLUSH_BATCH_SIZE,
+        flush_interval_ms: float = LIFECYCLE_FLUSH_INTERVAL_MS,
+        overflow: Literal["drop", "block"] = "drop",
+    ) -> None:
+        if max_buffer_size < 1:
+            raise ValueError(f"max_buffer_size must be >= 1, got {max_buffer_size}")
+        if flush_batch_size < 1:
+            raise ValueError(f"flush_batch_size must be >= 1, got {flush_batch_size}")
+        if flush_interval_ms <= 0:
+            raise ValueError(f"flush_interval_ms must be > 0, got {flush_interval_ms}")
+        if overflow not in ("drop", "block"):
+            raise ValueError(f"overflow must be 'drop' or 'block', got {overflow!r}")
+        self._producer = kafka_producer
+        self._max_buffer_size = max_buffer_size
+        self._flush_batch_size = flush_batch_size
+        self._flush_interval_s = flush_interval_ms / 1000.0
+        self._overflow = overflow
+        # Keyed by operation_id; completed-only records use a distinct key so
+        # they never absorb a later started event for the same operation.
+        self._buffer: OrderedDict[str | tuple[str, str], _PendingOperation] = (
+            OrderedDict()
+        )
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._closed = False
+        self._stats = _EmitterStats()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered operation records awaiting publish."""
+        return len(self._buffer)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters: enqueued, coalesced, published, dropped, failed, pending."""
+        return {
+            "enqueued": self._stats.enqueued,
+            "coalesced": self._stats.coalesced,
+            "published": self._stats.published,
+            "dropped": self._stats.dropped,
+            "failed": self._stats.failed,
+            "pending": len(self._buffer),
+        }
+
+    async def started(
+        self,
+        *,
+        operation_id: str,
+        operation_type: str,
+        correlation_id: str,
+        session_id: str | None,
+    ) -> None:
+        """Enqueue an operation-started event (never raises)."""
+        try:
+            event = ModelOperationStartedEvent(
+                operation_id=operation_id,
+                operation_type=operation_type,
+                correlation_id=correlation_id,
+                session_id=session_id,
+                started_at=datetime.now(UTC),
+            )
+        except Exception:
+            logger.warning(
+                "Failed to build operation-started event (non-blocking)",
+                exc_info=True,
+            )
+            return
+        if not await self._reserve():
+            return
+        self._buffer[operation_id] = _PendingOperation(started=event)
+        self._after_enqueue()
+
+    async def completed(
+        self,
+        *,
+        operation_id: str,
+        operation_type: str,
+        correlation_id: str,
+        status: str,
+        duration_ms: int,
+    ) -> None:
+        """Enqueue an operation-completed event (never raises).
+
+        If the matching started event has not been published yet, the two
+        are coalesced into one buffer record.
+        """
+        try:
+            event = ModelOperationCompletedEvent(
+                operation_id=operation_id,
+                operation_type=operation_type,
+                correlation_id=correlation_id,
+                status=status,
+                duration_ms=duration_ms,
+                completed_at=datetime.now(UTC),
+            )
+        except Exception:
+            logger.warning(
+                "Failed to build operation-completed event (non-blocking)",
+                exc_info=True,
+            )
+            return
+        pending = self._buffer.get(operation_id)
+        if pending is not None and pending.completed is None:
+            pending.completed = event
+            self._stats.enqueued += 1
+            self._stats.coalesced += 1
+            return
+        if not await self._reserve():
+            return
+        self._buffer[(operation_id, "completed")] = _PendingOperation(completed=event)
+        self._after_enqueue()
+
+    async def flush(self) -> None:
+        """Publish everything currently buffered."""
+        while self._buffer:
+            await self._publish_batch()
+
+    async def close(self) -> None:
+        """Stop the flush task and publish everything still buffered."""
+        self._closed = True
+        if self._flush_task is not None:
+            # Let an in-progress drain finish rather than cancelling
+            # publishes whose records have already left the buffer.
+            self._wakeup.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+        # Release callers blocked on a full buffer; they drop after close.
+        self._space.set()
+
+    async def _reserve(self) -> bool:
+        """Make room for one record; False means the event was dropped."""
+        while not self._closed and len(self._buffer) >= self._max_buffer_size:
+            if self._overflow == "drop":
+                break
+            self._space.clear()
+            self._wakeup.set()
+            self._ensure_flush_task()
+            await self._space.wait()
+        if self._closed or len(self._buffer) >= self._max_buffer_size:
+            self._stats.dropped += 1
+            if self._stats.dropped == 1 or self._stats.dropped % 1000 == 0:
+                logger.warning(
+                    "Lifecycle event buffer full or closed, dropping event "
+                    "(dropped_total=%d, max_buffer_size=%d)",
+                    self._stats.dropped,
+                    self._max_buffer_size,
+                )
+            return False
+        return True
+
+    def _after_enqueue(self) -> None:
+        self._stats.enqueued += 1
+        self._ensure_flush_task()
+        if len(self._buffer) >= self._flush_batch_size:
+            self._wakeup.set()
+
+    def _ensure_flush_task(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_loop()
+            )
+
+    async def _flush_loop(self) -> None:
+        while not self._closed:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval_s)
+            self._wakeup.clear()
+            while self._buffer:
+                await self._publish_batch()
+
+    async def _publish_batch(self) -> None:
+        batch = [
+            self._buffer.popitem(last=False)[1]
+            for _ in range(min(self._flush_batch_size, len(self._buffer)))
+        ]
+        self._space.set()
+        await asyncio.gather(*(self._publish_operation(op) for op in batch))
+
+    async def _publish_operation(self, pending: _PendingOperation) -> None:
+        # Started is awaited before completed so per-operation order holds.
+        if pending.started is not None:
+            await self._publish(TOPIC_OPERATION_STARTED_V1, pending.started)
+        if pending.completed is not None:
+            await self._publish(TOPIC_OPERATION_COMPLETED_V1, pending.completed)
+
+    async def _publish(
+        self,
+        topic: str,
+        event: ModelOperationStartedEvent | ModelOperationCompletedEvent,
+    ) -> None:
+        try:
+            await self._producer.publish(
+                topic=topic,
+                key=event.correlation_id,
+                value=event.model_dump(mode="json"),
+            )
+            self._stats.published += 1
+        except Exception:
+            self._stats.failed += 1
+            logger.warning(
+                "Failed to emit operation lifecycle event to %s (non-blocking)",
+                topic,
+                exc_info=True,
+            )
+
+
+__all__ = [
+    "LIFECYCLE_FLUSH_BATCH_SIZE",
+    "LIFECYCLE_FLUSH_INTERVAL_MS",
+    "LIFECYCLE_MAX_BUFFER_SIZE",
+    "BufferedLifecycleEmitter",
+]
@@ -61,6 +61,14 @@ Configuration:
       correlation_id. This env var provides a single fixed group ID used by
       all containers, ensuring exactly one delivery per message.
 
+    - OMNIINTELLIGENCE_INTENT_CLASSIFIER_SNAPSHOT_DIR: Directory for warm-start
+      snapshots of the adaptive intent classifier. Unset disables snapshots.
+    - OMNIINTELLIGENCE_INTENT_CLASSIFIER_WARMUP: When truthy, initialize() loads
+      (or builds and snapshots) the adaptive intent classifier eagerly.
+      Defaults to false/off. Warm-up failures are logged and do not fail init.
+    - MEMGRAPH_URI: When set, the code-persist handler triggers a coalesced
+      incremental Postgres -> Memgraph sync after each persisted file.
+
 Example Usage:
     ```python
     from omniintelligence.runtime.plugin import PluginIntelligence
@@ -102,6 +110,7 @@ import logging
 import os
 import time
 from collections.abc import Awaitable, Callable
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -111,9 +120,17 @@ if TYPE_CHECKING:
     from omnibase_infra.runtime.db import PostgresRepositoryRuntime
     from omnibase_infra.runtime.registry import RegistryMessageType
 
+    from omniintelligence.runtime.dispatch_handler_code_embed_graph import (
+        CodeEmbedGraphHandler,
+    )
+    from omniintelligence.runtime.dispatch_handler_graph_storage import (
+        GraphSyncScheduler,
+    )
+    from omniintelligence.runtime.dispatch_handlers import BatchedDispatchCallback
     from omniintelligence.runtime.introspection import (
         IntelligenceNodeIntrospectionProxy,
     )
+    from omniintelligence.runtime.lifecycle_emitter import BufferedLifecycleEmitter
 
 from omnibase_infra.errors import (
     DbOwnershipMismatchError,
@@ -175,6 +192,21 @@ _TRUTHY_VALUES = frozenset({"true", "1", "yes"})
 _INTELLIGENCE_CONSUMER_GROUP_ENV_VAR = "OMNIINTELLIGENCE_CONSUMER_GROUP"
 _INTELLIGENCE_CONSUMER_GROUP_DEFAULT = "omniintelligence-hooks"
 
+# Opt-in micro-batched dispatch for intelligence topic consumers.  When set
+# to a truthy value, each topic gets a BatchedDispatchCallback (batch size,
+# wait, and per-topic concurrency are read from the INTELLIGENCE_DISPATCH_BATCH_*
+# variables) instead of the default one-message-at-a-time callback.
+_DISPATCH_MICRO_BATCH_ENV_VAR = "OMNIINTELLIGENCE_DISPATCH_MICRO_BATCH"
+
+# Warm start for the adaptive intent classifier.  The snapshot directory (if
+# set) lets workers load the trained classifier instead of re-embedding every
+# label example; the warm-up flag builds or loads it during initialize() so
+# the first hook event after a rollout does not pay for it.
+_INTENT_CLASSIFIER_SNAPSHOT_DIR_ENV_VAR = (
+    "OMNIINTELLIGENCE_INTENT_CLASSIFIER_SNAPSHOT_DIR"
+)
+_INTENT_CLASSIFIER_WARMUP_ENV_VAR = "OMNIINTELLIGENCE_INTENT_CLASSIFIER_WARMUP"
+
 
 def _intelligence_consumer_group() -> str:
     """Return the shared Kafka consumer group ID for all intelligence consumers.
@@ -323,6 +355,10 @@ class PluginIntelligence:
         self._pattern_runtime: PostgresRepositoryRuntime | None = None
         self._idempotency_store: StoreIdempotencyPostgres | None = None
         self._unsubscribe_callbacks: list[Callable[[], Awaitable[None]]] = []
+        self._batched_callbacks: list[BatchedDispatchCallback] = []
+        self._graph_sync: GraphSyncScheduler | None = None
+        self._code_embed_graph: CodeEmbedGraphHandler | None = None
+        self._lifecycle_emitter: BufferedLifecycleEmitter | None = None
         self._shutdown_in_progress: bool = False
         self._handshake_validated: bool = False
         self._services_registered: list[str] = []
@@ -520,6 +556,8 @@ class PluginIntelligence:
                 correlation_id,
             )
 
+            await self._warm_up_intent_classifier(correlation_id)
+
             duration = time.time() - start_time
             return ModelDomainPluginResult(
                 plugin_id=self.plugin_id,
@@ -544,6 +582,47 @@ class PluginIntelligence:
                 duration_seconds=duration,
             )
 
+    async def _warm_up_intent_classifier(self, correlation_id: object) -> None:
+        """Configure classifier snapshots and optionally warm the classifier.
+
+        Runs in a worker thread so model loading does not block the event
+        loop. Never raises: a failed warm-up only means the first
+        classification initializes the classifier lazily, as before.
+        """
+        snapshot_dir = os.getenv(_INTENT_CLASSIFIER_SNAPSHOT_DIR_ENV_VAR, "").strip()
+        warm_up = (
+            os.getenv(_INTENT_CLASSIFIER_WARMUP_ENV_VAR, "").strip().lower()
+            in _TRUTHY_VALUES
+        )
+        if not snapshot_dir and not warm_up:
+            return
+
+        try:
+            from omniintelligence.nodes.node_intent_classifier_compute.handlers import (
+                configure_classifier_snapshot,
+                warm_up_classifier,
+            )
+
+            if snapshot_dir:
+                configure_classifier_snapshot(Path(snapshot_dir))
+            if warm_up:
+                warm_start = time.time()
+                version = await asyncio.to_thread(warm_up_classifier)
+                logger.info(
+                    "Adaptive intent classifier warmed up "
+                    "(version=%s, duration=%.2fs, correlation_id=%s)",
+                    version,
+                    time.time() - warm_start,
+                    correlation_id,
+                )
+        except Exception as e:
+            logger.warning(
+                "Adaptive intent classifier warm-up failed; it will initialize "
+                "on first use (correlation_id=%s): %s",
+                correlation_id,
+                get_log_sanitizer().sanitize(str(e)),
+            )
+
     # NOTE: validate_handshake() is intentionally NOT part of ProtocolDomainPlugin.
     # The kernel detects and calls it via hasattr() — callers holding a protocol
     # reference must cast to PluginIntelligence or use hasattr() before calling.
@@ -996,9 +1075,39 @@ class PluginIntelligence:
             # Store reference for promotion scheduler (OMN-5499)
             self._kafka_publisher_ref = kafka_publisher
 
+            # One lifecycle emitter shared by every dispatch callback; closed
+            # in shutdown() so buffered events are published (OMN-6125)
+            if kafka_publisher is not None:
+                from omniintelligence.runtime.lifecycle_emitter import (
+                    BufferedLifecycleEmitter,
+                )
+
+                self._lifecycle_emitter = BufferedLifecycleEmitter(kafka_publisher)
+
             # Read publish topics from contract.yaml declarations
             publish_topics = collect_publish_topics_for_dispatch()
 
+            # Code entity persistence + incremental Memgraph sync. The graph
+            # sync is only wired when MEMGRAPH_URI is configured.
+            from omniintelligence.nodes.node_ast_extraction_compute.repository.repository_code_entity import (
+                RepositoryCodeEntity,
+            )
+            from omniintelligence.runtime.dispatch_handler_graph_storage import (
+                GraphSyncScheduler,
+            )
+
+            code_entity_repository = RepositoryCodeEntity(self._pool)  # type: ignore[arg-type]
+            if os.getenv("MEMGRAPH_URI"):
+                self._graph_sync = GraphSyncScheduler(repository=code_entity_repository)
+
+            # Embed+graph handler owned here so shutdown() closes the
+            # embedding client it creates
+            from omniintelligence.runtime.dispatch_handler_code_embed_graph import (
+                create_code_embed_graph_dispatch_handler,
+            )
+
+            self._code_embed_graph = create_code_embed_graph_dispatch_handler()
+
             self._dispatch_engine = create_intelligence_dispatch_engine(
                 repository=repository,
                 idempotency_store=idempotency_store,
@@ -1009,6 +1118,9 @@ class PluginIntelligence:
                 # pattern_query_store: AdapterPatternStore implements ProtocolPatternQueryStore
                 # via query_patterns(). Pass it explicitly so the projection handler is wired.
                 pattern_query_store=pattern_upsert_store,
+                code_entity_repository=code_entity_repository,
+                graph_sync=self._graph_sync,
+                code_embed_graph_handler=self._code_embed_graph,
             )
 
             # Publish introspection events for all intelligence nodes
@@ -1118,6 +1230,10 @@ class PluginIntelligence:
             self._introspection_nodes = []
             self._introspection_proxies = []
             self._dispatch_engine = None
+            # Nothing was enqueued yet, so the emitter has no task to stop
+            self._lifecycle_emitter = None
+            # No event was dispatched, so no embedding client was created
+            self._code_embed_graph = None
             return ModelDomainPluginResult.failed(
                 plugin_id=self.plugin_id,
                 error_message=get_log_sanitizer().sanitize(str(e)),
@@ -1312,17 +1428,32 @@ class PluginIntelligence:
             )
 
         from omniintelligence.runtime.dispatch_handlers import (
+            create_batched_dispatch_callback,
             create_dispatch_callback,
         )
 
         handlers: dict[str, Callable[[object], Awaitable[None]]] = {}
+        micro_batch = (
+            os.getenv(_DISPATCH_MICRO_BATCH_ENV_VAR, "").strip().lower()
+            in _TRUTHY_VALUES
+        )
 
         for topic in INTELLIGENCE_SUBSCRIBE_TOPICS:
             dispatch_alias = canonical_topic_to_dispatch_alias(topic)
-            handlers[topic] = create_dispatch_callback(
-                engine=self._dispatch_engine,
-                dispatch_topic=dispatch_alias,
-            )
+            if micro_batch:
+                batched = create_batched_dispatch_callback(
+                    engine=self._dispatch_engine,
+                    dispatch_topic=dispatch_alias,
+                    lifecycle_emitter=self._lifecycle_emitter,
+                )
+                self._batched_callbacks.append(batched)
+                handlers[topic] = batched
+            else:
+                handlers[topic] = create_dispatch_callback(
+                    engine=self._dispatch_engine,
+                    dispatch_topic=dispatch_alias,
+                    lifecycle_emitter=self._lifecycle_emitter,
+                )
 
         return handlers
 
@@ -1421,6 +1552,22 @@ class PluginIntelligence:
                 correlation_id,
             )
 
+        # Drain micro-batched callbacks while the consumers are still
+        # subscribed, so buffered messages are acked/nacked before their
+        # partitions are released (and before the pool is closed).
+        for batched in self._batched_callbacks:
+            try:
+                await batched.flush()
+            except Exception as flush_error:
+                sanitized_flush = get_log_sanitizer().sanitize(str(flush_error))
+                errors.append(f"dispatch_flush: {sanitized_flush}")
+                logger.warning(
+                    "Failed to flush batched dispatch callback: %s (correlation_id=%s)",
+                    sanitized_flush,
+                    correlation_id,
+                )
+        self._batched_callbacks = []
+
         # Unsubscribe from topics
         for unsub in self._unsubscribe_callbacks:
             try:
@@ -1436,6 +1583,50 @@ class PluginIntelligence:
                 )
         self._unsubscribe_callbacks = []
 
+        # Publish buffered lifecycle events while the producer is still
+        # available (no callbacks can enqueue once unsubscribed)
+        if self._lifecycle_emitter is not None:
+            try:
+                await self._lifecycle_emitter.close()
+            except Exception as emitter_error:
+                sanitized_emitter = get_log_sanitizer().sanitize(str(emitter_error))
+                errors.append(f"lifecycle_emitter_close: {sanitized_emitter}")
+                logger.warning(
+                    "Failed to close lifecycle emitter: %s (correlation_id=%s)",
+                    sanitized_emitter,
+                    correlation_id,
+                )
+            self._lifecycle_emitter = None
+
+        # Finish the in-flight Memgraph sync (it reads from the pool) and
+        # close its driver
+        if self._graph_sync is not None:
+            try:
+                await self._graph_sync.close()
+            except Exception as graph_sync_error:
+                sanitized_graph = get_log_sanitizer().sanitize(str(graph_sync_error))
+                errors.append(f"graph_sync_close: {sanitized_graph}")
+                logger.warning(
+                    "Failed to close graph sync scheduler: %s (correlation_id=%s)",
+                    sanitized_graph,
+                    correlation_id,
+                )
+            self._graph_sync = None
+
+        # Release the embedding client created by the embed+graph handler
+        if self._code_embed_graph is not None:
+            try:
+                await self._code_embed_graph.close()
+            except Exception as embed_graph_error:
+                sanitized_embed = get_log_sanitizer().sanitize(str(embed_graph_error))
+                errors.append(f"code_embed_graph_close: {sanitized_embed}")
+                logger.warning(
+                    "Failed to close embed+graph handler: %s (correlation_id=%s)",
+                    sanitized_embed,
+                    correlation_id,
+                )
+            self._code_embed_graph = None
+
         # Clear runtime reference (must happen before pool shutdown)
         self._pattern_runtime = None
 
@@ -19,6 +19,12 @@ from omniintelligence.utils.log_sanitizer import (
     get_sanitizer_settings,
     sanitize_logs,
 )
+from omniintelligence.utils.parse_cache import (
+    ParseCache,
+    ParsedSource,
+    get_parse_cache,
+    parse_python,
+)
 from omniintelligence.utils.pg_status import parse_pg_status_count
 
 # tiktoken is an optional dependency for token counting; guard against
@@ -39,6 +45,11 @@ __all__ = [
     "LogSanitizer",
     "LogSanitizerSettings",
     "check_injection_safety",
+    # Shared parse cache
+    "ParseCache",
+    "ParsedSource",
+    "get_parse_cache",
+    "parse_python",
     # PostgreSQL status parsing
     "parse_pg_status_count",
     # Token counting
@@ -0,0 +1,318 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Process-wide parse cache shared by the code-analysis compute handlers.
+
+A single source file routinely passes through quality scoring, semantic
+analysis, feature extraction, and AST extraction in the same process. Each
+of those handlers used to call ``ast.parse`` on its own. ParseCache keys the
+parse result by a SHA-256 of the source text, so the second and later
+handlers reuse the first parse.
+
+Each cache entry (ParsedSource) carries:
+    - ``tree``: the parsed ``ast.Module``
+    - ``lines`` / ``line_offsets``: line index for offset <-> line lookups
+    - ``tokens``: the ``tokenize`` token stream, produced lazily
+    - ``derive()``: memoized per-entry derived artifacts (for example the
+      comment/string-stripped source used by quality scoring)
+
+Trees are shared between callers and MUST be treated as read-only. None of
+the current consumers mutate the AST; a handler that needs to transform it
+should ``copy.deepcopy`` the tree first.
+
+Sources that fail to parse are not cached: the SyntaxError propagates to
+the caller exactly as ``ast.parse`` would raise it.
+
+Cache effectiveness (hits, misses, evictions, entries, bytes) is available
+from ``ParseCache.stats`` and logged at DEBUG every
+``PARSE_CACHE_STATS_LOG_INTERVAL`` lookups.
+
+Configuration (environment variables):
+    INTELLIGENCE_PARSE_CACHE_MAX_ENTRIES: Maximum cached sources (default 256)
+    INTELLIGENCE_PARSE_CACHE_MAX_BYTES: Maximum total cached source size in
+        bytes (default 64 MiB)
+
+Usage:
+    from omniintelligence.utils.parse_cache import parse_python
+
+    tree = parse_python(content)                  # cached ast.Module
+    parsed = get_parse_cache().get_or_parse(content)
+    parsed.tokens, parsed.line_offsets
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import io
+import logging
+import os
+import threading
+import tokenize
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_STATS_LOG_INTERVAL: int = 1000
+"""Number of cache lookups between DEBUG stats log lines."""
+
+PARSE_CACHE_MAX_ENTRIES: int = 256
+"""Maximum number of parsed sources kept in the shared cache.
+
+Configurable via INTELLIGENCE_PARSE_CACHE_MAX_ENTRIES environment variable.
+"""
+try:
+    PARSE_CACHE_MAX_ENTRIES = max(
+        1, int(os.environ.get("INTELLIGENCE_PARSE_CACHE_MAX_ENTRIES", "256"))
+    )
+except ValueError:
+    PARSE_CACHE_MAX_ENTRIES = 256
+
+PARSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+"""Maximum total size (UTF-8 bytes of source) held by the shared cache.
+
+Configurable via INTELLIGENCE_PARSE_CACHE_MAX_BYTES environment variable.
+"""
+try:
+    PARSE_CACHE_MAX_BYTES = max(
+        1,
+        int(
+            os.environ.get("INTELLIGENCE_PARSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+        ),
+    )
+except ValueError:
+    PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def content_hash(source: str) -> str:
+    """Return the SHA-256 hex digest used as the cache key for ``source``."""
+    return hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class ParsedSource:
+    """Parse artifacts for one source text.
+
+    Attributes:
+        content_hash: SHA-256 hex digest of the source.
+        source: The original source text.
+        tree: Parsed module. Shared between callers; do not mutate.
+        size_bytes: UTF-8 size of the source, used for the byte budget.
+    """
+
+    def __init__(
+        self, *, content_hash: str, source: str, tree: ast.Module, size_bytes: int
+    ) -> None:
+        self.content_hash = content_hash
+        self.source = source
+        self.tree = tree
+        self.size_bytes = size_bytes
+        self._derived: dict[str, object] = {}
+        self._derived_lock = threading.Lock()
+
+    @cached_property
+    def lines(self) -> tuple[str, ...]:
+        """Source lines including their line terminators.
+
+        Splits on ``\n``, ``\r\n`` and ``\r`` only, matching the line numbers
+        reported by ``ast`` (``str.splitlines`` also splits on form feeds).
+        """
+        return tuple(io.StringIO(self.source, newline="").readlines())
+
+    @cached_property
+    def line_offsets(self) -> tuple[int, ...]:
+        """Character offset at which each (1-indexed) line starts.
+
+        ``line_offsets[lineno - 1]`` is the offset of line ``lineno``.
+        """
+        offsets = [0]
+        total = 0
+        for line in self.lines:
+            total += len(line)
+            offsets.append(total)
+        # The final entry is end-of-source; only keep it when the source
+        # ends with a newline (i.e. it starts an empty trailing line).
+        if len(offsets) > 1 and not self.source.endswith(("\n", "\r")):
+            offsets.pop()
+        return tuple(offsets)
+
+    @cached_property
+    def tokens(self) -> tuple[tokenize.TokenInfo, ...]:
+        """Token stream of the source, or an empty tuple if it cannot be tokenized."""
+        try:
+            return tuple(tokenize.generate_tokens(io.StringIO(self.source).readline))
+        except (tokenize.TokenError, SyntaxError):
+            return ()
+
+    def line_for_offset(self, offset: int) -> int:
+        """Return the 1-indexed line number containing character ``offset``."""
+        return max(1, bisect_right(self.line_offsets, offset))
+
+    def derive[T](self, key: str, compute: Callable[[str], T]) -> T:
+        """Return ``compute(source)``, memoized on this entry under ``key``.
+
+        Keys should be namespaced by the caller (e.g. ``"quality.stripped"``)
+        so unrelated handlers do not collide.
+        """
+        try:
+            return self._derived[key]  # type: ignore[return-value]
+        except KeyError:
+            pass
+        value = compute(self.source)
+        with self._derived_lock:
+            return self._derived.setdefault(key, value)  # type: ignore[return-value]
+
+
+@dataclass(slots=True)
+class _CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ParseCache:
+    """Content-hash keyed, size-bounded LRU cache of ParsedSource entries.
+
+    Thread-safe. Parsing happens outside the lock, so two threads missing on
+    the same source concurrently may both parse it; the first result wins.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = PARSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = PARSE_CACHE_MAX_BYTES,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, ParsedSource] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = _CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters: hits, misses, evictions, entries, bytes."""
+        with self._lock:
+            return {
+                "hits": self._stats.hits,
+                "misses": self._stats.misses,
+                "evictions": self._stats.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def get_or_parse(self, source: str) -> ParsedSource:
+        """Return the cached parse of ``source``, parsing it on a miss.
+
+        Raises:
+            SyntaxError: If ``source`` is not valid Python.
+            ValueError: If ``source`` contains null bytes.
+        """
+        key = content_hash(source)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+            else:
+                self._stats.misses += 1
+            lookups = self._stats.hits + self._stats.misses
+        if lookups % PARSE_CACHE_STATS_LOG_INTERVAL == 0:
+            self._log_stats()
+        if entry is not None:
+            return entry
+
+        tree = ast.parse(source)
+        size_bytes = len(source.encode("utf-8", "surrogatepass"))
+        entry = ParsedSource(
+            content_hash=key, source=source, tree=tree, size_bytes=size_bytes
+        )
+        if size_bytes > self._max_bytes:
+            # Too large to cache without evicting everything else.
+            return entry
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing
+            self._entries[key] = entry
+            self._total_bytes += size_bytes
+            while (
+                len(self._entries) > self._max_entries
+                or self._total_bytes > self._max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted.size_bytes
+                self._stats.evictions += 1
+        return entry
+
+    def _log_stats(self) -> None:
+        stats = self.stats
+        lookups = stats["hits"] + stats["misses"]
+        logger.debug(
+            "Parse cache: hits=%d misses=%d hit_rate=%.2f evictions=%d "
+            "entries=%d bytes=%d",
+            stats["hits"],
+            stats["misses"],
+            stats["hits"] / lookups if lookups else 0.0,
+            stats["evictions"],
+            stats["entries"],
+            stats["bytes"],
+        )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._stats = _CacheStats()
+
+
+_parse_cache: ParseCache | None = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    """Get or create the process-wide parse cache."""
+    global _parse_cache
+    if _parse_cache is None:
+        with _parse_cache_lock:
+            if _parse_cache is None:
+                _parse_cache = ParseCache()
+    return _parse_cache
+
+
+def parse_python(source: str) -> ast.Module:
+    """Drop-in replacement for ``ast.parse(source)`` backed by the shared cache.
+
+    The returned tree is shared; do not mutate it.
+
+    Raises:
+        SyntaxError: If ``source`` is not valid Python.
+        ValueError: If ``source`` contains null bytes.
+    """
+    return get_parse_cache().get_or_parse(source).tree
+
+
+__all__ = [
+    "PARSE_CACHE_MAX_BYTES",
+    "PARSE_CACHE_MAX_ENTRIES",
+    "PARSE_CACHE_STATS_LOG_INTERVAL",
+    "ParseCache",
+    "ParsedSource",
+    "content_hash",
+    "get_parse_cache",
+    "parse_python",
+]
@@ -49,14 +49,11 @@ async def test_full_promotion_lifecycle_bootstrap_candidate() -> None:
                 "distinct_days_seen": 2,
             }
         ],
+        # Gate snapshot data for the eligible chunk (no attributions)
+        [],
         # Phase 2: PROVISIONAL -> VALIDATED query (no results)
         [],
     ]
-    # fetchrow for gate snapshot enrichment
-    mock_repo.fetchrow.side_effect = [
-        {"count": 0},  # attribution count
-        None,  # no latest run result
-    ]
 
     # Mock apply_transition_fn
     mock_transition_result = MagicMock()
@@ -157,13 +154,11 @@ async def test_full_promotion_lifecycle_normal_metric_path() -> None:
                 "distinct_days_seen": 1,
             }
         ],
+        # Gate snapshot data for the eligible chunk
+        [{"pattern_id": pattern_id, "count": 2, "run_result": "success"}],
         # Phase 2: No provisionals
         [],
     ]
-    mock_repo.fetchrow.side_effect = [
-        {"count": 2},  # attribution count
-        {"run_result": "success"},  # latest run result
-    ]
 
     mock_transition_result = MagicMock()
     mock_transition_result.success = True
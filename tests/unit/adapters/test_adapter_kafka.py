@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for KafkaHandler produce/consume modes.
+
+confluent-kafka Producer and Consumer are replaced with in-memory fakes so
+the tests cover delivery-callback plumbing, batching and subscription
+handling without a broker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from omniintelligence.adapters import adapter_kafka
+from omniintelligence.adapters.adapter_kafka import KafkaHandler
+
+
+class _FakeMessage:
+    def __init__(
+        self,
+        topic: str,
+        offset: int,
+        value: bytes | None = b'{"n": 1}',
+        error: Any = None,
+    ) -> None:
+        self._topic = topic
+        self._offset = offset
+        self._value = value
+        self._error = error
+
+    def topic(self) -> str:
+        return self._topic
+
+    def partition(self) -> int:
+        return 0
+
+    def offset(self) -> int:
+        return self._offset
+
+    def key(self) -> bytes | None:
+        return None
+
+    def value(self) -> bytes | None:
+        return self._value
+
+    def headers(self) -> None:
+        return None
+
+    def error(self) -> Any:
+        return self._error
+
+
+class _FakeProducer:
+    """Queues delivery callbacks until poll()/flush() serves them."""
+
+    def __init__(self, conf: dict[str, Any]) -> None:
+        self.conf = conf
+        self.produced: list[dict[str, Any]] = []
+        self.flush_calls = 0
+        self.buffer_errors = 0
+        self._pending: list[tuple[Any, _FakeMessage]] = []
+        self._lock = threading.Lock()
+
+    def produce(self, *, on_delivery: Any, **kwargs: Any) -> None:
+        if self.buffer_errors:
+            self.buffer_errors -= 1
+            raise BufferError("Local: Queue full")
+        with self._lock:
+            offset = len(self.produced)
+            self.produced.append(kwargs)
+            self._pending.append(
+                (on_delivery, _FakeMessage(kwargs["topic"], offset, kwargs["value"]))
+            )
+
+    def poll(self, timeout: float) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for callback, msg in pending:
+            callback(None, msg)
+        if not pending:
+            threading.Event().wait(min(timeout, 0.01))
+        return len(pending)
+
+    def flush(self, timeout: float = -1) -> int:
+        self.flush_calls += 1
+        self.poll(0)
+        return 0
+
+
+class _FakeConsumer:
+    def __init__(self, conf: dict[str, Any]) -> None:
+        self.conf = conf
+        self.subscriptions: list[list[str]] = []
+        self.consume_calls: list[tuple[int, float]] = []
+        self.batch: list[_FakeMessage] = []
+
+    def subscribe(self, topics: list[str]) -> None:
+        self.subscriptions.append(list(topics))
+
+    def consume(self, num_messages: int = 1, timeout: float = -1) -> list[Any]:
+        self.consume_calls.append((num_messages, timeout))
+        return self.batch[:num_messages]
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_kafka(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(adapter_kafka, "Producer", _FakeProducer)
+    monkeypatch.setattr(adapter_kafka, "Consumer", _FakeConsumer)
+
+
+async def _connect(**config: Any) -> KafkaHandler:
+    handler = KafkaHandler()
+    await handler.connect({"bootstrap_servers": "localhost:9092", **config})
+    return handler
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSyncMode:
+    async def test_produce_reports_delivery(self) -> None:
+        handler = await _connect()
+        result = await handler.execute(
+            "produce", {"topic": "t", "value": {"a": 1}}, correlation_id="c-1"
+        )
+        assert result == {"topic": "t", "delivered": True, "partition": 0, "offset": 0}
+        producer = handler._producer
+        assert producer.produced[0]["headers"] == [("correlation-id", b"c-1")]
+        assert "linger.ms" not in producer.conf
+        await handler.disconnect()
+
+    async def test_produce_batch_flushes_once(self) -> None:
+        handler = await _connect()
+        producer = handler._producer
+        result = await handler.execute(
+            "produce_batch",
+            {"messages": [{"topic": "t", "value": {"i": i}} for i in range(5)]},
+        )
+        assert result["delivered"] == 5
+        assert result["failed"] == 0
+        assert [r["offset"] for r in result["results"]] == [0, 1, 2, 3, 4]
+        assert producer.flush_calls == 1
+        await handler.disconnect()
+
+    async def test_produce_batch_requires_messages(self) -> None:
+        handler = await _connect()
+        with pytest.raises(ValueError, match="messages"):
+            await handler.execute("produce_batch", {"messages": []})
+        await handler.disconnect()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAsyncMode:
+    async def test_connect_applies_batching_defaults_and_overrides(self) -> None:
+        handler = await _connect(async_mode=True, producer_config={"linger.ms": 20})
+        conf = handler._producer.conf
+        assert conf["linger.ms"] == 20
+        assert conf["batch.num.messages"] == 10000
+        assert await handler.health_check() is True
+        await handler.disconnect()
+        assert await handler.health_check() is False
+
+    async def test_produce_resolves_from_poll_thread_without_flush(self) -> None:
+        handler = await _connect(async_mode=True)
+        producer = handler._producer
+        result = await asyncio.wait_for(
+            handler.execute("produce", {"topic": "t", "value": "raw"}), timeout=5
+        )
+        assert result["delivered"] is True
+        assert producer.produced[0]["value"] == b"raw"
+        assert producer.flush_calls == 0
+        await handler.disconnect()
+
+    async def test_produce_batch_preserves_order(self) -> None:
+        handler = await _connect(async_mode=True)
+        messages = [{"topic": "t", "value": {"i": i}} for i in range(200)]
+        result = await asyncio.wait_for(
+            handler.execute("produce_batch", {"messages": messages}), timeout=5
+        )
+        assert result["delivered"] == 200
+        assert [r["offset"] for r in result["results"]] == list(range(200))
+        assert handler._producer.flush_calls == 0
+        await handler.disconnect()
+
+    async def test_produce_retries_when_queue_full(self) -> None:
+        handler = await _connect(async_mode=True)
+        handler._producer.buffer_errors = 3
+        result = await asyncio.wait_for(
+            handler.execute("produce", {"topic": "t", "value": {"a": 1}}), timeout=5
+        )
+        assert result["delivered"] is True
+        await handler.disconnect()
+
+    async def test_consume_subscribes_once_and_batches(self) -> None:
+        handler = await _connect(async_mode=True, group_id="g")
+        consumer = handler._consumer
+        consumer.batch = [_FakeMessage("t", i) for i in range(3)]
+        params = {"topics": ["t"], "max_messages": 10, "timeout": 0.5}
+
+        first = await handler.execute("consume", params)
+        second = await handler.execute("consume", params)
+        await handler.execute("consume", {"topics": ["u"]})
+
+        assert [m["offset"] for m in first["messages"]] == [0, 1, 2]
+        assert first["messages"][0]["value"] == {"n": 1}
+        assert second == first
+        assert consumer.subscriptions == [["t"], ["u"]]
+        assert consumer.consume_calls == [(10, 0.5), (10, 0.5), (1, 1.0)]
+        await handler.disconnect()
@@ -11,6 +11,8 @@ Ticket: OMN-2253
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 from omnibase_core.models.contracts import ModelDbRepositoryContract
 
@@ -182,3 +184,79 @@ class TestQueryPatternsContract:
         # All params are optional with defaults or nullable:
         # domain_id=None, language=None, min_confidence=0.7, limit=50, offset=0, project_scope=None
         assert args == (None, None, 0.7, 50, 0, None)
+
+
+@pytest.mark.unit
+class TestQueryPatternsAfterContract:
+    """Tests for the keyset-paginated query_patterns_after operation."""
+
+    @pytest.fixture
+    def contract(self) -> ModelDbRepositoryContract:
+        """Load the repository contract."""
+        return load_contract()
+
+    def test_operation_is_read(self, contract) -> None:
+        """query_patterns_after exists and is read-only."""
+        assert contract.ops["query_patterns_after"].mode == "read"
+
+    def test_sql_uses_keyset_not_offset(self, contract) -> None:
+        """Paging is done with a keyset predicate, not OFFSET."""
+        sql = contract.ops["query_patterns_after"].sql
+        assert "OFFSET" not in sql
+        normalized = " ".join(sql.split())
+        assert (
+            "(CASE WHEN status = 'validated' THEN 0 ELSE 1 END, -confidence, id)"
+            " > ($6::int, -($7::float8), $8)"
+        ) in normalized
+
+    def test_keyset_index_matches_row_comparison(self, migrations_dir: Path) -> None:
+        """Migration 030 indexes exactly the keyset row expressions."""
+        migration = (
+            migrations_dir / "030_learned_patterns_query_keyset_index.sql"
+        ).read_text()
+        normalized = " ".join(migration.split())
+        assert (
+            "( (CASE WHEN status = 'validated' THEN 0 ELSE 1 END), (-confidence), id )"
+        ) in normalized
+
+    def test_order_by_matches_query_patterns(self, contract) -> None:
+        """Keyset pages follow the same ordering as query_patterns."""
+
+        def _order_by(sql: str) -> str:
+            return " ".join(sql.split("ORDER BY", 1)[1].split("LIMIT", 1)[0].split())
+
+        assert _order_by(contract.ops["query_patterns_after"].sql) == _order_by(
+            contract.ops["query_patterns"].sql
+        )
+
+    def test_positional_args_order(self, contract) -> None:
+        """_build_positional_args maps params to $1..$8 in SQL order."""
+        from unittest.mock import MagicMock
+
+        from omniintelligence.repositories.adapter_pattern_store import (
+            AdapterPatternStore,
+        )
+
+        mock_runtime = MagicMock()
+        mock_runtime.contract = contract
+        adapter = AdapterPatternStore(runtime=mock_runtime)
+
+        args = adapter._build_positional_args(
+            "query_patterns_after",
+            {
+                "after_status_rank": 1,
+                "after_confidence": 0.8,
+                "after_id": "00000000-0000-0000-0000-000000000001",
+            },
+        )
+
+        assert args == (
+            None,
+            None,
+            0.7,
+            50,
+            None,
+            1,
+            0.8,
+            "00000000-0000-0000-0000-000000000001",
+        )
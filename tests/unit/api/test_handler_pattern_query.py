@@ -20,6 +20,7 @@ import pytest
 from fastapi import HTTPException
 
 from omniintelligence.api.handler_pattern_query import handle_query_patterns
+from omniintelligence.api.model_pattern_query_cursor import ModelPatternQueryCursor
 from omniintelligence.api.model_pattern_query_page import ModelPatternQueryPage
 from omniintelligence.api.model_pattern_query_response import ModelPatternQueryResponse
 
@@ -188,3 +189,86 @@ class TestHandleQueryPatterns:
 
         assert exc_info.value.status_code == 502
         assert "unexpected schema" in exc_info.value.detail.lower()
+
+
+@pytest.mark.unit
+class TestHandleQueryPatternsCursor:
+    """Tests for keyset (cursor) pagination in handle_query_patterns."""
+
+    async def test_full_page_returns_next_cursor(
+        self,
+        mock_adapter: AsyncMock,
+        sample_pattern_row: dict,
+    ) -> None:
+        """A full page carries a cursor pointing at its last row."""
+        mock_adapter.query_patterns.return_value = [sample_pattern_row]
+
+        result = await handle_query_patterns(adapter=mock_adapter, limit=1)
+
+        assert result.next_cursor is not None
+        cursor = ModelPatternQueryCursor.decode(result.next_cursor)
+        assert cursor.status_rank == 0
+        assert cursor.confidence == 0.9
+        assert cursor.id == sample_pattern_row["id"]
+
+    async def test_partial_page_has_no_next_cursor(
+        self,
+        mock_adapter: AsyncMock,
+        sample_pattern_row: dict,
+    ) -> None:
+        """A page with fewer rows than limit is the final page."""
+        mock_adapter.query_patterns.return_value = [sample_pattern_row]
+
+        result = await handle_query_patterns(adapter=mock_adapter, limit=2)
+
+        assert result.next_cursor is None
+
+    async def test_cursor_uses_keyset_query(
+        self,
+        mock_adapter: AsyncMock,
+    ) -> None:
+        """A cursor routes to query_patterns_after with the decoded position."""
+        pattern_id = uuid4()
+        mock_adapter.query_patterns_after = AsyncMock(return_value=[])
+        cursor = ModelPatternQueryCursor.from_pattern(
+            status="provisional", confidence=0.75, pattern_id=pattern_id
+        ).encode()
+
+        result = await handle_query_patterns(
+            adapter=mock_adapter,
+            domain="error_handling",
+            limit=25,
+            cursor=cursor,
+        )
+
+        mock_adapter.query_patterns.assert_not_awaited()
+        mock_adapter.query_patterns_after.assert_awaited_once_with(
+            domain="error_handling",
+            language=None,
+            min_confidence=0.7,
+            limit=25,
+            after_status_rank=1,
+            after_confidence=0.75,
+            after_id=pattern_id,
+        )
+        assert result.next_cursor is None
+
+    async def test_invalid_cursor_returns_400(self, mock_adapter: AsyncMock) -> None:
+        """A malformed cursor is a client error."""
+        with pytest.raises(HTTPException) as exc_info:
+            await handle_query_patterns(adapter=mock_adapter, cursor="not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+
+    async def test_cursor_with_offset_returns_400(
+        self, mock_adapter: AsyncMock
+    ) -> None:
+        """Cursor and non-zero offset are mutually exclusive."""
+        cursor = ModelPatternQueryCursor.from_pattern(
+            status="validated", confidence=0.9, pattern_id=uuid4()
+        ).encode()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await handle_query_patterns(adapter=mock_adapter, offset=10, cursor=cursor)
+
+        assert exc_info.value.status_code == 400
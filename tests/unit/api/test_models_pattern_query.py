@@ -16,6 +16,7 @@ from uuid import uuid4
 import pytest
 from pydantic import ValidationError
 
+from omniintelligence.api.model_pattern_query_cursor import ModelPatternQueryCursor
 from omniintelligence.api.model_pattern_query_page import ModelPatternQueryPage
 from omniintelligence.api.model_pattern_query_response import ModelPatternQueryResponse
 
@@ -164,3 +165,33 @@ class TestModelPatternQueryPage:
                 limit=50,
                 offset=-1,
             )
+
+
+@pytest.mark.unit
+class TestModelPatternQueryCursor:
+    """Tests for ModelPatternQueryCursor encoding."""
+
+    def test_round_trip(self) -> None:
+        """Decoding an encoded cursor restores the exact position."""
+        cursor = ModelPatternQueryCursor.from_pattern(
+            status="provisional", confidence=0.7123456789, pattern_id=uuid4()
+        )
+
+        token = cursor.encode()
+
+        assert "=" not in token
+        assert ModelPatternQueryCursor.decode(token) == cursor
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            "",
+            "not-base64!",
+            "eyJ2IjoyfQ",  # {"v":2}
+            "eyJ2IjoxLCJyIjo1LCJjIjowLjksImkiOiJ4In0",  # bad rank and id
+        ],
+    )
+    def test_decode_rejects_malformed(self, token: str) -> None:
+        """Malformed or foreign tokens raise ValueError."""
+        with pytest.raises(ValueError):
+            ModelPatternQueryCursor.decode(token)
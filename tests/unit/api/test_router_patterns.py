@@ -20,6 +20,7 @@ import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from omniintelligence.api.model_pattern_query_cursor import ModelPatternQueryCursor
 from omniintelligence.api.router_patterns import create_pattern_router
 
 
@@ -218,3 +219,21 @@ class TestGetPatternsEndpoint:
         assert call_kwargs["min_confidence"] == 0.8
         assert call_kwargs["limit"] == 10
         assert call_kwargs["offset"] == 20
+
+    async def test_passes_cursor(
+        self,
+        client: AsyncClient,
+        mock_adapter: AsyncMock,
+    ) -> None:
+        """Endpoint routes cursor requests to the keyset query."""
+        mock_adapter.query_patterns_after = AsyncMock(return_value=[])
+        cursor = ModelPatternQueryCursor.from_pattern(
+            status="validated", confidence=0.9, pattern_id=uuid4()
+        ).encode()
+
+        response = await client.get(f"/api/v1/patterns?cursor={cursor}")
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] is None
+        mock_adapter.query_patterns_after.assert_awaited_once()
+        mock_adapter.query_patterns.assert_not_awaited()
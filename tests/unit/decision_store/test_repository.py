@@ -4,14 +4,16 @@
 """Unit tests for DecisionRecordRepository.
 
 Tests storage, idempotency, querying, pagination, layer separation,
-and correlation_id threading.
+correlation_id threading, retention, and append-log persistence.
 
 Ticket: OMN-2467 - V1: Storage unit tests
 """
 
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 
@@ -364,3 +366,243 @@ class TestDecisionRecordRepositoryQueryByCandidate:
             "claude-3-opus", correlation_id="trace-xyz"
         )
         assert len(results) == 1
+
+
+# ---------------------------------------------------------------------------
+# Index pagination Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestDecisionRecordRepositoryIndexPagination:
+    """Tests for cursor paging over the sorted secondary indexes."""
+
+    def test_pages_ordered_with_out_of_order_inserts_and_ties(self) -> None:
+        repo = DecisionRecordRepository()
+        # Insert newest first, with several records sharing a stored_at.
+        for i in reversed(range(12)):
+            repo.store(
+                _make_record(
+                    decision_id=f"tie-{i:03d}",
+                    stored_at_offset_seconds=i // 3,
+                )
+            )
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page, cursor = repo.query_by_type("model_select", limit=5, cursor=cursor)
+            seen.extend(r["decision_id"] for r in page)
+            if cursor is None:
+                break
+        assert seen == [f"tie-{i:03d}" for i in range(12)]
+
+    def test_cursor_combined_with_time_range(self) -> None:
+        repo = DecisionRecordRepository()
+        base = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+        for i in range(10):
+            repo.store(
+                _make_record(decision_id=f"rng-{i:03d}", stored_at_offset_seconds=i)
+            )
+
+        page1, cursor = repo.query_by_candidate(
+            "claude-3-opus",
+            since=base + timedelta(seconds=2),
+            until=base + timedelta(seconds=6),
+            limit=3,
+        )
+        assert [r["decision_id"] for r in page1] == ["rng-002", "rng-003", "rng-004"]
+        assert cursor is not None
+
+        page2, cursor2 = repo.query_by_candidate(
+            "claude-3-opus",
+            since=base + timedelta(seconds=2),
+            until=base + timedelta(seconds=6),
+            limit=3,
+            cursor=cursor,
+        )
+        assert [r["decision_id"] for r in page2] == ["rng-005", "rng-006"]
+        assert cursor2 is None
+
+    def test_clear_resets_indexes(self) -> None:
+        repo = DecisionRecordRepository()
+        repo.store(_make_record(decision_id="clr-001"))
+        repo.clear()
+
+        assert repo.query_by_type("model_select") == ([], None)
+        assert repo.query_by_candidate("claude-3-opus") == ([], None)
+
+
+# ---------------------------------------------------------------------------
+# Retention Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestDecisionRecordRepositoryRetention:
+    """Tests for the max_records bound and oldest-first eviction."""
+
+    def test_oldest_records_evicted_past_bound(self) -> None:
+        repo = DecisionRecordRepository(max_records=10)
+        for i in range(11):
+            repo.store(
+                _make_record(
+                    decision_id=f"ret-{i:03d}",
+                    selected_candidate="gpt-4o" if i % 2 else "claude-3-opus",
+                    stored_at_offset_seconds=i,
+                )
+            )
+
+        # Exceeding the bound evicts down to 90% of it in one batch
+        assert repo.count() == 9
+        assert repo.get_record("ret-000") is None
+        assert repo.get_record("ret-001") is None
+        results, _ = repo.query_by_type("model_select")
+        assert [r["decision_id"] for r in results] == [
+            f"ret-{i:03d}" for i in range(2, 11)
+        ]
+        results, _ = repo.query_by_candidate("gpt-4o")
+        assert [r["decision_id"] for r in results] == [
+            "ret-003",
+            "ret-005",
+            "ret-007",
+            "ret-009",
+        ]
+
+    def test_eviction_follows_stored_at_not_insert_order(self) -> None:
+        repo = DecisionRecordRepository(max_records=3)
+        for i in (5, 1, 4, 2):
+            repo.store(_make_record(decision_id=f"ooo-{i}", stored_at_offset_seconds=i))
+
+        results, _ = repo.query_by_type("model_select")
+        # ooo-5 was inserted first, but ooo-1 is the oldest by stored_at
+        assert [r["decision_id"] for r in results] == ["ooo-2", "ooo-4", "ooo-5"]
+
+    def test_evicted_only_type_removed_from_index(self) -> None:
+        repo = DecisionRecordRepository(max_records=2)
+        repo.store(_make_record(decision_id="old", decision_type="workflow_route"))
+        for i in range(1, 3):
+            repo.store(_make_record(decision_id=f"new-{i}", stored_at_offset_seconds=i))
+
+        assert repo.query_by_type("workflow_route") == ([], None)
+        assert repo.count() == 2
+
+    def test_invalid_max_records_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            DecisionRecordRepository(max_records=0)
+
+
+# ---------------------------------------------------------------------------
+# Append-log persistence Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestDecisionRecordRepositoryLog:
+    """Tests for the append-only log and startup replay."""
+
+    def test_records_survive_restart(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "decisions.jsonl"
+        repo = DecisionRecordRepository(log_path=log_path)
+        repo.store(_make_record(decision_id="log-001", agent_rationale="why"))
+        repo.store(
+            _make_record(
+                decision_id="log-002",
+                decision_type="workflow_route",
+                stored_at_offset_seconds=5,
+            )
+        )
+        repo.store(_make_record(decision_id="log-001"))  # duplicate, not logged
+        repo.close()
+
+        assert len(log_path.read_text().splitlines()) == 2
+
+        reopened = DecisionRecordRepository(log_path=log_path)
+        assert reopened.count() == 2
+        full = reopened.get_record("log-001", include_rationale=True)
+        assert full is not None
+        assert full["agent_rationale"] == "why"
+        results, _ = reopened.query_by_type("workflow_route")
+        assert [r["decision_id"] for r in results] == ["log-002"]
+        assert reopened.store(_make_record(decision_id="log-001")) is False
+        reopened.close()
+
+    def test_torn_trailing_line_truncated(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "decisions.jsonl"
+        repo = DecisionRecordRepository(log_path=log_path)
+        repo.store(_make_record(decision_id="torn-001"))
+        repo.close()
+        with log_path.open("a") as f:
+            f.write('{"decision_id": "torn-0')
+
+        reopened = DecisionRecordRepository(log_path=log_path)
+        assert reopened.count() == 1
+        reopened.store(_make_record(decision_id="torn-002"))
+        reopened.close()
+
+        assert DecisionRecordRepository(log_path=log_path).count() == 2
+
+    def test_malformed_line_skipped(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "decisions.jsonl"
+        repo = DecisionRecordRepository(log_path=log_path)
+        repo.store(_make_record(decision_id="ok-001"))
+        repo.close()
+        with log_path.open("a") as f:
+            f.write('{"decision_id": "missing-fields"}\n')
+
+        reopened = DecisionRecordRepository(log_path=log_path)
+        assert reopened.count() == 1
+        reopened.close()
+        # The malformed line is compacted away on startup
+        assert len(log_path.read_text().splitlines()) == 1
+
+    def test_creates_missing_parent_directory(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "nested" / "decisions.jsonl"
+        repo = DecisionRecordRepository(log_path=log_path)
+        repo.store(_make_record(decision_id="nested-001"))
+        repo.close()
+
+        assert log_path.exists()
+
+    def test_log_compacted_once_past_twice_bound(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "decisions.jsonl"
+        repo = DecisionRecordRepository(log_path=log_path, max_records=4)
+        for i in range(9):
+            repo.store(
+                _make_record(decision_id=f"cmp-{i:03d}", stored_at_offset_seconds=i)
+            )
+            assert len(log_path.read_text().splitlines()) <= 8
+        repo.close()
+
+        # The compacted log holds exactly the retained records
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 4
+        reopened = DecisionRecordRepository(log_path=log_path, max_records=4)
+        results, _ = reopened.query_by_type("model_select")
+        assert [r["decision_id"] for r in results] == [
+            f"cmp-{i:03d}" for i in range(5, 9)
+        ]
+        reopened.close()
+        assert not (tmp_path / "decisions.jsonl.compact").exists()
+
+    def test_replay_applies_bound_and_compacts(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "decisions.jsonl"
+        repo = DecisionRecordRepository(log_path=log_path)
+        for i in reversed(range(6)):
+            repo.store(
+                _make_record(decision_id=f"rpl-{i:03d}", stored_at_offset_seconds=i)
+            )
+        repo.close()
+
+        reopened = DecisionRecordRepository(log_path=log_path, max_records=3)
+        assert reopened.count() == 3
+        assert reopened.get_record("rpl-002") is None
+        reopened.store(_make_record(decision_id="rpl-006", stored_at_offset_seconds=6))
+        reopened.close()
+
+        # Retained records were rewritten in stored_at order, then appended
+        ids = [
+            json.loads(line)["decision_id"]
+            for line in log_path.read_text().splitlines()
+        ]
+        assert ids == ["rpl-003", "rpl-004", "rpl-005", "rpl-006"]
@@ -5,10 +5,13 @@
 
 from __future__ import annotations
 
+import ast
+
 import pytest
 
 from omniintelligence.nodes.node_ast_extraction_compute.handlers.handler_quality_score import (
     QualityScorer,
+    extract_entity_sources,
 )
 
 QUALITY_CONFIG: dict = {
@@ -118,3 +121,52 @@ class MyHandler(Protocol):
 '''
         result = scorer.score(source_code=source, entity_name="MyHandler")
         assert result.dimensions["pattern_compliance"] > 0.5
+
+
+@pytest.mark.unit
+class TestExtractEntitySources:
+    """Tests for per-file statement slicing used for entity-scoped scores."""
+
+    SOURCE = '''import os
+
+
+@decorator
+class Foo:
+    """Foo."""
+
+    def method(self) -> int:
+        return 1
+
+
+def bar():
+    return os.sep
+'''
+
+    def test_slices_keyed_by_entity_line_number(self) -> None:
+        sources = extract_entity_sources(self.SOURCE)
+
+        assert sources[1] == "import os\n"
+        assert sources[5].startswith("@decorator\nclass Foo:")
+        assert sources[5].rstrip().endswith("return 1")
+        assert sources[8].startswith("def method")
+        assert "def bar" not in sources[8]
+        assert sources[12] == "def bar():\n    return os.sep\n"
+
+    def test_method_slice_parses_for_ast_complexity(self) -> None:
+        source = '''class Foo:
+    def method(self, x: int | None) -> int:
+        """Return 1 if x is set, or 2 for None and 3 otherwise."""
+        if x:
+            return 1
+        elif x is None:
+            return 2
+        return 3
+'''
+        method = extract_entity_sources(source)[2]
+
+        assert method.startswith("def method")
+        ast.parse(method)
+        assert QualityScorer._calculate_cyclomatic_complexity(method) == 3
+
+    def test_unparseable_source_returns_empty(self) -> None:
+        assert extract_entity_sources("def broken(:\n") == {}
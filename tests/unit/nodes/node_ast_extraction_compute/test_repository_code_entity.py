@@ -9,6 +9,7 @@ No real database required.
 from __future__ import annotations
 
 import json
+from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import AsyncMock
 from uuid import uuid4
@@ -140,6 +141,115 @@ class TestUpsertEntity:
         assert call_args[9] is None
 
 
+@pytest.mark.unit
+class TestBulkUpsert:
+    """Test multi-row entity and relationship upserts."""
+
+    async def test_upsert_entities_single_statement(self) -> None:
+        pool = _make_pool()
+        ids = [uuid4(), uuid4()]
+        pool.fetch.return_value = [
+            {"qualified_name": "m.A", "id": ids[0]},
+            {"qualified_name": "m.B", "id": ids[1]},
+        ]
+
+        repo = RepositoryCodeEntity(pool)
+        entity_a = _sample_entity(qualified_name="m.A")
+        entity_b = _sample_entity(qualified_name="m.B")
+        entity_b["methods"] = None
+        result = await repo.upsert_entities([entity_a, entity_b])
+
+        assert result == {"m.A": str(ids[0]), "m.B": str(ids[1])}
+        pool.fetch.assert_called_once()
+        pool.fetchrow.assert_not_called()
+        positional = pool.fetch.call_args[0]
+        sql = positional[0]
+        assert "unnest(" in sql
+        assert "ON CONFLICT (qualified_name, source_repo) DO UPDATE" in sql
+        assert "RETURNING qualified_name, id" in sql
+        # One array per column, in INSERT column order
+        assert positional[3] == ["m.A", "m.B"]
+        assert json.loads(positional[7][0]) == ["BaseModel"]
+        assert json.loads(positional[8][0]) == entity_a["methods"]
+        assert positional[8][1] is None
+        assert positional[13] == ["abc123", "abc123"]
+
+    async def test_upsert_entities_duplicate_keeps_last(self) -> None:
+        pool = _make_pool()
+        pool.fetch.return_value = []
+
+        repo = RepositoryCodeEntity(pool)
+        await repo.upsert_entities(
+            [
+                _sample_entity(qualified_name="m.A", file_hash="old"),
+                _sample_entity(qualified_name="m.A", file_hash="new"),
+            ]
+        )
+
+        positional = pool.fetch.call_args[0]
+        assert positional[3] == ["m.A"]
+        assert positional[13] == ["new"]
+
+    async def test_upsert_entities_empty_skips_query(self) -> None:
+        pool = _make_pool()
+
+        repo = RepositoryCodeEntity(pool)
+        assert await repo.upsert_entities([]) == {}
+        pool.fetch.assert_not_called()
+
+    async def test_upsert_relationships_resolves_names_server_side(self) -> None:
+        pool = _make_pool()
+        pool.fetch.return_value = [
+            {
+                "source_qualified_name": "m.A",
+                "target_qualified_name": "m.B",
+                "relationship_type": "calls",
+            }
+        ]
+
+        repo = RepositoryCodeEntity(pool)
+        relationships = [
+            {
+                "source_entity": "m.A",
+                "target_entity": "m.B",
+                "relationship_type": "calls",
+                "trust_tier": "weak",
+                "confidence": 0.5,
+                "evidence": ["line 3"],
+                "inject_into_context": False,
+            },
+            {
+                "source_entity": "m.A",
+                "target_entity": "missing.C",
+                "relationship_type": "imports",
+            },
+        ]
+        result = await repo.upsert_relationships(relationships, "my_repo")
+
+        assert result == [("m.A", "m.B", "calls")]
+        pool.fetch.assert_called_once()
+        positional = pool.fetch.call_args[0]
+        sql = positional[0]
+        assert "JOIN code_entities s" in sql
+        assert (
+            "ON CONFLICT (source_entity_id, target_entity_id, relationship_type)" in sql
+        )
+        assert positional[1] == ["m.A", "m.A"]
+        assert positional[2] == ["m.B", "missing.C"]
+        assert positional[4] == ["weak", "strong"]
+        assert positional[5] == [0.5, 1.0]
+        assert json.loads(positional[6][0]) == ["line 3"]
+        assert positional[7] == [False, True]
+        assert positional[8] == "my_repo"
+
+    async def test_upsert_relationships_empty_skips_query(self) -> None:
+        pool = _make_pool()
+
+        repo = RepositoryCodeEntity(pool)
+        assert await repo.upsert_relationships([], "my_repo") == []
+        pool.fetch.assert_not_called()
+
+
 @pytest.mark.unit
 class TestCheckFileHash:
     """Test check_file_hash skip optimization."""
@@ -242,6 +352,48 @@ class TestDeleteStaleEntities:
         assert "ALL" not in call_args[0]
 
 
+@pytest.mark.unit
+class TestDeleteStaleRelationships:
+    """Test zombie relationship cleanup."""
+
+    async def test_single_statement_with_keep_set(self) -> None:
+        pool = _make_pool()
+        pool.execute.return_value = "DELETE 3"
+
+        repo = RepositoryCodeEntity(pool)
+        result = await repo.delete_stale_relationships_for_file(
+            "src/foo.py",
+            "my_repo",
+            [("foo.A", "foo.B", "calls"), ("foo.A", "bar.C", "imports")],
+        )
+
+        assert result == 3
+        pool.execute.assert_called_once()
+        pool.fetch.assert_not_called()
+        pool.fetchrow.assert_not_called()
+        call_args = pool.execute.call_args[0]
+        assert "unnest($3::text[], $4::text[], $5::text[])" in call_args[0]
+        assert call_args[1:] == (
+            "src/foo.py",
+            "my_repo",
+            ["foo.A", "foo.A"],
+            ["foo.B", "bar.C"],
+            ["calls", "imports"],
+        )
+
+    async def test_empty_keep_set_passes_empty_arrays(self) -> None:
+        pool = _make_pool()
+        pool.execute.return_value = "DELETE 4"
+
+        repo = RepositoryCodeEntity(pool)
+        result = await repo.delete_stale_relationships_for_file(
+            "src/foo.py", "my_repo", []
+        )
+
+        assert result == 4
+        assert pool.execute.call_args[0][3:] == ([], [], [])
+
+
 @pytest.mark.unit
 class TestGetEntitiesNeeding:
     """Test query methods for enrichment and embedding pipelines."""
@@ -331,3 +483,99 @@ class TestUpdateMethods:
         pool.execute.assert_called_once()
         call_args = pool.execute.call_args[0]
         assert "last_graph_synced_at = NOW()" in call_args[0]
+        # updated_at drives incremental graph sync; recording a sync must not
+        # mark the entity as changed again
+        assert "updated_at" not in call_args[0].replace("last_graph_synced_at", "")
+
+
+@pytest.mark.unit
+class TestGraphSyncMethods:
+    """Test incremental graph sync queries (high-water mark + tombstones)."""
+
+    async def test_get_graph_sync_state(self) -> None:
+        pool = _make_pool()
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        pool.fetchrow.return_value = {"now": now, "high_water_mark": None}
+
+        repo = RepositoryCodeEntity(pool)
+        state = await repo.get_graph_sync_state("code_graph")
+
+        assert state == {"high_water_mark": None, "now": now}
+        call_args = pool.fetchrow.call_args[0]
+        assert "code_graph_sync_state" in call_args[0]
+        assert call_args[1] == "code_graph"
+
+    async def test_set_graph_sync_watermark_upserts(self) -> None:
+        pool = _make_pool()
+        mark = datetime(2026, 1, 1, tzinfo=UTC)
+
+        repo = RepositoryCodeEntity(pool)
+        await repo.set_graph_sync_watermark("code_graph", mark)
+
+        call_args = pool.execute.call_args[0]
+        assert "ON CONFLICT (sync_key) DO UPDATE" in call_args[0]
+        assert call_args[1:] == ("code_graph", mark)
+
+    async def test_get_entities_changed_page_uses_keyset(self) -> None:
+        pool = _make_pool()
+        pool.fetch.return_value = []
+        after = datetime(2026, 1, 1, tzinfo=UTC)
+        until = datetime(2026, 1, 2, tzinfo=UTC)
+        after_id = str(uuid4())
+
+        repo = RepositoryCodeEntity(pool)
+        result = await repo.get_entities_changed_page(
+            after_updated_at=after, after_id=after_id, until=until, limit=500
+        )
+
+        assert result == []
+        call_args = pool.fetch.call_args[0]
+        assert "(updated_at, id) > ($1, $2::uuid)" in call_args[0]
+        assert "ORDER BY updated_at, id" in call_args[0]
+        assert call_args[1:] == (after, after_id, until, 500)
+
+    async def test_get_relationships_changed_page_resolves_names(self) -> None:
+        pool = _make_pool()
+        pool.fetch.return_value = []
+
+        repo = RepositoryCodeEntity(pool)
+        await repo.get_relationships_changed_page(
+            after_updated_at=datetime(2026, 1, 1, tzinfo=UTC),
+            after_id=str(uuid4()),
+            until=datetime(2026, 1, 2, tzinfo=UTC),
+            limit=10,
+        )
+
+        sql = pool.fetch.call_args[0][0]
+        assert "source_qualified_name" in sql
+        assert "inject_into_context" in sql
+        # Non-injectable rows are returned so their edges can be removed
+        assert "WHERE cr.inject_into_context" not in sql
+
+    async def test_tombstone_pages(self) -> None:
+        pool = _make_pool()
+        pool.fetch.return_value = []
+        since = datetime(2026, 1, 1, tzinfo=UTC)
+        until = datetime(2026, 1, 2, tzinfo=UTC)
+
+        repo = RepositoryCodeEntity(pool)
+        await repo.get_entity_tombstones_page(
+            since=since, until=until, after_seq=7, limit=100
+        )
+        await repo.get_relationship_tombstones_page(
+            since=since, until=until, after_seq=0, limit=100
+        )
+
+        entity_call, relationship_call = pool.fetch.call_args_list
+        assert "FROM code_entity_tombstones" in entity_call[0][0]
+        assert entity_call[0][1:] == (since, until, 7, 100)
+        assert "FROM code_relationship_tombstones" in relationship_call[0][0]
+
+    async def test_prune_graph_tombstones_returns_total(self) -> None:
+        pool = _make_pool()
+        pool.execute.side_effect = ["DELETE 3", "DELETE 2"]
+
+        repo = RepositoryCodeEntity(pool)
+        deleted = await repo.prune_graph_tombstones(datetime(2026, 1, 1, tzinfo=UTC))
+
+        assert deleted == 5
@@ -87,6 +87,56 @@ class TestRepositoryEnrichment:
         assert "enrichment_metadata" in sql
         assert call_args[0][2] == 0.75  # $2 = quality_score
 
+    @pytest.mark.asyncio
+    async def test_update_quality_scores_bulk(self, mock_pool: MagicMock) -> None:
+        """update_quality_scores writes every entity in one statement."""
+        repo = RepositoryCodeEntity(mock_pool)
+        meta_patch = json.dumps({"quality": {"config_hash": "def456"}})
+        ids = [
+            "550e8400-e29b-41d4-a716-446655440000",
+            "550e8400-e29b-41d4-a716-446655440001",
+        ]
+
+        await repo.update_quality_scores(
+            [(ids[0], 0.75, '{"complexity": 0.7}'), (ids[1], 0.5, "{}")],
+            meta_patch,
+        )
+
+        mock_pool.execute.assert_called_once()
+        call_args = mock_pool.execute.call_args[0]
+        assert "unnest($1::uuid[], $2::float8[], $3::text[])" in call_args[0]
+        assert "enrichment_metadata || $4::jsonb" in call_args[0]
+        assert call_args[1:] == (
+            ids,
+            [0.75, 0.5],
+            ['{"complexity": 0.7}', "{}"],
+            meta_patch,
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_quality_scores_empty_skips_query(
+        self, mock_pool: MagicMock
+    ) -> None:
+        repo = RepositoryCodeEntity(mock_pool)
+
+        await repo.update_quality_scores([], "{}")
+
+        mock_pool.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_entities_by_ids_includes_idempotency_fields(
+        self, mock_pool: MagicMock
+    ) -> None:
+        """Rows carry line_number and enrichment metadata for the stages."""
+        repo = RepositoryCodeEntity(mock_pool)
+
+        await repo.get_entities_by_ids(["550e8400-e29b-41d4-a716-446655440000"])
+
+        sql = mock_pool.fetch.call_args[0][0]
+        assert "line_number" in sql
+        assert "file_hash" in sql
+        assert "enrichment_metadata" in sql
+
     @pytest.mark.asyncio
     async def test_get_entity_enrichment_metadata(self, mock_pool: MagicMock) -> None:
         """get_entity_enrichment_metadata returns file_hash and metadata."""
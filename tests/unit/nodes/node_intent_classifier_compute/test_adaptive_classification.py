@@ -88,6 +88,10 @@ MIN_CLASSIFIABLE_LENGTH: int = _handler_mod.MIN_CLASSIFIABLE_LENGTH
 AdaptiveClassificationResult = _handler_mod.AdaptiveClassificationResult
 _load_label_store = _handler_mod._load_label_store
 classify_intent_adaptive = _handler_mod.classify_intent_adaptive
+classify_intent_adaptive_batch = _handler_mod.classify_intent_adaptive_batch
+configure_classifier_snapshot = _handler_mod.configure_classifier_snapshot
+warm_up_classifier = _handler_mod.warm_up_classifier
+_snapshot_path = _handler_mod._snapshot_path
 get_classifier_version = _handler_mod.get_classifier_version
 reset_classifier = _handler_mod.reset_classifier
 
@@ -459,3 +463,93 @@ class TestMinClassifiableLength:
         assert result.classifier_version
         parts = result.classifier_version.split(".")
         assert len(parts) == 3, "Version must be semver"
+
+
+# ---------------------------------------------------------------------------
+# Batch classification tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestAdaptiveClassificationBatch:
+    """classify_intent_adaptive_batch matches per-text classification."""
+
+    def test_batch_matches_single_text_results(self) -> None:
+        """Each batch result equals classify_intent_adaptive for that text."""
+        texts = [
+            "Fix the failing login test",
+            "to",
+            "Explain how the caching layer works",
+            "Fix the failing login test",
+            "   ",
+        ]
+
+        batch = classify_intent_adaptive_batch(texts)
+
+        assert len(batch) == len(texts)
+        for text, result in zip(texts, batch, strict=True):
+            single = classify_intent_adaptive(text)
+            assert result.intent_label == single.intent_label
+            assert result.confidence == pytest.approx(single.confidence)
+            assert result.is_unknown == single.is_unknown
+            assert result.classifier_version == single.classifier_version
+
+    def test_batch_short_inputs_skip_classifier(self) -> None:
+        """Short inputs in a batch use the short-circuit unknown result."""
+        results = classify_intent_adaptive_batch(["t", "db"])
+        assert all(r.is_unknown and r.evidence == [] for r in results)
+
+    def test_empty_batch_returns_empty_list(self) -> None:
+        """An empty batch returns no results."""
+        assert classify_intent_adaptive_batch([]) == []
+
+
+# ---------------------------------------------------------------------------
+# Warm-start snapshot tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path: Path) -> Path:
+    """Enable classifier snapshots in a temporary directory for one test."""
+    configure_classifier_snapshot(tmp_path)
+    yield tmp_path
+    configure_classifier_snapshot(None)
+
+
+@pytest.mark.unit
+class TestClassifierSnapshot:
+    """Warm start from an on-disk classifier snapshot."""
+
+    def test_snapshot_path_keyed_by_version_and_examples(self, tmp_path: Path) -> None:
+        """Version and example changes produce distinct snapshot paths."""
+        examples = {"BUGFIX": ["fix the crash"]}
+
+        base = _snapshot_path(tmp_path, "1.0.0", examples)
+
+        assert base == _snapshot_path(tmp_path, "1.0.0", {"BUGFIX": ["fix the crash"]})
+        assert base != _snapshot_path(tmp_path, "1.1.0", examples)
+        assert base != _snapshot_path(tmp_path, "1.0.0", {"BUGFIX": ["fix it"]})
+        assert "1.0.0" in base.name
+        assert "all-MiniLM-L6-v2" in base.name
+
+    def test_warm_up_saves_snapshot(self, snapshot_dir: Path) -> None:
+        """First initialization writes a snapshot for the label store version."""
+        version = warm_up_classifier()
+
+        snapshots = [p for p in snapshot_dir.iterdir() if not p.name.startswith(".")]
+        assert len(snapshots) == 1
+        assert version in snapshots[0].name
+        assert (snapshots[0] / "model.safetensors").is_file()
+
+    def test_snapshot_load_matches_fresh_classifier(self, snapshot_dir: Path) -> None:
+        """A classifier loaded from the snapshot predicts like the fresh one."""
+        text = "Fix the null pointer exception in the login handler"
+        fresh = classify_intent_adaptive(text)
+
+        reset_classifier()
+        loaded = classify_intent_adaptive(text)
+
+        assert loaded.intent_label == fresh.intent_label
+        assert loaded.confidence == pytest.approx(fresh.confidence, abs=1e-5)
+        assert loaded.classifier_version == fresh.classifier_version
@@ -24,6 +24,7 @@ import pytest
 
 from omniintelligence.nodes.node_intent_classifier_compute.handlers import (
     handle_intent_classification,
+    handle_intent_classification_batch,
 )
 from omniintelligence.nodes.node_intent_classifier_compute.handlers.handler_langextract import (
     create_empty_semantic_result,
@@ -340,3 +341,55 @@ class TestLangextractBoostIntegration:
             )
 
         assert captured_kwargs.get("multi_label") is True
+
+
+# =============================================================================
+# handle_intent_classification_batch
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestHandleIntentClassificationBatch:
+    """Tests for the batch entry point used by prompt backfills."""
+
+    def test_batch_matches_single_item_results(self) -> None:
+        """Each batch output matches handle_intent_classification for that input."""
+        inputs = [
+            _make_input("Generate a Python function"),
+            _make_input("Fix the authentication bug"),
+            _make_input("   "),
+            _make_input("Generate a Python function"),
+        ]
+
+        outputs = handle_intent_classification_batch(inputs, _DEFAULT_CONFIG)
+
+        assert len(outputs) == len(inputs)
+        for input_data, output in zip(inputs, outputs, strict=True):
+            single = handle_intent_classification(input_data, _DEFAULT_CONFIG)
+            assert output.success == single.success
+            assert output.intent_category == single.intent_category
+            assert output.confidence == single.confidence
+            assert output.keywords == single.keywords
+            assert output.secondary_intents == single.secondary_intents
+
+    def test_duplicate_content_is_analyzed_once(self) -> None:
+        """Semantic analysis runs once per distinct content in a batch."""
+        from omniintelligence.nodes.node_intent_classifier_compute.handlers.handler_langextract import (
+            analyze_semantics as real_analyze_semantics,
+        )
+
+        inputs = [_make_input("Write unit tests")] * 3 + [_make_input("Add docs")]
+
+        with patch(
+            "omniintelligence.nodes.node_intent_classifier_compute.handlers"
+            ".handler_intent_classification.analyze_semantics",
+            wraps=real_analyze_semantics,
+        ) as mock_analyze:
+            outputs = handle_intent_classification_batch(inputs, _DEFAULT_CONFIG)
+
+        assert mock_analyze.call_count == 2
+        assert all(output.success for output in outputs)
+
+    def test_empty_batch_returns_empty_list(self) -> None:
+        """An empty batch returns no outputs."""
+        assert handle_intent_classification_batch([], _DEFAULT_CONFIG) == []
@@ -20,6 +20,13 @@ from omniintelligence.nodes.node_intent_classifier_compute.handlers import (
     INTENT_PATTERNS,
     classify_intent,
 )
+from omniintelligence.nodes.node_intent_classifier_compute.handlers.handler_intent_classification import (
+    _NORMALIZED_PATTERNS,
+    _calculate_intent_score,
+    _calculate_term_frequency,
+    _get_intent_matcher,
+    _tokenize,
+)
 from omniintelligence.nodes.node_intent_classifier_compute.models import (
     ModelClassificationConfig,
 )
@@ -886,3 +893,47 @@ class TestScoreBoosts:
         result = classify_intent("generate code", confidence_threshold=0.0)
         assert len(result["all_scores"]) > 0
         assert any(v > 0.0 for v in result["all_scores"].values())
+
+
+# =============================================================================
+# Compiled Keyword Matcher Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestCompiledIntentMatcher:
+    """The compiled matcher must agree with the per-intent reference scorer."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "Please generate a Python function to parse JSON",
+            "Fix the authentication token expiration bug in the api endpoint",
+            "refactoring the restful middleware; unittests for validation tests",
+            "re api es a x docs docstrings comments comprehensive coverage",
+            "analyze analyze analyze semantic meaning of the database schema",
+        ],
+    )
+    @pytest.mark.parametrize("min_pattern_length", [1, 3, 6])
+    def test_matches_reference_scorer(
+        self, content: str, min_pattern_length: int
+    ) -> None:
+        config = ModelClassificationConfig(
+            min_pattern_length_for_partial=min_pattern_length,
+            partial_match_weight=0.7,
+        )
+        tokens = _tokenize(content)
+        tf_scores = _calculate_term_frequency(tokens)
+
+        scores, keywords = _get_intent_matcher(min_pattern_length).score(
+            tf_scores, config
+        )
+
+        assert list(scores) == list(_NORMALIZED_PATTERNS)
+        for intent, patterns in _NORMALIZED_PATTERNS.items():
+            expected = _calculate_intent_score(tf_scores, patterns, tokens, config)
+            assert (scores[intent], keywords[intent]) == expected
+
+    def test_matcher_is_compiled_once_per_length(self) -> None:
+        assert _get_intent_matcher(3) is _get_intent_matcher(3)
+        assert _get_intent_matcher(3) is not _get_intent_matcher(4)
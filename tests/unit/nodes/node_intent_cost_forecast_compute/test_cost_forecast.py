@@ -7,6 +7,7 @@ Tests:
     - Baseline seeding produces non-empty distributions for all 8 intent classes
     - compute_forecast returns a frozen ModelIntentCostForecast
     - update_baseline accumulates real observations and increments sample_count
+    - Quantile sketches stay bounded, merge and serialize losslessly
     - check_escalation fires when actual tokens exceed p90
     - compute_accuracy_record captures actual vs. forecasted correctly
     - Confidence interval widens as classification confidence drops
@@ -18,6 +19,9 @@ Reference: OMN-2490
 
 from __future__ import annotations
 
+import json
+import statistics
+from bisect import bisect_left
 from datetime import UTC, datetime
 from uuid import uuid4
 
@@ -34,6 +38,7 @@ from omniintelligence.nodes.node_intent_cost_forecast_compute.models import (
     ModelCostBaseline,
     ModelIntentCostForecast,
     ModelIntentCostForecastInput,
+    ModelQuantileSketch,
     build_all_seeded_baselines,
     build_seeded_baseline,
 )
@@ -79,12 +84,12 @@ class TestBaselineSeeding:
     def test_build_seeded_baseline_has_token_samples(self) -> None:
         """Seeded baseline has non-empty token samples."""
         baseline = build_seeded_baseline(EnumIntentClass.REFACTOR)
-        assert len(baseline.token_samples) > 0
+        assert baseline.token_sketch.count > 0
 
     def test_build_seeded_baseline_has_latency_samples(self) -> None:
         """Seeded baseline has non-empty latency samples."""
         baseline = build_seeded_baseline(EnumIntentClass.FEATURE)
-        assert len(baseline.latency_samples_ms) > 0
+        assert baseline.latency_sketch_ms.count > 0
 
     def test_build_seeded_baseline_sample_count_is_zero(self) -> None:
         """Seeded baseline sample_count is 0 (synthetic seeds are not real observations)."""
@@ -314,20 +319,21 @@ class TestUpdateBaseline:
         assert baseline.sample_count == initial_count + 1
 
     def test_update_appends_token_sample(self) -> None:
-        """update_baseline appends the token count to token_samples."""
+        """update_baseline records the token count in token_sketch."""
         baseline = build_seeded_baseline(EnumIntentClass.REFACTOR)
-        initial_len = len(baseline.token_samples)
+        initial_count = baseline.token_sketch.count
         update_baseline(baseline, actual_tokens=9999, actual_latency_ms=5000.0)
-        assert len(baseline.token_samples) == initial_len + 1
-        assert baseline.token_samples[-1] == 9999
+        assert baseline.token_sketch.count == initial_count + 1
+        assert baseline.token_sketch.max_value == 9999
 
     def test_update_appends_latency_sample(self) -> None:
-        """update_baseline appends the latency observation to latency_samples_ms."""
+        """update_baseline records the latency observation in latency_sketch_ms."""
         baseline = build_seeded_baseline(EnumIntentClass.BUGFIX)
-        initial_len = len(baseline.latency_samples_ms)
+        initial_count = baseline.latency_sketch_ms.count
+        initial_total = baseline.latency_sketch_ms.total
         update_baseline(baseline, actual_tokens=2000, actual_latency_ms=7777.5)
-        assert len(baseline.latency_samples_ms) == initial_len + 1
-        assert baseline.latency_samples_ms[-1] == pytest.approx(7777.5)
+        assert baseline.latency_sketch_ms.count == initial_count + 1
+        assert baseline.latency_sketch_ms.total == pytest.approx(initial_total + 7777.5)
 
     def test_multiple_updates_shift_percentiles(self) -> None:
         """After many high-token updates, p90 should rise above the original seeded value."""
@@ -361,6 +367,106 @@ class TestUpdateBaseline:
         assert after.estimated_tokens_p90 > before.estimated_tokens_p90
 
 
+# ---------------------------------------------------------------------------
+# Quantile sketch tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+@pytest.mark.baseline
+class TestQuantileSketch:
+    """Tests for the KLL sketch backing baseline percentiles."""
+
+    def test_small_sketch_matches_statistics_quantiles(self) -> None:
+        """Before any compaction, percentiles match the statistics module."""
+        samples = [2200, 2800, 3500, 4100, 5000, 9999, 1]
+        sketch = ModelQuantileSketch()
+        for value in samples:
+            sketch.add(value)
+        assert sketch.is_exact
+        assert sketch.quantile(0.5) == pytest.approx(statistics.median(samples))
+        assert sketch.quantile(0.9) == pytest.approx(
+            statistics.quantiles(samples, n=10)[8]
+        )
+        assert sketch.quantile(0.99) == pytest.approx(
+            statistics.quantiles(samples, n=100)[98]
+        )
+
+    def test_large_stream_is_bounded_and_within_rank_error(self) -> None:
+        """Retained values stay O(k) and ranks stay within the documented bound."""
+        samples = [(i * 7919) % 50_000 for i in range(50_000)]
+        sketch = ModelQuantileSketch()
+        for value in samples:
+            sketch.add(value)
+        ordered = sorted(samples)
+
+        assert not sketch.is_exact
+        assert sum(len(level) for level in sketch.levels) <= 4 * sketch.k
+        assert sketch.mean == pytest.approx(statistics.fmean(samples))
+        for q in (0.5, 0.9, 0.99):
+            rank = bisect_left(ordered, sketch.quantile(q)) / len(ordered)
+            assert abs(rank - q) <= 0.017
+
+    def test_merge_matches_combined_stream(self) -> None:
+        """Merging two sketches tracks the quantiles of the combined stream."""
+        left, right = ModelQuantileSketch(), ModelQuantileSketch()
+        for i in range(20_000):
+            left.add(i)
+            right.add(20_000 + i)
+        left.merge(right)
+        assert left.count == 40_000
+        assert left.min_value == 0
+        assert left.max_value == 39_999
+        assert abs(left.quantile(0.5) - 20_000) <= 0.017 * 40_000
+
+    def test_merge_rejects_mismatched_k(self) -> None:
+        """Sketches with different accuracy parameters cannot be merged."""
+        with pytest.raises(ValueError, match="k="):
+            ModelQuantileSketch(k=100).merge(ModelQuantileSketch(k=200))
+
+    def test_round_trip_preserves_state_and_future_updates(self) -> None:
+        """from_dict(to_dict()) restores an identical, equally-evolving sketch."""
+        sketch = ModelQuantileSketch()
+        for i in range(5_000):
+            sketch.add(i % 997)
+        restored = ModelQuantileSketch.from_dict(
+            json.loads(json.dumps(sketch.to_dict()))
+        )
+        assert restored == sketch
+        for i in range(1_000):
+            sketch.add(i)
+            restored.add(i)
+        assert restored == sketch
+        assert restored.quantile(0.9) == sketch.quantile(0.9)
+
+    def test_quantile_rejects_out_of_range(self) -> None:
+        """q outside [0, 1] is rejected."""
+        with pytest.raises(ValueError, match="q must be"):
+            ModelQuantileSketch().quantile(1.5)
+
+    def test_baseline_round_trip_and_merge(self) -> None:
+        """Baselines serialize losslessly and merge worker deltas."""
+        baseline = build_seeded_baseline(EnumIntentClass.FEATURE)
+        delta = ModelCostBaseline(intent_class=EnumIntentClass.FEATURE)
+        update_baseline(delta, actual_tokens=12_000, actual_latency_ms=50_000.0)
+
+        restored = ModelCostBaseline.from_dict(
+            json.loads(json.dumps(baseline.to_dict()))
+        )
+        assert restored == baseline
+
+        restored.merge(delta)
+        assert restored.sample_count == 1
+        assert restored.token_sketch.count == baseline.token_sketch.count + 1
+        assert restored.token_p99 > baseline.token_p99
+
+    def test_baseline_merge_rejects_other_intent_class(self) -> None:
+        """Baselines for different intent classes cannot be merged."""
+        baseline = build_seeded_baseline(EnumIntentClass.FEATURE)
+        with pytest.raises(ValueError, match="Cannot merge"):
+            baseline.merge(build_seeded_baseline(EnumIntentClass.BUGFIX))
+
+
 # ---------------------------------------------------------------------------
 # Escalation tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,552 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the session outcome write-coalescing aggregator.
+
+Covers:
+- Single-outcome windows match the per-session rolling metric updates
+- Concurrent sessions coalesce into one set-based metrics statement
+- Failed flushes propagate to every caller and leave injections unrecorded
+- Retries after a failure never apply a session's metrics twice
+- Duplicate deliveries of a buffered session share one flush
+- record_session_outcome() routed through an aggregator
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from omniintelligence.enums import EnumHeuristicMethod
+from omniintelligence.nodes.node_pattern_feedback_effect.handlers import (
+    SessionOutcomeAggregator,
+    record_session_outcome,
+)
+from omniintelligence.nodes.node_pattern_feedback_effect.handlers.handler_outcome_aggregator import (
+    SQL_RECORD_COALESCED_OUTCOMES,
+)
+from omniintelligence.nodes.node_pattern_feedback_effect.models import (
+    EnumOutcomeRecordingStatus,
+)
+
+# =============================================================================
+# Mock Repository
+# =============================================================================
+
+
+@dataclass
+class PatternState:
+    """In-memory learned_patterns row (rolling metric columns only)."""
+
+    id: UUID
+    injection_count_rolling_20: int = 0
+    success_count_rolling_20: int = 0
+    failure_count_rolling_20: int = 0
+    failure_streak: int = 0
+
+
+@dataclass
+class InjectionState:
+    """In-memory pattern_injections row."""
+
+    injection_id: UUID
+    session_id: UUID
+    pattern_ids: list[UUID]
+    outcome_recorded: bool = False
+    outcome_success: bool | None = None
+    contribution_heuristic: str | None = None
+
+
+class MockCoalescingRepository:
+    """In-memory repository simulating the coalesced SQL statements.
+
+    Also serves the per-session lookup queries so record_session_outcome()
+    can run end to end against it.
+    """
+
+    def __init__(self) -> None:
+        self.patterns: dict[UUID, PatternState] = {}
+        self.injections: list[InjectionState] = []
+        self.queries_executed: list[tuple[str, tuple[Any, ...]]] = []
+        self.fail_metrics = False
+        self.fail_pattern_ids: set[UUID] = set()
+        self.fail_injection_ids: set[UUID] = set()
+        self.fail_scores = False
+        self.lose_response_once = False
+        self.metrics_gate: asyncio.Event | None = None
+
+    def add_session(self, session_id: UUID, *pattern_ids: UUID) -> None:
+        for pid in pattern_ids:
+            self.patterns.setdefault(pid, PatternState(id=pid))
+        self.injections.append(
+            InjectionState(
+                injection_id=uuid4(),
+                session_id=session_id,
+                pattern_ids=list(pattern_ids),
+            )
+        )
+
+    def rows_for(self, session_id: UUID) -> list[dict[str, Any]]:
+        return [
+            {"injection_id": inj.injection_id, "pattern_ids": inj.pattern_ids}
+            for inj in self.injections
+            if inj.session_id == session_id and not inj.outcome_recorded
+        ]
+
+    def count(self, fragment: str) -> int:
+        return sum(1 for query, _ in self.queries_executed if fragment in query)
+
+    async def fetch(self, query: str, *args: Any) -> list[dict[str, Any]]:
+        self.queries_executed.append((query, args))
+
+        if query == SQL_RECORD_COALESCED_OUTCOMES:
+            if self.metrics_gate is not None:
+                await self.metrics_gate.wait()
+            # The statement is atomic: failures leave every row untouched.
+            if self.fail_metrics:
+                raise ConnectionError("connection reset")
+            if self.fail_injection_ids.intersection(args[0]):
+                raise ValueError("invalid input value for pattern_injections")
+            if self.fail_pattern_ids.intersection(args[5]):
+                raise ValueError("invalid input value")
+            rows = self._record_outcomes(*args)
+            if self.lose_response_once:
+                # Committed, but the connection dropped before the reply.
+                self.lose_response_once = False
+                raise ConnectionError("connection reset after commit")
+            return rows
+
+        if "quality_score" in query:
+            if self.fail_scores:
+                raise ConnectionError("connection reset")
+            return [
+                {
+                    "id": pid,
+                    "quality_score": (
+                        p.success_count_rolling_20 / p.injection_count_rolling_20
+                    ),
+                }
+                for pid in args[0]
+                if (p := self.patterns.get(pid)) and p.injection_count_rolling_20
+            ]
+
+        if "COUNT(*)" in query:
+            return [
+                {
+                    "count": sum(
+                        1 for inj in self.injections if inj.session_id == args[0]
+                    )
+                }
+            ]
+
+        if "outcome_recorded = FALSE" in query:
+            return self.rows_for(args[0])
+
+        return []
+
+    async def fetchrow(self, query: str, *args: Any) -> dict[str, Any] | None:
+        rows = await self.fetch(query, *args)
+        return rows[0] if rows else None
+
+    async def execute(self, query: str, *args: Any) -> str:
+        self.queries_executed.append((query, args))
+        if "contribution_heuristic" in query and "unnest" in query:
+            count = 0
+            for injection_id, weights in zip(args[0], args[1], strict=True):
+                for inj in self.injections:
+                    if (
+                        inj.injection_id == injection_id
+                        and inj.contribution_heuristic is None
+                    ):
+                        inj.contribution_heuristic = weights
+                        count += 1
+            return f"UPDATE {count}"
+        return "UPDATE 0"
+
+    def _record_outcomes(
+        self,
+        injection_ids: list[UUID],
+        ordinals: list[int],
+        successes: list[bool],
+        _reasons: list[str | None],
+        pattern_ordinals: list[int],
+        pattern_ids: list[UUID],
+        window: int,
+    ) -> list[dict[str, Any]]:
+        """Mirror SQL_RECORD_COALESCED_OUTCOMES."""
+        rows: list[dict[str, Any]] = []
+        recorded: dict[int, bool] = {}
+        for injection_id, ordinal, success in zip(
+            injection_ids, ordinals, successes, strict=True
+        ):
+            for inj in self.injections:
+                if inj.injection_id == injection_id and not inj.outcome_recorded:
+                    inj.outcome_recorded = True
+                    inj.outcome_success = success
+                    recorded[ordinal] = success
+                    rows.append({"session_ord": ordinal, "id": None})
+
+        sequences: dict[UUID, list[tuple[int, str]]] = {}
+        for ordinal, pid in zip(pattern_ordinals, pattern_ids, strict=True):
+            if ordinal in recorded:
+                outcome = "S" if recorded[ordinal] else "F"
+                sequences.setdefault(pid, []).append((ordinal, outcome))
+
+        for pid, entries in sequences.items():
+            seq = "".join(outcome for _, outcome in sorted(entries))
+            s, f = seq.count("S"), seq.count("F")
+            trailing = len(seq) - len(seq.rstrip("F"))
+            p = self.patterns.get(pid)
+            if p is None:
+                continue
+            overflow = max(p.injection_count_rolling_20 + s + f - window, 0)
+            suffix = seq[len(seq) - overflow :] if overflow else ""
+            p.success_count_rolling_20 = min(
+                max(p.success_count_rolling_20 + s - suffix.count("F"), 0), window
+            )
+            p.failure_count_rolling_20 = min(
+                max(p.failure_count_rolling_20 + f - suffix.count("S"), 0), window
+            )
+            p.injection_count_rolling_20 = min(
+                p.injection_count_rolling_20 + s + f, window
+            )
+            p.failure_streak = trailing if s > 0 else p.failure_streak + f
+            rows.append({"session_ord": None, "id": pid})
+        return rows
+
+
+def _sequential(state: PatternState, success: bool) -> PatternState:
+    """Apply one outcome with the per-session SQL semantics."""
+    at_cap = state.injection_count_rolling_20 >= 20
+    result = PatternState(
+        id=state.id,
+        injection_count_rolling_20=min(state.injection_count_rolling_20 + 1, 20),
+        success_count_rolling_20=state.success_count_rolling_20,
+        failure_count_rolling_20=state.failure_count_rolling_20,
+    )
+    if success:
+        result.success_count_rolling_20 = min(result.success_count_rolling_20 + 1, 20)
+        if at_cap and result.failure_count_rolling_20 > 0:
+            result.failure_count_rolling_20 -= 1
+        result.failure_streak = 0
+    else:
+        result.failure_count_rolling_20 = min(result.failure_count_rolling_20 + 1, 20)
+        if at_cap and result.success_count_rolling_20 > 0:
+            result.success_count_rolling_20 -= 1
+        result.failure_streak = state.failure_streak + 1
+    return result
+
+
+async def _submit(
+    aggregator: SessionOutcomeAggregator,
+    repo: MockCoalescingRepository,
+    session_id: UUID,
+    success: bool,
+) -> Any:
+    return await aggregator.submit(
+        session_id=session_id,
+        success=success,
+        failure_reason=None if success else "tests failed",
+        injection_rows=repo.rows_for(session_id),
+        heuristic_method=EnumHeuristicMethod.EQUAL_SPLIT,
+    )
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestCoalescedMetrics:
+    """Rolling metric semantics of coalesced flushes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("success", [True, False])
+    @pytest.mark.parametrize(
+        ("injections", "successes", "failures", "streak"),
+        [(0, 0, 0, 0), (5, 3, 2, 1), (20, 15, 5, 2), (20, 0, 20, 20), (20, 20, 0, 0)],
+    )
+    async def test_single_outcome_window_matches_per_session_update(
+        self,
+        success: bool,
+        injections: int,
+        successes: int,
+        failures: int,
+        streak: int,
+    ) -> None:
+        repo = MockCoalescingRepository()
+        pid = uuid4()
+        session_id = uuid4()
+        repo.add_session(session_id, pid)
+        initial = PatternState(
+            id=pid,
+            injection_count_rolling_20=injections,
+            success_count_rolling_20=successes,
+            failure_count_rolling_20=failures,
+            failure_streak=streak,
+        )
+        repo.patterns[pid] = PatternState(**vars(initial))
+        aggregator = SessionOutcomeAggregator(repo, window_ms=0)
+
+        await _submit(aggregator, repo, session_id, success)
+
+        assert repo.patterns[pid] == _sequential(initial, success)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_share_one_metrics_statement(self) -> None:
+        repo = MockCoalescingRepository()
+        shared, other = uuid4(), uuid4()
+        sessions = [uuid4() for _ in range(5)]
+        for session_id in sessions:
+            repo.add_session(session_id, shared, other)
+        aggregator = SessionOutcomeAggregator(repo, window_ms=10_000)
+
+        outcomes = [True, False, True, False, False]
+        results = await asyncio.gather(
+            *(
+                _submit(aggregator, repo, session_id, success)
+                for session_id, success in zip(sessions, outcomes, strict=True)
+            ),
+            aggregator.flush(),
+        )
+
+        assert repo.count("d.outcomes") == 1
+        assert repo.count("outcome_recorded = TRUE") == 1
+        p = repo.patterns[shared]
+        assert p.injection_count_rolling_20 == 5
+        assert p.success_count_rolling_20 == 2
+        assert p.failure_count_rolling_20 == 3
+        assert p.failure_streak == 2
+        assert all(inj.outcome_recorded for inj in repo.injections)
+        assert all(inj.contribution_heuristic for inj in repo.injections)
+        for result in results[:5]:
+            assert result["injections_updated"] == 1
+            assert result["patterns_updated"] == 2
+            assert set(result["effectiveness_scores"]) == {shared, other}
+
+    @pytest.mark.asyncio
+    async def test_max_pending_sessions_flushes_without_waiting(self) -> None:
+        repo = MockCoalescingRepository()
+        pid = uuid4()
+        sessions = [uuid4(), uuid4()]
+        for session_id in sessions:
+            repo.add_session(session_id, pid)
+        aggregator = SessionOutcomeAggregator(
+            repo, window_ms=60_000, max_pending_sessions=2
+        )
+
+        await asyncio.wait_for(
+            asyncio.gather(*(_submit(aggregator, repo, s, True) for s in sessions)),
+            timeout=1.0,
+        )
+
+        assert repo.patterns[pid].success_count_rolling_20 == 2
+        assert aggregator.pending_count == 0
+
+
+class TestDeliverySemantics:
+    """Failure propagation and duplicate handling."""
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_raises_and_leaves_injections_unrecorded(
+        self,
+    ) -> None:
+        repo = MockCoalescingRepository()
+        pid = uuid4()
+        sessions = [uuid4(), uuid4()]
+        for session_id in sessions:
+            repo.add_session(session_id, pid)
+        repo.fail_metrics = True
+        aggregator = SessionOutcomeAggregator(repo, window_ms=10_000)
+
+        results = await asyncio.gather(
+            *(_submit(aggregator, repo, s, True) for s in sessions),
+            aggregator.flush(),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results[:2])
+        assert not any(inj.outcome_recorded for inj in repo.injections)
+
+        # Redelivery after recovery records both sessions.
+        repo.fail_metrics = False
+        await asyncio.gather(
+            *(_submit(aggregator, repo, s, True) for s in sessions),
+            aggregator.flush(),
+        )
+        assert all(inj.outcome_recorded for inj in repo.injections)
+        assert repo.patterns[pid].success_count_rolling_20 == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_per_session_writes(self) -> None:
+        repo = MockCoalescingRepository()
+        good, poison = uuid4(), uuid4()
+        ok_session, bad_session = uuid4(), uuid4()
+        repo.add_session(ok_session, good)
+        repo.add_session(bad_session, poison)
+        repo.fail_pattern_ids = {poison}
+        aggregator = SessionOutcomeAggregator(repo, window_ms=10_000)
+
+        ok_result, bad_result, _ = await asyncio.gather(
+            _submit(aggregator, repo, ok_session, True),
+            _submit(aggregator, repo, bad_session, True),
+            aggregator.flush(),
+            return_exceptions=True,
+        )
+
+        assert isinstance(bad_result, ValueError)
+        assert ok_result["injections_updated"] == 1
+        assert repo.patterns[good].success_count_rolling_20 == 1
+        assert [inj.outcome_recorded for inj in repo.injections] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_failure_at_mark_applies_each_session_once(self) -> None:
+        repo = MockCoalescingRepository()
+        pid = uuid4()
+        ok_session, bad_session = uuid4(), uuid4()
+        repo.add_session(ok_session, pid)
+        repo.add_session(bad_session, pid)
+        repo.fail_injection_ids = {repo.injections[1].injection_id}
+        aggregator = SessionOutcomeAggregator(repo, window_ms=10_000)
+
+        ok_result, bad_result, _ = await asyncio.gather(
+            _submit(aggregator, repo, ok_session, True),
+            _submit(aggregator, repo, bad_session, True),
+            aggregator.flush(),
+            return_exceptions=True,
+        )
+
+        assert isinstance(bad_result, ValueError)
+        assert ok_result["injections_updated"] == 1
+        assert repo.patterns[pid].injection_count_rolling_20 == 1
+        assert [inj.outcome_recorded for inj in repo.injections] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_committed_flush_does_not_double_count(self) -> None:
+        repo = MockCoalescingRepository()
+        pid = uuid4()
+        sessions = [uuid4(), uuid4()]
+        for session_id in sessions:
+            repo.add_session(session_id, pid)
+        repo.lose_response_once = True
+        aggregator = SessionOutcomeAggregator(repo, window_ms=10_000)
+
+        results = await asyncio.gather(
+            *(_submit(aggregator, repo, s, False) for s in sessions),
+            aggregator.flush(),
+        )
+
+        p = repo.patterns[pid]
+        assert p.injection_count_rolling_20 == 2
+        assert p.failure_count_rolling_20 == 2
+        assert p.failure_streak == 2
+        assert [r["injections_updated"] for r in results[:2]] == [0, 0]
+
+    @pytest.mark.asyncio
+    async def test_scoring_failure_keeps_metrics_and_skips_retry(self) -> None:
+        repo = MockCoalescingRepository()
+        pid = uuid4()
+        sessions = [uuid4(), uuid4()]
+        for session_id in sessions:
+            repo.add_session(session_id, pid)
+        repo.fail_scores = True
+        aggregator = SessionOutcomeAggregator(repo, window_ms=10_000)
+
+        results = await asyncio.gather(
+            *(_submit(aggregator, repo, s, True) for s in sessions),
+            aggregator.flush(),
+        )
+
+        assert repo.count("d.outcomes") == 1
+        assert repo.patterns[pid].success_count_rolling_20 == 2
+        assert all(r["effectiveness_scores"] is None for r in results[:2])
+
+    @pytest.mark.asyncio
+    async def test_cancelled_submitter_does_not_strand_other_callers(self) -> None:
+        repo = MockCoalescingRepository()
+        pid = uuid4()
+        waiting, cancelled = uuid4(), uuid4()
+        repo.add_session(waiting, pid)
+        repo.add_session(cancelled, pid)
+        repo.metrics_gate = asyncio.Event()
+        aggregator = SessionOutcomeAggregator(
+            repo, window_ms=60_000, max_pending_sessions=2
+        )
+
+        waiter = asyncio.create_task(_submit(aggregator, repo, waiting, True))
+        await asyncio.sleep(0)
+        # This submission fills the batch and starts the flush.
+        trigger = asyncio.create_task(_submit(aggregator, repo, cancelled, True))
+        await asyncio.sleep(0)
+        trigger.cancel()
+        repo.metrics_gate.set()
+
+        result = await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert result["injections_updated"] == 1
+        assert repo.patterns[pid].injection_count_rolling_20 == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_delivery_shares_buffered_flush(self) -> None:
+        repo = MockCoalescingRepository()
+        pid = uuid4()
+        session_id = uuid4()
+        repo.add_session(session_id, pid)
+        aggregator = SessionOutcomeAggregator(repo, window_ms=10_000)
+
+        first, second, _ = await asyncio.gather(
+            _submit(aggregator, repo, session_id, True),
+            _submit(aggregator, repo, session_id, True),
+            aggregator.flush(),
+        )
+
+        assert first == second
+        assert repo.patterns[pid].injection_count_rolling_20 == 1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"window_ms": -1.0}, {"max_pending_sessions": 0}],
+    )
+    def test_invalid_configuration_raises(self, kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError):
+            SessionOutcomeAggregator(MockCoalescingRepository(), **kwargs)
+
+
+class TestRecordSessionOutcomeWithAggregator:
+    """record_session_outcome() routed through the aggregator."""
+
+    @pytest.mark.asyncio
+    async def test_records_via_coalesced_writes(self) -> None:
+        repo = MockCoalescingRepository()
+        pids = [uuid4(), uuid4()]
+        session_id = uuid4()
+        repo.add_session(session_id, *pids)
+        aggregator = SessionOutcomeAggregator(repo, window_ms=0)
+
+        result = await record_session_outcome(
+            session_id=session_id,
+            success=True,
+            repository=repo,
+            aggregator=aggregator,
+        )
+
+        assert result.status == EnumOutcomeRecordingStatus.SUCCESS
+        assert result.injections_updated == 1
+        assert result.patterns_updated == 2
+        assert set(result.pattern_ids) == set(pids)
+        assert result.effectiveness_scores == dict.fromkeys(pids, 1.0)
+        assert repo.count("failure_streak = 0") == 0  # per-session SQL unused
+
+        again = await record_session_outcome(
+            session_id=session_id,
+            success=True,
+            repository=repo,
+            aggregator=aggregator,
+        )
+        assert again.status == EnumOutcomeRecordingStatus.ALREADY_RECORDED
@@ -5,10 +5,25 @@
 
 from __future__ import annotations
 
+import random
+
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.presets import (
+    ONEX_PATTERN_KEYWORDS,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.protocols import (
+    ExtractedFeaturesDict,
+    StructuralFeaturesDict,
+)
 from omniintelligence.nodes.node_pattern_learning_compute.models import (
     TrainingDataItemDict,
 )
 
+_KEYWORD_POOL = tuple(f"kw_{i}" for i in range(30)) + tuple(
+    sorted(ONEX_PATTERN_KEYWORDS)
+)
+_PATTERN_POOL = ("frozen", "pydantic_model", "protocol", "node_compute", "enum")
+_LABEL_POOL = ("compute", "effect", "reducer", "orchestrator")
+
 
 def make_training_item(
     item_id: str,
@@ -42,3 +57,41 @@ def make_training_item(
         context="test",
         framework="onex",
     )
+
+
+def make_random_corpus(seed: int, n: int) -> list[ExtractedFeaturesDict]:
+    """Factory for seeded random feature corpora.
+
+    Draws keywords, pattern indicators, and labels from small shared pools so
+    that pairs overlap often enough to exercise every similarity component.
+
+    Args:
+        seed: Seed for the random generator (same seed, same corpus).
+        n: Number of feature dicts to generate.
+
+    Returns:
+        A list of ExtractedFeaturesDict with item IDs ``item-0000`` onward.
+    """
+    rng = random.Random(seed)
+    return [
+        ExtractedFeaturesDict(
+            item_id=f"item-{i:04d}",
+            keywords=tuple(rng.sample(_KEYWORD_POOL, rng.randint(0, 10))),
+            pattern_indicators=tuple(rng.sample(_PATTERN_POOL, rng.randint(0, 3))),
+            structural=StructuralFeaturesDict(
+                class_count=rng.randint(0, 30),
+                function_count=rng.randint(0, 80),
+                max_nesting_depth=rng.randint(0, 12),
+                line_count=rng.randint(1, 900),
+                cyclomatic_complexity=rng.randint(1, 70),
+                has_type_hints=rng.random() < 0.5,
+                has_docstrings=rng.random() < 0.5,
+            ),
+            base_classes=(),
+            decorators=(),
+            labels=tuple(rng.sample(_LABEL_POOL, rng.randint(0, 2))),
+            language="python",
+            extraction_quality="full",
+        )
+        for i in range(n)
+    ]
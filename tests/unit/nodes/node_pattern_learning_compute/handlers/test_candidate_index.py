@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the candidate pair blocking index.
+
+This module tests the lossless blocking stage used by cluster_patterns:
+    - iter_candidate_pairs: superset of all pairs clearing the threshold
+    - select_index_components: lossless subset selection and fallback
+    - cluster_patterns parity: blocked output == exhaustive output
+
+The benchmark class compares exact vs. blocked clustering on recorded
+training data (top-level definitions of this repository's own source tree).
+"""
+
+from __future__ import annotations
+
+import ast
+import time
+from pathlib import Path
+
+import pytest
+
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.candidate_index import (
+    iter_candidate_pairs,
+    select_index_components,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.handler_feature_extraction import (
+    extract_features_batch,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.handler_pattern_clustering import (
+    cluster_patterns,
+    compute_similarity,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.presets import (
+    DEFAULT_SIMILARITY_WEIGHTS,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.protocols import (
+    SimilarityWeightsDict,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.models import (
+    TrainingDataItemDict,
+)
+from tests.unit.nodes.node_pattern_learning_compute.handlers.conftest import (
+    make_random_corpus,
+)
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+_SRC_ROOT = Path(__file__).resolve().parents[5] / "src" / "omniintelligence"
+
+
+def _recorded_training_items(limit: int) -> list[TrainingDataItemDict]:
+    """Top-level functions/classes of this repository as training items."""
+    items: list[TrainingDataItemDict] = []
+    for path in sorted(_SRC_ROOT.rglob("*.py")):
+        source = path.read_text(encoding="utf-8")
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            continue
+        for node in tree.body:
+            if not isinstance(
+                node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+            ):
+                continue
+            kind = "class" if isinstance(node, ast.ClassDef) else "function"
+            items.append(
+                TrainingDataItemDict(
+                    item_id=f"{path.relative_to(_SRC_ROOT)}::{node.name}",
+                    source_file=str(path),
+                    language="python",
+                    code_snippet=ast.get_source_segment(source, node) or "",
+                    pattern_type=kind,
+                    pattern_name=node.name,
+                    labels=[kind, path.parent.name],
+                    confidence=0.9,
+                    context="",
+                    framework="onex",
+                )
+            )
+            if len(items) >= limit:
+                return items
+    return items
+
+
+# =============================================================================
+# iter_candidate_pairs Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestCandidatePairsLossless:
+    """Candidates must include every pair whose similarity clears the threshold."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.6, 0.7, 0.85, 0.95])
+    def test_no_qualifying_pair_is_pruned(self, threshold: float) -> None:
+        features = make_random_corpus(seed=7, n=120)
+        candidates = set(
+            iter_candidate_pairs(features, threshold, DEFAULT_SIMILARITY_WEIGHTS)
+        )
+
+        for j in range(len(features)):
+            for i in range(j):
+                result = compute_similarity(features[i], features[j])
+                if result["similarity"] >= threshold:
+                    assert (i, j) in candidates
+
+    def test_custom_weights_remain_lossless(self) -> None:
+        weights = SimilarityWeightsDict(
+            keyword=0.5, pattern=0.1, structural=0.1, label=0.2, context=0.1
+        )
+        features = make_random_corpus(seed=11, n=100)
+        candidates = set(iter_candidate_pairs(features, 0.6, weights))
+
+        for j in range(len(features)):
+            for i in range(j):
+                if (
+                    compute_similarity(features[i], features[j], weights)["similarity"]
+                    >= 0.6
+                ):
+                    assert (i, j) in candidates
+
+    def test_pairs_are_ordered_and_unique(self) -> None:
+        features = make_random_corpus(seed=3, n=80)
+        pairs = list(iter_candidate_pairs(features, 0.7, DEFAULT_SIMILARITY_WEIGHTS))
+
+        assert len(pairs) == len(set(pairs))
+        assert all(i < j for i, j in pairs)
+        assert pairs == sorted(pairs, key=lambda p: (p[1], p[0]))
+
+    def test_prunes_pairs_on_sparse_input(self) -> None:
+        features = make_random_corpus(seed=5, n=150)
+        pairs = list(iter_candidate_pairs(features, 0.7, DEFAULT_SIMILARITY_WEIGHTS))
+
+        assert len(pairs) < len(features) * (len(features) - 1) // 2
+
+    def test_deterministic(self) -> None:
+        features = make_random_corpus(seed=9, n=60)
+        first = list(iter_candidate_pairs(features, 0.7, DEFAULT_SIMILARITY_WEIGHTS))
+        second = list(iter_candidate_pairs(features, 0.7, DEFAULT_SIMILARITY_WEIGHTS))
+
+        assert first == second
+
+
+@pytest.mark.unit
+class TestSelectIndexComponents:
+    """Tests for index subset selection."""
+
+    def test_low_threshold_falls_back_to_all_pairs(self) -> None:
+        # structural (0.20) + context (0.10) alone can reach 0.30
+        features = make_random_corpus(seed=1, n=20)
+
+        assert (
+            select_index_components(features, 0.3, DEFAULT_SIMILARITY_WEIGHTS) is None
+        )
+        pairs = list(iter_candidate_pairs(features, 0.3, DEFAULT_SIMILARITY_WEIGHTS))
+        assert len(pairs) == 20 * 19 // 2
+
+    def test_default_threshold_selects_lossless_subset(self) -> None:
+        features = make_random_corpus(seed=1, n=50)
+
+        selection = select_index_components(features, 0.7, DEFAULT_SIMILARITY_WEIGHTS)
+
+        assert selection is not None
+        subset, tau = selection
+        assert subset
+        assert 0.0 < tau <= 1.0
+
+    def test_empty_input(self) -> None:
+        assert list(iter_candidate_pairs([], 0.7, DEFAULT_SIMILARITY_WEIGHTS)) == []
+
+
+# =============================================================================
+# cluster_patterns Parity Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestClusterPatternsBlockingParity:
+    """Blocked clustering must match exhaustive clustering exactly."""
+
+    @pytest.mark.parametrize("threshold", [0.4, 0.7, 0.9])
+    def test_blocked_matches_exhaustive(self, threshold: float) -> None:
+        features = make_random_corpus(seed=42, n=150)
+
+        blocked = cluster_patterns(features, threshold=threshold)
+        exact = cluster_patterns(
+            features, threshold=threshold, use_candidate_index=False
+        )
+
+        assert blocked == exact
+
+    def test_default_limit_accepts_large_input(self) -> None:
+        features = make_random_corpus(seed=13, n=600)
+
+        clusters = cluster_patterns(features)
+
+        assert sum(c["member_count"] for c in clusters) == 600
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestCandidateIndexBenchmark:
+    """Exact vs. blocked clustering on recorded training data."""
+
+    def test_blocked_vs_exact_on_recorded_data(self) -> None:
+        features = extract_features_batch(_recorded_training_items(limit=800))
+        n = len(features)
+
+        start = time.perf_counter()
+        blocked = cluster_patterns(features, max_input_items=n)
+        blocked_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        exact = cluster_patterns(features, max_input_items=n, use_candidate_index=False)
+        exact_s = time.perf_counter() - start
+
+        candidates = sum(
+            1
+            for _ in iter_candidate_pairs(
+                sorted(features, key=lambda f: f["item_id"]),
+                0.70,
+                DEFAULT_SIMILARITY_WEIGHTS,
+            )
+        )
+        assert blocked == exact
+        assert candidates < n * (n - 1) // 2
+        assert blocked_s < exact_s
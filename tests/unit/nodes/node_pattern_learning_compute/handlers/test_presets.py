@@ -18,6 +18,7 @@ import pytest
 from omniintelligence.nodes.node_pattern_learning_compute.handlers.presets import (
     DEFAULT_CLUSTERING_THRESHOLD,
     DEFAULT_DEDUPLICATION_THRESHOLD,
+    DEFAULT_MAX_CLUSTERING_INPUT_ITEMS,
     DEFAULT_MIN_FREQUENCY,
     DEFAULT_PROMOTION_THRESHOLD,
     DEFAULT_SIMILARITY_WEIGHTS,
@@ -192,6 +193,10 @@ class TestClusteringThresholds:
         """NEAR_THRESHOLD_MARGIN should be 0.05."""
         assert NEAR_THRESHOLD_MARGIN == 0.05
 
+    def test_max_clustering_input_items_value(self) -> None:
+        """DEFAULT_MAX_CLUSTERING_INPUT_ITEMS should be 50,000."""
+        assert DEFAULT_MAX_CLUSTERING_INPUT_ITEMS == 50_000
+
 
 # =============================================================================
 # Promotion Threshold Tests
@@ -401,6 +406,7 @@ class TestModuleExports:
         expected_exports = [
             "DEFAULT_CLUSTERING_THRESHOLD",
             "DEFAULT_DEDUPLICATION_THRESHOLD",
+            "DEFAULT_MAX_CLUSTERING_INPUT_ITEMS",
             "DEFAULT_MIN_FREQUENCY",
             "DEFAULT_PROMOTION_THRESHOLD",
             "DEFAULT_SIMILARITY_WEIGHTS",
@@ -423,6 +429,7 @@ class TestModuleExports:
         expected_exports = {
             "DEFAULT_CLUSTERING_THRESHOLD",
             "DEFAULT_DEDUPLICATION_THRESHOLD",
+            "DEFAULT_MAX_CLUSTERING_INPUT_ITEMS",
             "DEFAULT_MIN_FREQUENCY",
             "DEFAULT_PROMOTION_THRESHOLD",
             "DEFAULT_SIMILARITY_WEIGHTS",
@@ -0,0 +1,231 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the vectorized similarity engine.
+
+This module verifies that SimilarityMatrix is bit-identical to the scalar
+compute_similarity path:
+    - pair_similarities / block_similarities parity (exact ==, not approx)
+    - medoid selection and intra-cluster similarity parity against the
+      original pairwise reference loops
+    - sequential_sum matches Python running totals
+
+The benchmark class compares the scalar and vectorized paths on a large
+cluster.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from omniintelligence.nodes.node_pattern_learning_compute.handlers import (
+    similarity_matrix,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.handler_pattern_clustering import (
+    _compute_intra_cluster_similarity,
+    _select_medoid,
+    compute_similarity,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.presets import (
+    DEFAULT_SIMILARITY_WEIGHTS,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.protocols import (
+    ExtractedFeaturesDict,
+    SimilarityWeightsDict,
+)
+from omniintelligence.nodes.node_pattern_learning_compute.handlers.similarity_matrix import (
+    SimilarityMatrix,
+    sequential_sum,
+)
+from tests.unit.nodes.node_pattern_learning_compute.handlers.conftest import (
+    make_random_corpus,
+)
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+_CUSTOM_WEIGHTS = SimilarityWeightsDict(
+    keyword=0.35, pattern=0.15, structural=0.3, label=0.1, context=0.1
+)
+
+
+def _reference_medoid(
+    members: list[ExtractedFeaturesDict],
+    weights: SimilarityWeightsDict,
+) -> ExtractedFeaturesDict:
+    """Original scalar medoid selection (pairwise compute_similarity)."""
+    scored = []
+    for i, member_i in enumerate(members):
+        total = 0.0
+        for j, member_j in enumerate(members):
+            if i != j:
+                total += compute_similarity(member_i, member_j, weights)["similarity"]
+        scored.append((member_i["item_id"], total / (len(members) - 1), member_i))
+    scored.sort(key=lambda x: (-x[1], x[0]))
+    return scored[0][2]
+
+
+def _reference_intra(
+    members: list[ExtractedFeaturesDict],
+    weights: SimilarityWeightsDict,
+) -> float:
+    """Original scalar intra-cluster similarity."""
+    total = 0.0
+    count = 0
+    for i in range(len(members)):
+        for j in range(i + 1, len(members)):
+            total += compute_similarity(members[i], members[j], weights)["similarity"]
+            count += 1
+    return total / count
+
+
+# =============================================================================
+# Parity Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSimilarityMatrixParity:
+    """Vectorized scores must equal scalar scores exactly."""
+
+    @pytest.mark.parametrize("weights", [DEFAULT_SIMILARITY_WEIGHTS, _CUSTOM_WEIGHTS])
+    def test_block_matches_compute_similarity(
+        self, weights: SimilarityWeightsDict
+    ) -> None:
+        features = make_random_corpus(seed=21, n=60)
+        engine = SimilarityMatrix(features, weights)
+
+        block = engine.block_similarities(range(60), range(60))
+
+        for i in range(60):
+            for j in range(60):
+                expected = compute_similarity(features[i], features[j], weights)
+                assert block[i, j] == expected["similarity"]
+
+    def test_pairs_match_compute_similarity(self) -> None:
+        features = make_random_corpus(seed=22, n=80)
+        engine = SimilarityMatrix(features, DEFAULT_SIMILARITY_WEIGHTS)
+        rng = np.random.default_rng(0)
+        rows = rng.integers(0, 80, size=500)
+        cols = rng.integers(0, 80, size=500)
+
+        scores = engine.pair_similarities(rows, cols)
+
+        for k in range(500):
+            expected = compute_similarity(features[rows[k]], features[cols[k]])
+            assert scores[k] == expected["similarity"]
+
+    def test_empty_token_sets(self) -> None:
+        features = make_random_corpus(seed=23, n=2)
+        for f in features:
+            f["keywords"] = ()
+            f["pattern_indicators"] = ()
+            f["labels"] = ()
+        engine = SimilarityMatrix(features, DEFAULT_SIMILARITY_WEIGHTS)
+
+        score = engine.pair_similarities(np.array([0]), np.array([1]))[0]
+
+        assert score == compute_similarity(features[0], features[1])["similarity"]
+
+    def test_empty_pairs(self) -> None:
+        engine = SimilarityMatrix(
+            make_random_corpus(seed=1, n=3), DEFAULT_SIMILARITY_WEIGHTS
+        )
+
+        assert engine.pair_similarities(np.array([]), np.array([])).shape == (0,)
+        assert engine.block_similarities([0], []).shape == (1, 0)
+
+    def test_row_blocks_reassemble_full_block(self) -> None:
+        features = make_random_corpus(seed=24, n=30)
+        engine = SimilarityMatrix(features, DEFAULT_SIMILARITY_WEIGHTS)
+        indices = list(range(0, 30, 2))
+
+        blocks = list(engine.iter_row_blocks(indices, max_block_elements=40))
+
+        assert [offset for offset, _ in blocks] == [0, 2, 4, 6, 8, 10, 12, 14]
+        assert all(block.size <= 40 for _, block in blocks)
+        np.testing.assert_array_equal(
+            np.vstack([block for _, block in blocks]),
+            engine.block_similarities(indices, indices),
+        )
+
+
+@pytest.mark.unit
+class TestClusterReductionsParity:
+    """Medoid and intra-cluster similarity match the scalar reference loops."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4])
+    def test_medoid_matches_reference(self, seed: int) -> None:
+        members = make_random_corpus(seed=seed, n=25)
+
+        medoid = _select_medoid(members, DEFAULT_SIMILARITY_WEIGHTS)
+
+        assert medoid is _reference_medoid(members, DEFAULT_SIMILARITY_WEIGHTS)
+
+    def test_medoid_tie_break_by_item_id(self) -> None:
+        members = make_random_corpus(seed=5, n=1) * 3
+        members = [{**members[0], "item_id": item_id} for item_id in ("c", "a", "b")]
+
+        medoid = _select_medoid(members, DEFAULT_SIMILARITY_WEIGHTS)  # type: ignore[arg-type]
+
+        assert medoid["item_id"] == "a"
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4])
+    def test_intra_similarity_matches_reference(self, seed: int) -> None:
+        members = make_random_corpus(seed=seed, n=25)
+
+        intra = _compute_intra_cluster_similarity(members, _CUSTOM_WEIGHTS)
+
+        assert intra == _reference_intra(members, _CUSTOM_WEIGHTS)
+
+    def test_chunked_reductions_match_reference(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        members = make_random_corpus(seed=6, n=40)
+        monkeypatch.setattr(similarity_matrix, "SIMILARITY_BLOCK_MAX_ELEMENTS", 90)
+
+        medoid = _select_medoid(members, DEFAULT_SIMILARITY_WEIGHTS)
+        intra = _compute_intra_cluster_similarity(members, DEFAULT_SIMILARITY_WEIGHTS)
+
+        assert medoid is _reference_medoid(members, DEFAULT_SIMILARITY_WEIGHTS)
+        assert intra == _reference_intra(members, DEFAULT_SIMILARITY_WEIGHTS)
+
+    def test_sequential_sum_matches_running_total(self) -> None:
+        values = np.random.default_rng(7).random((4, 1000))
+
+        totals = sequential_sum(values, axis=1)
+
+        for row, total in zip(values, totals, strict=True):
+            running = 0.0
+            for value in row.tolist():
+                running += value
+            assert total == running
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestSimilarityMatrixBenchmark:
+    """Scalar vs. vectorized medoid selection on a large cluster."""
+
+    def test_medoid_vectorized_vs_scalar(self) -> None:
+        members = make_random_corpus(seed=99, n=300)
+
+        start = time.perf_counter()
+        expected = _reference_medoid(members, DEFAULT_SIMILARITY_WEIGHTS)
+        scalar_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        medoid = _select_medoid(members, DEFAULT_SIMILARITY_WEIGHTS)
+        vector_s = time.perf_counter() - start
+
+        assert medoid is expected
+        assert vector_s < scalar_s
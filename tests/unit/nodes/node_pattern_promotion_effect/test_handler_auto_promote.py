@@ -11,12 +11,14 @@ Tests cover:
 - Failure streak gate: too many failures -> skipped
 - Mock apply_transition integration
 - Empty candidate/provisional sets
+- Chunked gate snapshot queries and bounded transition concurrency
 
 Reference: OMN-2133
 """
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
@@ -76,8 +78,9 @@ class MockKafkaPublisher:
 class MockPatternRepository:
     """Mock repository for auto-promote tests.
 
-    Supports configurable fetchrow responses via ``attribution_count``
-    and ``latest_run_result`` constructor parameters.
+    Supports configurable gate snapshot responses via ``attribution_count``
+    and ``latest_run_result`` constructor parameters. Every snapshot query
+    records the pattern IDs it was asked for in ``snapshot_batches``.
     """
 
     def __init__(
@@ -89,11 +92,28 @@ class MockPatternRepository:
         self.candidate_patterns: list[dict[str, Any]] = []
         self.provisional_patterns: list[dict[str, Any]] = []
         self.queries_executed: list[str] = []
+        self.snapshot_batches: list[list[UUID]] = []
+        self.fail_snapshot_query = False
         self._attribution_count = attribution_count
         self._latest_run_result = latest_run_result
 
     async def fetch(self, query: str, *args: Any) -> list[Mapping[str, Any]]:
         self.queries_executed.append(query.strip()[:80])
+        if "pattern_measured_attributions" in query:
+            if self.fail_snapshot_query:
+                raise RuntimeError("snapshot query failed")
+            pattern_ids = list(args[0])
+            self.snapshot_batches.append(pattern_ids)
+            if self._attribution_count == 0:
+                return []
+            return [
+                MockRecord(
+                    pattern_id=pattern_id,
+                    count=self._attribution_count,
+                    run_result=self._latest_run_result,
+                )
+                for pattern_id in pattern_ids
+            ]
         if "status = 'candidate'" in query:
             return [MockRecord(**p) for p in self.candidate_patterns]
         if "status = 'provisional'" in query:
@@ -102,12 +122,6 @@ class MockPatternRepository:
 
     async def fetchrow(self, query: str, *args: Any) -> Mapping[str, Any] | None:
         self.queries_executed.append(query.strip()[:80])
-        if "COUNT" in query:
-            return MockRecord(count=self._attribution_count)
-        if "run_result" in query:
-            if self._latest_run_result is not None:
-                return MockRecord(run_result=self._latest_run_result)
-            return None
         return None
 
     async def execute(self, query: str, *args: Any) -> str:
@@ -673,6 +687,182 @@ class TestGateSnapshotEnrichment:
         assert gate["latest_run_result"] is None
 
 
+# =============================================================================
+# Tests: Chunked Promotion
+# =============================================================================
+
+
+class TestChunkedPromotion:
+    """Tests for chunked gate snapshot queries and transition batches."""
+
+    @pytest.mark.asyncio
+    async def test_one_snapshot_query_per_chunk(
+        self,
+        correlation_id: UUID,
+        producer: MockKafkaPublisher,
+    ) -> None:
+        """Gate snapshot data is fetched once per chunk, not per pattern."""
+        repo = MockPatternRepository(attribution_count=2, latest_run_result="partial")
+        repo.candidate_patterns = [
+            _make_pattern(status="candidate", evidence_tier="observed")
+            for _ in range(5)
+        ]
+        repo.provisional_patterns = [
+            _make_pattern(status="provisional", evidence_tier="measured")
+            for _ in range(3)
+        ]
+
+        async def mock_apply_transition(
+            *_args: Any,
+            **kwargs: Any,
+        ) -> MockTransitionResult:
+            return MockTransitionResult(success=True, pattern_id=kwargs["pattern_id"])
+
+        result = await handle_auto_promote_check(
+            repository=repo,
+            apply_transition_fn=mock_apply_transition,
+            idempotency_store=None,
+            producer=producer,
+            correlation_id=correlation_id,
+            chunk_size=2,
+        )
+
+        assert [len(batch) for batch in repo.snapshot_batches] == [2, 2, 1, 2, 1]
+        assert result["candidates_promoted"] == 5
+        assert result["provisionals_promoted"] == 3
+        assert [r["pattern_id"] for r in result["results"]] == [
+            p["id"] for p in repo.candidate_patterns + repo.provisional_patterns
+        ]
+        assert all(
+            r["gate_snapshot"]["measured_attribution_count"] == 2
+            and r["gate_snapshot"]["latest_run_result"] == "partial"
+            for r in result["results"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_ineligible_patterns_not_queried(
+        self,
+        correlation_id: UUID,
+        producer: MockKafkaPublisher,
+    ) -> None:
+        """Only eligible patterns are included in gate snapshot queries."""
+        repo = MockPatternRepository()
+        eligible = _make_pattern(status="candidate", evidence_tier="observed")
+        repo.candidate_patterns = [
+            eligible,
+            _make_pattern(status="candidate", injection_count=1, success_count=1),
+        ]
+
+        async def mock_apply_transition(
+            *_args: Any,
+            **kwargs: Any,
+        ) -> MockTransitionResult:
+            return MockTransitionResult(success=True, pattern_id=kwargs["pattern_id"])
+
+        await handle_auto_promote_check(
+            repository=repo,
+            apply_transition_fn=mock_apply_transition,
+            idempotency_store=None,
+            producer=producer,
+            correlation_id=correlation_id,
+        )
+
+        assert repo.snapshot_batches == [[eligible["id"]]]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_query_failure_uses_defaults(
+        self,
+        correlation_id: UUID,
+        producer: MockKafkaPublisher,
+    ) -> None:
+        """A failed snapshot query still promotes with conservative defaults."""
+        repo = MockPatternRepository(attribution_count=4, latest_run_result="success")
+        repo.fail_snapshot_query = True
+        repo.candidate_patterns = [
+            _make_pattern(status="candidate", evidence_tier="observed"),
+        ]
+
+        async def mock_apply_transition(
+            *_args: Any,
+            **kwargs: Any,
+        ) -> MockTransitionResult:
+            return MockTransitionResult(success=True, pattern_id=kwargs["pattern_id"])
+
+        result = await handle_auto_promote_check(
+            repository=repo,
+            apply_transition_fn=mock_apply_transition,
+            idempotency_store=None,
+            producer=producer,
+            correlation_id=correlation_id,
+        )
+
+        assert result["candidates_promoted"] == 1
+        gate = result["results"][0]["gate_snapshot"]
+        assert gate["measured_attribution_count"] == 0
+        assert gate["latest_run_result"] is None
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_in_flight_transitions(
+        self,
+        correlation_id: UUID,
+        producer: MockKafkaPublisher,
+    ) -> None:
+        """No more than max_concurrency transitions run at once."""
+        repo = MockPatternRepository()
+        repo.candidate_patterns = [
+            _make_pattern(status="candidate", evidence_tier="observed")
+            for _ in range(6)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def mock_apply_transition(
+            *_args: Any,
+            **kwargs: Any,
+        ) -> MockTransitionResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return MockTransitionResult(success=True, pattern_id=kwargs["pattern_id"])
+
+        result = await handle_auto_promote_check(
+            repository=repo,
+            apply_transition_fn=mock_apply_transition,
+            idempotency_store=None,
+            producer=producer,
+            correlation_id=correlation_id,
+            max_concurrency=2,
+        )
+
+        assert result["candidates_promoted"] == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"max_concurrency": 0}])
+    async def test_invalid_arguments_raise(
+        self,
+        correlation_id: UUID,
+        producer: MockKafkaPublisher,
+        kwargs: dict[str, int],
+    ) -> None:
+        async def mock_apply_transition(
+            *_args: Any, **_kwargs: Any
+        ) -> MockTransitionResult:
+            raise AssertionError("Should not be called")
+
+        with pytest.raises(ValueError):
+            await handle_auto_promote_check(
+                repository=MockPatternRepository(),
+                apply_transition_fn=mock_apply_transition,
+                idempotency_store=None,
+                producer=producer,
+                correlation_id=correlation_id,
+                **kwargs,
+            )
+
+
 # =============================================================================
 # Tests: Protocol Conformance
 # =============================================================================
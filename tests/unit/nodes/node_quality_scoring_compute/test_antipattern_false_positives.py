@@ -28,6 +28,7 @@ from omniintelligence.nodes.node_quality_scoring_compute.handlers.handler_qualit
     _count_mutable_default_arguments,
     _strip_comments_and_strings,
 )
+from omniintelligence.utils.parse_cache import ParseCache
 
 
 class TestAntiPatternFalsePositives:
@@ -218,6 +219,31 @@ other_msg = 'Also avoid **kwargs'
         # The URL string should be stripped, but the structure preserved
         assert "# This is a comment" not in stripped
 
+    def test_cached_tokens_match_regex_stripping(self) -> None:
+        """Stripping from cached tokens matches the regex fallback."""
+        content = (
+            'url = "http://example.com#anchor"  # Comment with = []\n'
+            "other = 'Also avoid **kwargs'\n"
+        )
+        tokens = ParseCache().get_or_parse(content).tokens
+
+        assert _strip_comments_and_strings(
+            content, tokens
+        ) == _strip_comments_and_strings(content)
+
+    def test_cached_tokens_blank_fstrings_and_keep_lines(self) -> None:
+        """f-strings are blanked whole; multi-line strings keep their newlines."""
+        content = 'msg = f"avoid {name} = []"\ndoc = """multi\nline: Any"""\n'
+        tokens = ParseCache().get_or_parse(content).tokens
+
+        stripped = _strip_comments_and_strings(content, tokens)
+
+        assert "= []" not in stripped
+        assert ": Any" not in stripped
+        assert stripped.startswith("msg = ")
+        assert len(stripped) == len(content)
+        assert stripped.count("\n") == content.count("\n")
+
 
 class TestCountMutableDefaultArguments:
     """Tests for the _count_mutable_default_arguments helper function."""
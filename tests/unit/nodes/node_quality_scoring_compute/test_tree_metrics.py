@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the single-pass tree metrics collector.
+
+Validates that ``_collect_tree_metrics`` gathers the same counters the
+dimension functions previously computed with one ``ast.walk`` each, and that
+scoring with precomputed metrics matches scoring without them.
+"""
+
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+# Module-level marker: all tests in this file are unit tests
+pytestmark = pytest.mark.unit
+
+from omniintelligence.nodes.node_quality_scoring_compute.handlers.handler_quality_scoring import (
+    _collect_tree_metrics,
+    _compute_architectural_score,
+    _compute_complexity_score,
+    _compute_documentation_score,
+    _compute_maintainability_score,
+    _compute_patterns_score,
+)
+
+SAMPLE_CODE = '''"""Sample module."""
+
+import os
+from typing import ClassVar
+
+
+class Base(object, dict):
+    def method(self) -> None:
+        import json
+
+    config: ClassVar[int] = 1
+    model_config = {}
+
+
+class lower_case:
+    pass
+
+
+def outer(items=[], *, opts={}):
+    import sys
+
+    def inner(x):
+        """Inner."""
+        import re
+
+        return [y for y in x if y and x or not y]
+
+    for item in items:
+        try:
+            pass
+        except ValueError:
+            pass
+    return inner
+'''
+
+
+class TestCollectTreeMetrics:
+    """Tests for _collect_tree_metrics counters."""
+
+    def test_counters(self) -> None:
+        metrics = _collect_tree_metrics(ast.parse(SAMPLE_CODE))
+
+        assert metrics.function_count == 3
+        assert metrics.mutable_defaults == 2
+        assert metrics.multiple_inheritance_classes == 1
+        assert metrics.class_organization_issues == 2
+        assert metrics.class_name_scores == [1.0, 0.6]
+        # Module, two classes, three functions; module and inner documented
+        assert metrics.needs_docstring == 6
+        assert metrics.has_docstring == 2
+
+    def test_nested_function_imports_count_once_per_enclosing_function(
+        self,
+    ) -> None:
+        metrics = _collect_tree_metrics(ast.parse(SAMPLE_CODE))
+
+        # json (method), sys (outer), re (outer + inner)
+        assert metrics.imports_inside_functions == 4
+
+    def test_scores_match_with_and_without_metrics(self) -> None:
+        tree = ast.parse(SAMPLE_CODE)
+        metrics = _collect_tree_metrics(tree)
+
+        assert _compute_maintainability_score(
+            tree, metrics=metrics
+        ) == _compute_maintainability_score(tree)
+        assert _compute_complexity_score(
+            tree, metrics=metrics
+        ) == _compute_complexity_score(tree)
+        assert _compute_documentation_score(
+            tree, SAMPLE_CODE, metrics=metrics
+        ) == _compute_documentation_score(tree, SAMPLE_CODE)
+        assert _compute_architectural_score(
+            tree, metrics=metrics
+        ) == _compute_architectural_score(tree)
+        assert _compute_patterns_score(
+            tree, SAMPLE_CODE, metrics=metrics
+        ) == _compute_patterns_score(tree, SAMPLE_CODE)
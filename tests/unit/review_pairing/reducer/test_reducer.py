@@ -607,3 +607,103 @@ class TestFullLifecycle:
         reducer = PatternCandidateReducer()
         candidate = reducer.tick(candidate)
         assert candidate.candidate_id == original_id
+
+
+# ---------------------------------------------------------------------------
+# Similarity helpers
+# ---------------------------------------------------------------------------
+
+
+def _levenshtein(a: str, b: str) -> int:
+    """Reference full-matrix edit distance."""
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        curr = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            curr[j] = (
+                prev[j - 1] if ca == cb else 1 + min(prev[j], curr[j - 1], prev[j - 1])
+            )
+        prev = curr
+    return prev[-1]
+
+
+class TestSimilarityHelpers:
+    @pytest.mark.parametrize(
+        ("a", "b"),
+        [
+            ("kitten", "sitting"),
+            ("flaw", "lawn"),
+            ("bad_code()", "good_code()"),
+            ("abc", ""),
+            ("same", "same"),
+            ("x = 1\ny = 2", "x = 1\nz = 2\ny = 2"),
+        ],
+    )
+    @pytest.mark.parametrize("max_distance", [0, 1, 2, 3, 10])
+    def test_bounded_edit_distance_matches_reference(
+        self, a: str, b: str, max_distance: int
+    ) -> None:
+        from omniintelligence.review_pairing.reducer.reducer import (
+            _bounded_edit_distance,
+        )
+
+        distance = _levenshtein(a, b)
+        expected = distance if distance <= max_distance else max_distance + 1
+        assert _bounded_edit_distance(a, b, max_distance) == expected
+
+    def test_edit_similarity_exact_above_min_similarity(self) -> None:
+        from omniintelligence.review_pairing.reducer.reducer import _edit_similarity
+
+        # distance 3 over 7 characters
+        assert _edit_similarity("kitten", "sitting") == pytest.approx(1 - 3 / 7)
+        assert _edit_similarity(
+            "kitten", "sitting", min_similarity=0.5
+        ) == pytest.approx(1 - 3 / 7)
+
+    def test_edit_similarity_bounded_below_min_similarity(self) -> None:
+        from omniintelligence.review_pairing.reducer.reducer import _edit_similarity
+
+        exact = _edit_similarity("abcdefgh", "zyxwvuts")
+        bounded = _edit_similarity("abcdefgh", "zyxwvuts", min_similarity=0.9)
+        assert exact <= bounded < 0.9
+
+    def test_transform_similarity_threshold_keeps_passing_average_exact(
+        self,
+    ) -> None:
+        from omniintelligence.review_pairing.reducer.reducer import (
+            _transform_similarity,
+        )
+
+        pairs = [
+            _make_pair(
+                diff_hunks=[f"-value = compute({i})\n+value = compute_fast({i})"]
+            )
+            for i in range(4)
+        ]
+        exact = _transform_similarity(pairs)
+        assert _transform_similarity(pairs, threshold=0.85) == exact
+
+    def test_transform_similarity_threshold_stays_below_on_failure(self) -> None:
+        from omniintelligence.review_pairing.reducer.reducer import (
+            _transform_similarity,
+        )
+
+        pairs = [_make_pair(diff_hunks=["-a = 1\n+a = 2"])] * 3 + [
+            _make_pair(diff_hunks=[f"-{'x' * 200}\n+{'y' * 200}"])
+        ]
+        exact = _transform_similarity(pairs)
+        bounded = _transform_similarity(pairs, threshold=0.85)
+        assert exact <= bounded < 0.85
+
+    def test_gate_fails_transform_convergence_without_patch(self) -> None:
+        reducer = PatternCandidateReducer()
+        key = PatternClusterKey("ruff:E501")
+        candidate = PatternCandidateReducer.new_candidate(key)
+        for hunk in ("-alpha()\n+beta()", "-one_two\n+three", "-[1, 2]\n+{3: 4}"):
+            candidate = reducer.ingest_pair(candidate, _make_pair(diff_hunks=[hunk]))
+
+        result = reducer.evaluate_promotion_gates(candidate)
+
+        assert not result.passed
+        assert result.gate_name == "transform_convergence"
+        assert result.similarity_score < 0.85
@@ -155,3 +155,69 @@ class TestFindingAlignmentEngine:
         # Hungarian should match optimally: "Missing error handling" <-> "Missing error handling in API"
         # and "SQL injection risk" <-> "SQL injection vulnerability"
         assert len(tp) == 2
+
+
+class _CountingEmbeddingClient:
+    """Embedding client returning fixed vectors and recording requests."""
+
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self._vectors = vectors
+        self.requested: list[str] = []
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.requested.extend(texts)
+        return [self._vectors[t] for t in texts]
+
+
+@pytest.mark.unit
+class TestSimilarityMatrices:
+    """Tests for the vectorized similarity matrices."""
+
+    def test_jaccard_matrix_matches_token_sets(self) -> None:
+        from omniintelligence.review_pairing.alignment_engine import (
+            _jaccard_similarity_matrix,
+        )
+
+        gt = ["Missing error handling", "SQL injection risk", ""]
+        ch = ["missing ERROR handling in API", "", "risk risk"]
+        matrix = _jaccard_similarity_matrix(gt, ch)
+
+        assert matrix.shape == (3, 3)
+        assert matrix[0, 0] == pytest.approx(3 / 5)
+        assert matrix[1, 2] == pytest.approx(1 / 3)
+        assert matrix[0, 1] == 0.0
+        assert matrix[2, 1] == 1.0
+        assert matrix[2, 0] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_embedding_similarity_is_cosine(self) -> None:
+        client = _CountingEmbeddingClient(
+            {"a": [3.0, 4.0], "b": [4.0, 3.0], "zero": [0.0, 0.0]}
+        )
+        engine = FindingAlignmentEngine(embedding_client=client)
+
+        matrix = await engine._description_similarities(["a", "zero"], ["b", "a"])
+
+        assert matrix[0, 0] == pytest.approx(24 / 25)
+        assert matrix[0, 1] == pytest.approx(1.0)
+        assert matrix[1, 0] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_embeddings_cached_across_align_calls(self) -> None:
+        client = _CountingEmbeddingClient(
+            {"Missing error handling": [1.0, 0.0], "SQL injection": [0.0, 1.0]}
+        )
+        engine = FindingAlignmentEngine(embedding_client=client)
+        gt = [_make_finding(description="Missing error handling")]
+        ch = [
+            _make_finding(description="Missing error handling", source="r1"),
+            _make_finding(description="SQL injection", source="r1"),
+        ]
+
+        first = await engine.align(gt, ch)
+        second = await engine.align(gt, ch)
+
+        assert sorted(client.requested) == ["Missing error handling", "SQL injection"]
+        assert [a.similarity_score for a in first] == [
+            a.similarity_score for a in second
+        ]
@@ -9,6 +9,7 @@ Validates:
 - Memory stays reasonable for large episode counts
 - GAE advantage computation
 - Edge cases (empty buffer, oversized sample)
+- Ring-buffer eviction order and wrap-around
 
 Ticket: OMN-5562
 """
@@ -92,6 +93,42 @@ class TestBufferBasics:
             buf.add(_make_episode(action=i))
         assert len(buf) == 5
 
+    def test_eviction_keeps_newest_in_order(self) -> None:
+        buf = EpisodeReplayBuffer(max_episodes=5)
+        for i in range(12):
+            buf.add(_make_episode(action=i))
+        assert buf.sample_all().actions.tolist() == [7, 8, 9, 10, 11]
+
+    def test_add_batch_wraps_around(self) -> None:
+        buf = EpisodeReplayBuffer(max_episodes=4)
+        buf.add_batch([_make_episode(action=i) for i in range(3)])
+        buf.add_batch([_make_episode(action=i) for i in range(3, 6)])
+        assert buf.sample_all().actions.tolist() == [2, 3, 4, 5]
+
+    def test_add_batch_larger_than_capacity(self) -> None:
+        buf = EpisodeReplayBuffer(max_episodes=3)
+        buf.add_batch([_make_episode(action=i) for i in range(10)])
+        assert len(buf) == 3
+        assert buf.sample_all().actions.tolist() == [7, 8, 9]
+
+    def test_sample_draws_distinct_stored_episodes(self) -> None:
+        buf = EpisodeReplayBuffer(max_episodes=50)
+        for i in range(80):
+            buf.add(_make_episode(action=i))
+        actions = buf.sample(50).actions.tolist()
+        assert sorted(actions) == list(range(30, 80))
+
+    def test_observation_dim_mismatch_raises(self) -> None:
+        buf = EpisodeReplayBuffer()
+        buf.add(_make_episode(obs_dim=4))
+        with pytest.raises(ValueError, match="Observation dimension"):
+            buf.add(_make_episode(obs_dim=5))
+        assert len(buf) == 1
+
+    def test_invalid_max_episodes_raises(self) -> None:
+        with pytest.raises(ValueError, match="max_episodes"):
+            EpisodeReplayBuffer(max_episodes=0)
+
     def test_clear(self) -> None:
         buf = _make_buffer(50)
         buf.clear()
@@ -102,6 +139,8 @@ class TestBufferBasics:
         assert buf.observation_dim is None
         buf.add(_make_episode(obs_dim=8))
         assert buf.observation_dim == 8
+        buf.clear()
+        assert buf.observation_dim is None
 
 
 # ---------------------------------------------------------------------------
@@ -225,6 +264,11 @@ class TestMemoryUsage:
         buf = EpisodeReplayBuffer()
         assert buf.memory_estimate_bytes() == 0
 
+    def test_memory_released_on_clear(self) -> None:
+        buf = _make_buffer(100)
+        buf.clear()
+        assert buf.memory_estimate_bytes() == 0
+
     def test_memory_estimate_reasonable(self) -> None:
         buf = _make_buffer(100)
         mem = buf.memory_estimate_bytes()
@@ -249,4 +293,6 @@ class TestMemoryUsage:
         mem = buf.memory_estimate_bytes()
         # 500MB = 500 * 1024 * 1024
         assert mem < 500 * 1024 * 1024
+        # Columnar storage: ~112 bytes per episode at 20 dims
+        assert mem < 5 * 1024 * 1024
         assert len(buf) == 10_000
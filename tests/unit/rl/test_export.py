@@ -9,6 +9,7 @@ Covers:
 - Overall agreement >= 90% between policy and config
 - No critical bucket falls below 80% agreement
 - Disagreements in critical buckets are listed in fidelity report
+- Batched inference matches per-scenario inference
 """
 
 from __future__ import annotations
@@ -342,6 +343,67 @@ class TestFidelityCheck:
         assert report.agreements >= 0  # Structural: runs without error
 
 
+# ---------------------------------------------------------------------------
+# Batched inference tests
+# ---------------------------------------------------------------------------
+
+
+class TestBatchedInference:
+    """Tests for chunked, deduplicated policy inference over the grid."""
+
+    @staticmethod
+    def _per_scenario_actions(
+        policy: PPOPolicy, scenarios: list[Scenario]
+    ) -> list[int]:
+        with torch.no_grad():
+            return [
+                int(torch.argmax(policy(s.observation.to_tensor().unsqueeze(0))[0]))
+                for s in scenarios
+            ]
+
+    @pytest.mark.parametrize("batch_size", [1, 7, 4096])
+    def test_matches_per_scenario_inference(
+        self,
+        trained_policy: PPOPolicy,
+        batch_size: int,
+    ) -> None:
+        scenarios = generate_scenario_grid(oversample_degraded=5)
+        exporter = PolicyExporter(trained_policy, inference_batch_size=batch_size)
+        actions = exporter._infer_actions([s.observation for s in scenarios])
+        assert actions == self._per_scenario_actions(trained_policy, scenarios)
+
+    def test_duplicate_observations_inferred_once(
+        self,
+        trained_policy: PPOPolicy,
+    ) -> None:
+        scenarios = generate_scenario_grid(oversample_degraded=4)
+        unique_rows = torch.unique(
+            torch.stack([s.observation.to_tensor() for s in scenarios]), dim=0
+        ).shape[0]
+        assert unique_rows < len(scenarios)
+
+        rows_seen: list[int] = []
+        handle = trained_policy.register_forward_hook(
+            lambda _module, inputs, _output: rows_seen.append(inputs[0].shape[0])
+        )
+        try:
+            PolicyExporter(trained_policy)._infer_actions(
+                [s.observation for s in scenarios]
+            )
+        finally:
+            handle.remove()
+        assert rows_seen == [unique_rows]
+
+    def test_empty_scenarios(self, exporter: PolicyExporter) -> None:
+        assert exporter._infer_actions([]) == []
+        report = exporter.check_fidelity({"routing_rules": []}, scenarios=[])
+        assert report.total_scenarios == 0
+
+    def test_invalid_batch_size_rejected(self, trained_policy: PPOPolicy) -> None:
+        with pytest.raises(ValueError, match="inference_batch_size"):
+            PolicyExporter(trained_policy, inference_batch_size=0)
+
+
 # ---------------------------------------------------------------------------
 # Fidelity report tests
 # ---------------------------------------------------------------------------
@@ -373,3 +373,24 @@ class TestAdapterIntentClassifier:
                 config=adapter._config,
             )
             assert result is mock_result
+
+    @pytest.mark.asyncio()
+    async def test_compute_batch_calls_handle_intent_classification_batch(
+        self,
+    ) -> None:
+        """compute_batch() delegates to handle_intent_classification_batch."""
+        mock_results = [MagicMock(name="classification_output")]
+        mock_inputs = [MagicMock(name="classification_input")]
+
+        with patch(
+            "omniintelligence.nodes.node_intent_classifier_compute.handlers.handle_intent_classification_batch",
+            return_value=mock_results,
+        ) as mock_handler:
+            adapter = AdapterIntentClassifier()
+            result = await adapter.compute_batch(mock_inputs)
+
+            mock_handler.assert_called_once_with(
+                inputs=mock_inputs,
+                config=adapter._config,
+            )
+            assert result is mock_results
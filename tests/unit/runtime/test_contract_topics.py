@@ -338,6 +338,18 @@ class TestCollectPublishTopicsForDispatch:
         result = collect_publish_topics_for_dispatch()
         assert ".evt." in result["code_entities_extracted"]
 
+    def test_pattern_projection_delta_topic_is_secondary_publish_topic(self) -> None:
+        """Delta projection topic comes from the projection contract's publish_topics."""
+        result = collect_publish_topics_for_dispatch()
+        assert (
+            result["pattern_projection_delta"]
+            == "onex.evt.omniintelligence.pattern-projection-delta.v1"
+        )
+        assert (
+            result["pattern_projection"]
+            == "onex.evt.omniintelligence.pattern-projection.v1"
+        )
+
     def test_all_values_are_strings(self) -> None:
         """All publish topic values must be strings."""
         result = collect_publish_topics_for_dispatch()
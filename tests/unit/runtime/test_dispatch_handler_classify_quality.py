@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -107,15 +107,10 @@ class TestClassifyHandler:
                     "decorators": [],
                     "docstring": "Persists to database.",
                     "file_hash": "hash123",
+                    "enrichment_metadata": {},
                 }
             ]
         )
-        mock_repo.get_entity_enrichment_metadata = AsyncMock(
-            return_value={
-                "file_hash": "hash123",
-                "enrichment_metadata": {},
-            }
-        )
         mock_repo.update_deterministic_classification = AsyncMock()
 
         handler = create_code_classify_dispatch_handler(
@@ -152,17 +147,12 @@ class TestClassifyHandler:
                     "decorators": [],
                     "docstring": None,
                     "file_hash": "hash123",
+                    "enrichment_metadata": {
+                        "classify": {"config_hash": ch, "stage_version": "1.0.0"}
+                    },
                 }
             ]
         )
-        mock_repo.get_entity_enrichment_metadata = AsyncMock(
-            return_value={
-                "file_hash": "hash123",
-                "enrichment_metadata": {
-                    "classify": {"config_hash": ch, "stage_version": "1.0.0"}
-                },
-            }
-        )
         mock_repo.update_deterministic_classification = AsyncMock()
 
         handler = create_code_classify_dispatch_handler(
@@ -191,17 +181,15 @@ class TestClassifyHandler:
                     "decorators": [],
                     "docstring": None,
                     "file_hash": "hash123",
+                    "enrichment_metadata": {
+                        "classify": {
+                            "config_hash": "OLD_HASH",
+                            "stage_version": "1.0.0",
+                        }
+                    },
                 }
             ]
         )
-        mock_repo.get_entity_enrichment_metadata = AsyncMock(
-            return_value={
-                "file_hash": "hash123",
-                "enrichment_metadata": {
-                    "classify": {"config_hash": "OLD_HASH", "stage_version": "1.0.0"}
-                },
-            }
-        )
         mock_repo.update_deterministic_classification = AsyncMock()
 
         handler = create_code_classify_dispatch_handler(
@@ -233,16 +221,11 @@ class TestQualityHandler:
                     "entity_type": "function",
                     "source_path": "nonexistent.py",
                     "file_hash": "hash123",
+                    "enrichment_metadata": {},
                 }
             ]
         )
-        mock_repo.get_entity_enrichment_metadata = AsyncMock(
-            return_value={
-                "file_hash": "hash123",
-                "enrichment_metadata": {},
-            }
-        )
-        mock_repo.update_quality_score = AsyncMock()
+        mock_repo.update_quality_scores = AsyncMock()
 
         handler = create_code_quality_dispatch_handler(
             repository=mock_repo,
@@ -254,4 +237,104 @@ class TestQualityHandler:
             _make_context(),
         )
         assert result == "ok"
-        mock_repo.update_quality_score.assert_called_once()
+        mock_repo.update_quality_scores.assert_called_once()
+        scores, _meta_patch = mock_repo.update_quality_scores.call_args[0]
+        assert [entity_id for entity_id, _, _ in scores] == ["e1"]
+
+    @pytest.mark.asyncio
+    async def test_reads_file_once_and_scores_entity_slices(self) -> None:
+        """Source is read once per file and each entity scores its own slice."""
+        source = (
+            "import os\n"
+            "\n"
+            "\n"
+            "def simple():\n"
+            "    return 1\n"
+            "\n"
+            "\n"
+            "def branchy(x):\n"
+            + "".join(f"    if x == {i}:\n        return {i}\n" for i in range(20))
+            + "    return -1\n"
+        )
+        mock_repo = MagicMock()
+        mock_repo.get_entities_by_ids = AsyncMock(
+            return_value=[
+                {
+                    "id": "e1",
+                    "entity_name": "simple",
+                    "entity_type": "function",
+                    "source_path": "src/foo/bar.py",
+                    "line_number": 4,
+                    "file_hash": "hash123",
+                    "enrichment_metadata": {},
+                },
+                {
+                    "id": "e2",
+                    "entity_name": "branchy",
+                    "entity_type": "function",
+                    "source_path": "src/foo/bar.py",
+                    "line_number": 8,
+                    "file_hash": "hash123",
+                    "enrichment_metadata": {},
+                },
+            ]
+        )
+        mock_repo.update_quality_scores = AsyncMock()
+        mock_repo.get_entity_enrichment_metadata = AsyncMock()
+
+        handler = create_code_quality_dispatch_handler(
+            repository=mock_repo,
+            quality_config=QUALITY_CONFIG,
+        )
+
+        with patch(
+            "omniintelligence.runtime.dispatch_handler_code_quality._read_source_file",
+            return_value=source,
+        ) as mock_read:
+            await handler(
+                _make_envelope(_persisted_event_payload(["e1", "e2"])),
+                _make_context(),
+            )
+
+        mock_read.assert_called_once_with("omniintelligence", "src/foo/bar.py")
+        mock_repo.get_entity_enrichment_metadata.assert_not_called()
+        mock_repo.update_quality_scores.assert_called_once()
+        scores, _meta_patch = mock_repo.update_quality_scores.call_args[0]
+        dimensions = {entity_id: json.loads(dims) for entity_id, _, dims in scores}
+        assert dimensions["e1"]["complexity"] > dimensions["e2"]["complexity"]
+
+    @pytest.mark.asyncio
+    async def test_idempotency_skip(self) -> None:
+        """Already-scored entities are skipped and no update is issued."""
+        import hashlib
+
+        ch = hashlib.sha256(
+            json.dumps(QUALITY_CONFIG, sort_keys=True).encode()
+        ).hexdigest()[:16]
+        mock_repo = MagicMock()
+        mock_repo.get_entities_by_ids = AsyncMock(
+            return_value=[
+                {
+                    "id": "e1",
+                    "entity_name": "my_func",
+                    "entity_type": "function",
+                    "source_path": "nonexistent.py",
+                    "file_hash": "hash123",
+                    "enrichment_metadata": {
+                        "quality": {"config_hash": ch, "stage_version": "1.0.0"}
+                    },
+                }
+            ]
+        )
+        mock_repo.update_quality_scores = AsyncMock()
+
+        handler = create_code_quality_dispatch_handler(
+            repository=mock_repo,
+            quality_config=QUALITY_CONFIG,
+        )
+
+        await handler(
+            _make_envelope(_persisted_event_payload(["e1"])),
+            _make_context(),
+        )
+        mock_repo.update_quality_scores.assert_not_called()
@@ -6,6 +6,10 @@
 Validates:
     - Handler embeds entities in Qdrant and writes to Memgraph
     - Graceful degradation when Qdrant/Memgraph unavailable
+    - Entity texts are embedded in batches through one shared client
+    - Embedding concurrency is bounded across concurrent events
+    - Graph writes use the same labels, keys and edge types as the graph sync
+    - close() releases only the embedding client the handler created
 
 Related:
     - OMN-5717: Dispatch handler — embed to Qdrant + graph to Memgraph
@@ -13,6 +17,8 @@ Related:
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -22,52 +28,54 @@ from omnibase_core.protocols.handler.protocol_handler_context import (
     ProtocolHandlerContext,
 )
 
+from omniintelligence.nodes.node_ast_extraction_compute.models.model_code_entity import (
+    ModelCodeEntity,
+)
 from omniintelligence.runtime.dispatch_handler_code_embed_graph import (
     create_code_embed_graph_dispatch_handler,
 )
+from omniintelligence.runtime.dispatch_handler_graph_storage import node_merge_writes
 
 
 def _make_entity_dict(name: str = "MyClass") -> dict[str, object]:
     return {
-        "entity_id": f"cls_{name}",
-        "entity_type": "CLASS",
-        "name": name,
-        "file_path": "src/models.py",
-        "file_hash": "abc123",
+        "id": str(uuid4()),
+        "entity_name": name,
+        "entity_type": "class",
+        "qualified_name": f"src.models.{name}",
         "source_repo": "test_repo",
-        "line_start": 1,
-        "line_end": 10,
+        "source_path": "src/models.py",
+        "line_number": 1,
         "bases": ["BaseModel"],
-        "methods": ["__init__"],
+        "methods": [{"name": "__init__", "args": ["self"]}],
         "decorators": [],
         "docstring": "Test class.",
-        "source_code": None,
+        "file_hash": "abc123",
         "confidence": 1.0,
     }
 
 
 def _make_relationship_dict() -> dict[str, object]:
     return {
-        "relationship_id": f"rel_{uuid4().hex[:12]}",
-        "source_entity_id": "mod_src.models",
-        "target_entity_id": "cls_MyClass",
-        "relationship_type": "CONTAINS",
+        "id": str(uuid4()),
+        "source_entity": "src.models",
+        "target_entity": "src.models.Class0",
+        "relationship_type": "defines",
+        "trust_tier": "strong",
         "confidence": 1.0,
-        "trust_tier": "moderate",
-        "metadata": {},
     }
 
 
-def _make_extracted_payload() -> dict[str, object]:
+def _make_extracted_payload(entity_count: int = 2) -> dict[str, object]:
     return {
         "event_id": f"evt_{uuid4().hex[:12]}",
         "crawl_id": "crawl_test",
         "repo_name": "test_repo",
         "file_path": "src/models.py",
         "file_hash": "abc123",
-        "entities": [_make_entity_dict("ClassA"), _make_entity_dict("ClassB")],
+        "entities": [_make_entity_dict(f"Class{i}") for i in range(entity_count)],
         "relationships": [_make_relationship_dict()],
-        "entity_count": 2,
+        "entity_count": entity_count,
         "relationship_count": 1,
     }
 
@@ -82,6 +90,14 @@ def _make_context() -> ProtocolHandlerContext:
     return ctx
 
 
+def _make_embedding_client() -> AsyncMock:
+    client = AsyncMock()
+    client.get_embeddings_batch = AsyncMock(
+        side_effect=lambda texts: [[0.1] * 128 for _ in texts]
+    )
+    return client
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_embed_graph_with_mocked_clients() -> None:
@@ -93,33 +109,42 @@ async def test_embed_graph_with_mocked_clients() -> None:
     bolt_handler.write = AsyncMock()
 
     # Mock embedding endpoint
-    mock_embedding = [0.1] * 128
+    embedding_client = _make_embedding_client()
 
     handler = create_code_embed_graph_dispatch_handler(
         qdrant_client=qdrant_client,
         bolt_handler=bolt_handler,
-        embedding_url="http://test:8100",
+        embedding_client=embedding_client,
     )
 
-    with patch(
-        "omniintelligence.runtime.dispatch_handler_code_embed_graph._get_embedding",
-        AsyncMock(return_value=mock_embedding),
-    ):
-        result = await handler(
-            _make_envelope(_make_extracted_payload()),
-            _make_context(),
-        )
+    result = await handler(
+        _make_envelope(_make_extracted_payload()),
+        _make_context(),
+    )
 
     assert result == "ok"
 
+    # Both entities embedded in a single round trip
+    embedding_client.get_embeddings_batch.assert_called_once()
+    texts = embedding_client.get_embeddings_batch.call_args.args[0]
+    assert texts[0] == "Class0 | Test class. | bases: BaseModel | methods: __init__"
+
     # Qdrant should receive upsert call
     qdrant_client.upsert.assert_called_once()
     call_kwargs = qdrant_client.upsert.call_args.kwargs
     assert call_kwargs["collection_name"] == "code_patterns"
     assert len(call_kwargs["points"]) == 2
+    payload = call_kwargs["points"][0]["payload"]
+    assert payload["qualified_name"] == "src.models.Class0"
+    assert payload["file_path"] == "src/models.py"
 
-    # Memgraph should receive writes: 2 entities + 1 relationship
-    assert bolt_handler.write.call_count == 3
+    # Memgraph should receive one UNWIND batch of nodes + one batch of edges
+    assert bolt_handler.write.call_count == 2
+    node_rows = bolt_handler.write.call_args_list[0].kwargs["parameters"]["rows"]
+    assert [row["qn"] for row in node_rows] == [
+        "src.models.Class0",
+        "src.models.Class1",
+    ]
 
 
 @pytest.mark.unit
@@ -137,3 +162,252 @@ async def test_graceful_degradation_no_clients() -> None:
     )
 
     assert result == "ok"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_entities_embedded_in_configured_batches() -> None:
+    """Entity texts are split into batches of embedding_batch_size."""
+    qdrant_client = AsyncMock()
+    embedding_client = _make_embedding_client()
+
+    handler = create_code_embed_graph_dispatch_handler(
+        qdrant_client=qdrant_client,
+        embedding_client=embedding_client,
+        embedding_batch_size=2,
+    )
+
+    await handler(_make_envelope(_make_extracted_payload(5)), _make_context())
+
+    batch_sizes = [
+        len(call.args[0])
+        for call in embedding_client.get_embeddings_batch.call_args_list
+    ]
+    assert batch_sizes == [2, 2, 1]
+    points = qdrant_client.upsert.call_args.kwargs["points"]
+    assert [p["payload"]["name"] for p in points] == [f"Class{i}" for i in range(5)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_batch_skips_only_its_entities() -> None:
+    """A failing batch drops its own entities; other batches are still stored."""
+    qdrant_client = AsyncMock()
+    embedding_client = AsyncMock()
+
+    async def _embed(texts: list[str]) -> list[list[float]]:
+        if texts[0].startswith("Class0"):
+            raise RuntimeError("embedding server down")
+        return [[0.2] * 8 for _ in texts]
+
+    embedding_client.get_embeddings_batch = AsyncMock(side_effect=_embed)
+
+    handler = create_code_embed_graph_dispatch_handler(
+        qdrant_client=qdrant_client,
+        embedding_client=embedding_client,
+        embedding_batch_size=2,
+    )
+
+    result = await handler(_make_envelope(_make_extracted_payload(4)), _make_context())
+
+    assert result == "ok"
+    points = qdrant_client.upsert.call_args.kwargs["points"]
+    assert [p["payload"]["name"] for p in points] == ["Class2", "Class3"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_embedding_concurrency_bounded_across_events() -> None:
+    """In-flight batch requests never exceed embedding_max_concurrency."""
+    in_flight = 0
+    peak = 0
+
+    async def _embed(texts: list[str]) -> list[list[float]]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[0.3] * 8 for _ in texts]
+
+    embedding_client = AsyncMock()
+    embedding_client.get_embeddings_batch = AsyncMock(side_effect=_embed)
+
+    handler = create_code_embed_graph_dispatch_handler(
+        qdrant_client=AsyncMock(),
+        embedding_client=embedding_client,
+        embedding_batch_size=1,
+        embedding_max_concurrency=2,
+    )
+
+    await asyncio.gather(
+        *(
+            handler(_make_envelope(_make_extracted_payload(3)), _make_context())
+            for _ in range(4)
+        )
+    )
+
+    assert embedding_client.get_embeddings_batch.call_count == 12
+    assert peak == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_default_embedding_client_is_shared_across_events() -> None:
+    """Without an injected client, one pooled client is created and reused."""
+    embedding_client = _make_embedding_client()
+
+    handler = create_code_embed_graph_dispatch_handler(
+        qdrant_client=AsyncMock(),
+        embedding_url="http://test:8100",
+    )
+
+    with patch(
+        "omniintelligence.runtime.dispatch_handler_code_embed_graph.EmbeddingClientLocalOpenAI",
+        MagicMock(return_value=embedding_client),
+    ) as client_cls:
+        for _ in range(3):
+            await handler(_make_envelope(_make_extracted_payload()), _make_context())
+
+    client_cls.assert_called_once()
+    assert client_cls.call_args.args[0].base_url == "http://test:8100"
+    assert embedding_client.get_embeddings_batch.call_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_graph_writes_batched_with_failure_isolation() -> None:
+    """Nodes are written in graph_batch_size batches; a bad row loses only itself."""
+    written: list[str] = []
+
+    async def _write(cypher: str, parameters: dict[str, Any]) -> None:
+        if "MERGE (n:Class {qualified_name: row.qn" not in cypher:
+            return
+        names = [row["name"] for row in parameters["rows"]]
+        if "Class3" in names:
+            raise RuntimeError("write rejected")
+        written.extend(names)
+
+    bolt_handler = AsyncMock()
+    bolt_handler.write = AsyncMock(side_effect=_write)
+
+    handler = create_code_embed_graph_dispatch_handler(
+        bolt_handler=bolt_handler,
+        graph_batch_size=2,
+    )
+
+    await handler(_make_envelope(_make_extracted_payload(5)), _make_context())
+
+    assert written == ["Class0", "Class1", "Class2", "Class4"]
+    # 3 node batches + 2 row retries for the failed batch + 1 edge batch
+    assert bolt_handler.write.call_count == 6
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"embedding_batch_size": 0},
+        {"embedding_max_concurrency": 0},
+        {"graph_batch_size": 0},
+    ],
+)
+def test_invalid_embedding_limits_rejected(kwargs: dict[str, int]) -> None:
+    """Non-positive batch size or concurrency is a configuration error."""
+    with pytest.raises(ValueError):
+        create_code_embed_graph_dispatch_handler(**kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_graph_writes_match_graph_sync_schema() -> None:
+    """Nodes get entity-type labels and edges the sync's upper-cased types."""
+    bolt_handler = AsyncMock()
+    payload = _make_extracted_payload(1)
+    payload["entities"].append(  # type: ignore[union-attr]
+        {**_make_entity_dict("helper"), "entity_type": "function"}
+    )
+    payload["relationships"].append(  # type: ignore[union-attr]
+        {**_make_relationship_dict(), "inject_into_context": False}
+    )
+
+    handler = create_code_embed_graph_dispatch_handler(bolt_handler=bolt_handler)
+    await handler(_make_envelope(payload), _make_context())
+
+    writes = {
+        call.args[0]: call.kwargs["parameters"]["rows"]
+        for call in bolt_handler.write.call_args_list
+    }
+    expected = dict(
+        node_merge_writes(
+            [
+                ModelCodeEntity(**entity).model_dump()
+                for entity in payload["entities"]  # type: ignore[union-attr]
+            ]
+        )
+    )
+    assert set(expected) <= set(writes)
+    assert any(":Class {" in cypher for cypher in expected)
+    assert any(":Function {" in cypher for cypher in expected)
+    for cypher, rows in expected.items():
+        assert writes[cypher] == rows
+    assert writes[next(c for c in expected if ":Class {" in c)][0]["name"] == "Class0"
+
+    # Only the injectable relationship is graphed, as DEFINES with the repo
+    edge_writes = {c: r for c, r in writes.items() if "MERGE (s)-[r:" in c}
+    assert list(edge_writes) == [c for c in edge_writes if "[r:DEFINES]" in c]
+    (edge_rows,) = edge_writes.values()
+    assert edge_rows == [
+        {
+            "src_qn": "src.models",
+            "tgt_qn": "src.models.Class0",
+            "conf": 1.0,
+            "tier": "strong",
+            "repo": "test_repo",
+        }
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_close_releases_created_embedding_client() -> None:
+    """close() closes the lazily created client and the next event makes a new one."""
+    created = [_make_embedding_client(), _make_embedding_client()]
+
+    handler = create_code_embed_graph_dispatch_handler(
+        qdrant_client=AsyncMock(),
+        embedding_url="http://test:8100",
+    )
+
+    with patch(
+        "omniintelligence.runtime.dispatch_handler_code_embed_graph.EmbeddingClientLocalOpenAI",
+        MagicMock(side_effect=created),
+    ):
+        await handler(_make_envelope(_make_extracted_payload()), _make_context())
+        await handler.close()
+        created[0].close.assert_awaited_once()
+
+        await handler(_make_envelope(_make_extracted_payload()), _make_context())
+        created[1].get_embeddings_batch.assert_called_once()
+        await handler.close()
+        created[1].close.assert_awaited_once()
+
+    # Closing again is a no-op
+    await handler.close()
+    created[0].close.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_close_leaves_injected_embedding_client_open() -> None:
+    """An injected client belongs to the caller and is not closed."""
+    embedding_client = _make_embedding_client()
+
+    handler = create_code_embed_graph_dispatch_handler(
+        qdrant_client=AsyncMock(),
+        embedding_client=embedding_client,
+    )
+    await handler(_make_envelope(_make_extracted_payload()), _make_context())
+    await handler.close()
+
+    embedding_client.close.assert_not_called()
@@ -238,11 +238,17 @@ async def test_persist_handler_upserts_and_reconciles() -> None:
     )
 
     mock_repo = AsyncMock()
-    mock_repo.upsert_entity = AsyncMock(return_value=str(uuid.uuid4()))
-    mock_repo.get_entity_id_by_qualified_name = AsyncMock(
-        side_effect=lambda _qn, _repo: str(uuid.uuid4())
+    mock_repo.upsert_entities = AsyncMock(
+        side_effect=lambda entities: {
+            e["qualified_name"]: str(uuid.uuid4()) for e in entities
+        }
+    )
+    mock_repo.upsert_relationships = AsyncMock(
+        side_effect=lambda rels, _repo: [
+            (r["source_entity"], r["target_entity"], r["relationship_type"])
+            for r in rels
+        ]
     )
-    mock_repo.upsert_relationship = AsyncMock(return_value=str(uuid.uuid4()))
     mock_repo.delete_stale_entities = AsyncMock(return_value=0)
     mock_repo.delete_stale_relationships_for_file = AsyncMock(return_value=0)
 
@@ -298,17 +304,26 @@ async def test_persist_handler_upserts_and_reconciles() -> None:
     result = await handler(envelope, context)
 
     assert result == "ok"
-    # 2 entities upserted
-    assert mock_repo.upsert_entity.call_count == 2
-    # 1 relationship upserted
-    assert mock_repo.upsert_relationship.call_count == 1
+    # 2 entities upserted in a single bulk call
+    mock_repo.upsert_entities.assert_called_once()
+    assert len(mock_repo.upsert_entities.call_args[0][0]) == 2
+    # 1 relationship upserted in a single bulk call, names resolved server-side
+    mock_repo.upsert_relationships.assert_called_once()
+    rels, repo_name = mock_repo.upsert_relationships.call_args[0]
+    assert len(rels) == 1
+    assert repo_name == "test_repo"
+    mock_repo.get_entity_id_by_qualified_name.assert_not_called()
     # Reconciliation called (parse_status == "success")
     mock_repo.delete_stale_entities.assert_called_once_with(
         source_path="src/mod.py",
         source_repo="test_repo",
         current_qualified_names=["mod.ClassA", "mod.func_b"],
     )
-    mock_repo.delete_stale_relationships_for_file.assert_called_once()
+    mock_repo.delete_stale_relationships_for_file.assert_called_once_with(
+        source_path="src/mod.py",
+        source_repo="test_repo",
+        current_relationship_keys=[("mod.ClassA", "mod.func_b", "calls")],
+    )
 
 
 # =============================================================================
@@ -325,9 +340,10 @@ async def test_persist_handler_skips_reconciliation_on_partial() -> None:
     )
 
     mock_repo = AsyncMock()
-    mock_repo.upsert_entity = AsyncMock(return_value=str(uuid.uuid4()))
-    mock_repo.get_entity_id_by_qualified_name = AsyncMock(return_value=None)
-    mock_repo.upsert_relationship = AsyncMock(return_value=str(uuid.uuid4()))
+    mock_repo.upsert_entities = AsyncMock(
+        return_value={"mod.PartialClass": str(uuid.uuid4())}
+    )
+    mock_repo.upsert_relationships = AsyncMock(return_value=[])
     mock_repo.delete_stale_entities = AsyncMock(return_value=0)
     mock_repo.delete_stale_relationships_for_file = AsyncMock(return_value=0)
 
@@ -365,7 +381,7 @@ async def test_persist_handler_skips_reconciliation_on_partial() -> None:
 
     assert result == "ok"
     # Entity upserted
-    assert mock_repo.upsert_entity.call_count == 1
+    mock_repo.upsert_entities.assert_called_once()
     # Reconciliation NOT called (parse_status == "partial")
     mock_repo.delete_stale_entities.assert_not_called()
     mock_repo.delete_stale_relationships_for_file.assert_not_called()
@@ -6,12 +6,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
+import time
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 
 from omniintelligence.runtime.dispatch_handler_graph_storage import (
+    GRAPH_SYNC_KEY,
+    GraphSyncScheduler,
     handle_graph_storage,
 )
 
@@ -35,6 +42,275 @@ def _make_entity(
     }
 
 
+def _make_driver(session: Any) -> MagicMock:
+    # driver.session() returns a sync context manager with async __aenter__/__aexit__
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=session)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    driver = MagicMock()
+    driver.session.return_value = ctx
+    driver.close = AsyncMock()
+    return driver
+
+
+def _make_repository(
+    entities: list[dict[str, Any]], relationships: list[dict[str, Any]]
+) -> AsyncMock:
+    repository = AsyncMock()
+    repository.get_all_entities_and_relationships.return_value = (
+        entities,
+        relationships,
+    )
+    repository.update_graph_synced_at = AsyncMock()
+    return repository
+
+
+class _StandInSession:
+    """In-memory Memgraph stand-in that applies UNWIND MERGE/DELETE rows.
+
+    Counts round trips and simulates a fixed per-query network latency.
+    """
+
+    _NODE_LABEL = re.compile(r"MERGE \(n:(\w+) ")
+    _EDGE_TYPE = re.compile(r"MERGE \(s\)-\[r:(\w+)\]")
+    _DELETE_EDGE_TYPE = re.compile(r"-\[r:(\w+)\]->.* DELETE r$")
+
+    def __init__(self, latency_s: float = 0.0) -> None:
+        self.latency_s = latency_s
+        self.round_trips = 0
+        self.nodes: dict[tuple[str, str], dict[str, Any]] = {}
+        self.edges: dict[tuple[str, str, str], dict[str, Any]] = {}
+
+    async def run(self, cypher: str, **params: Any) -> AsyncMock:
+        self.round_trips += 1
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        if cypher == "MATCH (n) DETACH DELETE n":
+            self.nodes.clear()
+            self.edges.clear()
+        elif cypher.endswith("DETACH DELETE n"):
+            for row in params["rows"]:
+                self.nodes.pop((row["qn"], row["repo"]), None)
+                self.edges = {
+                    key: edge
+                    for key, edge in self.edges.items()
+                    if row["qn"] not in key[:2]
+                }
+        elif (match := self._DELETE_EDGE_TYPE.search(cypher)) is not None:
+            for row in params["rows"]:
+                self.edges.pop((row["src_qn"], row["tgt_qn"], match[1]), None)
+        elif (match := self._NODE_LABEL.search(cypher)) is not None:
+            for row in params["rows"]:
+                self.nodes[(row["qn"], row["repo"])] = {**row, "label": match[1]}
+        elif (match := self._EDGE_TYPE.search(cypher)) is not None:
+            qualified_names = {qn for qn, _ in self.nodes}
+            for row in params["rows"]:
+                if (
+                    row["src_qn"] in qualified_names
+                    and row["tgt_qn"] in qualified_names
+                ):
+                    self.edges[(row["src_qn"], row["tgt_qn"], match[1])] = row
+        return AsyncMock()
+
+
+class _FakeGraphSyncRepository:
+    """In-memory stand-in for RepositoryCodeEntity's graph sync methods.
+
+    Mirrors the SQL semantics: keyset pages on (updated_at, id), tombstones
+    written on delete (endpoint names NULL on cascade), a persisted mark.
+    Every mutation and every get_graph_sync_state() advances the clock.
+    """
+
+    def __init__(self) -> None:
+        self.clock = datetime(2026, 1, 1, tzinfo=UTC)
+        self.entities: dict[str, dict[str, Any]] = {}
+        self.relationships: dict[str, dict[str, Any]] = {}
+        self.entity_tombstones: list[dict[str, Any]] = []
+        self.relationship_tombstones: list[dict[str, Any]] = []
+        self.watermark: datetime | None = None
+        self.rows_read = 0
+        self.synced_ids: list[str] = []
+        self._seq = 0
+
+    def _tick(self) -> datetime:
+        self.clock += timedelta(minutes=5)
+        return self.clock
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def upsert_entity(self, name: str, entity_type: str = "class") -> str:
+        existing = next(
+            (e for e in self.entities.values() if e["entity_name"] == name), None
+        )
+        entity_id = existing["id"] if existing else str(uuid4())
+        self.entities[entity_id] = {
+            **_make_entity(entity_id, name, entity_type, f"pkg.{name}"),
+            "updated_at": self._tick(),
+        }
+        return entity_id
+
+    def upsert_relationship(
+        self, src: str, tgt: str, rel_type: str, *, inject: bool = True
+    ) -> str:
+        key = (src, tgt, rel_type)
+        existing = next(
+            (
+                r
+                for r in self.relationships.values()
+                if (
+                    r["source_entity_id"],
+                    r["target_entity_id"],
+                    r["relationship_type"],
+                )
+                == key
+            ),
+            None,
+        )
+        rel_id = existing["id"] if existing else str(uuid4())
+        self.relationships[rel_id] = {
+            **_make_relationship(src, tgt, rel_type, inject_into_context=inject),
+            "id": rel_id,
+            "updated_at": self._tick(),
+        }
+        return rel_id
+
+    def delete_relationship(self, rel_id: str, *, cascade: bool = False) -> None:
+        rel = self.relationships.pop(rel_id)
+        src = self.entities.get(rel["source_entity_id"])
+        tgt = self.entities.get(rel["target_entity_id"])
+        self.relationship_tombstones.append(
+            {
+                "seq": self._next_seq(),
+                "source_qualified_name": None if cascade else src["qualified_name"],
+                "target_qualified_name": None
+                if cascade or tgt is None
+                else tgt["qualified_name"],
+                "relationship_type": rel["relationship_type"],
+                "source_repo": rel["source_repo"],
+                "deleted_at": self._tick(),
+            }
+        )
+
+    def delete_entity(self, entity_id: str) -> None:
+        entity = self.entities.pop(entity_id)
+        self.entity_tombstones.append(
+            {
+                "seq": self._next_seq(),
+                "qualified_name": entity["qualified_name"],
+                "source_repo": entity["source_repo"],
+                "deleted_at": self._tick(),
+            }
+        )
+        for rel_id, rel in list(self.relationships.items()):
+            if entity_id in (rel["source_entity_id"], rel["target_entity_id"]):
+                self.delete_relationship(rel_id, cascade=True)
+
+    # --- RepositoryCodeEntity graph sync API ---
+
+    async def get_graph_sync_state(self, sync_key: str) -> dict[str, Any]:
+        assert sync_key == GRAPH_SYNC_KEY
+        return {"high_water_mark": self.watermark, "now": self._tick()}
+
+    async def set_graph_sync_watermark(
+        self, sync_key: str, high_water_mark: datetime
+    ) -> None:
+        self.watermark = high_water_mark
+
+    def _changed_page(
+        self,
+        rows: list[dict[str, Any]],
+        after_updated_at: datetime,
+        after_id: str,
+        until: datetime,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        page = sorted(
+            (
+                r
+                for r in rows
+                if (r["updated_at"], r["id"]) > (after_updated_at, after_id)
+                and r["updated_at"] <= until
+            ),
+            key=lambda r: (r["updated_at"], r["id"]),
+        )[:limit]
+        self.rows_read += len(page)
+        return page
+
+    async def get_entities_changed_page(
+        self, *, after_updated_at: datetime, after_id: str, until: datetime, limit: int
+    ) -> list[dict[str, Any]]:
+        return self._changed_page(
+            list(self.entities.values()), after_updated_at, after_id, until, limit
+        )
+
+    async def get_relationships_changed_page(
+        self, *, after_updated_at: datetime, after_id: str, until: datetime, limit: int
+    ) -> list[dict[str, Any]]:
+        rows = [
+            {
+                **rel,
+                "source_qualified_name": self.entities[rel["source_entity_id"]][
+                    "qualified_name"
+                ],
+                "target_qualified_name": self.entities[rel["target_entity_id"]][
+                    "qualified_name"
+                ],
+            }
+            for rel in self.relationships.values()
+        ]
+        return self._changed_page(rows, after_updated_at, after_id, until, limit)
+
+    def _tombstone_page(
+        self,
+        rows: list[dict[str, Any]],
+        since: datetime,
+        until: datetime,
+        after_seq: int,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        page = [
+            t for t in rows if since < t["deleted_at"] <= until and t["seq"] > after_seq
+        ][:limit]
+        self.rows_read += len(page)
+        return page
+
+    async def get_entity_tombstones_page(
+        self, *, since: datetime, until: datetime, after_seq: int, limit: int
+    ) -> list[dict[str, Any]]:
+        return self._tombstone_page(
+            self.entity_tombstones, since, until, after_seq, limit
+        )
+
+    async def get_relationship_tombstones_page(
+        self, *, since: datetime, until: datetime, after_seq: int, limit: int
+    ) -> list[dict[str, Any]]:
+        return self._tombstone_page(
+            self.relationship_tombstones, since, until, after_seq, limit
+        )
+
+    async def prune_graph_tombstones(self, before: datetime) -> int:
+        count = len(self.entity_tombstones) + len(self.relationship_tombstones)
+        self.entity_tombstones = [
+            t for t in self.entity_tombstones if t["deleted_at"] >= before
+        ]
+        self.relationship_tombstones = [
+            t for t in self.relationship_tombstones if t["deleted_at"] >= before
+        ]
+        return count - len(self.entity_tombstones) - len(self.relationship_tombstones)
+
+    async def update_graph_synced_at(self, entity_ids: list[str]) -> None:
+        self.synced_ids.extend(entity_ids)
+
+    async def get_all_entities_and_relationships(
+        self,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        return list(self.entities.values()), [
+            r for r in self.relationships.values() if r["inject_into_context"]
+        ]
+
+
 def _make_relationship(
     source_entity_id: str,
     target_entity_id: str,
@@ -137,3 +413,396 @@ class TestHandleGraphStorage:
         assert result == {"nodes_written": 0, "edges_written": 0}
         # Repository should never be called if Memgraph is unavailable
         mock_repository.get_all_entities_and_relationships.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_groups_rows_by_label_and_edge_type(self) -> None:
+        """Same-label nodes and same-type edges share UNWIND batches."""
+        entities = [
+            _make_entity(f"id-{i}", f"C{i}", "class", f"pkg.C{i}") for i in range(5)
+        ] + [_make_entity("id-f", "fn", "function", "pkg.fn")]
+        relationships = [
+            _make_relationship("id-0", "id-1", "inherits"),
+            _make_relationship("id-1", "id-2", "inherits"),
+            _make_relationship("id-f", "id-0", "calls"),
+        ]
+        session = _StandInSession()
+
+        result = await handle_graph_storage(
+            repository=_make_repository(entities, relationships),
+            driver=_make_driver(session),
+            batch_size=2,
+        )
+
+        assert result == {"nodes_written": 6, "edges_written": 3}
+        # class: 3 batches of <=2, function: 1, INHERITS: 1, CALLS: 1
+        assert session.round_trips == 6
+        assert session.nodes[("pkg.fn", "test-repo")]["label"] == "Function"
+        assert ("pkg.C0", "pkg.C1", "INHERITS") in session.edges
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_isolated_to_bad_rows(self) -> None:
+        """A failing batch is retried row by row; only the bad row is lost."""
+        entities = [
+            _make_entity(f"id-{i}", f"C{i}", "class", f"pkg.C{i}") for i in range(4)
+        ]
+        written_rows: list[str] = []
+
+        async def _run(cypher: str, **params: Any) -> AsyncMock:
+            qualified_names = [row["qn"] for row in params["rows"]]
+            if "pkg.C1" in qualified_names:
+                raise RuntimeError("constraint violation")
+            written_rows.extend(qualified_names)
+            return AsyncMock()
+
+        session = AsyncMock()
+        session.run = AsyncMock(side_effect=_run)
+        repository = _make_repository(entities, [])
+
+        result = await handle_graph_storage(
+            repository=repository,
+            driver=_make_driver(session),
+            batch_size=2,
+        )
+
+        assert result == {"nodes_written": 3, "edges_written": 0}
+        assert written_rows == ["pkg.C0", "pkg.C2", "pkg.C3"]
+        repository.update_graph_synced_at.assert_called_once_with(
+            ["id-0", "id-2", "id-3"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_batch_size(self) -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            await handle_graph_storage(
+                repository=AsyncMock(), driver=MagicMock(), batch_size=0
+            )
+
+
+@pytest.mark.unit
+class TestIncrementalGraphSync:
+    """Tests for incremental (high-water mark) graph sync."""
+
+    @staticmethod
+    def _seed(repo: _FakeGraphSyncRepository, n: int) -> list[str]:
+        ids = [repo.upsert_entity(f"E{i}") for i in range(n)]
+        for i in range(n - 1):
+            repo.upsert_relationship(ids[i], ids[i + 1], "calls")
+        return ids
+
+    @staticmethod
+    async def _full_graph(repo: _FakeGraphSyncRepository) -> _StandInSession:
+        """Graph produced by a full (non-incremental) sync of the current state."""
+        session = _StandInSession()
+        await handle_graph_storage(repository=repo, driver=_make_driver(session))
+        return session
+
+    @pytest.mark.asyncio
+    async def test_first_run_streams_everything_in_pages(self) -> None:
+        repo = _FakeGraphSyncRepository()
+        self._seed(repo, 7)
+        session = _StandInSession()
+
+        result = await handle_graph_storage(
+            repository=repo,
+            driver=_make_driver(session),
+            incremental=True,
+            page_size=3,
+        )
+
+        assert result == {
+            "nodes_written": 7,
+            "edges_written": 6,
+            "nodes_deleted": 0,
+            "edges_deleted": 0,
+        }
+        assert sorted(repo.synced_ids) == sorted(repo.entities)
+        assert repo.watermark is not None
+        expected = await self._full_graph(repo)
+        assert session.nodes == expected.nodes
+        assert session.edges == expected.edges
+
+    @pytest.mark.asyncio
+    async def test_delta_syncs_only_changes_and_deletes_zombies(self) -> None:
+        repo = _FakeGraphSyncRepository()
+        ids = self._seed(repo, 50)
+        session = _StandInSession()
+        await handle_graph_storage(
+            repository=repo, driver=_make_driver(session), incremental=True
+        )
+        repo.rows_read = 0
+        session.round_trips = 0
+
+        # Small commit: one modified entity, one new entity + edge, one
+        # deleted entity (cascades its edges), one deleted edge, one edge
+        # flipped to non-injectable.
+        repo.upsert_entity("E3", entity_type="function")
+        new_id = repo.upsert_entity("E_new")
+        repo.upsert_relationship(ids[0], new_id, "imports")
+        repo.delete_entity(ids[10])
+        calls_20_21 = next(
+            rel_id
+            for rel_id, rel in repo.relationships.items()
+            if rel["source_entity_id"] == ids[20]
+        )
+        repo.delete_relationship(calls_20_21)
+        repo.upsert_relationship(ids[30], ids[31], "calls", inject=False)
+
+        result = await handle_graph_storage(
+            repository=repo, driver=_make_driver(session), incremental=True
+        )
+
+        assert result == {
+            "nodes_written": 2,
+            "edges_written": 1,
+            "nodes_deleted": 1,
+            "edges_deleted": 2,
+        }
+        # Only the delta is read: 2 entities, 2 relationships, 1 entity
+        # tombstone, 3 relationship tombstones (2 from the cascade)
+        assert repo.rows_read == 8
+        assert session.round_trips <= 6
+        expected = await self._full_graph(repo)
+        assert session.nodes == expected.nodes
+        assert session.edges == expected.edges
+        assert ("pkg.E10", "test-repo") not in session.nodes
+        # Tombstones consumed by this run are pruned once outside the overlap
+        await handle_graph_storage(
+            repository=repo, driver=_make_driver(session), incremental=True
+        )
+        assert repo.entity_tombstones == []
+
+    @pytest.mark.asyncio
+    async def test_no_changes_is_a_no_op(self) -> None:
+        repo = _FakeGraphSyncRepository()
+        self._seed(repo, 5)
+        session = _StandInSession()
+        await handle_graph_storage(
+            repository=repo, driver=_make_driver(session), incremental=True
+        )
+        session.round_trips = 0
+
+        result = await handle_graph_storage(
+            repository=repo, driver=_make_driver(session), incremental=True
+        )
+
+        assert result["nodes_written"] == result["edges_written"] == 0
+        assert session.round_trips == 0
+
+    @pytest.mark.asyncio
+    async def test_write_failure_keeps_watermark(self) -> None:
+        repo = _FakeGraphSyncRepository()
+        self._seed(repo, 3)
+        session = AsyncMock()
+        session.run = AsyncMock(side_effect=RuntimeError("memgraph down"))
+
+        result = await handle_graph_storage(
+            repository=repo, driver=_make_driver(session), incremental=True
+        )
+
+        assert result["nodes_written"] == 0
+        assert repo.watermark is None
+
+    @pytest.mark.asyncio
+    async def test_rebuild_ignores_watermark(self) -> None:
+        repo = _FakeGraphSyncRepository()
+        self._seed(repo, 4)
+        await handle_graph_storage(
+            repository=repo, driver=_make_driver(_StandInSession()), incremental=True
+        )
+
+        session = _StandInSession()
+        result = await handle_graph_storage(
+            repository=repo,
+            driver=_make_driver(session),
+            incremental=True,
+            rebuild=True,
+        )
+
+        assert result["nodes_written"] == 4
+        assert result["edges_written"] == 3
+
+
+@pytest.mark.unit
+class TestGraphSyncScheduler:
+    """Tests for the dispatch-path sync trigger."""
+
+    _TARGET = (
+        "omniintelligence.runtime.dispatch_handler_graph_storage.handle_graph_storage"
+    )
+
+    @pytest.mark.asyncio
+    async def test_incremental_failure_is_surfaced_without_snapshot(self) -> None:
+        calls: list[bool] = []
+
+        async def fake_sync(**kwargs: Any) -> dict[str, int]:
+            calls.append(kwargs["incremental"])
+            if len(calls) == 1:
+                raise RuntimeError("tombstone table missing")
+            return {"nodes_written": 3, "edges_written": 2}
+
+        scheduler = GraphSyncScheduler(repository=MagicMock(), driver=MagicMock())
+        with patch(self._TARGET, side_effect=fake_sync):
+            with pytest.raises(RuntimeError, match="tombstone"):
+                await scheduler.sync_once()
+
+            scheduler.request_sync()
+            await scheduler.close()
+            assert scheduler.consecutive_failures == 0
+            assert calls == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_failed_run_recorded_and_retried_incrementally(self) -> None:
+        calls: list[bool] = []
+
+        async def fake_sync(**kwargs: Any) -> dict[str, int]:
+            calls.append(kwargs["incremental"])
+            if len(calls) == 1:
+                raise RuntimeError("tombstone table missing")
+            return {"nodes_written": 0, "edges_written": 0}
+
+        scheduler = GraphSyncScheduler(repository=MagicMock(), driver=MagicMock())
+        with patch(self._TARGET, side_effect=fake_sync):
+            scheduler.request_sync()
+            await scheduler.close()
+            assert scheduler.consecutive_failures == 1
+            assert isinstance(scheduler.last_error, RuntimeError)
+
+            scheduler.request_sync()
+            await scheduler.close()
+
+        assert calls == [True, True]
+        assert scheduler.consecutive_failures == 0
+        assert scheduler.last_error is None
+
+    @pytest.mark.asyncio
+    async def test_snapshot_runs_only_when_requested(self) -> None:
+        calls: list[bool] = []
+
+        async def fake_sync(**kwargs: Any) -> dict[str, int]:
+            calls.append(kwargs["incremental"])
+            return {"nodes_written": 0, "edges_written": 0}
+
+        scheduler = GraphSyncScheduler(repository=MagicMock(), driver=MagicMock())
+        with patch(self._TARGET, side_effect=fake_sync):
+            scheduler.request_sync(snapshot=True)
+            await scheduler.close()
+            scheduler.request_sync()
+            await scheduler.close()
+
+        assert calls == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_requests_during_a_run_coalesce(self) -> None:
+        started = asyncio.Event()
+        release = asyncio.Event()
+        runs = 0
+
+        async def fake_sync(**kwargs: Any) -> dict[str, int]:
+            nonlocal runs
+            runs += 1
+            started.set()
+            await release.wait()
+            return {"nodes_written": 0, "edges_written": 0}
+
+        scheduler = GraphSyncScheduler(repository=MagicMock(), driver=MagicMock())
+        with patch(self._TARGET, side_effect=fake_sync):
+            scheduler.request_sync()
+            await started.wait()
+            for _ in range(5):
+                scheduler.request_sync()
+            release.set()
+            await scheduler.close()
+
+        assert runs == 2
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_in_flight_run(self) -> None:
+        finished = False
+
+        async def fake_sync(**kwargs: Any) -> dict[str, int]:
+            nonlocal finished
+            await asyncio.sleep(0)
+            finished = True
+            return {"nodes_written": 0, "edges_written": 0}
+
+        driver = MagicMock()
+        driver.close = AsyncMock()
+        scheduler = GraphSyncScheduler(repository=MagicMock(), driver=driver)
+        with patch(self._TARGET, side_effect=fake_sync):
+            scheduler.request_sync()
+            await scheduler.close()
+
+        assert finished
+        # Caller-supplied drivers are not closed by the scheduler.
+        driver.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_no_uri_skips_sync(self) -> None:
+        scheduler = GraphSyncScheduler(repository=MagicMock())
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch(self._TARGET) as sync,
+        ):
+            result = await scheduler.sync_once()
+
+        assert result == {"nodes_written": 0, "edges_written": 0}
+        sync.assert_not_called()
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestGraphStorageBenchmark:
+    """Per-row vs. UNWIND batch writes against a latency-simulating stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_vs_per_row_round_trips(self) -> None:
+        n = 500
+        entity_types = ("class", "protocol", "model", "function")
+        entities = [
+            _make_entity(f"id-{i}", f"E{i}", entity_types[i % 4], f"pkg.E{i}")
+            for i in range(n)
+        ]
+        relationships = [
+            _make_relationship(
+                f"id-{i}", f"id-{(i * 7 + 1) % n}", ("calls", "imports")[i % 2]
+            )
+            for i in range(n)
+        ]
+
+        per_row = _StandInSession(latency_s=0.0002)
+        start = time.perf_counter()
+        per_row_result = await handle_graph_storage(
+            repository=_make_repository(entities, relationships),
+            driver=_make_driver(per_row),
+            batch_size=1,
+        )
+        per_row_s = time.perf_counter() - start
+
+        bulk = _StandInSession(latency_s=0.0002)
+        start = time.perf_counter()
+        bulk_result = await handle_graph_storage(
+            repository=_make_repository(entities, relationships),
+            driver=_make_driver(bulk),
+        )
+        bulk_s = time.perf_counter() - start
+
+        print(
+            f"\nentities={n} edges={n} "
+            f"per_row: trips={per_row.round_trips} {per_row_s:.3f}s "
+            f"bulk: trips={bulk.round_trips} {bulk_s:.3f}s"
+        )
+
+        assert (
+            bulk_result
+            == per_row_result
+            == {
+                "nodes_written": n,
+                "edges_written": n,
+            }
+        )
+        assert bulk.nodes == per_row.nodes
+        assert bulk.edges == per_row.edges
+        assert per_row.round_trips == 2 * n
+        # 4 labels x 1 batch + 2 edge types x 1 batch
+        assert bulk.round_trips == 6
+        assert bulk_s < per_row_s
@@ -37,11 +37,10 @@ class TestPersistHandlerEvent:
     async def test_emits_persisted_event_on_success(self) -> None:
         """Persist handler emits code-entities-persisted.v1 after upsert."""
         mock_repo = MagicMock()
-        mock_repo.upsert_entity = AsyncMock(return_value="entity-uuid-1")
-        mock_repo.upsert_relationship = AsyncMock(return_value="rel-uuid-1")
-        mock_repo.get_entity_id_by_qualified_name = AsyncMock(
-            return_value="entity-uuid-1"
+        mock_repo.upsert_entities = AsyncMock(
+            return_value={"foo.bar.MyClass": "entity-uuid-1"}
         )
+        mock_repo.upsert_relationships = AsyncMock(return_value=[])
         mock_repo.delete_stale_entities = AsyncMock(return_value=0)
         mock_repo.delete_stale_relationships_for_file = AsyncMock(return_value=0)
 
@@ -93,7 +92,7 @@ class TestPersistHandlerEvent:
         assert event_data["repo_name"] == "omniintelligence"
         assert event_data["file_path"] == "src/foo/bar.py"
         assert event_data["persisted_count"] == 1
-        assert len(event_data["entity_ids"]) == 1
+        assert event_data["entity_ids"] == ["entity-uuid-1"]
 
     @pytest.mark.asyncio
     async def test_no_event_on_syntax_error(self) -> None:
@@ -127,10 +126,8 @@ class TestPersistHandlerEvent:
     async def test_no_event_without_publisher(self) -> None:
         """Works without publisher (backwards compatible with Part 1)."""
         mock_repo = MagicMock()
-        mock_repo.upsert_entity = AsyncMock(return_value="entity-uuid-1")
-        mock_repo.get_entity_id_by_qualified_name = AsyncMock(
-            return_value="entity-uuid-1"
-        )
+        mock_repo.upsert_entities = AsyncMock(return_value={"ok.Foo": "entity-uuid-1"})
+        mock_repo.upsert_relationships = AsyncMock(return_value=[])
         mock_repo.delete_stale_entities = AsyncMock(return_value=0)
         mock_repo.delete_stale_relationships_for_file = AsyncMock(return_value=0)
 
@@ -170,3 +167,51 @@ class TestPersistHandlerEvent:
 
         result = await handler(_make_envelope(payload), _make_context())
         assert result == "ok"
+
+    @pytest.mark.asyncio
+    async def test_requests_graph_sync_after_persist(self) -> None:
+        """A configured graph sync scheduler is triggered once per file."""
+        mock_repo = MagicMock()
+        mock_repo.upsert_entities = AsyncMock(return_value={"ok.Foo": "entity-uuid-1"})
+        mock_repo.upsert_relationships = AsyncMock(return_value=[])
+        mock_repo.delete_stale_entities = AsyncMock(return_value=0)
+        mock_repo.delete_stale_relationships_for_file = AsyncMock(return_value=0)
+        graph_sync = MagicMock()
+
+        handler = create_code_persist_dispatch_handler(
+            repository=mock_repo,
+            graph_sync=graph_sync,
+        )
+
+        payload = {
+            "event_id": "evt-004",
+            "crawl_id": "crawl-123",
+            "repo_name": "test",
+            "file_path": "ok.py",
+            "file_hash": "abc",
+            "parse_status": "success",
+            "parse_error": None,
+            "entities": [
+                {
+                    "id": "e1",
+                    "entity_name": "Foo",
+                    "entity_type": "function",
+                    "qualified_name": "ok.Foo",
+                    "source_repo": "test",
+                    "source_path": "ok.py",
+                    "file_hash": "abc",
+                    "line_number": 1,
+                    "bases": [],
+                    "methods": [],
+                    "fields": [],
+                    "decorators": [],
+                    "docstring": None,
+                    "signature": None,
+                },
+            ],
+            "relationships": [],
+        }
+
+        result = await handler(_make_envelope(payload), _make_context())
+        assert result == "ok"
+        graph_sync.request_sync.assert_called_once_with()
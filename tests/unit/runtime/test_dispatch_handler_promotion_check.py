@@ -91,6 +91,46 @@ async def test_promotion_check_dispatch_handler_generates_correlation_id() -> No
     assert call_kwargs["correlation_id"] is not None
 
 
+@pytest.mark.unit
+async def test_promotion_check_dispatch_handler_passes_chunking() -> None:
+    """Handler should forward chunk size and concurrency to the check."""
+    handler = create_promotion_check_dispatch_handler(
+        repository=AsyncMock(),
+        kafka_producer=AsyncMock(),
+        chunk_size=250,
+        max_concurrency=8,
+    )
+
+    mock_result = {
+        "candidates_checked": 0,
+        "candidates_promoted": 0,
+        "provisionals_checked": 0,
+        "provisionals_promoted": 0,
+        "results": [],
+    }
+
+    with patch(
+        "omniintelligence.nodes.node_pattern_promotion_effect.handlers.handler_auto_promote.handle_auto_promote_check",
+        new_callable=AsyncMock,
+        return_value=mock_result,
+    ) as mock_auto_promote:
+        await handler(SimpleNamespace(payload={}), SimpleNamespace())
+
+    call_kwargs = mock_auto_promote.call_args.kwargs
+    assert call_kwargs["chunk_size"] == 250
+    assert call_kwargs["max_concurrency"] == 8
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"max_concurrency": 0}])
+def test_promotion_check_dispatch_handler_rejects_invalid_chunking(
+    kwargs: dict[str, int],
+) -> None:
+    """Factory should reject non-positive chunk size or concurrency."""
+    with pytest.raises(ValueError):
+        create_promotion_check_dispatch_handler(repository=AsyncMock(), **kwargs)
+
+
 @pytest.mark.unit
 def test_dispatch_alias_follows_naming_convention() -> None:
     """Dispatch alias should follow the onex.commands.* naming convention."""
@@ -10,6 +10,7 @@ Validates:
     - Bridge handler handles unexpected payload types gracefully
     - Event bus callback deserializes bytes, wraps in envelope, dispatches
     - Event bus callback acks on success, nacks on failure
+    - Micro-batched callback preserves per-key order and acks in offset order
     - Topic alias mapping is correct
 
 Related:
@@ -22,8 +23,10 @@ Related:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import time
 from dataclasses import dataclass, field
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -50,6 +53,7 @@ from omniintelligence.runtime.dispatch_handlers import (
     DISPATCH_ALIAS_PATTERN_LIFECYCLE,
     DISPATCH_ALIAS_SESSION_OUTCOME,
     DISPATCH_ALIAS_TOOL_CONTENT,
+    create_batched_dispatch_callback,
     create_claude_hook_dispatch_handler,
     create_compliance_evaluate_dispatch_handler,
     create_dispatch_callback,
@@ -2532,6 +2536,332 @@ class TestCreateDispatchCallback:
         )
 
 
+# =============================================================================
+# Tests: Micro-Batched Event Bus Callback
+# =============================================================================
+
+
+@dataclass
+class _RecordingMessage(_MockEventMessage):
+    """Mock message that records the order in which it is settled."""
+
+    offset: int = 0
+    partition: int | None = None
+    settled: list[tuple[int, str]] = field(default_factory=list)
+
+    async def ack(self) -> None:
+        self._acked = True
+        self.settled.append((self.offset, "ack"))
+
+    async def nack(self) -> None:
+        self._nacked = True
+        self.settled.append((self.offset, "nack"))
+
+
+class _FakeDispatchEngine:
+    """Dispatch engine stand-in with per-message latency and outcome.
+
+    Each payload carries ``seq`` (arrival order), ``delay`` (seconds), and
+    ``ok`` (dispatch outcome). Completion order per key and peak concurrency
+    are recorded for assertions.
+    """
+
+    def __init__(self) -> None:
+        self.completed: list[tuple[str, int]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def dispatch(self, topic: str, envelope: Any) -> MagicMock:
+        payload = envelope.payload
+        assert isinstance(payload, dict)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(payload.get("delay", 0.0))
+        finally:
+            self.in_flight -= 1
+        self.completed.append((payload.get("key", ""), payload["seq"]))
+        result = MagicMock()
+        result.is_successful.return_value = payload.get("ok", True)
+        result.error_message = "database unavailable"
+        result.status = "success" if payload.get("ok", True) else "failed"
+        result.handler_id = "fake-handler"
+        result.duration_ms = 0.0
+        return result
+
+
+def _batch_messages(
+    specs: list[tuple[str | None, float, bool]],
+    partitions: list[int] | None = None,
+) -> list[_RecordingMessage]:
+    """Build messages from (key, delay_seconds, ok) specs sharing one log."""
+    settled: list[tuple[int, str]] = []
+    return [
+        _RecordingMessage(
+            key=key.encode() if key is not None else None,
+            value=json.dumps(
+                {"seq": seq, "key": key or "", "delay": delay, "ok": ok}
+            ).encode("utf-8"),
+            offset=seq,
+            partition=partitions[seq] if partitions is not None else None,
+            settled=settled,
+        )
+        for seq, (key, delay, ok) in enumerate(specs)
+    ]
+
+
+class TestBatchedDispatchCallback:
+    """Validate the opt-in micro-batching dispatch callback."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_when_batch_is_full(self) -> None:
+        engine = _FakeDispatchEngine()
+        callback = create_batched_dispatch_callback(
+            engine,  # type: ignore[arg-type]
+            DISPATCH_ALIAS_CLAUDE_HOOK,
+            max_batch_size=4,
+            max_wait_ms=60_000,
+        )
+        messages = _batch_messages([(None, 0.0, True)] * 4)
+
+        for msg in messages[:3]:
+            await callback(msg)
+        assert callback.pending_count == 3
+        assert engine.completed == []
+
+        await callback(messages[3])
+
+        assert callback.pending_count == 0
+        assert all(msg._acked for msg in messages)
+
+    @pytest.mark.asyncio
+    async def test_dispatches_partial_batch_after_max_wait(self) -> None:
+        engine = _FakeDispatchEngine()
+        callback = create_batched_dispatch_callback(
+            engine,  # type: ignore[arg-type]
+            DISPATCH_ALIAS_CLAUDE_HOOK,
+            max_batch_size=100,
+            max_wait_ms=5,
+        )
+        messages = _batch_messages([(None, 0.0, True)] * 2)
+
+        for msg in messages:
+            await callback(msg)
+        await asyncio.sleep(0.05)
+        await callback.flush()
+
+        assert all(msg._acked for msg in messages)
+
+    @pytest.mark.asyncio
+    async def test_flush_drains_buffered_messages(self) -> None:
+        engine = _FakeDispatchEngine()
+        callback = create_batched_dispatch_callback(
+            engine,  # type: ignore[arg-type]
+            DISPATCH_ALIAS_CLAUDE_HOOK,
+            max_batch_size=100,
+            max_wait_ms=60_000,
+        )
+        messages = _batch_messages([("a", 0.0, True), ("b", 0.0, False)])
+
+        for msg in messages:
+            await callback(msg)
+        await callback.flush()
+
+        assert messages[0]._acked
+        assert messages[1]._nacked, "Transient failure must still be nacked"
+
+    @pytest.mark.asyncio
+    async def test_preserves_per_key_order(self) -> None:
+        engine = _FakeDispatchEngine()
+        callback = create_batched_dispatch_callback(
+            engine,  # type: ignore[arg-type]
+            DISPATCH_ALIAS_CLAUDE_HOOK,
+            max_batch_size=8,
+            max_concurrency=4,
+        )
+        # Earlier messages for each key are slower, so any reordering
+        # within a key would show up in completion order.
+        messages = _batch_messages(
+            [
+                ("a", 0.03, True),
+                ("b", 0.03, True),
+                ("a", 0.0, True),
+                ("b", 0.0, True),
+                ("a", 0.01, True),
+                ("c", 0.0, True),
+                ("b", 0.0, True),
+                ("a", 0.0, True),
+            ]
+        )
+
+        for msg in messages:
+            await callback(msg)
+
+        for key, expected in (("a", [0, 2, 4, 7]), ("b", [1, 3, 6]), ("c", [5])):
+            assert [seq for k, seq in engine.completed if k == key] == expected
+
+    @pytest.mark.asyncio
+    async def test_acks_in_offset_order(self) -> None:
+        engine = _FakeDispatchEngine()
+        callback = create_batched_dispatch_callback(
+            engine,  # type: ignore[arg-type]
+            DISPATCH_ALIAS_CLAUDE_HOOK,
+            max_batch_size=6,
+            max_concurrency=6,
+        )
+        # Later offsets finish first; settlement must still follow offsets.
+        messages = _batch_messages(
+            [(f"k{i}", 0.005 * (6 - i), i != 2) for i in range(6)],
+            partitions=[0, 1, 0, 1, 1, 1],
+        )
+
+        for msg in messages:
+            await callback(msg)
+
+        assert [seq for _, seq in engine.completed] == [5, 4, 3, 2, 1, 0]
+        assert messages[0].settled == [
+            (0, "ack"),
+            (1, "ack"),
+            (2, "nack"),
+            (3, "ack"),
+            (4, "ack"),
+            (5, "ack"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_nack_blocks_later_acks_on_same_partition(self) -> None:
+        engine = _FakeDispatchEngine()
+        callback = create_batched_dispatch_callback(
+            engine,  # type: ignore[arg-type]
+            DISPATCH_ALIAS_CLAUDE_HOOK,
+            max_batch_size=4,
+            max_concurrency=4,
+        )
+        # Offset 0 fails on partition 0; offset 2 succeeds on the same
+        # partition and must not be acked past the failure. Partition 1 is
+        # unaffected.
+        messages = _batch_messages(
+            [("a", 0.0, False), ("b", 0.0, True), ("c", 0.0, True), ("d", 0.0, True)],
+            partitions=[0, 1, 0, 1],
+        )
+
+        for msg in messages:
+            await callback(msg)
+
+        assert messages[0].settled == [
+            (0, "nack"),
+            (1, "ack"),
+            (2, "nack"),
+            (3, "ack"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_nack_without_partition_blocks_rest_of_batch(self) -> None:
+        engine = _FakeDispatchEngine()
+        callback = create_batched_dispatch_callback(
+            engine,  # type: ignore[arg-type]
+            DISPATCH_ALIAS_CLAUDE_HOOK,
+            max_batch_size=3,
+        )
+        messages = _batch_messages(
+            [("a", 0.0, True), ("b", 0.0, False), ("c", 0.0, True)]
+        )
+
+        for msg in messages:
+            await callback(msg)
+
+        assert messages[0].settled == [(0, "ack"), (1, "nack"), (2, "nack")]
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(self) -> None:
+        engine = _FakeDispatchEngine()
+        callback = create_batched_dispatch_callback(
+            engine,  # type: ignore[arg-type]
+            DISPATCH_ALIAS_CLAUDE_HOOK,
+            max_batch_size=12,
+            max_concurrency=3,
+        )
+        messages = _batch_messages([(None, 0.005, True)] * 12)
+
+        for msg in messages:
+            await callback(msg)
+
+        assert engine.peak_in_flight == 3
+        assert all(msg._acked for msg in messages)
+
+    @pytest.mark.asyncio
+    async def test_batches_settle_in_order(self) -> None:
+        engine = _FakeDispatchEngine()
+        callback = create_batched_dispatch_callback(
+            engine,  # type: ignore[arg-type]
+            DISPATCH_ALIAS_CLAUDE_HOOK,
+            max_batch_size=3,
+            max_wait_ms=1,
+        )
+        # The first (timer-flushed) batch is slow; the second, size-flushed
+        # batch must wait for it before any of its messages settle.
+        messages = _batch_messages([("a", 0.03, True)] + [("a", 0.0, True)] * 3)
+
+        await callback(messages[0])
+        await asyncio.sleep(0.01)
+        for msg in messages[1:]:
+            await callback(msg)
+        await callback.flush()
+
+        assert [offset for offset, _ in messages[0].settled] == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_batch_size": 0},
+            {"max_wait_ms": -1},
+            {"max_concurrency": 0},
+        ],
+    )
+    def test_invalid_limits_raise(self, kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError):
+            create_batched_dispatch_callback(
+                MagicMock(), DISPATCH_ALIAS_CLAUDE_HOOK, **kwargs
+            )
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestBatchedDispatchCallbackBenchmark:
+    """Throughput of micro-batched dispatch versus the concurrency limit."""
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_concurrency(self) -> None:
+        count = 64
+        timings: dict[int, float] = {}
+        for concurrency in (1, 4, 16):
+            engine = _FakeDispatchEngine()
+            callback = create_batched_dispatch_callback(
+                engine,  # type: ignore[arg-type]
+                DISPATCH_ALIAS_CLAUDE_HOOK,
+                max_batch_size=32,
+                max_concurrency=concurrency,
+            )
+            messages = _batch_messages([(f"k{i}", 0.005, True) for i in range(count)])
+
+            start = time.perf_counter()
+            for msg in messages:
+                await callback(msg)
+            await callback.flush()
+            timings[concurrency] = time.perf_counter() - start
+
+            assert all(msg._acked for msg in messages)
+
+        print(
+            "\n"
+            + " ".join(
+                f"concurrency={c} msgs/s={count / s:.0f}" for c, s in timings.items()
+            )
+        )
+        assert timings[4] * 2 < timings[1]
+        assert timings[16] < timings[4]
+
+
 # =============================================================================
 # Tests: Compliance Evaluate Handler (OMN-2339)
 # =============================================================================
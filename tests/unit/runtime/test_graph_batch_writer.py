@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+# Copyright (c) 2025 OmniNode Team
+"""Tests for graph_batch_writer."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from omniintelligence.runtime.graph_batch_writer import write_rows_batched
+
+
+def _rows(count: int) -> list[dict[str, Any]]:
+    return [{"qn": f"pkg.C{i}"} for i in range(count)]
+
+
+@pytest.mark.unit
+class TestWriteRowsBatched:
+    @pytest.mark.asyncio
+    async def test_writes_in_batches_of_batch_size(self) -> None:
+        batches: list[list[str]] = []
+
+        async def write(rows: list[dict[str, Any]]) -> None:
+            batches.append([row["qn"] for row in rows])
+
+        written = await write_rows_batched(write, _rows(5), 2)
+
+        assert written == _rows(5)
+        assert batches == [
+            ["pkg.C0", "pkg.C1"],
+            ["pkg.C2", "pkg.C3"],
+            ["pkg.C4"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retried_row_by_row(self) -> None:
+        calls: list[int] = []
+
+        async def write(rows: list[dict[str, Any]]) -> None:
+            calls.append(len(rows))
+            if any(row["qn"] == "pkg.C1" for row in rows):
+                raise RuntimeError("constraint violation")
+
+        written = await write_rows_batched(write, _rows(4), 2)
+
+        assert [row["qn"] for row in written] == ["pkg.C0", "pkg.C2", "pkg.C3"]
+        assert calls == [2, 1, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_issue_no_writes(self) -> None:
+        async def write(rows: list[dict[str, Any]]) -> None:
+            raise AssertionError("unexpected write")
+
+        assert await write_rows_batched(write, [], 10) == []
@@ -0,0 +1,237 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the buffered operation lifecycle emitter.
+
+Validates:
+    - Started/completed pairs are coalesced while buffered
+    - Size- and time-triggered flushing
+    - Drop-with-counter and blocking overflow policies
+    - Publish failures are counted, never raised
+    - Dispatch callbacks do not wait on lifecycle publishing
+
+Related:
+    - OMN-6125: Operation lifecycle telemetry
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from omniintelligence.constants import (
+    TOPIC_OPERATION_COMPLETED_V1,
+    TOPIC_OPERATION_STARTED_V1,
+)
+from omniintelligence.runtime.dispatch_handlers import create_dispatch_callback
+from omniintelligence.runtime.lifecycle_emitter import BufferedLifecycleEmitter
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class _RecordingProducer:
+    """Kafka publisher stand-in with configurable latency and failures."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.published: list[tuple[str, str]] = []
+
+    async def publish(self, topic: str, key: str, value: dict[str, object]) -> None:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("broker unavailable")
+        self.published.append((topic, str(value["operation_id"])))
+
+
+async def _start(emitter: BufferedLifecycleEmitter, operation_id: str) -> None:
+    await emitter.started(
+        operation_id=operation_id,
+        operation_type="test.topic",
+        correlation_id="corr-1",
+        session_id=None,
+    )
+
+
+async def _complete(emitter: BufferedLifecycleEmitter, operation_id: str) -> None:
+    await emitter.completed(
+        operation_id=operation_id,
+        operation_type="test.topic",
+        correlation_id="corr-1",
+        status="success",
+        duration_ms=3,
+    )
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestBufferedLifecycleEmitter:
+    """Buffering, coalescing, and overflow behavior."""
+
+    async def test_coalesces_pair_and_preserves_order(self) -> None:
+        producer = _RecordingProducer()
+        emitter = BufferedLifecycleEmitter(producer, flush_interval_ms=60_000)
+
+        await _start(emitter, "op-1")
+        await _complete(emitter, "op-1")
+
+        assert emitter.pending_count == 1
+        assert emitter.stats["coalesced"] == 1
+
+        await emitter.close()
+
+        assert producer.published == [
+            (TOPIC_OPERATION_STARTED_V1, "op-1"),
+            (TOPIC_OPERATION_COMPLETED_V1, "op-1"),
+        ]
+        assert emitter.stats["published"] == 2
+
+    async def test_completed_after_flush_is_separate_record(self) -> None:
+        producer = _RecordingProducer()
+        emitter = BufferedLifecycleEmitter(producer, flush_interval_ms=60_000)
+
+        await _start(emitter, "op-1")
+        await emitter.flush()
+        await _complete(emitter, "op-1")
+        await emitter.close()
+
+        assert producer.published == [
+            (TOPIC_OPERATION_STARTED_V1, "op-1"),
+            (TOPIC_OPERATION_COMPLETED_V1, "op-1"),
+        ]
+        assert emitter.stats["coalesced"] == 0
+
+    async def test_flushes_when_batch_size_reached(self) -> None:
+        producer = _RecordingProducer()
+        emitter = BufferedLifecycleEmitter(
+            producer, flush_batch_size=2, flush_interval_ms=60_000
+        )
+
+        await _start(emitter, "op-1")
+        await _start(emitter, "op-2")
+        await asyncio.sleep(0.01)
+
+        assert len(producer.published) == 2
+        await emitter.close()
+
+    async def test_flushes_after_interval(self) -> None:
+        producer = _RecordingProducer()
+        emitter = BufferedLifecycleEmitter(producer, flush_interval_ms=5)
+
+        await _start(emitter, "op-1")
+        await asyncio.sleep(0.05)
+
+        assert producer.published == [(TOPIC_OPERATION_STARTED_V1, "op-1")]
+        await emitter.close()
+
+    async def test_drops_with_counter_when_full(self) -> None:
+        producer = _RecordingProducer()
+        emitter = BufferedLifecycleEmitter(
+            producer, max_buffer_size=2, flush_interval_ms=60_000
+        )
+
+        for i in range(5):
+            await _start(emitter, f"op-{i}")
+        # Coalescing into a buffered record needs no extra slot.
+        await _complete(emitter, "op-0")
+
+        assert emitter.stats["dropped"] == 3
+        assert emitter.stats["coalesced"] == 1
+        await emitter.close()
+        assert [op for _, op in producer.published] == ["op-0", "op-1", "op-0"]
+
+    async def test_block_overflow_waits_for_flush(self) -> None:
+        producer = _RecordingProducer(delay=0.001)
+        emitter = BufferedLifecycleEmitter(
+            producer,
+            max_buffer_size=2,
+            flush_batch_size=2,
+            flush_interval_ms=60_000,
+            overflow="block",
+        )
+
+        for i in range(10):
+            await _start(emitter, f"op-{i}")
+        await emitter.close()
+
+        assert emitter.stats["dropped"] == 0
+        assert [op for _, op in producer.published] == [f"op-{i}" for i in range(10)]
+
+    async def test_publish_failures_are_counted(self) -> None:
+        emitter = BufferedLifecycleEmitter(
+            _RecordingProducer(fail=True), flush_interval_ms=60_000
+        )
+
+        await _start(emitter, "op-1")
+        await _complete(emitter, "op-1")
+        await emitter.close()
+
+        assert emitter.stats["failed"] == 2
+        assert emitter.stats["published"] == 0
+
+    async def test_events_after_close_are_dropped(self) -> None:
+        producer = _RecordingProducer()
+        emitter = BufferedLifecycleEmitter(producer)
+        await emitter.close()
+
+        await _start(emitter, "op-1")
+
+        assert emitter.stats["dropped"] == 1
+        assert producer.published == []
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_buffer_size": 0},
+            {"flush_batch_size": 0},
+            {"flush_interval_ms": 0},
+            {"overflow": "spill"},
+        ],
+    )
+    def test_invalid_arguments_raise(self, kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError):
+            BufferedLifecycleEmitter(_RecordingProducer(), **kwargs)
+
+
+@pytest.mark.unit
+class TestDispatchCallbackLifecycle:
+    """Dispatch callbacks enqueue lifecycle events instead of awaiting Kafka."""
+
+    async def test_slow_lifecycle_topic_does_not_delay_ack(self) -> None:
+        producer = _RecordingProducer(delay=0.2)
+        emitter = BufferedLifecycleEmitter(producer, flush_interval_ms=60_000)
+        result = MagicMock()
+        result.is_successful.return_value = True
+        engine = MagicMock()
+        engine.dispatch = AsyncMock(return_value=result)
+        callback = create_dispatch_callback(
+            engine, "onex.evt.test.topic.v1", lifecycle_emitter=emitter
+        )
+        msg = MagicMock()
+        msg.value = json.dumps({"session_id": "s-1"}).encode("utf-8")
+        msg.ack = AsyncMock()
+
+        start = time.perf_counter()
+        await callback(msg)
+        elapsed = time.perf_counter() - start
+
+        msg.ack.assert_awaited_once()
+        assert elapsed < 0.1
+        assert emitter.stats["coalesced"] == 1
+
+        await emitter.close()
+        assert [topic for topic, _ in producer.published] == [
+            TOPIC_OPERATION_STARTED_V1,
+            TOPIC_OPERATION_COMPLETED_V1,
+        ]
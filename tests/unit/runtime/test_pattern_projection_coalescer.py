@@ -0,0 +1,361 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+# Copyright (c) 2025 OmniNode Team
+"""Unit tests for the debounced delta-projection dispatch handler.
+
+Validates:
+    - A burst of triggers for the same pattern produces one delta per flush
+    - The first flush publishes a full snapshot that seeds last-published state
+    - Unchanged patterns produce no delta after the snapshot
+    - A trigger without a pattern id forces a snapshot rebuild
+    - A snapshot that fails to query or publish stays due
+    - Removals are published before the first snapshot succeeds
+    - Deltas and rebuild snapshots share a monotonic sequence per flush
+    - The debounce timer flushes without an explicit flush() call
+    - The factory returns the coalescer only when a delta topic is given
+
+Related:
+    - OMN-2424: Pattern projection snapshot publisher
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from omniintelligence.runtime.dispatch_handlers import (
+    PatternProjectionCoalescer,
+    create_pattern_projection_dispatch_handler,
+)
+
+_SNAPSHOT_TOPIC = "onex.evt.omniintelligence.pattern-projection.v1"
+_DELTA_TOPIC = "onex.evt.omniintelligence.pattern-projection-delta.v1"
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _row(pattern_id: UUID, *, status: str = "validated") -> dict[str, Any]:
+    return {
+        "id": pattern_id,
+        "pattern_signature": f"pattern {pattern_id}",
+        "signature_hash": "test-sig-hash",
+        "domain_id": "general",
+        "confidence": 0.85,
+        "status": status,
+        "is_current": True,
+        "version": 1,
+        "created_at": datetime(2026, 3, 1, tzinfo=UTC),
+    }
+
+
+class _QueryStore:
+    """In-memory ProtocolPatternQueryStore over a mutable row list."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.by_ids_calls: list[list[UUID]] = []
+        self.projection_error: Exception | None = None
+
+    async def query_patterns(self, **kwargs: Any) -> list[dict[str, Any]]:
+        return []
+
+    async def query_patterns_projection(
+        self, *, min_confidence: float, limit: int, offset: int
+    ) -> list[dict[str, Any]]:
+        if self.projection_error is not None:
+            raise self.projection_error
+        rows = [
+            r
+            for r in self.rows
+            if r["status"] in ("validated", "provisional")
+            and r["confidence"] >= min_confidence
+        ]
+        return rows[offset : offset + limit]
+
+    async def query_patterns_projection_by_ids(
+        self, *, pattern_ids: list[UUID]
+    ) -> list[dict[str, Any]]:
+        self.by_ids_calls.append(list(pattern_ids))
+        return [r for r in self.rows if r["id"] in pattern_ids]
+
+
+class _Producer:
+    def __init__(self) -> None:
+        self.published: list[tuple[str, str, dict[str, Any]]] = []
+        self.failing_topics: set[str] = set()
+
+    async def publish(self, topic: str, key: str, value: dict[str, Any]) -> None:
+        if topic in self.failing_topics:
+            raise RuntimeError("broker down")
+        self.published.append((topic, key, value))
+
+    def on_topic(self, topic: str) -> list[tuple[str, str, dict[str, Any]]]:
+        return [event for event in self.published if event[0] == topic]
+
+
+def _envelope(pattern_id: UUID | None) -> SimpleNamespace:
+    payload: dict[str, Any] = {"event_type": "PatternLifecycleTransitioned"}
+    if pattern_id is not None:
+        payload["pattern_id"] = str(pattern_id)
+    return SimpleNamespace(payload=payload)
+
+
+def _context() -> SimpleNamespace:
+    return SimpleNamespace(correlation_id=uuid4())
+
+
+def _coalescer(
+    store: _QueryStore, producer: _Producer, *, debounce_seconds: float = 60.0
+) -> PatternProjectionCoalescer:
+    return PatternProjectionCoalescer(
+        pattern_query_store=store,
+        kafka_producer=producer,
+        snapshot_topic=_SNAPSHOT_TOPIC,
+        delta_topic=_DELTA_TOPIC,
+        debounce_seconds=debounce_seconds,
+        snapshot_interval_seconds=3600.0,
+    )
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestPatternProjectionCoalescer:
+    """Tests for PatternProjectionCoalescer flush behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_first_flush_publishes_snapshot(self) -> None:
+        store = _QueryStore([_row(uuid4()), _row(uuid4())])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+
+        await coalescer(_envelope(uuid4()), _context())
+        await coalescer.flush()
+
+        snapshots = producer.on_topic(_SNAPSHOT_TOPIC)
+        assert len(snapshots) == 1
+        assert snapshots[0][2]["total_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_burst_for_one_pattern_yields_one_delta(self) -> None:
+        pattern_id = uuid4()
+        store = _QueryStore([])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+        await coalescer.flush()  # initial (empty) snapshot
+
+        store.rows.append(_row(pattern_id))
+        for _ in range(5):
+            await coalescer(_envelope(pattern_id), _context())
+        assert coalescer.pending_count == 1
+        await coalescer.flush()
+
+        deltas = producer.on_topic(_DELTA_TOPIC)
+        assert len(deltas) == 1
+        assert deltas[0][1] == str(pattern_id)
+        assert deltas[0][2]["operation"] == "upsert"
+        assert store.by_ids_calls == [[pattern_id]]
+        assert len(producer.on_topic(_SNAPSHOT_TOPIC)) == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_pattern_publishes_nothing(self) -> None:
+        pattern_id = uuid4()
+        store = _QueryStore([_row(pattern_id)])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+        await coalescer.flush()
+        producer.published.clear()
+
+        await coalescer(_envelope(pattern_id), _context())
+        await coalescer.flush()
+
+        assert producer.published == []
+
+    @pytest.mark.asyncio
+    async def test_deprecation_after_snapshot_publishes_remove(self) -> None:
+        pattern_id = uuid4()
+        store = _QueryStore([_row(pattern_id)])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+        await coalescer.flush()
+
+        store.rows[0]["status"] = "deprecated"
+        await coalescer(_envelope(pattern_id), _context())
+        await coalescer.flush()
+
+        deltas = producer.on_topic(_DELTA_TOPIC)
+        assert [(key, value["operation"]) for _, key, value in deltas] == [
+            (str(pattern_id), "remove")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_removal_in_first_flush_publishes_remove(self) -> None:
+        pattern_id = uuid4()
+        store = _QueryStore([_row(pattern_id, status="deprecated")])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+
+        await coalescer(_envelope(pattern_id), _context())
+        await coalescer.flush()
+
+        deltas = producer.on_topic(_DELTA_TOPIC)
+        assert [(key, value["operation"]) for _, key, value in deltas] == [
+            (str(pattern_id), "remove")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_removal_while_snapshot_failing_publishes_remove(self) -> None:
+        kept, removed = uuid4(), uuid4()
+        store = _QueryStore([_row(kept), _row(removed)])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+        producer.failing_topics.add(_SNAPSHOT_TOPIC)
+        await coalescer.flush()
+
+        store.rows[1]["status"] = "deprecated"
+        await coalescer(_envelope(removed), _context())
+        await coalescer.flush()
+
+        deltas = producer.on_topic(_DELTA_TOPIC)
+        assert [(key, value["operation"]) for _, key, value in deltas] == [
+            (str(removed), "remove")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_trigger_without_pattern_id_forces_snapshot(self) -> None:
+        store = _QueryStore([_row(uuid4())])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+        await coalescer.flush()
+
+        await coalescer(_envelope(None), _context())
+        assert coalescer.pending_count == 0
+        await coalescer.flush()
+
+        assert len(producer.on_topic(_SNAPSHOT_TOPIC)) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_snapshot_publish_stays_due(self) -> None:
+        store = _QueryStore([_row(uuid4())])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+        producer.failing_topics.add(_SNAPSHOT_TOPIC)
+        await coalescer.flush()
+
+        producer.failing_topics.clear()
+        await coalescer.flush()
+
+        assert len(producer.on_topic(_SNAPSHOT_TOPIC)) == 1
+        await coalescer.flush()
+        assert len(producer.on_topic(_SNAPSHOT_TOPIC)) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_rebuild_query_keeps_last_published(self) -> None:
+        pattern_id = uuid4()
+        store = _QueryStore([_row(pattern_id)])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+        await coalescer.flush()
+
+        store.projection_error = RuntimeError("db down")
+        await coalescer(_envelope(None), _context())
+        await coalescer.flush()
+        assert len(producer.on_topic(_SNAPSHOT_TOPIC)) == 1
+
+        # The unchanged pattern is still known to consumers: no delta, and
+        # the explicit rebuild is retried.
+        store.projection_error = None
+        await coalescer(_envelope(pattern_id), _context())
+        await coalescer.flush()
+
+        assert producer.on_topic(_DELTA_TOPIC) == []
+        assert len(producer.on_topic(_SNAPSHOT_TOPIC)) == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_sequence_increases_and_matches_rebuild(self) -> None:
+        pattern_id = uuid4()
+        store = _QueryStore([])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer)
+        await coalescer.flush()
+
+        store.rows.append(_row(pattern_id))
+        await coalescer(_envelope(pattern_id), _context())
+        await coalescer.flush()
+        store.rows[0]["status"] = "deprecated"
+        await coalescer(_envelope(pattern_id), _context())
+        await coalescer(_envelope(None), _context())
+        await coalescer.flush()
+
+        snapshots = [value for _, _, value in producer.on_topic(_SNAPSHOT_TOPIC)]
+        deltas = [value for _, _, value in producer.on_topic(_DELTA_TOPIC)]
+        assert [d["operation"] for d in deltas] == ["upsert", "remove"]
+        assert (
+            snapshots[0]["sequence"]
+            < deltas[0]["sequence"]
+            < deltas[1]["sequence"]
+            == snapshots[1]["sequence"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_debounce_timer_flushes(self) -> None:
+        pattern_id = uuid4()
+        store = _QueryStore([_row(pattern_id)])
+        producer = _Producer()
+        coalescer = _coalescer(store, producer, debounce_seconds=0.0)
+
+        await coalescer(_envelope(pattern_id), _context())
+        await asyncio.sleep(0.01)
+
+        assert coalescer.pending_count == 0
+        assert len(producer.on_topic(_SNAPSHOT_TOPIC)) == 1
+
+    def test_rejects_invalid_timings(self) -> None:
+        with pytest.raises(ValueError, match="debounce_seconds"):
+            PatternProjectionCoalescer(
+                pattern_query_store=_QueryStore([]),
+                kafka_producer=None,
+                snapshot_topic=_SNAPSHOT_TOPIC,
+                delta_topic=_DELTA_TOPIC,
+                debounce_seconds=-1.0,
+            )
+        with pytest.raises(ValueError, match="snapshot_interval_seconds"):
+            PatternProjectionCoalescer(
+                pattern_query_store=_QueryStore([]),
+                kafka_producer=None,
+                snapshot_topic=_SNAPSHOT_TOPIC,
+                delta_topic=_DELTA_TOPIC,
+                snapshot_interval_seconds=0.0,
+            )
+
+
+@pytest.mark.unit
+class TestProjectionHandlerFactory:
+    """Tests for create_pattern_projection_dispatch_handler mode selection."""
+
+    def test_delta_topic_selects_coalescer(self) -> None:
+        handler = create_pattern_projection_dispatch_handler(
+            pattern_query_store=_QueryStore([]),
+            publish_topic=_SNAPSHOT_TOPIC,
+            delta_topic=_DELTA_TOPIC,
+        )
+        assert isinstance(handler, PatternProjectionCoalescer)
+
+    def test_no_delta_topic_keeps_snapshot_handler(self) -> None:
+        handler = create_pattern_projection_dispatch_handler(
+            pattern_query_store=_QueryStore([]),
+            publish_topic=_SNAPSHOT_TOPIC,
+        )
+        assert not isinstance(handler, PatternProjectionCoalescer)
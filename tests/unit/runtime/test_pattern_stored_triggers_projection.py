@@ -100,6 +100,7 @@ def mock_pattern_query_store() -> MagicMock:
     }
     store.query_patterns = AsyncMock(return_value=[_row])
     store.query_patterns_projection = AsyncMock(return_value=[_row])
+    store.query_patterns_projection_by_ids = AsyncMock(return_value=[_row])
     assert isinstance(store, ProtocolPatternQueryStore)
     return store
 
@@ -25,6 +25,7 @@ import asyncio
 import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
@@ -35,6 +36,8 @@ from omnibase_core.protocols.event_bus.protocol_event_bus import ProtocolEventBu
 from omniintelligence.runtime.plugin import (
     _INTELLIGENCE_CONSUMER_GROUP_DEFAULT,
     _INTELLIGENCE_CONSUMER_GROUP_ENV_VAR,
+    _INTENT_CLASSIFIER_SNAPSHOT_DIR_ENV_VAR,
+    _INTENT_CLASSIFIER_WARMUP_ENV_VAR,
     INTELLIGENCE_SUBSCRIBE_TOPICS,
     PluginIntelligence,
     _intelligence_consumer_group,
@@ -579,6 +582,31 @@ class TestPluginShutdownClearsEngine:
         await plugin.shutdown(config)
         assert plugin._dispatch_engine is None
 
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_lifecycle_emitter_after_consumers(self) -> None:
+        """Batches drain, consumers unsubscribe, then the emitter is closed."""
+        plugin = PluginIntelligence()
+        config = _make_config()
+        order: list[str] = []
+
+        batched = MagicMock()
+        batched.flush = AsyncMock(side_effect=lambda: order.append("flush"))
+
+        async def _unsubscribe() -> None:
+            order.append("unsubscribe")
+
+        emitter = MagicMock()
+        emitter.close = AsyncMock(side_effect=lambda: order.append("emitter_close"))
+
+        plugin._batched_callbacks = [batched]
+        plugin._unsubscribe_callbacks = [_unsubscribe]
+        plugin._lifecycle_emitter = emitter
+
+        await plugin.shutdown(config)
+
+        assert order == ["flush", "unsubscribe", "emitter_close"]
+        assert plugin._lifecycle_emitter is None
+
 
 # =============================================================================
 # Tests: OMNIINTELLIGENCE_PUBLISH_INTROSPECTION gate (OMN-2342)
@@ -944,3 +972,67 @@ class TestSharedConsumerGroup:
         )
         (actual_group,) = group_ids
         assert actual_group == _INTELLIGENCE_CONSUMER_GROUP_DEFAULT
+
+
+# =============================================================================
+# Tests: Adaptive intent classifier warm-up
+# =============================================================================
+
+_INTENT_HANDLERS = "omniintelligence.nodes.node_intent_classifier_compute.handlers"
+
+
+class TestIntentClassifierWarmUp:
+    """initialize() warm-up of the adaptive intent classifier (env-gated)."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_noop_when_unconfigured(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Neither snapshot nor warm-up is touched when both vars are unset."""
+        monkeypatch.delenv(_INTENT_CLASSIFIER_SNAPSHOT_DIR_ENV_VAR, raising=False)
+        monkeypatch.delenv(_INTENT_CLASSIFIER_WARMUP_ENV_VAR, raising=False)
+
+        with (
+            patch(f"{_INTENT_HANDLERS}.configure_classifier_snapshot") as configure,
+            patch(f"{_INTENT_HANDLERS}.warm_up_classifier") as warm_up,
+        ):
+            await PluginIntelligence()._warm_up_intent_classifier(uuid4())
+
+        configure.assert_not_called()
+        warm_up.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_configures_snapshot_and_warms_up(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Snapshot dir is configured and the classifier is warmed when enabled."""
+        monkeypatch.setenv(_INTENT_CLASSIFIER_SNAPSHOT_DIR_ENV_VAR, str(tmp_path))
+        monkeypatch.setenv(_INTENT_CLASSIFIER_WARMUP_ENV_VAR, "true")
+
+        with (
+            patch(f"{_INTENT_HANDLERS}.configure_classifier_snapshot") as configure,
+            patch(
+                f"{_INTENT_HANDLERS}.warm_up_classifier", return_value="1.0.0"
+            ) as warm_up,
+        ):
+            await PluginIntelligence()._warm_up_intent_classifier(uuid4())
+
+        configure.assert_called_once_with(tmp_path)
+        warm_up.assert_called_once_with()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_warm_up_failure_is_not_raised(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failing warm-up is logged and does not propagate."""
+        monkeypatch.delenv(_INTENT_CLASSIFIER_SNAPSHOT_DIR_ENV_VAR, raising=False)
+        monkeypatch.setenv(_INTENT_CLASSIFIER_WARMUP_ENV_VAR, "1")
+
+        with patch(
+            f"{_INTENT_HANDLERS}.warm_up_classifier",
+            side_effect=RuntimeError("model download failed"),
+        ):
+            await PluginIntelligence()._warm_up_intent_classifier(uuid4())
@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for omniintelligence.utils.parse_cache."""
+
+from __future__ import annotations
+
+import ast
+import logging
+import tokenize
+
+import pytest
+
+from omniintelligence.utils import parse_cache
+from omniintelligence.utils.parse_cache import (
+    ParseCache,
+    get_parse_cache,
+    parse_python,
+)
+
+_SOURCE = 'def f(x):\n    """Doc."""\n    return x  # comment\n'
+
+
+@pytest.mark.unit
+class TestParseCache:
+    """Tests for the content-hash keyed LRU parse cache."""
+
+    def test_hit_returns_same_tree(self) -> None:
+        cache = ParseCache()
+
+        first = cache.get_or_parse(_SOURCE)
+        second = cache.get_or_parse(_SOURCE)
+
+        assert first is second
+        assert isinstance(first.tree, ast.Module)
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_tree_matches_ast_parse(self) -> None:
+        parsed = ParseCache().get_or_parse(_SOURCE)
+
+        assert ast.dump(parsed.tree) == ast.dump(ast.parse(_SOURCE))
+
+    def test_syntax_error_propagates_and_is_not_cached(self) -> None:
+        cache = ParseCache()
+
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                cache.get_or_parse("def broken(:\n")
+
+        assert len(cache) == 0
+        assert cache.stats["misses"] == 2
+
+    def test_evicts_least_recently_used_by_count(self) -> None:
+        cache = ParseCache(max_entries=2)
+        a = cache.get_or_parse("a = 1\n")
+        cache.get_or_parse("b = 2\n")
+        cache.get_or_parse("a = 1\n")  # a becomes most recent
+        cache.get_or_parse("c = 3\n")
+
+        assert cache.stats["evictions"] == 1
+        assert cache.get_or_parse("a = 1\n") is a
+        assert cache.stats["misses"] == 3
+
+    def test_evicts_by_byte_budget(self) -> None:
+        cache = ParseCache(max_bytes=10)
+        cache.get_or_parse("a = 1\n")
+        cache.get_or_parse("b = 2\n")
+
+        assert len(cache) == 1
+        assert cache.stats["bytes"] == 6
+
+    def test_oversized_source_is_not_cached(self) -> None:
+        cache = ParseCache(max_bytes=4)
+
+        parsed = cache.get_or_parse("value = 1\n")
+
+        assert isinstance(parsed.tree, ast.Module)
+        assert len(cache) == 0
+
+    def test_clear_resets_entries_and_stats(self) -> None:
+        cache = ParseCache()
+        cache.get_or_parse(_SOURCE)
+        cache.clear()
+
+        assert cache.stats == {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "entries": 0,
+            "bytes": 0,
+        }
+
+    @pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"max_bytes": 0}])
+    def test_invalid_arguments_raise(self, kwargs: dict[str, int]) -> None:
+        with pytest.raises(ValueError):
+            ParseCache(**kwargs)
+
+
+@pytest.mark.unit
+class TestParsedSource:
+    """Tests for the per-entry line index, tokens, and derived artifacts."""
+
+    def test_line_index(self) -> None:
+        parsed = ParseCache().get_or_parse("x = 1\r\n\x0cy = 2\nz = 3")
+
+        assert parsed.line_offsets == (0, 7, 14)
+        assert parsed.line_for_offset(0) == 1
+        assert parsed.line_for_offset(8) == 2
+        assert parsed.line_for_offset(14) == 3
+
+    def test_tokens_include_comments(self) -> None:
+        parsed = ParseCache().get_or_parse(_SOURCE)
+
+        comments = [t.string for t in parsed.tokens if t.type == tokenize.COMMENT]
+        assert comments == ["# comment"]
+
+    def test_derive_is_memoized(self) -> None:
+        parsed = ParseCache().get_or_parse(_SOURCE)
+        calls: list[str] = []
+
+        def _compute(source: str) -> int:
+            calls.append(source)
+            return len(source)
+
+        assert parsed.derive("test.len", _compute) == len(_SOURCE)
+        assert parsed.derive("test.len", _compute) == len(_SOURCE)
+        assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_parse_python_uses_shared_cache() -> None:
+    source = "shared_cache_probe = 42\n"
+    before = get_parse_cache().stats["hits"]
+
+    tree = parse_python(source)
+
+    assert parse_python(source) is tree
+    assert get_parse_cache().stats["hits"] >= before + 1
+
+
+@pytest.mark.unit
+def test_stats_logged_at_interval(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(parse_cache, "PARSE_CACHE_STATS_LOG_INTERVAL", 2)
+    cache = ParseCache()
+
+    with caplog.at_level(logging.DEBUG, logger=parse_cache.__name__):
+        cache.get_or_parse(_SOURCE)
+        cache.get_or_parse(_SOURCE)
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "Parse cache: hits=1 misses=1 hit_rate=0.50 evictions=0 entries=1 "
+        f"bytes={len(_SOURCE)}"
+    ]